@@ -26,6 +26,7 @@ import os
 import re
 import sys
 import traceback
+from io import BytesIO
 from pickle import UnpicklingError
 
 import pysollib.app_stat
@@ -33,10 +34,14 @@ from pysollib.actions import PysolMenubar
 from pysollib.actions import PysolToolbar
 from pysollib.app_stat_result import GameStatResult
 from pysollib.app_statistics import Statistics
-from pysollib.cardsetparser import read_cardset_config
+from pysollib.cardsetparser import CardsetConfigCache
+from pysollib.game.binsave import BinarySaveReader
+from pysollib.game.journal import MoveJournal, loadJournal
 from pysollib.gamedb import GAME_DB, GI, loadGame
 from pysollib.help import destroy_help_html, help_about
-from pysollib.images import Images, SubsampledImages
+from pysollib.images import CardsetImagesCache, Images
+from pysollib.images import ScaledImageDiskCache
+from pysollib.images import SubsampledImages
 from pysollib.mfxutil import Struct, destruct
 from pysollib.mfxutil import USE_PIL
 from pysollib.mfxutil import getprefdir, getusername
@@ -61,6 +66,8 @@ from pysollib.resource import Tile, TileManager
 from pysollib.settings import DEBUG
 from pysollib.settings import PACKAGE, VERSION_TUPLE  # , WIN_SYSTEM
 from pysollib.settings import TOOLKIT
+from pysollib.solvercache import solver_cache
+from pysollib.statsdb import StatisticsDB, sqlite3
 from pysollib.util import IMAGE_EXTENSIONS
 from pysollib.winsystems import TkSettings
 if TOOLKIT == 'tk':
@@ -117,7 +124,7 @@ class Application:
         self.progress_images = []
         self.cardset_manager = CardsetManager()
         self.cardset = None             # current cardset
-        self.cardsets_cache = {}
+        self.cardsets_cache = CardsetImagesCache()
         self.tabletile_manager = TileManager()
         self.tabletile_index = 0        # current table tile
         self.sample_manager = SampleManager()
@@ -134,6 +141,7 @@ class Application:
             savegames=os.path.join(config, "savegames"),
             boards=os.path.join(config, "boards"),
             maint=os.path.join(config, "maint"),          # debug
+            scaled_images=os.path.join(config, "scaled"),
         )
         for k, v in self.dn.__dict__.items():
             #             if os.name == "nt":
@@ -145,8 +153,12 @@ class Application:
             opt=os.path.join(self.dn.config, "options.dat"),
             opt_cfg=os.path.join(self.dn.config, "options.cfg"),
             stats=os.path.join(self.dn.config, "statistics.dat"),
+            stats_db=os.path.join(self.dn.config, "statistics.db"),
             holdgame=os.path.join(self.dn.config, "holdgame.dat"),
+            journal=os.path.join(self.dn.config, "journal.dat"),
             comments=os.path.join(self.dn.config, "comments.dat"),
+            solver_cache=os.path.join(self.dn.config, "solutions.dat"),
+            cardset_cache=os.path.join(self.dn.config, "cardsets.dat"),
         )
         for k, v in self.dn.__dict__.items():
             if os.name == "nt":
@@ -171,6 +183,7 @@ class Application:
             cardset=None,             # use this cardset
             holdgame=0,               # hold this game on exit ?
             bookmark=None,            # goto this bookmark (load new cardset)
+            journal=None,             # replay these MoveJournal records
         )
         self.commandline = Struct(
             loadgame=None,            # load a game ?
@@ -195,6 +208,23 @@ class Application:
             logging.info('App: game started {},{}'.format(id_, random))
             self.runGame(id_, random)
 
+    def _recover_journal_game(self, tmpgame):
+        """load the game of a session that crashed"""
+        if not self.opt.move_journal or self.nextgame.loadedgame:
+            return
+        journal = loadJournal(self.fn.journal)
+        if journal is None:
+            return
+        base, records = journal
+        try:
+            game = tmpgame._undumpGame(BinarySaveReader(BytesIO(base)), self)
+        except Exception:
+            traceback.print_exc()
+            return
+        self.nextgame.id = game.id
+        self.nextgame.loadedgame = game
+        self.nextgame.journal = records
+
     def _load_held_or_saved_game(self, tmpgame):
         """docstring for _load_held_or_saved_game"""
         if self.opt.game_holded > 0 and not self.nextgame.loadedgame:
@@ -292,6 +322,12 @@ class Application:
             except Exception:
                 traceback.print_exc()
                 pass
+            # save solutions
+            try:
+                self.saveSolverCache()
+            except Exception:
+                traceback.print_exc()
+                pass
             # shut down audio
             try:
                 self.audio.destroy()
@@ -313,6 +349,12 @@ class Application:
         except Exception:
             traceback.print_exc()
             pass
+        # try to load solutions
+        try:
+            self.loadSolverCache()
+        except Exception:
+            traceback.print_exc()
+            pass
 
         # Under normal circumstances, this won't trigger.
         # But if the config has been incorrectly edited or
@@ -327,6 +369,7 @@ class Application:
             self.nextgame.id = GI.PROTECTED_GAMES.get(self.opt.last_gameid)
         # load a holded or saved game
         tmpgame = self.constructGame(self.gdb.getGamesIdSortedByName()[0])
+        self._recover_journal_game(tmpgame)
         self._load_held_or_saved_game(tmpgame)
         if not self.nextgame.loadedgame:
             if self.commandline.loadgame:
@@ -413,6 +456,9 @@ class Application:
         self.game = self.constructGame(id_)
         self.gdb.setSelected(id_)
         self.game.busy = 1
+        if self.opt.move_journal:
+            self.game.journal = MoveJournal(self.fn.journal,
+                                            self.opt.move_journal_compact)
         # create stacks and layout
         self.game.create(self)
         # connect with game
@@ -442,6 +488,8 @@ class Application:
             self.stats.gameid_balance = 0
             self.game.restoreGame(self.nextgame.loadedgame)
             destruct(self.nextgame.loadedgame)
+            if self.nextgame.journal:
+                self.game.replayJournal(self.nextgame.journal)
         elif self.nextgame.bookmark is not None:
             self.game.restoreGameFromBookmark(self.nextgame.bookmark)
         else:
@@ -450,6 +498,7 @@ class Application:
             autoplay = 1
         self.nextgame.loadedgame = None
         self.nextgame.bookmark = None
+        self.nextgame.journal = None
         # splash screen
         if self.opt.splashscreen and self.splashscreen > 0:
             status = help_about(self, timeout=20000, sound=0)
@@ -479,6 +528,8 @@ class Application:
         self.canvas.update_idletasks()
         # destruct the game
         if self.game:
+            if self.game.journal:
+                self.game.journal.stop()
             self.game.destruct()
             destruct(self.game)
         self.game = None
@@ -727,21 +778,18 @@ class Application:
             if not tocache:
                 self.updateCardset(id, update=update)
             return 1
-        # cache carsets
-        # self.cardsets_cache:
-        #   key: Cardset.type
-        #   value: (Cardset.ident, Images, SubsampledImages)
-        c = self.cardsets_cache.get(cs.type)
-        if c:
-            c2 = c.get(cs.subtype)
-            if c2 and c2[0] == cs.ident:
-                # print 'load from cache', c
-                self.images, self.subsampled_images = c2[1], c2[2]
-                if not tocache:
-                    self.updateCardset(id, update=update)
-                    if self.menubar is not None:
-                        self.menubar.updateBackgroundImagesMenu()
-                return 1
+        # cache carsets (see CardsetImagesCache)
+        c2 = self.cardsets_cache.get(cs.type, cs.subtype, cs.ident)
+        if c2:
+            # print 'load from cache', c2
+            if not tocache and self.images is not None:
+                self.images.stopPrefetch()
+            self.images, self.subsampled_images = c2[1], c2[2]
+            if not tocache:
+                self.updateCardset(id, update=update)
+                if self.menubar is not None:
+                    self.menubar.updateBackgroundImagesMenu()
+            return 1
         #
         if progress is None and not noprogress:
             self.wm_save_state()
@@ -755,6 +803,10 @@ class Application:
                                         images=self.progress_images)
         images = Images(self.dataloader, cs)
         images.cardset_bottoms = self.opt.use_cardset_bottoms
+        images.scaled_cache_size = self.opt.scaled_images_cache_size
+        if USE_PIL and self.opt.scaled_images_on_disk:
+            images.scaled_disk_cache = \
+                ScaledImageDiskCache(self.dn.scaled_images)
         try:
             if not images.load(app=self, progress=progress):
                 raise Exception("Invalid or damaged cardset")
@@ -765,15 +817,11 @@ class Application:
             # directly conflicts with the ability to allow previews of
             # other cardset types.
             # if self.opt.save_cardsets:
-            c = self.cardsets_cache.get(cs.type)
-            if c:
-                c2 = c.get(cs.subtype)
-                if c2:
-                    # c2[1].destruct()
-                    destruct(c2[1])
-            self.cardsets_cache[cs.type] = {}
-            self.cardsets_cache[cs.type][cs.subtype] = (cs.ident, images,
-                                                        simages)
+            c2 = self.cardsets_cache.put(cs.type, cs.subtype,
+                                         (cs.ident, images, simages))
+            if c2:
+                c2[1].destruct()
+                destruct(c2[1])
             if not tocache:
                 # elif self.images is not None:
                 #    # self.images.destruct()
@@ -785,9 +833,16 @@ class Application:
                             # clear saved games geometry
                             self.opt.games_geometry = {}
                 # update
+                if self.images is not None:
+                    self.images.stopPrefetch()
+                if self.opt.prefetch_card_images:
+                    images.startPrefetch(self.top)
                 self.images = images
                 self.subsampled_images = simages
                 self.updateCardset(id, update=update)
+            self.cardsets_cache.max_memory = \
+                self.opt.cardsets_cache_memory * 1024 * 1024
+            self.cardsets_cache.evict(keep=(self.images, images))
             r = 1
         except (Exception, TclError, UnpicklingError) as ex:
             traceback.print_exc()
@@ -991,12 +1046,26 @@ class Application:
         self.opt.setConstants()
 
     def loadStatistics(self):
-        if not os.path.exists(self.fn.stats):
-            return
-        stats = unpickle(self.fn.stats)
-        if stats:
-            # print "loaded:", stats.__dict__
-            self.stats.__dict__.update(stats.__dict__)
+        db = None
+        if sqlite3 is not None:
+            try:
+                db = StatisticsDB(self.fn.stats_db)
+            except sqlite3.Error as ex:
+                print_err('cannot open %s: %s' % (self.fn.stats_db, ex))
+        if db and (db.getValue('migrated') or
+                   not os.path.exists(self.fn.stats)):
+            self.stats.setDB(db)
+        elif os.path.exists(self.fn.stats):
+            stats = unpickle(self.fn.stats)
+            if stats:
+                # print "loaded:", stats.__dict__
+                self.stats.__dict__.update(stats.__dict__)
+                self.stats.db = None
+                if db:
+                    # one-time import, the pickle is kept for older
+                    # versions
+                    db.migrate(self.stats)
+                    self.stats.setDB(db)
         # start a new session
         self.stats.session_games = {}
         self.stats.session_balance = {}
@@ -1011,8 +1080,20 @@ class Application:
         self.opt.save(self.fn.opt_cfg)
 
     def saveStatistics(self):
+        if self.stats.db:
+            self.stats.version_tuple = VERSION_TUPLE
+            self.stats.saved += 1
+            self.stats.saveDB()
+            return
         self.__saveObject(self.stats, self.fn.stats)
 
+    def loadSolverCache(self):
+        solver_cache.max_size = self.opt.solver_cache_size
+        solver_cache.load(self.fn.solver_cache)
+
+    def saveSolverCache(self):
+        solver_cache.save(self.fn.solver_cache)
+
     #
     # access games database
     #
@@ -1021,7 +1102,10 @@ class Application:
         gi = self.gdb.get(id)
         if gi is None:
             raise Exception("Unknown game (id %d)" % id)
-        return gi.gameclass(gi)
+        gameclass = self.gdb.loadGameClass(gi)
+        if gameclass is None:
+            raise Exception("Unknown game (id %d)" % id)
+        return gameclass(gi)
 
     def getGamesIdSortedById(self):
         return self.gdb.getGamesIdSortedById()
@@ -1030,71 +1114,40 @@ class Application:
         return self.gdb.getGamesIdSortedByName()
 
     ##
-    def getGamesIdSortedByPlayed(self, player=''):
+    def _getGamesIdSortedByStats(self, player, key):
         if player == '':
             player = self.opt.player
-
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return wa+la
+        # one query instead of a lookup per game
+        stats = self.stats.getAllFullStats(player)
+        no_stats = (0, 0, 0, 0)
         games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
+        games.sort(key=lambda a: key(*stats.get(a, no_stats)))
         return games[::-1]
 
-    def getGamesIdSortedByWon(self, player=''):
-        if player == '':
-            player = self.opt.player
+    def getGamesIdSortedByPlayed(self, player=''):
+        return self._getGamesIdSortedByStats(
+            player, lambda wa, la, ta, ma: wa+la)
 
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return wa
-        games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
-        return games[::-1]
+    def getGamesIdSortedByWon(self, player=''):
+        return self._getGamesIdSortedByStats(
+            player, lambda wa, la, ta, ma: wa)
 
     def getGamesIdSortedByLost(self, player=''):
-        if player == '':
-            player = self.opt.player
-
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return la
-        games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
-        return games[::-1]
+        return self._getGamesIdSortedByStats(
+            player, lambda wa, la, ta, ma: la)
 
     def getGamesIdSortedByPercent(self, player=''):
-        if player == '':
-            player = self.opt.player
-
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return float(wa)/(1 if wa+la == 0 else wa+la)
-        games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
-        return games[::-1]
+        return self._getGamesIdSortedByStats(
+            player,
+            lambda wa, la, ta, ma: float(wa)/(1 if wa+la == 0 else wa+la))
 
     def getGamesIdSortedByPlayingTime(self, player=''):
-        if player == '':
-            player = self.opt.player
-
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return ta
-        games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
-        return games[::-1]
+        return self._getGamesIdSortedByStats(
+            player, lambda wa, la, ta, ma: ta)
 
     def getGamesIdSortedByMoves(self, player=''):
-        if player == '':
-            player = self.opt.player
-
-        def _key(a):
-            wa, la, ta, ma = self.stats.getFullStats(player, a)
-            return ma
-        games = list(self.gdb.getGamesIdSortedByName())
-        games.sort(key=_key)
-        return games[::-1]
+        return self._getGamesIdSortedByStats(
+            player, lambda wa, la, ta, ma: ma)
 
     def getGameInfo(self, id):
         return self.gdb.get(id)
@@ -1103,7 +1156,7 @@ class Application:
         gi = self.gdb.get(id)
         if gi is None:
             return None
-        return gi.gameclass
+        return self.gdb.loadGameClass(gi)
 
     def getGameTitleName(self, id):
         gi = self.gdb.get(id)
@@ -1184,12 +1237,15 @@ class Application:
     #
 
     # read & parse a cardset config.txt file - see class Cardset in resource.py
-    def _readCardsetConfig(self, dirname, filename):
-        cs = read_cardset_config(dirname, filename)
+    def _readCardsetConfig(self, cache, dirname):
+        r = cache.readCardset(dirname)
+        if r is None or not r[0]:
+            return r
+        cs = r[0]
         # set offsets from options.cfg
         if cs.ident in self.opt.offsets:
             cs.CARD_XOFFSET, cs.CARD_YOFFSET = self.opt.offsets[cs.ident]
-        return cs
+        return r
 
     def initCardsets(self):
         """Load all valid cardset config.txt files and ignore invalid ones.
@@ -1200,40 +1256,44 @@ class Application:
         dirs = manager.getSearchDirs(self, ("cardsets", ""), "PYSOL_CARDSETS")
         if DEBUG:
             dirs += manager.getSearchDirs(self, "cardsets-*")
+        # the parsed configs of the last run
+        cache = CardsetConfigCache()
+        try:
+            cache.load(self.fn.cardset_cache)
+        except Exception:
+            traceback.print_exc()
         found = []
         found_names = []  # (to check for duplicates)
         for dirname in dirs:
             try:
-                subdirs = [os.path.join(dirname, subdir)
-                           for subdir in os.listdir(dirname)
-                           if subdir.startswith('cardset-')]
+                subdirs = cache.listCardsetDirs(dirname)
             except EnvironmentError:
                 traceback.print_exc()
                 continue
-            subdirs.sort()
             for d in subdirs:
-                config_txt_path = os.path.join(d, "config.txt")
-                if not os.path.isfile(config_txt_path):
-                    continue
                 try:
-                    cs = self._readCardsetConfig(d, config_txt_path)
+                    r = self._readCardsetConfig(cache, d)
                 except Exception:
                     traceback.print_exc()
-                    cs = None
+                    r = (None, False)
+                if r is None:
+                    # no config.txt
+                    continue
+                cs, has_images = r
                 if not cs:
                     print_err('failed to parse cardset file: %s'
-                              % config_txt_path)
+                              % os.path.join(d, "config.txt"))
                     continue
-                back = cs.backnames[cs.backindex]
-                back_im_path = os.path.join(d, back)
-                shade_im_path = os.path.join(d, "shade" + cs.ext)
                 if (cs.name not in found_names and
                         cs.ext in IMAGE_EXTENSIONS and
                         cs.CARDD <= screendepth and
-                        os.path.isfile(back_im_path) and
-                        os.path.isfile(shade_im_path)):
+                        has_images):
                     found.append(cs)
                     found_names.append(cs.name)
+        try:
+            cache.save(self.fn.cardset_cache)
+        except Exception:
+            traceback.print_exc()
 
         # register cardsets
         for obj in found:
@@ -23,6 +23,7 @@
 
 from pysollib.app_stat import GameStat
 from pysollib.settings import VERSION_TUPLE
+from pysollib.statsdb import GamesLog
 
 
 class Statistics:
@@ -39,15 +40,40 @@ class Statistics:
         self.total_balance = {}     # a dictionary of integers
         self.session_balance = {}   # reset per session
         self.gameid_balance = 0     # reset when changing the gameid
+        # a StatisticsDB: the statistics are stored there when a game
+        # ends instead of being pickled on exit
+        self.db = None
 
     def new(self):
         return Statistics()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('db', None)
+        return state
+
+    def setDB(self, db):
+        self.db = db
+        self.games_stats = db.getGameStats()
+        self.prev_games = GamesLog(db)
+        self.all_prev_games = GamesLog(db, all_games=True)
+        self.total_balance = dict(db.getValue('total_balance', []))
+        self.saved = db.getValue('saved', 0)
+
+    # store the things that are not saved per game
+    def saveDB(self):
+        with self.db.conn:
+            self.db._setValue('total_balance',
+                              list(self.total_balance.items()))
+            self.db._setValue('saved', self.saved)
+
     #
     # player & demo statistics
     #
 
     def resetStats(self, player, gameid):
+        if self.db:
+            self.db.resetStats(player, gameid)
         self.__resetPrevGames(player, self.prev_games, gameid)
         self.__resetPrevGames(player, self.session_games, gameid)
         if player not in self.games_stats:
@@ -87,6 +113,15 @@ class Statistics:
                     s.moves_result.average,)
         return (0, 0, 0, 0)
 
+    def getAllFullStats(self, player):
+        # returned {gameid: (won, lost, playing time, moves)} of the
+        # played games
+        if self.db:
+            return self.db.getFullStats(player)
+        return dict([(gameid, self.getFullStats(player, gameid))
+                     for gameid in self.games_stats.get(player, {})
+                     if gameid != 'all'])
+
     def getSessionStats(self, player, gameid):
         games = self.session_games.get(player, [])
         games = [g for g in games if g[0] == gameid]
@@ -105,6 +140,9 @@ class Statistics:
             if player is None:
                 # demo
                 ret = self.updateGameStat(player, game, status)
+                if self.db:
+                    self.db.addGameResult(
+                        player, None, self.__getGameStats(player, game))
             else:
                 # player
                 if player not in self.prev_games:
@@ -114,6 +152,9 @@ class Statistics:
                     self.all_prev_games[player] = []
                 self.all_prev_games[player].append(log)
                 ret = self.updateGameStat(player, game, status)
+                if self.db:
+                    self.db.addGameResult(
+                        player, log, self.__getGameStats(player, game))
         # session log
         if player not in self.session_games:
             self.session_games[player] = []
@@ -137,6 +178,10 @@ class Statistics:
         all_games_stat.update(game, status)
         return game_stat.update(game, status)
 
+    def __getGameStats(self, player, game):
+        stats = self.games_stats[player]
+        return (stats[game.id], stats['all'])
+
 #      def __setstate__(self, state):      # for backward compatible
 #          if 'gameid' not in state:
 #              self.gameid = None
@@ -21,8 +21,13 @@
 #
 # ---------------------------------------------------------------------------##
 
-from pysollib.mfxutil import print_err
+import copy
+import os
+import stat
+
+from pysollib.mfxutil import pickle, print_err, unpickle
 from pysollib.resource import Cardset, CardsetConfig
+from pysollib.settings import VERSION
 
 
 def _perr(line_no, field=None, msg=''):
@@ -160,3 +165,104 @@ def parse_cardset_config(lines_list):
 
     # if cs.type != 1: print cs.type, cs.name
     return cs
+
+
+# ************************************************************************
+# * Cache of the parsed config.txt files, so that startup does not have
+# * to read the config of every installed cardset. An entry is keyed by
+# * the cardset directory and stays valid as long as the modification
+# * time of the directory and the modification time and size of its
+# * config.txt do not change. The cardset-* subdirectories of the search
+# * dirs are cached the same way.
+# ************************************************************************
+
+class CardsetConfigCache:
+    VERSION = 1
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.modified = False
+        self._dirs = {}         # search dir: (mtime, cardset dirs)
+        self._cardsets = {}     # cardset dir: (stamp, config, has_images)
+        self._used = set()
+
+    def listCardsetDirs(self, dirname):
+        mtime = os.stat(dirname).st_mtime
+        self._used.add(dirname)
+        entry = self._dirs.get(dirname)
+        if entry is None or entry[0] != mtime:
+            subdirs = [os.path.join(dirname, subdir)
+                       for subdir in os.listdir(dirname)
+                       if subdir.startswith('cardset-')]
+            subdirs.sort()
+            entry = self._dirs[dirname] = (mtime, subdirs)
+            self.modified = True
+        return entry[1][:]
+
+    # Return None if dirname has no config.txt, else (cardset,
+    # has_images): the cardset (None if the config is invalid) and
+    # whether its default back and shade images exist.
+    def readCardset(self, dirname):
+        filename = os.path.join(dirname, "config.txt")
+        try:
+            st = os.stat(filename)
+        except EnvironmentError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        stamp = (os.stat(dirname).st_mtime, st.st_mtime, st.st_size)
+        self._used.add(dirname)
+        entry = self._cardsets.get(dirname)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            config, has_images = entry[1], entry[2]
+            if config is None:
+                return None, False
+            cs = Cardset()
+            cs.dir = dirname
+            cs.update(copy.deepcopy(config))
+            return cs, has_images
+        self.misses += 1
+        cs = read_cardset_config(dirname, filename)
+        config, has_images = None, False
+        if cs:
+            config = dict([(k, copy.deepcopy(getattr(cs, k)))
+                           for k in CardsetConfig().__dict__])
+            back = cs.backnames[cs.backindex]
+            has_images = (
+                os.path.isfile(os.path.join(dirname, back)) and
+                os.path.isfile(os.path.join(dirname, "shade" + cs.ext)))
+        self._cardsets[dirname] = (stamp, config, has_images)
+        self.modified = True
+        return cs, has_images
+
+    def load(self, filename):
+        if not os.path.exists(filename):
+            return
+        data = unpickle(filename)
+        if not isinstance(data, dict) or \
+                data.get('version') != self.VERSION or \
+                data.get('pysol_version') != VERSION:
+            # the parser may have changed, start afresh
+            return
+        self._dirs = data['dirs']
+        self._cardsets = data['cardsets']
+        self.modified = False
+
+    def save(self, filename):
+        # forget the directories that were not seen in this session
+        if self._used:
+            for d in (self._dirs, self._cardsets):
+                for dirname in list(d):
+                    if dirname not in self._used:
+                        del d[dirname]
+                        self.modified = True
+        if not self.modified:
+            return
+        data = {'version': self.VERSION,
+                'pysol_version': VERSION,
+                'dirs': self._dirs,
+                'cardsets': self._cardsets}
+        pickle(data, filename, protocol=-1)
+        self.modified = False
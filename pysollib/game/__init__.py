@@ -32,10 +32,16 @@ import attr
 from pysol_cards.cards import ms_rearrange
 from pysol_cards.random import random__int2str
 
+from pysollib.game.binsave import BinarySaveReader, BinarySaveWriter
+from pysollib.game.binsave import isBinarySave
 from pysollib.game.dump import pysolDumpGame
+from pysollib.game.journal import J_MOVE, J_REDO, J_UNDO, JF_DEMO, JF_REDO
+from pysollib.game.lookahead import LookaheadSearch
+from pysollib.game.snapshot import MASK64, SnapshotStore, mix64
+from pysollib.game.snapshot import snapshotHash, snapshotStackHash
 from pysollib.gamedb import GI
 from pysollib.help import help_about
-from pysollib.hint import DefaultHint
+from pysollib.hint import Base_Solver_Hint, DefaultHint
 from pysollib.mfxutil import Image, ImageTk, USE_PIL
 from pysollib.mfxutil import Struct, SubclassResponsibility, destruct
 from pysollib.mfxutil import format_time, print_err
@@ -288,6 +294,10 @@ class _alt_unpickler(Unpickler):
         else:
             return super().find_class(module, name)
 
+    def set_random(self, random):
+        # a pickled state carries its own objects
+        pass
+
 
 @attr.s
 class StackGroups(NewStruct):
@@ -530,9 +540,13 @@ class Game(object):
     # the format for a saved game changed (see also canLoadGame())
     GAME_VERSION = 1
 
+    # the demo gives up after this many moves (see playOneDemoMove)
+    DEMO_MAX_MOVES = 2000
+
     # only basic initialization here
     def __init__(self, gameinfo):
         self.preview = 0
+        self.app = None
         self.random = None
         self.gameinfo = gameinfo
         self.id = gameinfo.id
@@ -547,8 +561,9 @@ class Game(object):
         self.stackmap = {}              # dict with (x,y) tuples as key
         self.allstacks = []
         self.sn_groups = []  # snapshot groups; list of list of similar stacks
-        self.snapshots = []
-        self.failed_snapshots = []
+        self.snapshots = self.createSnapshotStore()
+        self.failed_snapshots = self.createSnapshotStore()
+        self.snapshot_hash = None       # see getSnapshot()
         self.stackdesc_list = []
         self.demo_logo = None
         self.pause_logo = None
@@ -558,6 +573,7 @@ class Game(object):
         self.init_size = (0, 0)
         self.center_offset = (0, 0)
         self.event_handled = False      # if click event handled by Stack (???)
+        self.journal = None             # MoveJournal (set by the app)
         self.reset()
 
     # main constructor
@@ -766,8 +782,9 @@ class Game(object):
         self.hints = GameHints()
         self.saveinfo = GameSaveInfo()
         self.loadinfo = GameLoadInfo()
-        self.snapshots = []
-        self.failed_snapshots = []
+        self.snapshots = self.createSnapshotStore()
+        self.failed_snapshots = self.createSnapshotStore()
+        self.resetSnapshotHash()
         # local statistics are reset on each game restart
         self.stats = GameStatsStruct()
         self.startMoves()
@@ -854,6 +871,7 @@ class Game(object):
         self.updateStatus(moves=(0, 0))
         self.updateMenus()
         self.stopSamples()
+        self.startJournal()
         if autoplay:
             self.autoPlay()
             self.stats.player_moves = 0
@@ -881,7 +899,7 @@ class Game(object):
         self.gsaveinfo = game.gsaveinfo
         self.s.talon.round = game.loadinfo.talon_round
         self.finished = game.finished
-        self.snapshots = game.snapshots
+        self.snapshots = self.createSnapshotStore(game.snapshots)
         # 3) move cards to stacks
         assert len(self.allstacks) == len(game.loadinfo.stacks)
         old_state = game.moves.state
@@ -896,6 +914,7 @@ class Game(object):
                     card.showBack()
                 self.allstacks[i].addCard(card)
         game.moves.state = old_state
+        self.resetSnapshotHash()
         # 4) update settings
         for stack_id, cap in self.saveinfo.stack_caps:
             # print stack_id, cap
@@ -917,6 +936,7 @@ class Game(object):
         self.setCursor(cursor=self.app.top_cursor)
         self.stats.update_time = time.time()
         self.busy = old_busy
+        self.startJournal()
         # wait for canvas is mapped
         after(self.top, 200, self._configureHandler)
         if TOOLKIT == 'gtk':
@@ -929,7 +949,7 @@ class Game(object):
     def restoreGameFromBookmark(self, bookmark):
         old_busy, self.busy = self.busy, 1
         file = BytesIO(bookmark)
-        p = _alt_unpickler(file)
+        p = self._createUndumper(file)
         game = self._undumpGame(p, self.app)
         assert game.id == self.id
         self.restoreGame(game, reset=0)
@@ -939,6 +959,7 @@ class Game(object):
     def resetGame(self):
         self.hints.list = None
         self.s.talon.removeAllCards()
+        self.resetSnapshotHash()
         for stack in self.allstacks:
             stack.resetGame()
             if TOOLKIT == 'gtk':
@@ -969,7 +990,7 @@ class Game(object):
         if bookmark:
             id, random = self.id, self.random
             f = BytesIO()
-            self._dumpGame(Pickler(f, 1), bookmark=1)
+            self._dumpGame(self._createDumper(f, 1), bookmark=1)
             self.app.nextgame.bookmark = f.getvalue()
         if id > 0:
             self.setCursor(cursor=CURSOR_WATCH)
@@ -1135,22 +1156,34 @@ class Game(object):
     def leaveState(self, old_state):
         self.moves.state = old_state
 
-    def getSnapshotHash(self):
-        # generate hash (unique string) of current move
-        sn = []
-        for stack in self.allstacks:
-            s = []
-            for card in stack.cards:
-                s.append('%d%03d%d' % (card.suit, card.rank, card.face_up))
-            sn.append(''.join(s))
-        sn = '-'.join(sn)
-        return sn
+    def getSnapshotState(self):
+        # subclass hook: extra game variables (hashable, preferably ints)
+        # that must be taken into account when comparing positions
+        return None
 
     def getSnapshot(self):
-        # optimisation
-        sn = hash(self.getSnapshotHash())
+        # the card part of the hash is kept up to date by the atomic
+        # moves (see updateSnapshotHash); only rebuild it after a reset
+        sn = self.snapshot_hash
+        if sn is None:
+            sn = self.snapshot_hash = snapshotHash(self.allstacks)
+        state = self.getSnapshotState()
+        if state is not None:
+            sn ^= mix64(hash(state) & MASK64)
         return sn
 
+    def updateSnapshotHash(self, stack, start=0):
+        # xor the keys of stack.cards[start:] into the position hash;
+        # called by the atomic moves before and after touching the cards,
+        # the cards added by Stack.addCard()/insertCard() are hashed there
+        if self.snapshot_hash is not None:
+            self.snapshot_hash ^= snapshotStackHash(
+                stack.id, stack.cards, start)
+
+    def resetSnapshotHash(self):
+        # cards were moved without an atomic move
+        self.snapshot_hash = None
+
     def createSnGroups(self):
         # group stacks by class and cap
         sg = {}
@@ -1167,14 +1200,16 @@ class Game(object):
         sg = list(sg.values())
         self.sn_groups = sg
 
+    def createSnapshotStore(self, snapshots=()):
+        max_size, eviction = 0, SnapshotStore.EVICT_OLDEST
+        if self.app:
+            max_size = self.app.opt.snapshots_max
+            eviction = self.app.opt.snapshots_eviction
+        return SnapshotStore(snapshots, max_size, eviction)
+
     def updateSnapshots(self):
         sn = self.getSnapshot()
-        if sn in self.snapshots:
-            # self.updateStatus(snapshot=True)
-            pass
-        else:
-            self.snapshots.append(sn)
-            # self.updateStatus(snapshot=False)
+        self.snapshots.add(sn)
 
     # Create all cards for the game.
     def createCards(self, progress=None):
@@ -1222,6 +1257,7 @@ class Game(object):
         for card in cards:
             self.s.talon.addCard(card, update=0)
             card.showBack(unhide=0)
+        self.resetSnapshotHash()
 
     # shuffle cards, but keep decks together
     def shuffleSeparateDecks(self):
@@ -1237,6 +1273,7 @@ class Game(object):
         for card in cards:
             self.s.talon.addCard(card, update=0)
             card.showBack(unhide=0)
+        self.resetSnapshotHash()
 
     # subclass overrideable (must use self.random)
     def _shuffleHook(self, cards):
@@ -2501,7 +2538,18 @@ class Game(object):
         if hint_class is None:
             return None
         hint = hint_class(self, level)      # call constructor
-        return hint.getHints(taken_hint)    # and return all hints
+        hints = hint.getHints(taken_hint)   # and return all hints
+        if level == 2 and hints and self.app.opt.demo_lookahead and \
+                not (taken_hint and taken_hint[6]) and \
+                hint_class.LOOKAHEAD and \
+                not issubclass(hint_class, Base_Solver_Hint):
+            # let the demo look a few moves ahead
+            search = LookaheadSearch(
+                self, hint_class,
+                time_budget=self.app.opt.demo_lookahead_time,
+                max_depth=self.app.opt.demo_lookahead_depth)
+            hints = search.sortHints(hints)
+        return hints
 
     # give a hint
     def showHint(self, level=0, sleep=1.5, taken_hint=None):
@@ -2614,7 +2662,7 @@ class Game(object):
             mixed=mixed,
             sleep=self.app.opt.timeouts['demo'],
             last_deal=[],
-            snapshots=[],
+            snapshots=self.createSnapshotStore(),
             hint=None,
             keypress=None,
             start_demo_moves=self.stats.demo_moves,
@@ -2755,7 +2803,7 @@ class Game(object):
 
     # play one demo move while in the demo event
     def playOneDemoMove(self, demo):
-        if self.moves.index > 2000:
+        if self.moves.index > self.DEMO_MAX_MOVES:
             # we're probably looping because of some bug in the hint code
             return 1
         sleep = demo.sleep
@@ -2786,10 +2834,9 @@ class Game(object):
             else:                       # new version, based on snapshots
                 # check snapshot
                 sn = self.getSnapshot()
-                if sn in demo.snapshots:
+                if not demo.snapshots.add(sn):
                     # not unique
                     return 1
-                demo.snapshots.append(sn)
         elif from_stack == to_stack:
             # a flip-move
             from_stack.flipMove(animation=True)
@@ -2881,16 +2928,13 @@ class Game(object):
     def getStuck(self):
         h = self.Stuck_Class.getHints(None)
         if h:
-            self.failed_snapshots = []
+            self.failed_snapshots.clear()
             return True
         if not self.canDealCards():
             return False
         # can deal cards: do we have any hints in previous deals ?
         sn = self.getSnapshot()
-        if sn in self.failed_snapshots:
-            return False
-        self.failed_snapshots.append(sn)
-        return True
+        return self.failed_snapshots.add(sn)
 
     def updateStuck(self):
         # stuck
@@ -3108,6 +3152,8 @@ class Game(object):
         if not undo:
             self.updateStuck()
         reset_solver_dialog()
+        if self.journal:
+            self.journal.addMove(self, moves.index - 1, current, redo)
 
         return 1
 
@@ -3130,8 +3176,10 @@ class Game(object):
         self.updateStatus(moves=(self.moves.index, self.stats.total_moves))
         self.updateMenus()
         self.updateStatus(stuck='')
-        self.failed_snapshots = []
+        self.failed_snapshots.clear()
         reset_solver_dialog()
+        if self.journal:
+            self.journal.addUndo(self, self.moves.index + 1)
 
     def redo(self):
         assert self.canRedo()
@@ -3154,6 +3202,83 @@ class Game(object):
         self.updateMenus()
         self.updateStuck()
         reset_solver_dialog()
+        if self.journal:
+            self.journal.addRedo(self, self.moves.index - 1)
+
+    #
+    # move journal (crash recovery)
+    #
+
+    def startJournal(self):
+        if self.journal and not self.preview:
+            self.journal.start(self)
+
+    # play the records of a MoveJournal on the restored base game
+    def replayJournal(self, records):
+        moves, stats = self.moves, self.stats
+        journal, self.journal = self.journal, None
+        old_busy, self.busy = self.busy, 1
+        try:
+            for r in records:
+                kind, index = r[:2]
+                if index != moves.index:
+                    break
+                if kind == J_MOVE:
+                    current, flags = r[2], r[3]
+                    if flags & JF_REDO:
+                        if index >= len(moves.history):
+                            break
+                        moves.history[index] = current
+                    else:
+                        moves.history[index:] = [current]
+                    self._replayJournalMoves(current, self.S_REDO)
+                    moves.index += 1
+                    if flags & JF_DEMO:
+                        stats.demo_moves += 1
+                        if index == 0:
+                            stats.player_moves = 0
+                    else:
+                        stats.player_moves += 1
+                        if index == 0:
+                            stats.demo_moves = 0
+                elif kind == J_UNDO:
+                    if index == 0:
+                        break
+                    moves.index -= 1
+                    self._replayJournalMoves(
+                        reversed(moves.history[moves.index]), self.S_UNDO)
+                    stats.undo_moves += 1
+                elif kind == J_REDO:
+                    if index >= len(moves.history):
+                        break
+                    self._replayJournalMoves(moves.history[index],
+                                             self.S_REDO)
+                    moves.index += 1
+                    stats.redo_moves += 1
+                else:
+                    break
+                stats.total_moves += 1
+                self.updateSnapshots()
+        finally:
+            self.journal = journal
+            self.busy = old_busy
+        self.hints.list = None
+        for stack in self.allstacks:
+            stack.updateText()
+        self.updateText()
+        self.updateStatus(moves=(moves.index, stats.total_moves))
+        self.updateMenus()
+        # a new base
+        self.startJournal()
+
+    def _replayJournalMoves(self, atomic_moves, state):
+        self.moves.state = state
+        for atomic_move in atomic_moves:
+            if state == self.S_UNDO:
+                atomic_move.undo(self)
+            else:
+                atomic_move.redo(self)
+        self.moves.state = self.S_PLAY
 
     #
     # subclass hooks
@@ -3184,7 +3309,7 @@ class Game(object):
                 return 0
         f = BytesIO()
         try:
-            self._dumpGame(Pickler(f, 1), bookmark=2)
+            self._dumpGame(self._createDumper(f, 1), bookmark=2)
             bm = (f.getvalue(), self.moves.index)
         except Exception:
             pass
@@ -3208,7 +3333,7 @@ class Game(object):
             s, moves_index = bm
             self.setCursor(cursor=CURSOR_WATCH)
             file = BytesIO(s)
-            p = _alt_unpickler(file)
+            p = self._createUndumper(file)
             game = self._undumpGame(p, self.app)
             assert game.id == self.id
             # save state for undoGotoBookmark
@@ -3300,7 +3425,7 @@ class Game(object):
     def _loadGame(self, filename, app):
         game = None
         with open(filename, "rb") as f:
-            game = self._undumpGame(_alt_unpickler(f), app)
+            game = self._undumpGame(self._createUndumper(f), app)
             game.gstats.loaded += 1
 
         return game
@@ -3361,6 +3486,7 @@ class Game(object):
         #
         initial_seed = random__int2str(pload(int))
         game.random = construct_random(initial_seed)
+        p.set_random(game.random)
         state = pload()
         if (game.random is not None and
                 not isinstance(game.random, random2.Random) and
@@ -3389,11 +3515,19 @@ class Game(object):
             saveinfo = pload(GameSaveInfo)
             game.saveinfo.__dict__.update(saveinfo.__dict__)
             gsaveinfo = pload(GameGlobalSaveInfo)
+            if isinstance(p, BinarySaveReader):
+                # no pickled bookmarks in a binary save
+                bookmarks = gsaveinfo.bookmarks
+                for n, bm in list(bookmarks.items()):
+                    if not (isinstance(bm, tuple) and len(bm) == 2 and
+                            isinstance(bm[0], bytes) and
+                            isBinarySave(BytesIO(bm[0]))):
+                        del bookmarks[n]
             game.gsaveinfo.__dict__.update(gsaveinfo.__dict__)
         moves = pload(GameMoves)
         game.moves.__dict__.update(moves.__dict__)
         snapshots = pload(list)
-        game.snapshots = snapshots
+        game.snapshots = game.createSnapshotStore(snapshots)
         if 0 <= bookmark <= 1:
             gstats = pload(GameGlobalStatsStruct)
             game.gstats.__dict__.update(gstats.__dict__)
@@ -3413,11 +3547,22 @@ class Game(object):
     def _saveGame(self, filename, protocol=-1):
         if self.canSaveGame():
             with open(filename, "wb") as f:
-                self._dumpGame(Pickler(f, protocol))
+                self._dumpGame(self._createDumper(f, protocol))
 
     def _dumpGame(self, p, bookmark=0):
         return pysolDumpGame(self, p, bookmark)
 
+    def _createDumper(self, f, protocol=-1):
+        if self.app and not self.app.opt.binary_saves:
+            return Pickler(f, protocol)
+        return BinarySaveWriter(f)
+
+    def _createUndumper(self, f):
+        # old games and bookmarks are pickled
+        if isBinarySave(f):
+            return BinarySaveReader(f)
+        return _alt_unpickler(f)
+
     def startPlayTimer(self):
         self.updateStatus(time=None)
         self.stopPlayTimer()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import struct
+from io import BytesIO
+from pickle import UnpicklingError
+
+from pysollib.mfxutil import Struct
+from pysollib.move import AFlipAllMove
+from pysollib.move import AFlipAndMoveMove
+from pysollib.move import AFlipMove
+from pysollib.move import AInnerMove
+from pysollib.move import AMoveMove
+from pysollib.move import ANextRoundMove
+from pysollib.move import ASaveSeedMove
+from pysollib.move import ASaveStateMove
+from pysollib.move import AShuffleStackMove
+from pysollib.move import ASingleCardMove
+from pysollib.move import ASingleFlipMove
+from pysollib.move import ATurnStackMove
+from pysollib.move import AUpdateStackMove
+from pysollib.move import NEW_ATurnStackMove
+
+# ************************************************************************
+# * Binary save games
+# *
+# * A drop-in replacement for Pickler/Unpickler in pysolDumpGame() and
+# * Game._undumpGame(): every p.dump(value) writes one tagged value and
+# * p.load() reads it back, so the layout of a save is still defined by
+# * pysolDumpGame() alone.
+# *
+# * The file starts with BINSAVE_MAGIC and a 16-bit format version.
+# * Each value starts with a tag byte:
+# *   0x00-0x7f  the integer 0..127 itself (card ids, face_up, ...)
+# *   T_INT      a zigzag varint
+# *   T_MOVE     a move type byte and five int16 fields (12 bytes in
+# *              all), followed by the state of the moves that save one
+# *   T_MOVES    a list of moves without a state, stored as a count and
+# *              the 11 byte records
+# *   T_UINTS    a list of non-negative ints, stored as a count and
+# *              a block of varints (one byte for a card id)
+# *   T_UINT64S  a list of 64-bit ints, only written by dumpUInt64s()
+# *              for the snapshot hashes
+# *   T_STRUCT   a class number and the dict of the attributes
+# * Only the types listed here can be loaded, so unlike pickle a damaged
+# * or malicious file cannot run any code.
+# ************************************************************************
+
+BINSAVE_MAGIC = b'PySolSav'
+# 2: T_UINTS
+BINSAVE_VERSION = 2
+
+T_NONE = 0x80
+T_FALSE = 0x81
+T_TRUE = 0x82
+T_INT = 0x83
+T_FLOAT = 0x84
+T_STR = 0x85
+T_BYTES = 0x86
+T_TUPLE = 0x87
+T_LIST = 0x88
+T_DICT = 0x89
+T_STRUCT = 0x8a
+T_MOVE = 0x8b
+# the seed method of the game random (MTRandom.getstate() returns it)
+T_SEED = 0x8c
+# a list of moves without state, as a block of records
+T_MOVES = 0x8d
+# a list of unsigned 64-bit ints (the snapshots)
+T_UINT64S = 0x8e
+# a list of non-negative ints, as a block of varints
+T_UINTS = 0x8f
+
+# limits for damaged files
+MAX_LENGTH = 1 << 24
+MAX_INT_BYTES = 256
+MAX_DEPTH = 32
+
+_HEADER = struct.Struct('<8sH')
+_MOVE = struct.Struct('<B5h')
+_FLOAT = struct.Struct('<d')
+_UINT64 = struct.Struct('<Q')
+
+# (class, int16 fields, value fields); the move type is the index + 1,
+# so only append to this list
+MOVE_TYPES = (
+    (AMoveMove,
+     ('ncards', 'from_stack_id', 'to_stack_id', 'frames', 'shadow'), ()),
+    (AFlipMove, ('stack_id',), ()),
+    (ASingleFlipMove, ('stack_id',), ()),
+    (AFlipAndMoveMove, ('from_stack_id', 'to_stack_id', 'frames'), ()),
+    (AFlipAllMove, ('stack_id',), ()),
+    (ATurnStackMove, ('from_stack_id', 'to_stack_id'), ()),
+    (NEW_ATurnStackMove,
+     ('from_stack_id', 'to_stack_id', 'update_flags'), ()),
+    (AUpdateStackMove, ('stack_id', 'flags'), ()),
+    (ANextRoundMove, ('stack_id',), ()),
+    (ASaveSeedMove, (), ('state',)),
+    (ASaveStateMove, ('flags',), ('state',)),
+    (AShuffleStackMove, ('stack_id',), ('card_ids', 'state')),
+    (ASingleCardMove,
+     ('from_stack_id', 'to_stack_id', 'from_pos', 'frames', 'shadow'), ()),
+    (AInnerMove, ('stack_id', 'from_pos', 'to_pos'), ()),
+)
+
+_MOVE_CODES = dict([(t[0], i + 1) for i, t in enumerate(MOVE_TYPES)])
+_PLAIN_MOVES = frozenset([t[0] for t in MOVE_TYPES if not t[2]])
+
+_struct_classes = None
+
+
+def _getStructClasses():
+    # the class number is the index, so only append to this list
+    global _struct_classes
+    if _struct_classes is None:
+        # pysollib.game imports this module
+        from pysollib.game import GameGlobalSaveInfo, GameMoves
+        from pysollib.game import GameGlobalStatsStruct, GameStatsStruct
+        from pysollib.game import GameSaveInfo
+        _struct_classes = (Struct, GameMoves, GameSaveInfo,
+                           GameGlobalSaveInfo, GameStatsStruct,
+                           GameGlobalStatsStruct)
+    return _struct_classes
+
+
+def _appendUInt(buf, n):
+    while n > 0x7f:
+        buf.append((n & 0x7f) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def isBinarySave(f):
+    pos = f.tell()
+    magic = f.read(len(BINSAVE_MAGIC))
+    f.seek(pos)
+    return magic == BINSAVE_MAGIC
+
+
+# ************************************************************************
+# * Writer
+# ************************************************************************
+
+class BinarySaveWriter(object):
+    # header=False appends to an existing stream
+    def __init__(self, file, header=True):
+        self.file = file
+        self.write = file.write
+        if header:
+            self.write(_HEADER.pack(BINSAVE_MAGIC, BINSAVE_VERSION))
+
+    def dump(self, obj):
+        self._dump(obj)
+
+    # the snapshot hashes are random 64-bit ints, 8 bytes is the best
+    # we can do for them; see pysolDumpGame()
+    def dumpUInt64s(self, items):
+        self.write(bytes((T_UINT64S,)))
+        self._dumpUInt(len(items))
+        self.write(struct.pack('<%dQ' % len(items), *items))
+
+    def _dumpUInt(self, n):
+        buf = bytearray()
+        _appendUInt(buf, n)
+        self.write(bytes(buf))
+
+    def _dumpItems(self, tag, items):
+        self.write(bytes((tag,)))
+        self._dumpUInt(len(items))
+        for item in items:
+            self._dump(item)
+
+    def _dump(self, obj):
+        write = self.write
+        t = type(obj)
+        if t is int:
+            if 0 <= obj <= 0x7f:
+                write(bytes((obj,)))
+            else:
+                write(bytes((T_INT,)))
+                self._dumpUInt(obj * 2 if obj >= 0 else -obj * 2 - 1)
+        elif obj is None:
+            write(bytes((T_NONE,)))
+        elif t is bool:
+            write(bytes((obj and T_TRUE or T_FALSE,)))
+        elif t is float:
+            write(bytes((T_FLOAT,)) + _FLOAT.pack(obj))
+        elif t is str:
+            data = obj.encode('utf-8')
+            write(bytes((T_STR,)))
+            self._dumpUInt(len(data))
+            write(data)
+        elif t is bytes:
+            write(bytes((T_BYTES,)))
+            self._dumpUInt(len(obj))
+            write(obj)
+        elif t is tuple:
+            self._dumpItems(T_TUPLE, obj)
+        elif t is list:
+            if obj and all([type(x) in _PLAIN_MOVES for x in obj]):
+                self._dumpMoves(obj)
+            elif len(obj) > 1 and all([type(x) is int and x >= 0
+                                       for x in obj]):
+                buf = bytearray((T_UINTS,))
+                _appendUInt(buf, len(obj))
+                for x in obj:
+                    _appendUInt(buf, x)
+                write(bytes(buf))
+            else:
+                self._dumpItems(T_LIST, obj)
+        elif t is dict:
+            write(bytes((T_DICT,)))
+            self._dumpUInt(len(obj))
+            for key, value in obj.items():
+                self._dump(key)
+                self._dump(value)
+        elif t in _MOVE_CODES:
+            self._dumpMove(obj)
+        elif t in _getStructClasses():
+            write(bytes((T_STRUCT, _getStructClasses().index(t))))
+            d = obj.__dict__
+            if isinstance(d.get('bookmarks'), dict):
+                d = dict(d, bookmarks=_convertBookmarks(d['bookmarks']))
+            self._dump(d)
+        elif (getattr(obj, '__name__', None) == 'seed' and
+              hasattr(obj, '__self__')):
+            write(bytes((T_SEED,)))
+        else:
+            raise TypeError('cannot save %s object' % t.__name__)
+
+    def _dumpMove(self, am):
+        code = _MOVE_CODES[type(am)]
+        cls, fields, values = MOVE_TYPES[code - 1]
+        args = [getattr(am, f) for f in fields]
+        args += [0] * (5 - len(args))
+        self.write(bytes((T_MOVE,)) + _MOVE.pack(code, *args))
+        for v in values:
+            self._dump(getattr(am, v))
+
+    def _dumpMoves(self, moves):
+        records = []
+        for am in moves:
+            code = _MOVE_CODES[type(am)]
+            fields = MOVE_TYPES[code - 1][1]
+            args = [getattr(am, f) for f in fields]
+            args += [0] * (5 - len(args))
+            records.append(_MOVE.pack(code, *args))
+        self.write(bytes((T_MOVES,)))
+        self._dumpUInt(len(moves))
+        self.write(b''.join(records))
+
+
+# ************************************************************************
+# * Reader
+# ************************************************************************
+
+class BinarySaveReader(object):
+    # the file is read in chunks of this size
+    BUFSIZE = 65536
+
+    def __init__(self, file):
+        self.file = file
+        self.random = None
+        self._buf = b''
+        self._pos = 0
+        magic, version = _HEADER.unpack(self._read(_HEADER.size))
+        if magic != BINSAVE_MAGIC:
+            raise UnpicklingError('not a binary save file')
+        if version > BINSAVE_VERSION:
+            raise UnpicklingError(
+                'unsupported save file version %d' % version)
+        self.version = version
+
+    # same interface as _alt_unpickler
+    def set_version(self, version_tuple):
+        pass
+
+    # the game random, for T_SEED
+    def set_random(self, random):
+        self.random = random
+
+    def load(self):
+        return self._load(0)
+
+    def _fill(self, n):
+        buf = self._buf[self._pos:]
+        while len(buf) < n:
+            data = self.file.read(max(n - len(buf), self.BUFSIZE))
+            if not data:
+                raise UnpicklingError('unexpected end of file')
+            buf += data
+        self._buf, self._pos = buf, 0
+
+    def _read(self, n):
+        if self._pos + n > len(self._buf):
+            self._fill(n)
+        pos = self._pos
+        self._pos = pos + n
+        return self._buf[pos:pos + n]
+
+    def _readByte(self):
+        try:
+            b = self._buf[self._pos]
+        except IndexError:
+            self._fill(1)
+            b = self._buf[0]
+        self._pos += 1
+        return b
+
+    def _loadUInt(self):
+        n, shift = 0, 0
+        for i in range(MAX_INT_BYTES):
+            b = self._readByte()
+            n |= (b & 0x7f) << shift
+            if b < 0x80:
+                return n
+            shift += 7
+        raise UnpicklingError('integer too long')
+
+    def _loadLength(self):
+        n = self._loadUInt()
+        if n > MAX_LENGTH:
+            raise UnpicklingError('invalid length %d' % n)
+        return n
+
+    def _load(self, depth):
+        tag = self._readByte()
+        if tag <= 0x7f:
+            return tag
+        if tag == T_INT:
+            n = self._loadUInt()
+            return -((n + 1) >> 1) if n & 1 else n >> 1
+        if depth > MAX_DEPTH:
+            raise UnpicklingError('data nested too deep')
+        if tag == T_TUPLE:
+            load = self._load
+            return tuple([load(depth + 1)
+                          for i in range(self._loadLength())])
+        if tag == T_LIST:
+            load = self._load
+            return [load(depth + 1) for i in range(self._loadLength())]
+        if tag == T_MOVES:
+            return self._loadMoves()
+        if tag == T_UINTS:
+            load = self._loadUInt
+            return [load() for i in range(self._loadLength())]
+        if tag == T_UINT64S:
+            n = self._loadLength()
+            return list(struct.unpack('<%dQ' % n, self._read(n * 8)))
+        if tag == T_MOVE:
+            return self._loadMove(depth)
+        if tag == T_NONE:
+            return None
+        if tag == T_FALSE:
+            return False
+        if tag == T_TRUE:
+            return True
+        if tag == T_FLOAT:
+            return _FLOAT.unpack(self._read(_FLOAT.size))[0]
+        if tag == T_STR:
+            try:
+                return self._read(self._loadLength()).decode('utf-8')
+            except UnicodeDecodeError as ex:
+                raise UnpicklingError(str(ex))
+        if tag == T_BYTES:
+            return self._read(self._loadLength())
+        if tag == T_DICT:
+            d = {}
+            for i in range(self._loadLength()):
+                key = self._load(depth + 1)
+                try:
+                    d[key] = self._load(depth + 1)
+                except TypeError:
+                    raise UnpicklingError('invalid dict key')
+            return d
+        if tag == T_STRUCT:
+            return self._loadStruct(depth)
+        if tag == T_SEED:
+            if self.random is None:
+                raise UnpicklingError('no random for the seed state')
+            return self.random.seed
+        raise UnpicklingError('invalid tag 0x%02x' % tag)
+
+    def _newMove(self, args):
+        code = args[0]
+        if not 1 <= code <= len(MOVE_TYPES):
+            raise UnpicklingError('invalid move type %d' % code)
+        cls, fields, values = MOVE_TYPES[code - 1]
+        am = cls.__new__(cls)
+        am.__dict__.update(zip(fields, args[1:]))
+        return am, values
+
+    def _loadMove(self, depth):
+        am, values = self._newMove(_MOVE.unpack(self._read(_MOVE.size)))
+        d = am.__dict__
+        for v in values:
+            d[v] = self._load(depth + 1)
+        return am
+
+    def _loadMoves(self):
+        n = self._loadLength()
+        moves = []
+        for args in _MOVE.iter_unpack(self._read(n * _MOVE.size)):
+            am, values = self._newMove(args)
+            if values:
+                raise UnpicklingError('invalid move list')
+            moves.append(am)
+        return moves
+
+    def _loadStruct(self, depth):
+        classes = _getStructClasses()
+        code = self._read(1)[0]
+        if code >= len(classes):
+            raise UnpicklingError('invalid struct type %d' % code)
+        d = self._load(depth + 1)
+        if not isinstance(d, dict) or not all(
+                [isinstance(k, str) for k in d]):
+            raise UnpicklingError('invalid struct')
+        obj = classes[code]()
+        obj.__dict__.update(d)
+        return obj
+
+
+# ************************************************************************
+# * Convert a pickled save (a .pso file or a bookmark) to the binary
+# * format. The values are copied one by one up to the final "EOF";
+# * BinarySaveWriter converts the bookmarks in the gsaveinfo.
+# ************************************************************************
+
+def convertSave(src, dst):
+    from pysollib.game import _alt_unpickler, GameMoves
+    p = _alt_unpickler(src)
+    w = BinarySaveWriter(dst)
+    i = 0
+    prev = None
+    while True:
+        obj = p.load()
+        if i == 2:
+            p.set_version(obj)
+        i += 1
+        # the snapshots follow the moves, see pysolDumpGame()
+        if type(prev) is GameMoves and type(obj) is list:
+            w.dumpUInt64s(obj)
+        else:
+            w.dump(obj)
+        prev = obj
+        if obj == "EOF":
+            return i
+
+
+def _convertBookmarks(bookmarks):
+    d = {}
+    for n, (s, moves_index) in bookmarks.items():
+        if not isBinarySave(BytesIO(s)):
+            f = BytesIO()
+            convertSave(BytesIO(s), f)
+            s = f.getvalue()
+        d[n] = (s, moves_index)
+    return d
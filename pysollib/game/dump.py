@@ -46,7 +46,8 @@ def pysolDumpGame(game_, p, bookmark=0):
         p.dump(game_.saveinfo)
         p.dump(game_.gsaveinfo)
     p.dump(game_.moves)
-    p.dump(game_.snapshots)
+    # a BinarySaveWriter stores the hashes as 64-bit ints
+    getattr(p, 'dumpUInt64s', p.dump)(game_.snapshots.tolist())
     if 0 <= bookmark <= 1:
         if bookmark == 0:
             game_.gstats.saved += 1
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import os
+from io import BytesIO
+from pickle import UnpicklingError
+
+from pysollib.game.binsave import BinarySaveReader, BinarySaveWriter
+from pysollib.mfxutil import print_err
+from pysollib.move import AtomicMove
+
+# ************************************************************************
+# * Move journal (crash recovery)
+# *
+# * The journal is a binary save stream (see binsave.py) that starts with
+# * a full dump of the game (the base) and then gets one small record
+# * appended for every finished move, undo and redo:
+# *   (J_MOVE, index, moves, flags)    moves.history[index:] = [moves]
+# *   (J_UNDO, index)
+# *   (J_REDO, index)
+# * index is moves.index before the move. Every compact_moves records the
+# * journal is rewritten with the current game as the new base.
+# *
+# * The file is removed when the game ends normally, so a journal found
+# * at startup belongs to a session that crashed.
+# ************************************************************************
+
+JOURNAL_MAGIC = 'PySolJournal'
+JOURNAL_VERSION = 1
+
+J_MOVE = 0
+J_UNDO = 1
+J_REDO = 2
+
+# J_MOVE flags
+JF_DEMO = 1         # a move of the demo
+JF_REDO = 2         # replaces moves.history[index] (see finishMove)
+
+
+class MoveJournal(object):
+    def __init__(self, filename, compact_moves=100):
+        self.filename = filename
+        self.compact_moves = compact_moves
+        self.file = None
+        self.writer = None
+        self.records = 0
+
+    # write a new journal with the current state of the game as the base
+    def start(self, game):
+        self._close()
+        if not game.canSaveGame():
+            self._remove()
+            return
+        try:
+            base = BytesIO()
+            game._dumpGame(BinarySaveWriter(base), bookmark=1)
+            tmp = self.filename + '.tmp'
+            with open(tmp, 'wb') as f:
+                w = BinarySaveWriter(f)
+                w.dump(JOURNAL_MAGIC)
+                w.dump(JOURNAL_VERSION)
+                w.dump(base.getvalue())
+            os.replace(tmp, self.filename)
+            self.file = open(self.filename, 'ab')
+            self.writer = BinarySaveWriter(self.file, header=False)
+            self.records = 0
+        except EnvironmentError as ex:
+            print_err('cannot write the move journal: %s' % ex)
+            self._close()
+
+    # the game ended normally
+    def stop(self):
+        self._close()
+        self._remove()
+
+    def addMove(self, game, index, moves, redo=False):
+        flags = (game.demo and JF_DEMO or 0) | (redo and JF_REDO or 0)
+        self._add(game, (J_MOVE, index, moves, flags))
+
+    def addUndo(self, game, index):
+        self._add(game, (J_UNDO, index))
+
+    def addRedo(self, game, index):
+        self._add(game, (J_REDO, index))
+
+    def _add(self, game, record):
+        if self.file is None:
+            return
+        try:
+            self.writer.dump(record)
+            self.file.flush()
+        except EnvironmentError as ex:
+            print_err('cannot write the move journal: %s' % ex)
+            self._close()
+            return
+        self.records += 1
+        if self.compact_moves and self.records >= self.compact_moves:
+            self.start(game)
+
+    def _close(self):
+        if self.file is not None:
+            try:
+                self.file.close()
+            except EnvironmentError:
+                pass
+        self.file = self.writer = None
+
+    def _remove(self):
+        try:
+            os.remove(self.filename)
+        except EnvironmentError:
+            pass
+
+
+# return (base, records) of the journal in filename, or None; a record
+# cut off by the crash is ignored
+def loadJournal(filename):
+    if not os.path.exists(filename):
+        return None
+    try:
+        with open(filename, 'rb') as f:
+            p = BinarySaveReader(f)
+            if p.load() != JOURNAL_MAGIC or p.load() != JOURNAL_VERSION:
+                return None
+            base = p.load()
+            if not isinstance(base, bytes):
+                return None
+            records = []
+            while True:
+                try:
+                    r = p.load()
+                except UnpicklingError:
+                    break
+                if not _validRecord(r):
+                    break
+                records.append(r)
+    except (EnvironmentError, UnpicklingError) as ex:
+        print_err('cannot read the move journal: %s' % ex)
+        return None
+    return base, records
+
+
+def _validRecord(r):
+    if not isinstance(r, tuple) or len(r) < 2:
+        return False
+    kind, index = r[:2]
+    if not isinstance(index, int) or index < 0:
+        return False
+    if kind == J_MOVE:
+        return (len(r) == 4 and isinstance(r[2], list) and
+                len(r[2]) > 0 and
+                all([isinstance(am, AtomicMove) for am in r[2]]))
+    return kind in (J_UNDO, J_REDO) and len(r) == 2
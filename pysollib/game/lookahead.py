@@ -0,0 +1,204 @@
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import time
+
+from pysollib.game.snapshot import snapshotCardKey, snapshotHash
+
+# ************************************************************************
+# * Lookahead search for the demo
+# *
+# * The hint class of the game only scores the moves of the current
+# * position, so the demo happily walks into dead ends. LookaheadSearch
+# * plays the best few hints of every position on the model (see
+# * Stack.makeCards(); nothing is drawn and no move is recorded),
+# * deepening the search one move at a time until the time budget is
+# * used up, and then puts the hint with the best outcome first.
+# *
+# * Positions are keyed by their Zobrist hash (see game/snapshot.py) in
+# * a transposition table. Flips and deals are not played: what a
+# * face-down card or the Talon holds is unknown, so the search stops
+# * there and scores the position.
+# ************************************************************************
+
+
+class _Timeout(Exception):
+    pass
+
+
+class LookaheadSearch:
+    SCORE_WON = 1000000
+    SCORE_FOUNDATION = 100      # for every card on the Foundations
+    SCORE_EMPTY_ROW = 20
+    SCORE_CAN_FLIP = 10         # a face-down card can be turned up
+    SCORE_FACE_DOWN = -5        # for every face-down card on the rows
+    SCORE_DEAD_END = -10000     # no move, no flip, no deal
+
+    def __init__(self, game, hint_class, time_budget=0.5, max_depth=8,
+                 beam_width=4):
+        self.game = game
+        self.hint_class = hint_class
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.beam_width = beam_width
+        # statistics of the last search
+        self.depth = 0
+        self.nodes = 0
+        self.tt_hits = 0
+        self._tt = {}
+        self._path = set()
+        self._cycles = 0
+        self._deadline = 0
+
+    # Return hints (as returned by AbstractHint.getHints()) with the
+    # hint leading to the best position within the search horizon
+    # first. On equal outcome the order of the hint class is kept.
+    def sortHints(self, hints):
+        moves = self._getMoves(hints, 0)
+        if len(moves) < 2:
+            return hints
+        best = self.search(moves)
+        if best is None or best is hints[0]:
+            return hints
+        return [best] + [h for h in hints if h is not best]
+
+    def search(self, moves):
+        self.depth = self.nodes = self.tt_hits = 0
+        self._tt = {}
+        self._deadline = time.time() + self.time_budget
+        h = snapshotHash(self.game.allstacks)
+        self._path = set([h])
+        best = None
+        for depth in range(1, self.max_depth+1):
+            try:
+                values = [self._searchMove(m, h, depth-1) for m in moves]
+            except _Timeout:
+                break
+            i = values.index(max(values))
+            best = moves[i]
+            self.depth = depth
+            if values[i] >= self.SCORE_WON:
+                break
+            # search the best move first in the next iteration, to get
+            # the most out of a partial iteration
+            moves = [best] + moves[:i] + moves[i+1:]
+        return best
+
+    #
+    # internals
+    #
+
+    # hints that are plain moves, without duplicates; flips and deals
+    # are left to the hint order
+    def _getMoves(self, hints, width):
+        moves, seen = [], set()
+        for hint in hints:
+            ncards, from_stack, to_stack = hint[2:5]
+            if ncards == 0 or from_stack is to_stack:
+                if hint is hints[0]:
+                    # a flip or a deal is the best move anyway
+                    return []
+                continue
+            key = (ncards, from_stack.id, to_stack.id)
+            if key in seen:
+                continue
+            seen.add(key)
+            moves.append(hint)
+            if len(moves) == width:
+                break
+        return moves
+
+    def _searchMove(self, hint, h, depth):
+        undo = []
+        try:
+            h = self._makeMove(hint[2], hint[3], hint[4], h, undo)
+            forced = hint[6]
+            if forced and forced[2] and forced[3] is not forced[4] and \
+                    len(forced[3].cards) >= forced[2]:
+                h = self._makeMove(forced[2], forced[3], forced[4], h, undo)
+            if h in self._path:
+                # do not walk in circles; the value depends on the path,
+                # see _searchPosition()
+                self._cycles += 1
+                return self.SCORE_DEAD_END
+            self._path.add(h)
+            try:
+                return self._searchPosition(h, depth)
+            finally:
+                self._path.discard(h)
+        finally:
+            for stack, saved in reversed(undo):
+                stack.unmakeCards(saved)
+
+    def _searchPosition(self, h, depth):
+        self.nodes += 1
+        if time.time() > self._deadline:
+            raise _Timeout()
+        entry = self._tt.get(h)
+        if entry is not None and entry[0] >= depth:
+            self.tt_hits += 1
+            return entry[1]
+        cycles = self._cycles
+        if self.game.isGameWon():
+            value = self.SCORE_WON + depth
+        elif depth == 0:
+            value = self.evaluate()
+        else:
+            hints = self.hint_class(self.game, 2).getHints()
+            moves = self._getMoves(hints, self.beam_width)
+            if moves:
+                value = max([self._searchMove(m, h, depth-1)
+                             for m in moves])
+            elif hints:
+                # a flip or a deal
+                value = self.evaluate()
+            else:
+                value = self.evaluate() + self.SCORE_DEAD_END
+        if self._cycles == cycles:
+            # a value cut short by the path to this position is not
+            # valid when reached on another path
+            self._tt[h] = (depth, value)
+        return value
+
+    def _makeMove(self, ncards, from_stack, to_stack, h, undo):
+        rcards, tcards = from_stack.cards, to_stack.cards
+        n = len(rcards) - ncards
+        pile = rcards[n:]
+        for i, card in enumerate(pile):
+            h ^= snapshotCardKey(from_stack.id, n+i, card)
+            h ^= snapshotCardKey(to_stack.id, len(tcards)+i, card)
+        undo.append((from_stack, from_stack.makeCards(rcards[:n])))
+        undo.append((to_stack, to_stack.makeCards(tcards+pile)))
+        return h
+
+    # a generic score of the current position
+    def evaluate(self):
+        s = self.game.s
+        score = 0
+        for f in s.foundations:
+            score += self.SCORE_FOUNDATION * len(f.cards)
+        for r in s.rows:
+            if not r.cards:
+                score += self.SCORE_EMPTY_ROW
+                continue
+            if not r.cards[-1].face_up:
+                score += self.SCORE_CAN_FLIP
+            for card in r.cards:
+                if not card.face_up:
+                    score += self.SCORE_FACE_DOWN
+        return score
@@ -0,0 +1,109 @@
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from collections import OrderedDict
+
+# ************************************************************************
+# * Position hashing (Zobrist style)
+# *
+# * Every (stack, position, suit, rank, face_up) tuple gets a pseudo
+# * random 64-bit key; the hash of a position is the xor of the keys of
+# * all cards on the table. Because xor is its own inverse, an atomic
+# * move only has to xor out the keys of the cards it is about to touch
+# * and xor in the keys of the cards afterwards.
+# ************************************************************************
+
+MASK64 = (1 << 64) - 1
+
+
+def mix64(x):
+    # splitmix64 finalizer
+    x = (x + 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    return x ^ (x >> 31)
+
+
+def snapshotCardKey(stack_id, pos, card):
+    code = (((stack_id * 4096 + pos) * 256 + card.suit) * 1024 + card.rank)
+    return mix64(code * 2 + (card.face_up and 1 or 0))
+
+
+def snapshotStackHash(stack_id, cards, start=0):
+    # xor of the keys of cards[start:]
+    h = 0
+    for pos in range(start, len(cards)):
+        h ^= snapshotCardKey(stack_id, pos, cards[pos])
+    return h
+
+
+def snapshotHash(stacks):
+    h = 0
+    for stack in stacks:
+        h ^= snapshotStackHash(stack.id, stack.cards)
+    return h
+
+
+# ************************************************************************
+# * A set of position hashes that remembers the insertion order (saved
+# * games store the snapshots as a plain list) and holds at most
+# * max_size entries (0 means unlimited).
+# ************************************************************************
+
+class SnapshotStore(object):
+    EVICT_OLDEST = 'fifo'               # forget the oldest positions first
+    EVICT_LRU = 'lru'                   # forget the least recently seen
+
+    def __init__(self, snapshots=(), max_size=0, eviction=EVICT_OLDEST):
+        if eviction not in (self.EVICT_OLDEST, self.EVICT_LRU):
+            eviction = self.EVICT_OLDEST
+        self.max_size = max(0, max_size)
+        self.eviction = eviction
+        self.evicted = 0
+        self._data = OrderedDict()
+        for sn in snapshots:
+            self.add(sn)
+
+    def __contains__(self, sn):
+        return sn in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    # return True if sn is a new position
+    def add(self, sn):
+        data = self._data
+        if sn in data:
+            if self.eviction == self.EVICT_LRU:
+                data.move_to_end(sn)
+            return False
+        data[sn] = None
+        if self.max_size:
+            while len(data) > self.max_size:
+                data.popitem(last=False)
+                self.evicted += 1
+        return True
+
+    def clear(self):
+        self._data.clear()
+
+    def tolist(self):
+        return list(self._data)
@@ -21,6 +21,8 @@
 #
 # ---------------------------------------------------------------------------##
 
+import importlib
+
 import pysollib.settings
 from pysollib.mfxutil import Struct, print_err
 from pysollib.mygettext import _, n_
@@ -742,7 +744,78 @@ class GameInfo(Struct):
                         skill_level=skill_level,
                         suits=tuple(suits), ranks=tuple(ranks),
                         trumps=tuple(trumps),
-                        si=gi_si, rules_filename=rules_filename)
+                        si=gi_si, rules_filename=rules_filename,
+                        module=None)
+
+
+# ************************************************************************
+# * The game index (pysollib/gameindex.py) lets the games database
+# * register all games at startup without importing the ~100 game
+# * modules. An entry holds the fields of a registered GameInfo with the
+# * untranslated names, the module that registers the game and whether
+# * the game has a solver.
+# ************************************************************************
+
+GAME_INDEX_VERSION = 1
+
+_INDEX_SUITS = tuple(range(4))
+_INDEX_RANKS = tuple(range(13))
+
+
+def gameIndexEntry(gi, module):
+    si = dict(gi.si.__dict__)
+    game_type, game_flags = si.pop('game_type'), si.pop('game_flags')
+    for key in ('decks', 'redeals', 'ncards'):
+        if si[key] == getattr(gi, key):
+            del si[key]
+    short_name = gi.short_name
+    if short_name == gi.name:
+        short_name = None
+    suits, ranks = gi.suits, gi.ranks
+    if suits == _INDEX_SUITS:
+        suits = None
+    if ranks == _INDEX_RANKS:
+        ranks = None
+    solver = getattr(gi.gameclass, 'Solver_Class', None) is not None
+    return (gi.id, module, gi.en_name, short_name, tuple(gi.altnames),
+            game_type, game_flags, gi.decks, gi.redeals, gi.ncards,
+            gi.category, gi.subcategory, gi.skill_level,
+            suits, ranks, gi.trumps, gi.rules_filename, si, solver)
+
+
+def gameInfoFromIndex(entry):
+    (id, module, en_name, short_name, altnames,
+     game_type, game_flags, decks, redeals, ncards,
+     category, subcategory, skill_level,
+     suits, ranks, trumps, rules_filename, si, solver) = entry
+    name = en_name
+    if pysollib.settings.TRANSLATE_GAME_NAMES:
+        name = _(name)
+        if short_name:
+            short_name = _(short_name)
+        altnames = [_(n) for n in altnames]
+    if suits is None:
+        suits = _INDEX_SUITS
+    if ranks is None:
+        ranks = _INDEX_RANKS
+    gi_si = Struct(game_type=game_type, game_flags=game_flags,
+                   decks=decks, redeals=redeals, ncards=ncards)
+    gi_si.__dict__.update(si)
+    for f, l in ((GI.GT_CHILDREN, GI._CHILDREN_GAMES),
+                 (GI.GT_OPEN, GI._OPEN_GAMES),
+                 (GI.GT_POPULAR, GI._POPULAR_GAMES)):
+        if (game_flags & f) and (id not in l):
+            l.append(id)
+    gi = GameInfo.__new__(GameInfo)
+    Struct.__init__(gi, id=id, gameclass=None,
+                    name=name, short_name=short_name or name,
+                    altnames=sorted(altnames), en_name=en_name,
+                    decks=decks, redeals=redeals, ncards=ncards,
+                    category=category, subcategory=subcategory,
+                    skill_level=skill_level,
+                    suits=suits, ranks=ranks, trumps=trumps,
+                    si=gi_si, rules_filename=rules_filename, module=module)
+    return gi
 
 
 class GameManager:
@@ -762,6 +835,7 @@ class GameManager:
         self.registered_game_types = {}
         self.callback = None            # update progress-bar (see main.py)
         self._num_games = 0             # for callback only
+        self.index_loaded = False       # see loadIndex()
 
     def setCallback(self, func):
         self.callback = func
@@ -802,12 +876,27 @@ class GameManager:
         # print gi.id, gi.short_name.encode('utf-8')
         if not isinstance(gi, GameInfo):
             raise GameInfoException("wrong GameInfo class")
+        indexed = self.__all_games.get(gi.id)
+        if indexed is not None and indexed.gameclass is None:
+            # the module of a game from the index is being imported
+            indexed.gameclass = gi.gameclass
+            return
         if self.check_game and pysollib.settings.CHECK_GAMES:
             self._check_game(gi)
         # if 0 and gi.si.game_flags & GI.GT_XORIGINAL:
         #     return
         # print gi.id, gi.name
         gi.altnames = sorted(gi.altnames)
+        self._add(gi, (hasattr(gi.gameclass, 'Solver_Class') and
+                       gi.gameclass.Solver_Class is not None))
+        if self.current_filename is not None:
+            gi.gameclass.MODULE_FILENAME = self.current_filename
+
+        if self.callback and self._num_games % 10 == 0:
+            self.callback()
+        self._num_games += 1
+
+    def _add(self, gi, solver):
         self.__all_games[gi.id] = gi
         self.__all_gamenames[gi.name] = gi
         for n in gi.altnames:
@@ -829,15 +918,40 @@ class GameManager:
 #                      if gi.id in k: break
 #                  else:
 #                      print gi.id
-            if hasattr(gi.gameclass, 'Solver_Class') and \
-               gi.gameclass.Solver_Class is not None:
+            if solver:
                 self.__games_for_solver.append(gi.id)
-        if self.current_filename is not None:
-            gi.gameclass.MODULE_FILENAME = self.current_filename
 
-        if self.callback and self._num_games % 10 == 0:
-            self.callback()
-        self._num_games += 1
+    #
+    # game index - register the games without importing their modules
+    #
+
+    # Register the games of pysollib/gameindex.py (written by
+    # scripts/gen_game_index.py). A game module is imported by
+    # loadGameClass(), i.e. when the game is played. Return False if
+    # there is no usable index; the game modules must then be imported.
+    def loadIndex(self, french_only=False):
+        try:
+            from pysollib import gameindex
+        except ImportError:
+            return False
+        if gameindex.VERSION != GAME_INDEX_VERSION or \
+                gameindex.PYSOL_VERSION != pysollib.settings.VERSION:
+            return False
+        # do not let "import pysollib.games" import all game modules
+        self.index_loaded = True
+        for entry in gameindex.GAMES:
+            module = entry[1]
+            if french_only and (
+                    module.startswith('pysollib.games.mahjongg.') or
+                    module.startswith('pysollib.games.special.')):
+                continue
+            self._add(gameInfoFromIndex(entry), entry[-1])
+        return True
+
+    def loadGameClass(self, gi):
+        if gi.gameclass is None and gi.module:
+            importlib.import_module(gi.module)
+        return gi.gameclass
 
     #
     # access games database - we do not expose hidden games
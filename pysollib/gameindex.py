@@ -0,0 +1,3844 @@
+# Generated by scripts/gen_game_index.py - do not edit.
+#
+# (id, module, name, short_name, altnames,
+#  game_type, game_flags, decks, redeals, ncards,
+#  category, subcategory, skill_level,
+#  suits, ranks, trumps, rules_filename, si, solver)
+
+VERSION = 1
+PYSOL_VERSION = '3.0.0'
+
+GAMES = (
+    (1, 'pysollib.games.gypsy', 'Gypsy', None, (), 12, 262144, 2, 0, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (2, 'pysollib.games.klondike', 'Klondike', None,
+     ('American Patience', 'Classic Solitaire'), 15, 262144, 1, -1, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (3, 'pysollib.games.gypsy', 'Irmgard', None, (), 12, 0, 2, 0, 104, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (4, 'pysollib.games.klondike', '8 x 8', None, (), 15, 0, 2, -1, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (5, 'pysollib.games.freecell', 'Relaxed FreeCell', None, (), 10, 589824, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (6, 'pysollib.games.bakersgame', 'Relaxed Seahaven Towers', None, (), 10,
+     589824, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (7, 'pysollib.games.picturegallery', 'Picture Gallery', None,
+     ('Die Bildgallerie', 'Mod-3'), 41, 262144, 2, 0, 104, 1, 0, 3, None, None,
+     (), None, {}, False),
+    (8, 'pysollib.games.freecell', 'FreeCell', None, ('Four Free',), 10,
+     327680, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (9, 'pysollib.games.bakersgame', 'Seahaven Towers', None,
+     ('Sea Towers', 'Tours du Alice', 'Towers'), 10, 327680, 1, 0, 52, 1, 0, 5,
+     None, None, (), None, {}, True),
+    (10, 'pysollib.games.spider', 'Relaxed Spider', None, (), 30, 524288, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (11, 'pysollib.games.spider', 'Spider', None, (), 30, 262144, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (12, 'pysollib.games.braid', 'Braid', None,
+     ('Der Zopf', 'Pigtail', 'Plait'), 21, 262144, 2, 2, 104, 1, 0, 3, None,
+     None, (), None, {}, False),
+    (13, 'pysollib.games.fortythieves', 'Forty Thieves', None,
+     ('Le Cadran', 'Napoleon at St. Helena', 'Roosevelt at San Juan'), 9,
+     262144, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (14, 'pysollib.games.spider', 'Grounds for a Divorce', None,
+     ('Scheidungsgrund',), 30, 262144, 2, 0, 104, 1, 0, 4, None, None, (),
+     None, {}, False),
+    (15, 'pysollib.games.harp', 'Big Harp', None,
+     ('Die Pyramide', 'Die grosse Harfe', 'Harp'), 15, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (16, 'pysollib.games.eiffeltower', 'Eiffel Tower', None, (), 24, 8192, 2,
+     0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (17, 'pysollib.games.matriarchy', 'Matriarchy', None, (), 1, 0, 2, -2, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (18, 'pysollib.games.klondike', 'Klondike (Draw 3)', None, (), 15, 0, 1,
+     -1, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (19, 'pysollib.games.yukon', 'Yukon', None, (), 33, 262144, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (20, 'pysollib.games.yukon', 'Russian Solitaire', None, (), 33, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (21, 'pysollib.games.harp', 'Double Klondike', None, (), 15, 0, 2, -1, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (23, 'pysollib.games.fortythieves', 'Forty and Eight', None, (), 9, 0, 2,
+     1, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (24, 'pysollib.games.spider', 'Spiderette', None, (), 30, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (25, 'pysollib.games.harp', 'Gargantua', None, ('Jumbo',), 15, 0, 2, 1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (26, 'pysollib.games.bakersgame', "King Only Baker's Game", None, (), 10,
+     65536, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (27, 'pysollib.games.yukon', 'Odessa', None, (), 33, 0, 1, 0, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (28, 'pysollib.games.harp', 'Double Klondike (Draw 3)', None, (), 15, 0, 2,
+     -1, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (29, 'pysollib.games.spider', 'Scorpion', None, (), 30, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (30, 'pysollib.games.windmill', 'Windmill', None, ('Propeller',), 1, 0, 2,
+     0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (31, 'pysollib.games.bakersdozen', "Baker's Dozen", None, (), 4, 327680, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (33, 'pysollib.games.klondike', 'Westcliff', None, (), 15, 8192, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (34, 'pysollib.games.beleagueredcastle', 'Beleaguered Castle', None,
+     ('Laying Siege', 'Sham Battle'), 5, 327680, 1, 0, 52, 1, 0, 4, None, None,
+     (), None, {}, True),
+    (35, 'pysollib.games.unionsquare', 'Union Square', None,
+     ('British Square',), 1, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {},
+     False),
+    (36, 'pysollib.games.golf', 'Golf', None, ('One Foundation',), 11, 262144,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, True),
+    (37, 'pysollib.games.larasgame', "Lara's Game", None,
+     ("Leoni's Own", 'Thirteen Packs', 'Weavers'), 1, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (38, 'pysollib.games.pyramid', 'Pyramid', None, (), 24, 262144, 1, 2, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (39, 'pysollib.games.klondike', 'Small Harp', None, ('Die kleine Harfe',),
+     15, 0, 1, -1, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (40, 'pysollib.games.golf', 'Elevator', None,
+     ('Egyptian Solitaire', 'Pyramid Golf'), 11, 0, 1, 0, 52, 1, 0, 3, None,
+     None, (), None, {}, True),
+    (41, 'pysollib.games.pileon', 'PileOn', None,
+     ('Beeswax', 'Fan Fifteen', 'Fifteen Puzzle'), 0, 65536, 1, 0, 52, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (42, 'pysollib.games.bristol', 'Bristol', None, (), 8, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (43, 'pysollib.games.canfield', 'Chameleon', None, ('Kansas',), 6, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (45, 'pysollib.games.bakersgame', "Baker's Game", None, (), 10, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (46, 'pysollib.games.freecell', 'ForeCell', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (47, 'pysollib.games.spider', 'Baby Spiderette', None, (), 30, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (48, 'pysollib.games.spider', "Will o' the Wisp", None, (), 30, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (49, 'pysollib.games.spider', 'Black Widow', None, ('Scarab',), 30, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (50, 'pysollib.games.spider', 'Simple Simon', None, (), 30, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, True),
+    (51, 'pysollib.games.harp', 'Steps', None, (), 15, 0, 2, 1, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (53, 'pysollib.games.montana', 'Montana', None, ('Gaps', 'Vacancies'), 19,
+     327680, 1, 2, 52, 1, 0, 4, None, None, (), None, {'ncards': 48}, False),
+    (54, 'pysollib.games.royalcotillion', 'Royal Cotillion', None,
+     ('Lords and Ladies',), 1, 0, 2, 0, 104, 1, 0, 1, None, None, (), None, {},
+     False),
+    (55, 'pysollib.games.royalcotillion', 'Odd and Even', None, (), 1, 8192, 2,
+     1, 104, 1, 0, 1, None, None, (), None, {}, False),
+    (56, 'pysollib.games.fan', 'Fan', None, (), 8, 65536, 1, 0, 52, 1, 0, 4,
+     None, None, (), None, {}, True),
+    (57, 'pysollib.games.fan', 'Shamrocks', None, ('Three Card Fan',), 8,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (58, 'pysollib.games.klondike', 'Thumb and Pouch', None, (), 15, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (59, 'pysollib.games.osmosis', 'Osmium', None, (), 0, 0, 1, -1, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (60, 'pysollib.games.osmosis', 'Osmium II', None, (), 0, 0, 1, -1, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (61, 'pysollib.games.klondike', 'Casino Klondike', None, (), 15, 1048576,
+     1, 2, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (62, 'pysollib.games.gypsy', 'Miss Milligan', None, (), 12, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (63, 'pysollib.games.montana', 'Blue Moon', None, ('Rangoon',), 19, 65536,
+     1, 2, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (64, 'pysollib.games.bakersgame', 'Penguin', None, ('Beak and Flipper',),
+     10, 65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (65, 'pysollib.games.gypsy', 'Giant', None, (), 12, 0, 2, 0, 104, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (66, 'pysollib.games.klondike', 'Eastcliff', None, (), 15, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (67, 'pysollib.games.klondike', 'Whitehead', None, (), 15, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (68, 'pysollib.games.gypsy', 'Lexington Harp', None, ('Milligan Yukon',),
+     33, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (69, 'pysollib.games.fortythieves', 'Indian', None, (), 9, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (70, 'pysollib.games.fortythieves', 'Number Ten', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (71, 'pysollib.games.fortythieves', 'Rank and File', None,
+     ('Dress Parade',), 9, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (73, 'pysollib.games.fortythieves', 'Maria', None,
+     ('Maria Luisa', 'Thirty-Six Card Tableau'), 9, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (74, 'pysollib.games.fortythieves', 'Midshipman', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (76, 'pysollib.games.fortythieves', 'Streets', None, (), 9, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (77, 'pysollib.games.freecell', 'Stalactites', None,
+     ('Grampus', 'Old Mole'), 10, 65536, 1, 0, 52, 1, 0, 4, None, None, (),
+     None, {}, False),
+    (78, 'pysollib.games.gypsy', 'Milligan Cell', None, (), 12, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (79, 'pysollib.games.fortythieves', 'Waning Moon', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (80, 'pysollib.games.fortythieves', 'Busy Aces', None, (), 9, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (81, 'pysollib.games.klondike', 'Blind Alleys', None, (), 15, 0, 1, 1, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (83, 'pysollib.games.bakersdozen', 'Castles in Spain', None, (), 4, 0, 1,
+     0, 52, 1, 0, 3, None, None, (), None, {}, True),
+    (84, 'pysollib.games.bakersdozen', 'Martha', None, (), 4, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (85, 'pysollib.games.bakersdozen', 'Spanish Patience', None, (), 4, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (86, 'pysollib.games.bakersdozen', 'Good Measure', None, (), 4, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (87, 'pysollib.games.fan', 'Scotch Patience', None, (), 8, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (88, 'pysollib.games.fan', 'Trefoil', None, (), 8, 65536, 1, 2, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (89, 'pysollib.games.montecarlo', 'Monte Carlo', None, ('Quilt',), 24, 0,
+     1, 0, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (90, 'pysollib.games.montecarlo', 'Simple Carlo', None, (), 24, 8192, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (91, 'pysollib.games.montecarlo', 'Simple Pairs', None,
+     ('Hunter', 'Jamestown', 'Pirate Gold', 'Treasure Hunt'), 24, 8192, 1, 0,
+     52, 1, 0, 1, None, None, (), None, {}, False),
+    (92, 'pysollib.games.montecarlo', 'Neighbour', None, (), 24, 0, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (93, 'pysollib.games.royaleast', 'Royal East', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (94, 'pysollib.games.calculation', 'Hopscotch', None, (), 0, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (95, 'pysollib.games.auldlangsyne', 'Auld Lang Syne', None, ('Patience',),
+     23, 0, 1, 0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (96, 'pysollib.games.montecarlo', 'Fourteen', None,
+     ('Fourteen Out', 'Fourteen Puzzle', 'Take Fourteen'), 24, 73728, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (97, 'pysollib.games.royalcotillion', 'Carpet', None, (), 0, 8192, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (98, 'pysollib.games.golf', 'Black Hole', None, (), 11, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, True),
+    (99, 'pysollib.games.canfield', 'Rainfall', None, (), 6, 131072, 1, 2, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (100, 'pysollib.games.canfield', 'Storehouse', None,
+     ('Provisions', 'Straight Up', 'The Reserve', 'Thirteen Up'), 6, 0, 1, 2,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (101, 'pysollib.games.canfield', 'Superior Canfield', None, (), 6, 0, 1,
+     -1, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (102, 'pysollib.games.canfield', 'Variegated Canfield', None, (), 6, 0, 2,
+     2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (103, 'pysollib.games.canfield', 'American Toad', None, (), 6, 0, 2, 1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (104, 'pysollib.games.bakersdozen', 'Cruel', None, (), 4, 65536, 1, -1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (105, 'pysollib.games.canfield', 'Canfield', None, (), 6, 278528, 1, -1,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (106, 'pysollib.games.canfield', 'Double Canfield', None, (), 6, 0, 2, -1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (107, 'pysollib.games.klondike', 'Pas Seul', None, (), 15, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (108, 'pysollib.games.canfield', 'Rainbow', None, (), 6, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (109, 'pysollib.games.fortythieves', 'Deuces', None, ('Les Deux', 'Twos'),
+     9, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (110, 'pysollib.games.fortythieves', 'Courtyard', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (111, 'pysollib.games.doublets', 'Doublets', None, ('Double or Quits',), 0,
+     0, 1, 2, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (112, 'pysollib.games.canfield', 'Eagle Wing', None, ('Thirteen Down',), 6,
+     0, 1, 2, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (113, 'pysollib.games.fortythieves', 'Zebra', None, (), 9, 0, 2, 1, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (114, 'pysollib.games.spider', "Grandmother's Game", None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (115, 'pysollib.games.fortythieves', 'Little Forty', None, (), 9, 0, 2, 3,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (116, 'pysollib.games.montana', 'Spaces', None, ('Addiction',), 19, 65536,
+     1, 2, 52, 1, 0, 4, None, None, (), None, {'ncards': 48}, False),
+    (117, 'pysollib.games.montana', 'Red Moon', None, (), 19, 65536, 1, 2, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (118, 'pysollib.games.siebenbisas', 'Sieben bis As', None, (), 19, 8454144,
+     1, 0, 32, 1, 0, 4, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {},
+     False),
+    (119, 'pysollib.games.gypsy', 'Die Koenigsbergerin', None, (), 12, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (120, 'pysollib.games.dieboesesieben', 'Bad Seven', None,
+     ('Die boese Sieben',), 1, 8388608, 2, 1, 64, 1, 0, 2, None,
+     (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (121, 'pysollib.games.gypsy', 'Mississippi', None, (), 33, 4194304, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (122, 'pysollib.games.gypsy', 'Griffon', None, (), 33, 4194304, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (123, 'pysollib.games.auldlangsyne', 'Interregnum', None, (), 23, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (124, 'pysollib.games.special.hanoi', 'Tower of Hanoy', None,
+     ('Tower of Hanoi',), 35, 65536, 1, 0, 9, 1, 0, 5, (2,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8), (), None, {}, False),
+    (125, 'pysollib.games.fortythieves', 'Lucas', None, (), 9, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (126, 'pysollib.games.fortythieves', 'Red and Black', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (127, 'pysollib.games.klondike', 'Eight Times Eight', None,
+     ('Achtmal Acht',), 15, 0, 2, 2, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (128, 'pysollib.games.fan', 'Three Shuffles and a Draw', None, (), 8,
+     65536, 1, 2, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (129, 'pysollib.games.klondike', 'Vegas Klondike', None, (), 15, 1048576,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (130, 'pysollib.games.acesup', 'Perpetual Motion', None,
+     ('First Law', 'Narcotic'), 0, 0, 1, -1, 52, 1, 0, 2, None, None, (), None,
+     {}, False),
+    (131, 'pysollib.games.fortythieves', 'Double Rail', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (132, 'pysollib.games.fan', 'Super Flower Garden', None, (), 8, 65536, 1,
+     2, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (133, 'pysollib.games.klondike', 'Batsford', None, (), 15, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (134, 'pysollib.games.calculation', 'Betsy Ross', None,
+     ('Fairest', 'Four Kings', 'Musical Patience', 'Plus Belle',
+      'Quadruple Alliance'),
+     0, 0, 1, 2, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (135, 'pysollib.games.terrace', 'Terrace', None, (), 32, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (136, 'pysollib.games.terrace', "General's Patience", None, (), 32, 0, 2,
+     0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (137, 'pysollib.games.terrace', 'Blondes and Brunettes', None, (), 32, 0,
+     2, 0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (138, 'pysollib.games.terrace', 'Falling Star', None, (), 32, 0, 2, 0, 104,
+     1, 0, 2, None, None, (), None, {}, False),
+    (139, 'pysollib.games.special.poker', 'Poker Square', None, (), 25,
+     1048576, 1, 0, 52, 1, 0, 4, None, None, (), None, {'ncards': 25}, False),
+    (140, 'pysollib.games.special.poker', 'Poker Shuffle', None, (), 25,
+     1114112, 1, 0, 52, 1, 0, 4, None, None, (), None, {'ncards': 25}, False),
+    (141, 'pysollib.games.katzenschwanz', "Cat's Tail", None,
+     ('Der Katzenschwanz',), 10, 65536, 2, 0, 104, 1, 0, 4, None, None, (),
+     None, {}, True),
+    (142, 'pysollib.games.katzenschwanz', 'Snake', None, ('Die Schlange',), 10,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, True),
+    (143, 'pysollib.games.royalcotillion', 'Kingdom', None, (), 1, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (144, 'pysollib.games.siebenbisas', 'Maze', None, (), 19, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {'ncards': 48}, False),
+    (145, 'pysollib.games.beleagueredcastle', 'Citadel', None,
+     ('Under Siege',), 5, 65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {},
+     True),
+    (146, 'pysollib.games.beleagueredcastle', 'Streets and Alleys', None, (),
+     5, 65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (147, 'pysollib.games.beleagueredcastle', 'Fortress', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (148, 'pysollib.games.beleagueredcastle', 'Chessboard', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (149, 'pysollib.games.diplomat', 'Diplomat', None, (), 9, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (150, 'pysollib.games.diplomat', 'Congress', None,
+     ("President's Cabinet",), 9, 0, 2, 0, 104, 1, 0, 4, None, None, (), None,
+     {}, False),
+    (151, 'pysollib.games.diplomat', 'Lady Palk', None, (), 9, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (152, 'pysollib.games.montecarlo', 'The Last Monarch', None,
+     ('Der letzte Monarch',), 0, 65536, 1, 0, 52, 1, 0, 4, None, None, (),
+     None, {}, False),
+    (153, 'pysollib.games.pasdedeux', 'Pas de Deux', None, (), 19, 2097152, 2,
+     1, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (154, 'pysollib.games.gypsy', 'Brunswick', None, (), 33, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (157, 'pysollib.games.special.tarock', 'Wheel of Fortune', None, (), 31,
+     147456, 1, 0, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (158, 'pysollib.games.special.tarock', 'Imperial Trumps', None, (), 31,
+     409600, 1, -1, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (159, 'pysollib.games.special.tarock', 'Pagat', None, (), 31, 212992, 1, 0,
+     78, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (160, 'pysollib.games.special.tarock', 'Skiz', None, (), 31, 212992, 1, 0,
+     78, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (161, 'pysollib.games.special.tarock', 'Fifteen Plus', None, (), 31,
+     147456, 1, 0, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (162, 'pysollib.games.special.tarock', 'Excuse', None, (), 31, 212992, 1,
+     0, 78, 3, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (163, 'pysollib.games.special.tarock', 'Grasshopper', None, (), 31, 147456,
+     1, 1, 78, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (164, 'pysollib.games.special.tarock', 'Double Grasshopper', None, (), 31,
+     147456, 2, 1, 156, 3, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (165, 'pysollib.games.special.hexadeck', 'Bits n Bytes', None, (), 14, 0,
+     1, 1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (166, 'pysollib.games.special.hexadeck', 'Hex A Klon', None, (), 14, 0, 1,
+     -1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (167, 'pysollib.games.napoleon', 'Der kleine Napoleon', None, (), 21,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (168, 'pysollib.games.napoleon', 'Der freie Napoleon', None, (), 21, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (169, 'pysollib.games.napoleon', 'Napoleon', None, (), 21, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (170, 'pysollib.games.napoleon', 'Free Napoleon', None, (), 21, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (171, 'pysollib.games.numerica', 'Lady Betty', None, (), 23, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (172, 'pysollib.games.auldlangsyne', "Tam O'Shanter", None, (), 23, 0, 1,
+     0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (173, 'pysollib.games.auldlangsyne', 'Strategy', None, (), 23, 0, 1, 0, 52,
+     1, 0, 5, None, None, (), None, {}, False),
+    (174, 'pysollib.games.gypsy', 'Russian Patience', None, ('Die Russische',),
+     15, 8454144, 2, 0, 64, 1, 0, 4, None, (0, 6, 7, 8, 9, 10, 11, 12), (),
+     None, {}, False),
+    (175, 'pysollib.games.braid', 'Long Braid', None, ('Der lange Zopf',), 21,
+     0, 2, 2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (176, 'pysollib.games.special.memory', 'Memory 24', None, (), 18, 1056768,
+     2, 0, 24, 10, 0, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), None,
+     {}, False),
+    (177, 'pysollib.games.special.memory', 'Memory 40', None, (), 18, 1048576,
+     2, 0, 40, 10, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19),
+     None, {}, False),
+    (178, 'pysollib.games.special.memory', 'Concentration', None,
+     ('Pelmanism',), 18, 1048576, 1, 0, 52, 1, 0, 5, None, None, (), None, {},
+     False),
+    (179, 'pysollib.games.special.tarock', 'Ponytail', None, (), 31, 147456, 2,
+     2, 156, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (180, 'pysollib.games.special.pegged', 'Pegged Octagon', None, (), 36, 0,
+     1, 0, 37, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36),
+     'pegged.html', {}, False),
+    (181, 'pysollib.games.special.pegged', 'Pegged Cross 1', None, (), 36, 0,
+     1, 0, 33, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32),
+     'pegged.html', {}, False),
+    (182, 'pysollib.games.special.pegged', 'Pegged Cross 2', None, (), 36, 0,
+     1, 0, 45, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44),
+     'pegged.html', {}, False),
+    (183, 'pysollib.games.special.pegged', 'Pegged 6x6', None, (), 36, 0, 1, 0,
+     36, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35),
+     'pegged.html', {}, False),
+    (184, 'pysollib.games.special.pegged', 'Pegged 7x7', None, (), 36, 0, 1, 0,
+     49, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48),
+     'pegged.html', {}, False),
+    (185, 'pysollib.games.spider', 'Wasp', None, (), 30, 0, 1, 0, 52, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (186, 'pysollib.games.yukon', 'Alaska', None, (), 33, 0, 1, 0, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (187, 'pysollib.games.yukon', 'Chinese Discipline', None, (), 33, 4194304,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (188, 'pysollib.games.yukon', 'Chinese Solitaire', None, (), 33, 4194304,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (189, 'pysollib.games.yukon', 'Queenie', None, (), 33, 4194304, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (190, 'pysollib.games.yukon', 'Rushdike', None, (), 33, 4194304, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (191, 'pysollib.games.yukon', 'Russian Point', None, (), 33, 4194304, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (192, 'pysollib.games.yukon', 'Abacus', None, (), 33, 4194304, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (193, 'pysollib.games.pyramid', 'Relaxed Pyramid', None,
+     ('Pyramid Clear', "Pyramid's Stones"), 24, 524288, 1, 2, 52, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (194, 'pysollib.games.spider', 'Rachel', None, (), 30, 4194304, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (195, 'pysollib.games.fortythieves', 'Quadrangle', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (196, 'pysollib.games.fortythieves', 'Corona', None, ('Round Dozen',), 9,
+     0, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (197, 'pysollib.games.fortythieves', 'Triple Line', None, (), 9, 4194304,
+     2, 1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (198, 'pysollib.games.fortythieves', "Napoleon's Exile", None, (), 9,
+     4194304, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (199, 'pysollib.games.fortythieves', 'Single Rail', None,
+     ('Auxiliary Sequences',), 9, 0, 1, 0, 52, 1, 0, 2, None, None, (), None,
+     {}, False),
+    (200, 'pysollib.games.gypsy', 'Nomad', None, (), 12, 147456, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (201, 'pysollib.games.sanibel', 'Sanibel', None, (), 33, 147456, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (202, 'pysollib.games.special.tarock', 'Cavalier', None, (), 31, 147456, 1,
+     0, 78, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (203, 'pysollib.games.special.tarock', 'Five Aces', None, (), 31, 147456,
+     1, 0, 78, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (204, 'pysollib.games.special.tarock', 'Wicked', None, (), 31, 212992, 1,
+     -1, 78, 3, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (205, 'pysollib.games.special.tarock', 'Nasty', None, (), 31, 212992, 1,
+     -1, 78, 3, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (206, 'pysollib.games.acesup', 'Fortunes', None, (), 0, 0, 1, 0, 52, 1, 0,
+     1, None, None, (), None, {}, False),
+    (207, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 4', None, (), 35,
+     65536, 1, 0, 4, 1, 0, 5, (2,), (0, 1, 2, 3), (), 'hanoipuzzle.html', {},
+     False),
+    (208, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 5', None, (), 35,
+     65536, 1, 0, 5, 1, 0, 5, (2,), (0, 1, 2, 3, 4), (), 'hanoipuzzle.html',
+     {}, False),
+    (209, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 6', None, (), 35,
+     65536, 1, 0, 6, 1, 0, 5, (2,), (0, 1, 2, 3, 4, 5), (), 'hanoipuzzle.html',
+     {}, False),
+    (210, 'pysollib.games.special.pegged', 'Pegged Triangle 1', None, (), 36,
+     0, 1, 0, 15, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14), 'pegged.html', {},
+     False),
+    (211, 'pysollib.games.special.pegged', 'Pegged Triangle 2', None, (), 36,
+     0, 1, 0, 21, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19,
+      20),
+     'pegged.html', {}, False),
+    (212, 'pysollib.games.montecarlo', 'Weddings', None, (), 24, 0, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (213, 'pysollib.games.acesup', 'Russian Aces', None, (), 0, 0, 1, 0, 52, 1,
+     0, 1, None, None, (), None, {}, False),
+    (214, 'pysollib.games.bristol', 'Belvedere', None, (), 8, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (215, 'pysollib.games.klondike', 'Somerset', None, (), 5, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (216, 'pysollib.games.montecarlo', 'Monte Carlo (2 Decks)', None, (), 24,
+     0, 2, 0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (217, 'pysollib.games.gypsy', 'Milligan Harp', None, (), 12, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (218, 'pysollib.games.gypsy', 'Carlton', None, (), 12, 0, 2, 0, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (219, 'pysollib.games.special.memory', 'Memory 30', None, (), 18, 1048576,
+     2, 0, 30, 10, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14), None, {}, False),
+    (220, 'pysollib.games.spider', 'Rouge et Noir', None, (), 12, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (221, 'pysollib.games.klondike', 'Stonewall', None, (), 27, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (222, 'pysollib.games.klondike', 'Flower Garden', None,
+     ('Le Parterre', 'The Bouquet', 'The Garden'), 27, 65536, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (223, 'pysollib.games.klondike', 'Brigade', None, (), 27, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (224, 'pysollib.games.klondike', 'Easthaven', None, (), 12, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (225, 'pysollib.games.klondike', 'Westhaven', None, (), 12, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (226, 'pysollib.games.gypsy', 'Blockade', None, (), 12, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (227, 'pysollib.games.fan', 'Intelligence', None, (), 8, 0, 2, 2, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (228, 'pysollib.games.fortythieves', 'Limited', None, (), 9, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (229, 'pysollib.games.klondike', 'Agnes Sorel', None, (), 12, 0, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (230, 'pysollib.games.klondike', 'Jane', None, (), 27, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (231, 'pysollib.games.klondike', 'Canister', None, (), 5, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (232, 'pysollib.games.klondike', 'Raglan', None, (), 27, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (233, 'pysollib.games.klondike', 'King Albert', None, ("Idiot's Delight",),
+     27, 65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (234, 'pysollib.games.royalcotillion', 'Alhambra', None, (), 1, 0, 2, 2,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (235, 'pysollib.games.montecarlo', 'Nestor', None, (), 24, 65536, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (236, 'pysollib.games.klondike', 'Agnes Bernauer', None, (), 27, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (256, 'pysollib.games.calculation', 'Calculation', None,
+     ('Broken Intervals', 'Progression'), 0, 0, 1, 0, 52, 1, 0, 4, None, None,
+     (), None, {}, False),
+    (257, 'pysollib.games.numerica', 'Numerica', None,
+     ('Old Patience', 'Sir Tommy', 'Try Again'), 23, 16384, 1, 0, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (258, 'pysollib.games.bakersgame', 'Eight Off', None, (), 10, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, True),
+    (259, 'pysollib.games.golf', 'Dead King Golf', None, (), 11, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, True),
+    (260, 'pysollib.games.golf', 'Relaxed Golf', None, ('Putt Putt',), 11,
+     524288, 1, 0, 52, 1, 0, 3, None, None, (), None, {}, True),
+    (261, 'pysollib.games.grandfathersclock', "Grandfather's Clock", None, (),
+     0, 65536, 1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (263, 'pysollib.games.klondike', 'Phoenix', None, (), 27, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (264, 'pysollib.games.freecell', 'Double FreeCell', None, (), 10, 65536, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (265, 'pysollib.games.freecell', 'Triple FreeCell', None, (), 10, 65536, 3,
+     0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (266, 'pysollib.games.bristol', 'Dover', None, (), 8, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (267, 'pysollib.games.golf', 'Four Leaf Clovers', None, (), 11, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (268, 'pysollib.games.fan', 'House in the Wood', None, ('Double Fan',), 8,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (269, 'pysollib.games.spider', 'Spider (1 Suit)', None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, (0, 0, 0, 0), None, (), 'spider.html', {}, False),
+    (270, 'pysollib.games.spider', 'Spider (2 Suits)', None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, (0, 0, 2, 2), None, (), 'spider.html', {}, False),
+    (271, 'pysollib.games.yukon', 'Double Yukon', None, (), 33, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (272, 'pysollib.games.yukon', 'Triple Yukon', None, (), 33, 0, 3, 0, 156,
+     1, 0, 3, None, None, (), None, {}, False),
+    (273, 'pysollib.games.harp', 'Triple Klondike', None, (), 15, 0, 3, -1,
+     156, 1, 0, 3, None, None, (), None, {}, False),
+    (274, 'pysollib.games.harp', 'Triple Klondike (Draw 3)', None, (), 15, 0,
+     3, -1, 156, 1, 0, 2, None, None, (), None, {}, False),
+    (275, 'pysollib.games.montana', 'Galary', None, (), 19, 196608, 1, 2, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (276, 'pysollib.games.montana', 'Free Parking', None,
+     ('Moonlight', 'Park and Ride'), 19, 65536, 1, 2, 52, 1, 0, 4, None, None,
+     (), None, {'ncards': 48}, False),
+    (277, 'pysollib.games.windmill', "Napoleon's Tomb", None, (), 0, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (278, 'pysollib.games.yukon', "Tvete's Grandfather", None, (), 33, 0, 1, 2,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (279, 'pysollib.games.katzenschwanz', 'Kings', None,
+     ("King's Plume", 'Retinue of Kings'), 10, 327680, 2, 0, 104, 1, 0, 4,
+     None, None, (), None, {}, True),
+    (280, 'pysollib.games.camelot', 'Camelot', None, ('Kings in the Corners',),
+     0, 0, 1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (281, 'pysollib.games.golf', 'Escalator', None, (), 11, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, True),
+    (282, 'pysollib.games.glenwood', 'Dutchess', None, ('Duchess', 'Glenwood'),
+     6, 0, 1, 1, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (284, 'pysollib.games.yukon', 'Ten Across', None, (), 33, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (285, 'pysollib.games.yukon', 'Panopticon', None, (), 33, 131072, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (286, 'pysollib.games.katzenschwanz', 'Retinue', None, (), 10, 196608, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, True),
+    (287, 'pysollib.games.pushpin', 'Push Pin', None, ('Queens',), 0, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (288, 'pysollib.games.pushpin', 'Royal Marriage', None,
+     ('Betrothal', 'Coquette'), 0, 0, 1, 0, 52, 1, 0, 2, None, None, (), None,
+     {}, False),
+    (289, 'pysollib.games.pileon', 'Small PileOn', None, (), 0, 8585216, 1, 0,
+     36, 1, 0, 4, None, (0, 5, 6, 7, 8, 9, 10, 11, 12), (), 'pileon.html', {},
+     False),
+    (290, 'pysollib.games.bisley', 'Bisley', None, (), 0, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (291, 'pysollib.games.bakersdozen', 'Royal Family', None, (), 4, 65536, 1,
+     1, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (292, 'pysollib.games.capricieuse', 'Capricieuse', None, ('Capricious',),
+     4, 65536, 2, 2, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (293, 'pysollib.games.capricieuse', 'Nationale', None, ('Zigzag Course',),
+     4, 65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (294, 'pysollib.games.curdsandwhey', 'Curds and Whey', None, (), 30, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (295, 'pysollib.games.fortythieves', "Napoleon's Square", None, (), 9, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (296, 'pysollib.games.auldlangsyne', 'Colorado', None, (), 23, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (298, 'pysollib.games.osmosis', 'Open Osmium', None, (), 0, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (299, 'pysollib.games.katzenschwanz', 'Salic Law', None, (), 1, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (300, 'pysollib.games.beleagueredcastle', 'Stronghold', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (301, 'pysollib.games.beleagueredcastle', 'Private Lane', None,
+     ('Fastness',), 5, 65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {},
+     True),
+    (302, 'pysollib.games.sthelena', 'St. Helena', None,
+     ("Napoleon's Favorite", "Washington's Favorite"), 1, 0, 2, 2, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (303, 'pysollib.games.tournament', 'Tournament', None, ('Marechal Saxe',),
+     1, 0, 2, 2, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (304, 'pysollib.games.tournament', 'La Nivernaise', None,
+     ("Napoleon's Flank",), 1, 0, 2, 2, 104, 1, 0, 2, None, None, (), None, {},
+     False),
+    (305, 'pysollib.games.spider', 'Three Blind Mice', None, (), 30, 0, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (306, 'pysollib.games.beleagueredcastle', 'Zerline', None, (), 5, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (307, 'pysollib.games.headsandtails', 'Heads and Tails', None,
+     ('Regiment',), 1, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (308, 'pysollib.games.bakersdozen', 'Portuguese Solitaire', None, (), 4,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (309, 'pysollib.games.spider', 'Mrs. Mop', None, (), 30, 65536, 2, 0, 104,
+     1, 0, 5, None, None, (), None, {}, False),
+    (310, 'pysollib.games.fortythieves', 'Emperor', None, ('Deauville',), 9, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (311, 'pysollib.games.curdsandwhey', 'Dumfries', None, (), 0, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (312, 'pysollib.games.curdsandwhey', 'Galloway', None, (), 0, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (313, 'pysollib.games.curdsandwhey', 'Robin', None, (), 1, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (314, 'pysollib.games.wavemotion', 'Wave Motion', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (315, 'pysollib.games.canfield', 'Gate', None, (), 6, 0, 1, 0, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (316, 'pysollib.games.canfield', 'Little Gate', None, (), 6, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (317, 'pysollib.games.fan', 'House on the Hill', None, (), 8, 65536, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (318, 'pysollib.games.needle', 'Needle', None, (), 10, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (319, 'pysollib.games.needle', 'Haystack', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (320, 'pysollib.games.fan', 'Clover Leaf', None, (), 8, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (321, 'pysollib.games.algerian', 'Carthage', None, (), 1, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (322, 'pysollib.games.algerian', 'Algerian Patience', None, (), 1, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (323, 'pysollib.games.fortythieves', 'Octave', None, (), 9, 0, 2, 1, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (324, 'pysollib.games.beleagueredcastle', 'Bastion', None, (), 5, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (325, 'pysollib.games.beleagueredcastle', 'Ten by One', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (326, 'pysollib.games.klondike', 'Lanes', None, (), 15, 0, 1, 1, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (327, 'pysollib.games.klondike', 'Thirty-Six', None, (), 15, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (328, 'pysollib.games.montecarlo', 'The Wish', None, (), 24, 8396800, 1, 0,
+     32, 1, 0, 2, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (329, 'pysollib.games.montecarlo', 'The Wish (Open)', None, (), 24,
+     8593408, 1, 0, 32, 1, 0, 4, None, (0, 6, 7, 8, 9, 10, 11, 12), (),
+     'thewish.html', {}, False),
+    (330, 'pysollib.games.sultan', 'Sultan', None,
+     ('Emperor of Germany', 'Sultan of Turkey'), 1, 0, 2, 2, 104, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (331, 'pysollib.games.sultan', 'Sultan +', None, (), 1, 0, 2, 2, 104, 1, 0,
+     2, None, None, (), None, {}, False),
+    (332, 'pysollib.games.fortythieves', 'Mumbai', None, (), 9, 0, 3, 0, 156,
+     1, 0, 4, None, None, (), None, {}, False),
+    (333, 'pysollib.games.harp', 'Open Gargantua', None, ('Open Jumbo',), 15,
+     0, 2, 1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (334, 'pysollib.games.takeaway', 'Take Away', None,
+     ('Eliminator', 'Strip', 'Wolfpack'), 11, 65536, 1, 0, 52, 1, 0, 4, None,
+     None, (), None, {}, False),
+    (335, 'pysollib.games.takeaway', 'Four Stacks', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (336, 'pysollib.games.freecell', 'Challenge FreeCell', None, (), 10, 65536,
+     1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (337, 'pysollib.games.freecell', 'Super Challenge FreeCell', None, (), 10,
+     65536, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (338, 'pysollib.games.buffalobill', 'Buffalo Bill', None, (), 1, 65536, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (339, 'pysollib.games.yukon', 'Moosehide', None, (), 33, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (340, 'pysollib.games.fan', 'Intelligence +', None, (), 8, 0, 2, 2, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (341, 'pysollib.games.spider', 'Cicely', None, (), 30, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (342, 'pysollib.games.spider', 'Trillium', None, (), 30, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (343, 'pysollib.games.spider', 'Lily', None, (), 30, 0, 2, 0, 104, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (344, 'pysollib.games.spider', 'Chelicera', None, (), 30, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (345, 'pysollib.games.spider', 'Scorpion Head', None, (), 30, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (346, 'pysollib.games.spider', 'Scorpion Tail', None, (), 30, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (347, 'pysollib.games.fan', 'Free Fan', None, (), 8, 65536, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, True),
+    (348, 'pysollib.games.curdsandwhey', 'Arachnida', None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (349, 'pysollib.games.curdsandwhey', 'Miss Muffet', None, (), 30, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (350, 'pysollib.games.klondike', 'Q.C.', None, ('K.C.',), 15, 0, 2, 1, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (351, 'pysollib.games.beleagueredcastle', 'Chequers', None, (), 5, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (352, 'pysollib.games.curdsandwhey', 'Nordic', None, (), 30, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (353, 'pysollib.games.acesup', 'Aces Up 5', None, (), 0, 0, 1, 0, 52, 1, 0,
+     1, None, None, (), None, {}, False),
+    (354, 'pysollib.games.sultan', 'Boudoir', None, (), 1, 0, 2, 2, 104, 1, 0,
+     2, None, None, (), None, {}, False),
+    (355, 'pysollib.games.numerica', 'Frog', None, (), 23, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (356, 'pysollib.games.numerica', 'Fly', None, (), 23, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (357, 'pysollib.games.numerica', 'Gnat', None, (), 23, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (358, 'pysollib.games.braid', 'Fort', None, (), 21, 0, 2, 2, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (359, 'pysollib.games.spider', 'Spider Web', None, ('Sea Spider',), 30, 0,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (360, 'pysollib.games.canfield', 'Munger', None, (), 6, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (361, 'pysollib.games.klondike', 'Northwest Territory', None, (), 27, 0, 1,
+     0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (362, 'pysollib.games.klondike', 'Morehead', None, (), 5, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (363, 'pysollib.games.freecell', 'Spidercells', None, (), 30, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (364, 'pysollib.games.freecell', 'Seven by Four', None, (), 10, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (365, 'pysollib.games.freecell', 'Seven by Five', None, (), 10, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (366, 'pysollib.games.spider', 'Simon Jester', None, (), 30, 65536, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (367, 'pysollib.games.needle', 'Pitchfork', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (368, 'pysollib.games.montecarlo', 'Vertical', None, (), 24, 65536, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (369, 'pysollib.games.bakersdozen', 'Ripple Fan', None, (), 4, 65536, 1,
+     -1, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (370, 'pysollib.games.osmosis', 'Genesis', None, (), 0, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (371, 'pysollib.games.osmosis', 'Genesis +', None, (), 0, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (372, 'pysollib.games.bisley', 'Double Bisley', None, (), 1, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (373, 'pysollib.games.bisley', 'Gloria', None, (), 1, 196608, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (374, 'pysollib.games.bisley', 'Realm', None, (), 0, 196608, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (375, 'pysollib.games.bisley', 'Mancunian', None, (), 0, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (376, 'pysollib.games.braid', 'Backbone', None, (), 21, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (377, 'pysollib.games.braid', 'Backbone +', None, (), 21, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (378, 'pysollib.games.numerica', 'Gloaming', None, (), 23, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (379, 'pysollib.games.numerica', 'Chamberlain', None, (), 23, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (380, 'pysollib.games.montana', 'Jungle', None, (), 19, 65536, 1, 1, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (381, 'pysollib.games.montana', 'Spaces and Aces', None, (), 19, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (382, 'pysollib.games.spider', 'Applegate', None, (), 30, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (383, 'pysollib.games.freecell', 'Bath', None, (), 10, 65536, 1, 0, 52, 1,
+     0, 5, None, None, (), None, {}, True),
+    (384, 'pysollib.games.spider', 'Big Spider', None, (), 30, 0, 3, 0, 156, 1,
+     0, 4, None, None, (), None, {}, False),
+    (385, 'pysollib.games.fan', 'Box Fan', None, (), 8, 65536, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, True),
+    (386, 'pysollib.games.tournament', 'Kingsdown Eights', None, (), 1, 0, 2,
+     0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (387, 'pysollib.games.yukon', 'Roslin', None, ('Roslyn',), 33, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (388, 'pysollib.games.klondike', 'Senate', None, (), 27, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (389, 'pysollib.games.klondike', 'Senate +', None, (), 27, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (390, 'pysollib.games.klondike', 'Arizona', None, (), 27, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (391, 'pysollib.games.royalcotillion', 'British Constitution', None,
+     ('Constitution',), 1, 8388608, 2, 0, 88, 1, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (), None, {}, False),
+    (392, 'pysollib.games.royalcotillion', 'New British Constitution', None,
+     (), 1, 8519680, 2, 0, 88, 1, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (), None, {}, False),
+    (393, 'pysollib.games.beleagueredcastle', 'Castle of Indolence', None, (),
+     5, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (394, 'pysollib.games.freecell', 'Clink', None, (), 10, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (395, 'pysollib.games.beleagueredcastle', 'Zerline (3 Decks)', None, (), 5,
+     131072, 3, 0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (396, 'pysollib.games.canfield', 'Triple Canfield', None, (), 6, 0, 3, -1,
+     156, 1, 0, 3, None, None, (), None, {}, False),
+    (397, 'pysollib.games.picturegallery', 'Great Wheel', None, (), 41,
+     8388608, 2, 0, 96, 1, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (), None, {}, False),
+    (398, 'pysollib.games.picturegallery', 'Mount Olympus', None, (), 41, 0, 2,
+     0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (399, 'pysollib.games.picturegallery', 'Zeus', None, (), 41, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (400, 'pysollib.games.beleagueredcastle', 'Rittenhouse', None, (), 5,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (401, 'pysollib.games.spider', 'Big Divorce', None, (), 30, 0, 3, 0, 156,
+     1, 0, 4, None, None, (), None, {}, False),
+    (402, 'pysollib.games.numerica', 'Toad', None, ('Toad in the Hole',), 23,
+     0, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (403, 'pysollib.games.canfield', 'Acme', None, (), 6, 0, 1, 1, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (404, 'pysollib.games.bakersdozen', 'Perseverance', None, (), 4, 65536, 1,
+     2, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (405, 'pysollib.games.golf', 'All in a Row', None, ('Quasar',), 11, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (406, 'pysollib.games.auldlangsyne', 'Amazons', None, (), 23, 8388608, 1,
+     -1, 28, 1, 0, 1, None, (0, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (407, 'pysollib.games.klondike', 'Aunt Mary', None, (), 15, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (408, 'pysollib.games.sthelena', 'Box Kite', None, (), 1, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (409, 'pysollib.games.osmosis', 'Bridesmaids', None, (), 0, 0, 1, -1, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (410, 'pysollib.games.sultan', 'Captive Queens', None,
+     ('La Francaise', 'Partners', 'Quadrille'), 0, 0, 1, 2, 52, 1, 0, 1, None,
+     None, (), None, {}, False),
+    (411, 'pysollib.games.fortythieves', 'Carre Napoleon', None, (), 9, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (412, 'pysollib.games.gypsy', 'Cone', None, (), 12, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (413, 'pysollib.games.canfield', 'Duke', None, (), 6, 0, 1, 2, 52, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (414, 'pysollib.games.curdsandwhey', 'German Patience', None, (), 1, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (415, 'pysollib.games.curdsandwhey', 'Bavarian Patience', None, (), 1, 0,
+     2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (416, 'pysollib.games.fortythieves', "Fortune's Favor", None, (), 9, 0, 1,
+     0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (417, 'pysollib.games.windmill', 'Corners', None, (), 0, 0, 1, 2, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (418, 'pysollib.games.sultan', 'Contradance', None, ('Cotillion',), 1, 0,
+     2, 1, 104, 1, 0, 1, None, None, (), None, {}, False),
+    (419, 'pysollib.games.sultan', 'Idle Aces', None, (), 1, 0, 2, 2, 104, 1,
+     0, 2, None, None, (), None, {}, False),
+    (420, 'pysollib.games.klondike', 'Double Dot', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (421, 'pysollib.games.buffalobill', 'Little Billie', None, (), 1, 65536, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (422, 'pysollib.games.canfield', 'Minerva', None, (), 6, 0, 1, 1, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (423, 'pysollib.games.sultan', 'Lady of the Manor', None,
+     ('La Chatelaine', 'Vassal'), 1, 0, 2, 0, 104, 1, 0, 2, None, None, (),
+     None, {}, False),
+    (424, 'pysollib.games.sultan', 'Matrimony', None, (), 1, 0, 2, 16, 104, 1,
+     0, 2, None, None, (), None, {}, False),
+    (425, 'pysollib.games.bristol', 'New York', None, (), 8, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (426, 'pysollib.games.fortythieves', 'Octagon', None, (), 9, 0, 2, 3, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (427, 'pysollib.games.bakersgame', 'Opus', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (428, 'pysollib.games.parallels', 'Parallels', None, (), 1, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (429, 'pysollib.games.sultan', 'Patriarchs', None, (), 1, 0, 2, 1, 104, 1,
+     0, 2, None, None, (), None, {}, False),
+    (430, 'pysollib.games.numerica', 'Puss in the Corner', None, (), 23, 0, 1,
+     1, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (431, 'pysollib.games.terrace', 'Queen of Italy', None, (), 32, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (432, 'pysollib.games.golf', 'Robert', None, (), 11, 0, 1, 2, 52, 1, 0, 1,
+     None, None, (), None, {}, False),
+    (433, 'pysollib.games.diplomat', 'Rows of Four', None, (), 9, 0, 2, 2, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (434, 'pysollib.games.klondike', 'Seven Devils', None, (), 27, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (435, 'pysollib.games.numerica', 'Shifting', None, (), 23, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (436, 'pysollib.games.simplex', 'Simplex', None, (), 0, 0, 1, 0, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (437, 'pysollib.games.windmill', 'Simplicity', None, (), 0, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (438, 'pysollib.games.sultan', 'Sixes and Sevens', None, (), 1, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (439, 'pysollib.games.unionsquare', 'Solid Square', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (440, 'pysollib.games.fortythieves', 'Squadron', None, (), 9, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (441, 'pysollib.games.spider', 'York', None, (), 30, 196608, 2, 0, 104, 1,
+     0, 5, None, None, (), None, {}, False),
+    (442, 'pysollib.games.katzenschwanz', 'Deep', None, (), 10, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, True),
+    (443, 'pysollib.games.royalcotillion', 'Twenty', None, (), 23, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (444, 'pysollib.games.spider', 'Big York', None, (), 30, 196608, 3, 0, 156,
+     1, 0, 5, None, None, (), None, {}, False),
+    (445, 'pysollib.games.spider', 'Big Spider (1 Suit)', None, (), 30, 0, 3,
+     0, 156, 1, 0, 4, (0, 0, 0, 0), None, (), 'bigspider.html', {}, False),
+    (446, 'pysollib.games.spider', 'Big Spider (2 Suits)', None, (), 30, 0, 3,
+     0, 156, 1, 0, 4, (0, 0, 2, 2), None, (), 'bigspider.html', {}, False),
+    (447, 'pysollib.games.yukon', 'Australian Patience', None,
+     ('Outback Patience',), 33, 0, 1, 0, 52, 1, 0, 3, None, None, (), None, {},
+     False),
+    (448, 'pysollib.games.freecell', 'Repair', None, (), 10, 65536, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, True),
+    (449, 'pysollib.games.spider', 'Spider 3x3', None, (), 30, 8519680, 3, 0,
+     117, 1, 0, 4, (0, 1, 2), None, (), None, {}, False),
+    (450, 'pysollib.games.yukon', 'Raw Prawn', None, (), 33, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (451, 'pysollib.games.freecell', 'Cell 11', None, (), 10, 65536, 3, 0, 156,
+     1, 0, 4, None, None, (), None, {}, False),
+    (452, 'pysollib.games.klondike', 'Double Easthaven', None, (), 12, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (453, 'pysollib.games.klondike', 'Triple Easthaven', None, (), 12, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (454, 'pysollib.games.spider', 'Spider (4 Decks)', None, (), 30, 0, 4, 0,
+     208, 1, 0, 4, None, None, (), None, {}, False),
+    (455, 'pysollib.games.spider', 'Very Big Divorce', None, (), 30, 0, 4, 0,
+     208, 1, 0, 4, None, None, (), None, {}, False),
+    (456, 'pysollib.games.yukon', 'Bim Bom', None, (), 33, 131072, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (457, 'pysollib.games.algerian', 'Algerian Patience (3 Decks)', None, (),
+     2, 131072, 3, 0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (458, 'pysollib.games.spider', 'Spidike', None, (), 30, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (459, 'pysollib.games.spider', "Fred's Spider", None, (), 30, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (460, 'pysollib.games.spider', "Fred's Spider (3 Decks)", None, (), 30, 0,
+     3, 0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (461, 'pysollib.games.spider', 'Open Spider', None, ('Beetle',), 30, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (462, 'pysollib.games.fortythieves', 'Josephine', None, ('Forty Bandits',),
+     9, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (463, 'pysollib.games.gypsy', 'Surprise', None, (), 12, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (464, 'pysollib.games.freecell', 'Four Colours', None, (), 10, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (465, 'pysollib.games.royalcotillion', 'Granada', None, (), 1, 0, 2, 2,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (466, 'pysollib.games.yukon', 'Double Russian Solitaire', None, (), 33, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (467, 'pysollib.games.zodiac', 'Zodiac', None, (), 1, 0, 2, -1, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (468, 'pysollib.games.bristol', 'Spike', None, (), 15, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (469, 'pysollib.games.gypsy', 'Phantom Blockade', None, (), 12, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (470, 'pysollib.games.klondike', 'Moving Left', None, (), 15, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (471, 'pysollib.games.klondike', 'Souter', None, (), 15, 0, 2, 1, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (472, 'pysollib.games.numerica', 'Strategerie', None, (), 23, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (473, 'pysollib.games.klondike', 'Big Forty', None, (), 15, 0, 1, -1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (474, 'pysollib.games.klondike', 'Ali Baba', None, (), 15, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (475, 'pysollib.games.klondike', 'Cassim', None, (), 15, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (476, 'pysollib.games.canfield', 'Demon', None, (), 6, 0, 2, -1, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (477, 'pysollib.games.sultan', 'Corner Suite', None, (), 0, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (478, 'pysollib.games.gypsy', 'Elba', None, (), 12, 0, 2, 0, 104, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (479, 'pysollib.games.klondike', 'Saratoga', None, ('Thoughtful',), 15, 0,
+     1, -1, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (480, 'pysollib.games.curdsandwhey', 'Trusty Twelve', None, (), 0, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (481, 'pysollib.games.curdsandwhey', 'Knotty Nines', None, (), 0, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (482, 'pysollib.games.curdsandwhey', 'Sweet Sixteen', None, (), 0, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (483, 'pysollib.games.windmill', 'Czarina', None, (), 0, 0, 1, 0, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (484, 'pysollib.games.windmill', 'Four Seasons', None,
+     ('Corner Card', 'Cross Currents', 'Vanishing Cross'), 0, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (485, 'pysollib.games.diplomat', 'Dieppe', None, (), 9, 0, 2, 0, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (486, 'pysollib.games.gypsy', 'Imperial Guards', None, (), 12, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (487, 'pysollib.games.gypsy', 'Millie', None, (), 12, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (488, 'pysollib.games.yukon', 'Triple Russian Solitaire', None, (), 33, 0,
+     3, 0, 156, 1, 0, 3, None, None, (), None, {}, False),
+    (489, 'pysollib.games.diplomat', 'Little Napoleon', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (490, 'pysollib.games.auldlangsyne', 'Acquaintance', None, (), 23, 0, 1, 2,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (491, 'pysollib.games.klondike', 'Whitehorse', None, (), 15, 0, 1, -1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (492, 'pysollib.games.yukon', 'Geoffrey', None, (), 33, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (493, 'pysollib.games.fortythieves', 'Marie Rose', None, (), 9, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (494, 'pysollib.games.canfield', 'Mystique', None, (), 6, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (495, 'pysollib.games.harp', 'Lady Jane', None, (), 15, 0, 2, 1, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (496, 'pysollib.games.harp', 'Inquisitor', None, (), 15, 0, 2, 2, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (497, 'pysollib.games.harp', 'Arabella', None, (), 15, 0, 3, 0, 156, 1, 0,
+     3, None, None, (), None, {}, False),
+    (498, 'pysollib.games.gypsy', 'Steve', None, (), 12, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (499, 'pysollib.games.terrace', 'Signora', None, (), 32, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (500, 'pysollib.games.terrace', 'Madame', None, (), 32, 0, 3, 0, 156, 1, 0,
+     4, None, None, (), None, {}, False),
+    (501, 'pysollib.games.spider', 'Wake-Robin', None, (), 30, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (502, 'pysollib.games.spider', 'Wake-Robin (3 Decks)', None, (), 30,
+     131072, 3, 0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (503, 'pysollib.games.fortythieves', 'Big Streets', None, (), 9, 131072, 3,
+     0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (504, 'pysollib.games.fortythieves', 'Number Twelve', None, (), 9, 131072,
+     3, 0, 156, 1, 0, 3, None, None, (), None, {}, False),
+    (505, 'pysollib.games.fortythieves', 'Big Courtyard', None, (), 9, 131072,
+     3, 0, 156, 1, 0, 3, None, None, (), None, {}, False),
+    (506, 'pysollib.games.fortythieves', 'Express', None, (), 9, 131072, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (507, 'pysollib.games.beleagueredcastle', 'Lightweight', None, (), 5,
+     196608, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, True),
+    (508, 'pysollib.games.beleagueredcastle', 'Castle Mount', None, (), 5,
+     65536, 3, 0, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (509, 'pysollib.games.freecell', 'Big Cell', None, (), 10, 196608, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (510, 'pysollib.games.braid', 'Big Braid', None, (), 21, 131072, 3, 2, 156,
+     1, 0, 3, None, None, (), None, {}, False),
+    (511, 'pysollib.games.spider', 'Double Scorpion', None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (512, 'pysollib.games.spider', 'Triple Scorpion', None, (), 30, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (513, 'pysollib.games.freecell', 'Double Seahaven Towers', None,
+     ('Ocean Towers',), 10, 65536, 2, 0, 104, 1, 0, 4, None, None, (), None,
+     {}, True),
+    (514, 'pysollib.games.fortythieves', 'Carnation', None, (), 9, 131072, 4,
+     0, 208, 1, 0, 4, None, None, (), None, {}, False),
+    (515, 'pysollib.games.bakersdozen', 'Indefatigable', None, (), 4, 65536, 1,
+     2, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (516, 'pysollib.games.fan', 'Troika', None, (), 8, 65536, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (517, 'pysollib.games.fan', 'Quads', None, (), 8, 196608, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (518, 'pysollib.games.klondike', 'Boost', None, ('Klondike Mini',), 15,
+     131072, 1, 2, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (519, 'pysollib.games.bristol', 'Gotham', None, (), 8, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (520, 'pysollib.games.freecell', 'German FreeCell', None, (), 10, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (521, 'pysollib.games.canfield', 'Canfield Rush', None, (), 6, 0, 1, 2, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (522, 'pysollib.games.klondike', 'Artic Garden', None, (), 27, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (523, 'pysollib.games.katzenschwanz', 'Intrigue', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (524, 'pysollib.games.beleagueredcastle', 'Selective Castle', None, (), 5,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (525, 'pysollib.games.yukon', 'Queensland', None, (), 33, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (527, 'pysollib.games.canfield', 'Doorway', None, ('Solstice',), 15, 0, 1,
+     0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (528, 'pysollib.games.fortythieves', 'Final Battle', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (529, 'pysollib.games.fortythieves', 'San Juan Hill', None,
+     ('Kettle Hill',), 9, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (530, 'pysollib.games.yukon', 'Russian Spider', None,
+     ('Ukrainian Solitaire',), 30, 0, 1, 0, 52, 1, 0, 3, None, None, (), None,
+     {}, False),
+    (531, 'pysollib.games.yukon', 'Double Russian Spider', None, (), 30,
+     131072, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (532, 'pysollib.games.klondike', 'Gold Rush', None, (), 15, 0, 1, 2, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (533, 'pysollib.games.terrace', 'Mamy Susan', None, (), 32, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (534, 'pysollib.games.curdsandwhey', 'Harvestman', None, (), 30, 131072, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (535, 'pysollib.games.beleagueredcastle', 'Exiled Kings', None, (), 5,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (536, 'pysollib.games.napoleon', 'Master', None, (), 21, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (537, 'pysollib.games.napoleon', 'The Little Corporal', None, (), 21,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (538, 'pysollib.games.napoleon', 'Bonaparte', None, (), 21, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (539, 'pysollib.games.klondike', 'Usk', None, (), 15, 65536, 1, 1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (540, 'pysollib.games.fortythieves', 'Waterloo', None, (), 9, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (541, 'pysollib.games.klondike', 'Batsford Again', None, (), 15, 0, 2, 1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (542, 'pysollib.games.freecell', 'KingCell', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (543, 'pysollib.games.spider', "Farmer's Wife", None, (), 30, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (544, 'pysollib.games.spider', 'How They Run', None, (), 30, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (545, 'pysollib.games.harp', 'Big Deal', None, (), 15, 131072, 4, 1, 208,
+     1, 0, 3, None, None, (), None, {}, False),
+    (546, 'pysollib.games.picturegallery', 'Royal Parade', None,
+     ('Financier', 'Hussars'), 41, 0, 2, 0, 104, 1, 0, 4, None, None, (), None,
+     {}, False),
+    (547, 'pysollib.games.picturegallery', 'Virginia Reel', None, (), 41, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (548, 'pysollib.games.diplomat', 'Parliament', None, (), 9, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (549, 'pysollib.games.diplomat', 'Wheatsheaf', None, (), 9, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (550, 'pysollib.games.calculation', 'One234', None, ('1-2-3-4',), 0, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (551, 'pysollib.games.golf', 'Diamond Mine', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (552, 'pysollib.games.acesup', 'Cover', None, (), 0, 0, 1, 0, 52, 1, 0, 1,
+     None, None, (), None, {}, False),
+    (553, 'pysollib.games.auldlangsyne', 'Scuffle', None, (), 23, 0, 1, 2, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (554, 'pysollib.games.pileon', 'Foursome', None, (), 0, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (555, 'pysollib.games.pileon', 'Quartets', None, (), 0, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (556, 'pysollib.games.fortythieves', 'Junction', None, (), 9, 8388608, 4,
+     0, 128, 1, 0, 4, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (557, 'pysollib.games.grandduchess', 'Grand Duchess', None,
+     ('Duchess de Luynes',), 23, 0, 2, 3, 104, 1, 0, None, None, None, (),
+     None, {}, False),
+    (558, 'pysollib.games.numerica', 'Numerica (2 Decks)', None, (), 23, 0, 2,
+     0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (559, 'pysollib.games.sultan', 'Marshal', None, (), 1, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (560, 'pysollib.games.auldlangsyne', 'Double Acquaintance', None, (), 23,
+     0, 2, 2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (561, 'pysollib.games.windmill', 'Dutch Solitaire', None, (), 1, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (562, 'pysollib.games.harp', 'Delivery', None, (), 9, 131072, 4, 0, 208, 1,
+     0, 3, None, None, (), None, {}, False),
+    (563, 'pysollib.games.diplomat', 'Twin Queens', None, (), 9, 0, 2, 1, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (564, 'pysollib.games.fortythieves', 'Kilowatt', None, (), 9, 0, 2, 0, 104,
+     1, 0, 2, None, None, (), None, {}, False),
+    (565, 'pysollib.games.sultan', 'Royal Aids', None, (), 1, 0, 2, -1, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (566, 'pysollib.games.gypsy', 'Hypotenuse', None, ('Brazilian Patience',),
+     12, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (567, 'pysollib.games.gypsy', 'Eternal Triangle', None, ('Lobachevsky',),
+     12, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (568, 'pysollib.games.gypsy', 'Right Triangle', None, (), 12, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (569, 'pysollib.games.auldlangsyne', 'Primrose', None,
+     ('As You Like It', 'Capuchin'), 23, 65536, 2, 8, 104, 1, 0, 3, None, None,
+     (), None, {}, False),
+    (570, 'pysollib.games.spider', 'Long Tail', None, (), 30, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (571, 'pysollib.games.spider', 'Short Tail', None, (), 30, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (572, 'pysollib.games.klondike', 'Gold Mine', None, (), 23, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (573, 'pysollib.games.fortythieves', 'Double Gold Mine', None, (), 23,
+     131072, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (574, 'pysollib.games.fortythieves', 'Interchange', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (575, 'pysollib.games.fortythieves', 'Unlimited', None, (), 9, 0, 2, -1,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (576, 'pysollib.games.fortythieves', 'Breakwater', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (577, 'pysollib.games.fortythieves', 'Forty-Nine', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (578, 'pysollib.games.fortythieves', 'Indian Patience', None, (), 9, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (579, 'pysollib.games.royalcotillion', 'Three Pirates', None, (), 1, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (580, 'pysollib.games.gypsy', 'Trapdoor', None, (), 12, 131072, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (581, 'pysollib.games.gypsy', 'Flamenco', None, (), 12, 131072, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (582, 'pysollib.games.terrace', 'Wood', None, (), 32, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (583, 'pysollib.games.acesup', 'Firing Squad', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (584, 'pysollib.games.gypsy', 'Eclipse', None, (), 12, 0, 2, 0, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (585, 'pysollib.games.klondike', 'Lucky Thirteen', None, (), 0, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (586, 'pysollib.games.klondike', 'Lucky Piles', None, (), 8, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (587, 'pysollib.games.glenwood', 'Double Fives', None, (), 1, 2097152, 2,
+     1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (588, 'pysollib.games.fortythieves', 'Roosevelt', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (589, 'pysollib.games.numerica', 'Last Chance', None, (), 23, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (590, 'pysollib.games.harp', 'Chinese Klondike', None, (), 15, 8388608, 3,
+     -1, 117, 1, 0, 3, (0, 1, 2), None, (), None, {}, False),
+    (591, 'pysollib.games.harp', 'Pantagruel', None, (), 15, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (592, 'pysollib.games.pyramid', 'Giza', None, (), 24, 65536, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (593, 'pysollib.games.pyramid', 'Thirteens', None,
+     ('Good Thirteen', 'Helsinki'), 24, 0, 1, 0, 52, 1, 0, 1, None, None, (),
+     None, {}, False),
+    (594, 'pysollib.games.pyramid', 'Elevens', None, ('Eleven Away',), 24, 0,
+     1, 0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (595, 'pysollib.games.pyramid', 'Elevens Too', None, (), 24, 0, 1, 0, 52,
+     1, 0, 1, None, None, (), None, {}, False),
+    (596, 'pysollib.games.pyramid', 'Suit Elevens', None, (), 24, 0, 1, 0, 52,
+     1, 0, 1, None, None, (), None, {}, False),
+    (597, 'pysollib.games.pyramid', 'Fifteens', None, (), 24, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (598, 'pysollib.games.sultan', 'Picture Patience', None, (), 1, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (599, 'pysollib.games.numerica', 'Assembly', None, (), 23, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (600, 'pysollib.games.numerica', 'Anno Domini', None, (), 23, 0, 1, 2, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (601, 'pysollib.games.klondike', 'American Canister', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (602, 'pysollib.games.klondike', 'British Canister', None, (), 5, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (603, 'pysollib.games.yukon', 'Brisbane', None, (), 33, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (604, 'pysollib.games.bristol', 'Interment', None, (), 8, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (605, 'pysollib.games.canfield', 'Skippy', None, (), 8, 0, 2, 0, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (606, 'pysollib.games.capricieuse', 'Strata', None,
+     ('Bezique', 'Persian Patience'), 4, 8454144, 2, 2, 64, 1, 0, 4, None,
+     (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (607, 'pysollib.games.klondike', 'Legion', None, (), 15, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (608, 'pysollib.games.royalcotillion', 'Frames', None, (), 1, 0, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (609, 'pysollib.games.royalcotillion', "Grant's Reinforcement", None,
+     ('Reinforcements',), 1, 0, 2, 2, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (610, 'pysollib.games.camelot', 'Sly Fox', None, (), 23, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (611, 'pysollib.games.katzenschwanz', 'Faerie Queen', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (612, 'pysollib.games.katzenschwanz', 'Glencoe', None, (), 1, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (613, 'pysollib.games.numerica', 'Fanny', None, (), 23, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (614, 'pysollib.games.camelot', 'Open Sly Fox', None, (), 23, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (615, 'pysollib.games.parallels', 'British Blockade', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (616, 'pysollib.games.katzenschwanz', 'Laggard Lady', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (617, 'pysollib.games.grandduchess', 'Parisienne', None,
+     ('La Parisienne', 'Parisian'), 23, 0, 2, 3, 104, 1, 0, None, None, None,
+     (), None, {}, False),
+    (618, 'pysollib.games.grandduchess', 'Grand Duchess +', None, (), 23, 0, 2,
+     3, 104, 1, 0, None, None, None, (), None, {}, False),
+    (619, 'pysollib.games.pyramid', 'Triple Alliance', None, ('Triplets',), 24,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (620, 'pysollib.games.sthelena', 'Les Quatre Coins', None,
+     ('Corner Patience', 'Cornerstones', 'Four Corners'), 1, 0, 2, 2, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (621, 'pysollib.games.sthelena', 'Regal Family', None, (), 1, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (622, 'pysollib.games.camelot', "Grandmamma's Patience", None, (), 23, 0,
+     2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (623, 'pysollib.games.camelot', 'Princess Patience', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (624, 'pysollib.games.katzenschwanz', 'Step-Up', None, (), 1, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (625, 'pysollib.games.fan', 'Fascination Fan', None, ('Demon Fan',), 8, 0,
+     1, 6, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (626, 'pysollib.games.beleagueredcastle', 'Soother', None, (), 3, 131072,
+     4, 0, 208, 1, 0, 4, None, None, (), None, {}, False),
+    (627, 'pysollib.games.klondike', 'Queen Victoria', None, (), 27, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (628, 'pysollib.games.fortythieves', 'Crossroads', None, (), 9, 0, 4, 0,
+     208, 1, 0, 3, None, None, (), None, {}, False),
+    (629, 'pysollib.games.bakersgame', 'Tuxedo', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, True),
+    (630, 'pysollib.games.klondike', 'Big Bertha', None, (), 27, 65536, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (631, 'pysollib.games.fortythieves', 'Alternation', None, (), 9, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (632, 'pysollib.games.fortythieves', 'Floradora', None, (), 9, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (633, 'pysollib.games.klondike', 'Athena', None, (), 15, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (634, 'pysollib.games.klondike', 'Chinaman', None, (), 15, 0, 1, 1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (635, 'pysollib.games.sultan', 'Circle Eight', None, (), 0, 0, 1, 1, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (636, 'pysollib.games.auldlangsyne', 'Strategy +', None, (), 23, 0, 1, 0,
+     52, 1, 0, 5, None, None, (), None, {}, False),
+    (637, 'pysollib.games.terrace', 'Bastille Day', None, (), 32, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (638, 'pysollib.games.royalcotillion', 'Royal Rendezvous', None,
+     ('Royal Appointment',), 1, 0, 2, 0, 104, 1, 0, 3, None, None, (), None,
+     {}, False),
+    (639, 'pysollib.games.royalcotillion', 'Shady Lanes', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (641, 'pysollib.games.numerica', 'Circle Nine', None, (), 23, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (642, 'pysollib.games.canfield', 'Lafayette', None, (), 6, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (643, 'pysollib.games.numerica', 'Measure', None, (), 23, 131072, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (644, 'pysollib.games.numerica', 'Double Measure', None, (), 23, 131072, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (645, 'pysollib.games.tournament', 'Saxony', None, (), 1, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (646, 'pysollib.games.sultan', 'Adela', None, (), 1, 0, 2, 0, 104, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (647, 'pysollib.games.fan', 'Crescent', None, ('La Demi-Lune',), 8, 65536,
+     2, 3, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (648, 'pysollib.games.freecell', 'Headquarters', None, (), 10, 196608, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (649, 'pysollib.games.montecarlo', 'Doublets II', None, (), 24, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (650, 'pysollib.games.beleagueredcastle', 'Castles End', None, (), 5,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (651, 'pysollib.games.klondike', 'Eight by Eight', None, (), 15, 0, 2, 2,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (652, 'pysollib.games.tournament', 'Ladies Battle', None, (), 0, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (653, 'pysollib.games.calculation', 'Senior Wrangler', None,
+     ('Mathematics',), 1, 0, 2, 8, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (654, 'pysollib.games.takeaway', 'Striptease', None, (), 11, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (655, 'pysollib.games.pyramid', 'Pharaohs', None, (), 24, 65536, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (656, 'pysollib.games.pushpin', 'Bayan', None, (), 0, 0, 1, 0, 52, 1, 0, 5,
+     None, None, (), None, {}, False),
+    (657, 'pysollib.games.pyramid', 'Baroness', None, ('Five Piles',), 24, 0,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (658, 'pysollib.games.pyramid', 'Apophis', None, (), 24, 0, 1, 2, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (659, 'pysollib.games.pyramid', 'Cheops', None, (), 24, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (660, 'pysollib.games.sultan', 'Toni', None, (), 1, 0, 2, 2, 104, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (661, 'pysollib.games.golf', 'Dolphin', None, (), 11, 196608, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (662, 'pysollib.games.golf', 'Double Dolphin', None, (), 11, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (663, 'pysollib.games.montecarlo', 'The Last Monarch II', None, (), 1,
+     131072, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (664, 'pysollib.games.bakersdozen', 'Spanish Patience II', None, (), 4,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (665, 'pysollib.games.beleagueredcastle', "Penelope's Web", None, (), 5,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (666, 'pysollib.games.gypsy', 'Trapdoor Spider', None, (), 30, 131072, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (667, 'pysollib.games.klondike', 'Kingsley', None, (), 15, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (668, 'pysollib.games.harp', 'Double Kingsley', None, (), 15, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (669, 'pysollib.games.klondike', 'Scarp', None, (), 12, 131072, 3, 0, 156,
+     1, 0, 4, None, None, (), None, {}, False),
+    (670, 'pysollib.games.spider', 'Chinese Spider', None, (), 30, 8388608, 4,
+     0, 156, 1, 0, 4, (0, 1, 2), None, (), None, {}, False),
+    (671, 'pysollib.games.spider', 'Incompatibility', None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (672, 'pysollib.games.spider', 'Scorpion II', None, (), 30, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (673, 'pysollib.games.capricieuse', 'Fifteen', None, (), 4, 65536, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (674, 'pysollib.games.pyramid', 'Relaxed Exit', None, (), 24, 589824, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (675, 'pysollib.games.royalcotillion', 'Four Winds', None, (), 0, 0, 1, 1,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (676, 'pysollib.games.royalcotillion', 'Boxing the Compass', None, (), 1,
+     0, 2, 1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (677, 'pysollib.games.pyramid', 'Two Pyramids', None, (), 24, 131072, 2, 2,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (678, 'pysollib.games.harp', 'Thieves of Egypt', None, (), 15, 0, 2, 1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (679, 'pysollib.games.fortythieves', 'Triple Interchange', None, (), 9, 0,
+     3, -1, 156, 1, 0, 4, None, None, (), None, {}, False),
+    (680, 'pysollib.games.spider', 'Tarantula', None, (), 30, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (681, 'pysollib.games.pyramid', 'King Tut', None, ("Tut's Tomb",), 24, 0,
+     1, -1, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (682, 'pysollib.games.grandfathersclock', 'Dial', None, (), 0, 0, 1, 1, 52,
+     1, 0, 1, None, None, (), None, {}, False),
+    (683, 'pysollib.games.fortythieves', 'Famous Fifty', None, (), 9, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (684, 'pysollib.games.acesup', 'Deck', None, ('Affinity', 'Suits Up'), 0,
+     0, 1, 0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (685, 'pysollib.games.spider', "Fechter's Game", None, (), 30, 0, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (686, 'pysollib.games.bisley', 'Hospital Patience', None, (), 0, 0, 1, -1,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (687, 'pysollib.games.curdsandwhey', 'Glacier', None, (), 1, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (688, 'pysollib.games.auldlangsyne', 'Ants', None, ('Formic',), 11, 0, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (689, 'pysollib.games.harp', 'Brush', None, (), 30, 131072, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (690, 'pysollib.games.grandfathersclock', 'Hemispheres', None,
+     ('The Four Continents',), 1, 0, 2, 0, 104, 1, 0, 3, None, None, (), None,
+     {}, False),
+    (691, 'pysollib.games.sultan', 'Khedive', None, (), 1, 0, 2, 0, 104, 1, 0,
+     2, None, None, (), None, {}, False),
+    (692, 'pysollib.games.bisley', 'Board Patience', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (693, 'pysollib.games.royalcotillion', 'Colonel', None,
+     ("Uncle Walter's",), 1, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {},
+     False),
+    (694, 'pysollib.games.braid', 'Casket', None, (), 1, 0, 2, 0, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (695, 'pysollib.games.royalcotillion', 'The Red and the Black', None, (),
+     1, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (696, 'pysollib.games.windmill', 'Florentine Patience', None, (), 0, 0, 1,
+     1, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (697, 'pysollib.games.grandfathersclock', 'Big Ben', None,
+     ('Father Time',), 1, 0, 2, 0, 104, 1, 0, 3, None, None, (), None, {},
+     False),
+    (698, 'pysollib.games.freecell', 'Can Can', None, (), 27, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (699, 'pysollib.games.pyramid', 'Double Pyramid', None, (), 24, 0, 2, 2,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (700, 'pysollib.games.pyramid', 'Triangle', None, ('Yield',), 24, 0, 1, 2,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (701, 'pysollib.games.pyramid', 'Up and Down', None, (), 24, 131072, 2, 2,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (702, 'pysollib.games.auldlangsyne', 'Double Line', None, (), 23, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (703, 'pysollib.games.pileon', 'Four by Four', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (704, 'pysollib.games.calculation', 'S Patience', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (705, 'pysollib.games.napoleon', 'Busy Cards', None, (), 21, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (706, 'pysollib.games.montana', 'Paganini', None, ('Long Trip',), 19,
+     8454144, 1, 1, 36, 1, 0, 4, None, (0, 5, 6, 7, 8, 9, 10, 11, 12), (),
+     None, {}, False),
+    (707, 'pysollib.games.yukon', 'Hawaiian', None, (), 33, 131072, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (708, 'pysollib.games.headsandtails', 'Barrier', None, (), 1, 131072, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (709, 'pysollib.games.golf', 'Waterfall', None, (), 1, 131072, 2, 0, 104,
+     1, 0, 4, None, None, (), None, {}, False),
+    (710, 'pysollib.games.spider', 'Bebop', None, (), 1, 131072, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (711, 'pysollib.games.spider', 'The Jolly Roger', None, (), 30, 131072, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (712, 'pysollib.games.gypsy', 'Leprechaun', None, (), 12, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (713, 'pysollib.games.bakersgame', 'Flipper', None, (), 10, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (714, 'pysollib.games.fan', 'Shamrocks II', None, (), 8, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (715, 'pysollib.games.osmosis', 'Osmosis', None, ('Treasure Trove',), 0, 0,
+     1, -1, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (716, 'pysollib.games.osmosis', 'Peek', None, (), 0, 0, 1, -1, 52, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (717, 'pysollib.games.braid', 'Well', None, (), 1, 0, 2, 4, 104, 1, 0, 3,
+     None, None, (), None, {}, False),
+    (718, 'pysollib.games.gypsy', 'Locked Cards', None, (), 1, 0, 2, 2, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (719, 'pysollib.games.fan', 'School', None, (), 8, 65536, 1, 2, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (720, 'pysollib.games.golf', 'Vague', None, (), 0, 0, 1, 0, 52, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (721, 'pysollib.games.gypsy', 'Thirty', None, (), 0, 8454144, 1, 0, 32, 1,
+     0, 4, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (722, 'pysollib.games.zodiac', 'Twelve Sleeping Maids', None, (), 1, 0, 2,
+     2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (723, 'pysollib.games.golf', "Devil's Solitaire", None, ('Banner',), 1, 0,
+     2, 2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (724, 'pysollib.games.curdsandwhey', 'Eight Packs', None, (), 1, 131072, 2,
+     2, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (725, 'pysollib.games.gypsy', 'Topsy-Turvy Queens', None, (), 1, 0, 2, 2,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (726, 'pysollib.games.klondike', 'Eight Sages', None, (), 15, 0, 2, 1, 104,
+     1, 0, 2, None, None, (), None, {}, False),
+    (727, 'pysollib.games.montecarlo', 'Right and Left', None, (), 24, 0, 2,
+     -1, 104, 1, 0, 1, None, None, (), None, {}, False),
+    (728, 'pysollib.games.golf', 'Thirty-Two Cards', None, (), 1, 0, 2, 0, 104,
+     1, 0, 1, None, None, (), None, {}, False),
+    (729, 'pysollib.games.sultan', 'Two Rings', None, (), 1, 0, 2, 1, 104, 1,
+     0, 2, None, None, (), None, {}, False),
+    (730, 'pysollib.games.sultan', 'Phalanx', None, (), 0, 0, 1, 0, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (731, 'pysollib.games.golf', 'Three Fir-trees', None, (), 11, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, True),
+    (732, 'pysollib.games.yukon', 'Wave', None, (), 33, 131072, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (733, 'pysollib.games.golf', 'Napoleon Takes Moscow', None, (), 21, 0, 2,
+     2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (734, 'pysollib.games.golf', 'Napoleon Leaves Moscow', None,
+     ('Napoleon at Friedland',), 21, 0, 2, 2, 104, 1, 0, 3, None, None, (),
+     None, {}, False),
+    (735, 'pysollib.games.pyramid', 'Hurricane', None, (), 24, 0, 1, 0, 52, 1,
+     0, 2, None, None, (), None, {}, False),
+    (736, 'pysollib.games.montana', 'Spoilt', None, (), 19, 8388608, 1, 0, 32,
+     1, 0, 2, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (737, 'pysollib.games.grandfathersclock', 'Clock', None,
+     ('Sundial', 'Travellers'), 0, 0, 1, 0, 52, 1, 0, 1, None, None, (), None,
+     {}, False),
+    (738, 'pysollib.games.unionsquare', 'Boomerang', None, (), 1, 8388608, 2,
+     0, 64, 1, 0, 3, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (739, 'pysollib.games.fan', 'Forest Glade', None, (), 8, 0, 2, 2, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (740, 'pysollib.games.pileon', 'Footling', None, (), 10, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (741, 'pysollib.games.pileon', 'Double Footling', None, (), 10, 196608, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (742, 'pysollib.games.sultan', 'Grandee', None, (), 1, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (743, 'pysollib.games.sultan', 'Turncoats', None, (), 0, 0, 1, 0, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (744, 'pysollib.games.sultan', 'Voracious', None, (), 1, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (745, 'pysollib.games.sultan', 'Desert Island', None, (), 1, 131072, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (746, 'pysollib.games.freecell', 'Limpopo', None, (), 10, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (747, 'pysollib.games.bisley', 'Cringle', None, (), 1, 131072, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (748, 'pysollib.games.royalcotillion', 'Twilight Zone', None, (), 1, 0, 2,
+     1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (749, 'pysollib.games.golf', 'Flake', None, (), 11, 196608, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (750, 'pysollib.games.golf', 'Flake (2 Decks)', None, (), 11, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (751, 'pysollib.games.fortythieves', 'Blind Patience', None, (), 9, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (752, 'pysollib.games.royalcotillion', 'Reserves', None, (), 1, 0, 2, 2,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (753, 'pysollib.games.wavemotion', 'Flourish', None, (), 0, 196608, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (754, 'pysollib.games.numerica', 'Amphibian', None, (), 23, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (755, 'pysollib.games.capricieuse', 'Choice', None, (), 2, 8585216, 3, 0,
+     96, 1, 0, 4, None, (5, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (756, 'pysollib.games.acesup', 'Tabby Cat', None, (), 0, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (757, 'pysollib.games.acesup', 'Manx', None, (), 0, 0, 1, 0, 52, 1, 0, 4,
+     None, None, (), None, {}, False),
+    (758, 'pysollib.games.acesup', 'Maine Coon', None, (), 1, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (759, 'pysollib.games.montana', 'Paganini II', None, (), 19, 65536, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (760, 'pysollib.games.numerica', 'Aglet', None, (), 0, 196608, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (761, 'pysollib.games.sultan', 'Catherine the Great', None, (), 1, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (762, 'pysollib.games.curdsandwhey', 'Four Packs', None, (), 1, 0, 2, 1,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (763, 'pysollib.games.golf', 'Wasatch', None, (), 11, 0, 1, -1, 52, 1, 0,
+     2, None, None, (), None, {}, False),
+    (764, 'pysollib.games.golf', 'Beacon', None, (), 0, 131072, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (765, 'pysollib.games.fortythieves', 'Foothold', None, (), 9, 131072, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, False),
+    (766, 'pysollib.games.katzenschwanz', 'Kentish', None, (), 1, 196608, 2, 0,
+     104, 1, 0, 4, None, None, (), None, {}, True),
+    (767, 'pysollib.games.fan', 'Quads +', None, (), 8, 196608, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (768, 'pysollib.games.golf', 'Relaxed Three Fir-trees', None, (), 11,
+     524288, 2, 0, 104, 1, 0, 3, None, None, (), None, {}, True),
+    (769, 'pysollib.games.special.hanoi', 'Hanoi Sequence', None, (), 35,
+     65536, 1, 0, 9, 1, 0, 5, (2,), (0, 1, 2, 3, 4, 5, 6, 7, 8), (), None, {},
+     False),
+    (770, 'pysollib.games.montana', 'Double Blue Moon', None, (), 19, 65536, 2,
+     2, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (771, 'pysollib.games.montana', 'Double Red Moon', None, (), 19, 65536, 2,
+     2, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (772, 'pysollib.games.pushpin', 'Accordion', None,
+     ('Idle Year', 'Methuselah', 'One Away Three Away', 'One-Handed',
+      'Tower of Babel'),
+     0, 0, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (773, 'pysollib.games.pushpin', 'Relaxed Accordion', None, (), 0, 524288,
+     1, 0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (774, 'pysollib.games.hitormiss', 'Hit or Miss', None, ('Roll Call',), 0,
+     0, 1, -2, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (775, 'pysollib.games.fortythieves', 'Sixty Thieves', None, (), 9, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (776, 'pysollib.games.fortythieves', 'Eighty Thieves', None, (), 9, 0, 4,
+     0, 208, 1, 0, 4, None, None, (), None, {}, False),
+    (777, 'pysollib.games.golf', 'Double Golf', None, (), 11, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, True),
+    (778, 'pysollib.games.crossword', 'Crossword', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (779, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 3', None, (), 35,
+     65536, 1, 0, 3, 1, 0, 5, (2,), (0, 1, 2), (), 'hanoipuzzle.html', {},
+     False),
+    (780, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 7', None, (), 35,
+     65536, 1, 0, 7, 1, 0, 5, (2,), (0, 1, 2, 3, 4, 5, 6), (),
+     'hanoipuzzle.html', {}, False),
+    (781, 'pysollib.games.special.hanoi', 'Hanoi Puzzle 8', None, (), 35,
+     65536, 1, 0, 8, 1, 0, 5, (2,), (0, 1, 2, 3, 4, 5, 6, 7), (),
+     'hanoipuzzle.html', {}, False),
+    (782, 'pysollib.games.picturegallery', 'Greater Wheel', None, (), 41,
+     8388608, 4, 0, 192, 1, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (), None, {}, False),
+    (783, 'pysollib.games.golf', 'Uintah', None, (), 11, 0, 1, -1, 52, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (784, 'pysollib.games.takeaway', 'Take Away 8', None, (), 11, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (785, 'pysollib.games.terrace', 'Big Terrace', None, (), 32, 0, 4, 0, 208,
+     1, 0, 4, None, None, (), None, {}, False),
+    (786, 'pysollib.games.terrace', 'Empress of Italy', None, (), 32, 0, 4, 0,
+     208, 1, 0, 4, None, None, (), None, {}, False),
+    (787, 'pysollib.games.terrace', "Admiral's Patience", None, (), 32, 0, 4,
+     0, 208, 1, 0, 4, None, None, (), None, {}, False),
+    (788, 'pysollib.games.spider', 'Autumn Leaves', None, (), 30, 0, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (789, 'pysollib.games.canfield', 'Beehive', None, (), 6, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (790, 'pysollib.games.precedence', 'Precedence', None,
+     ('Order of Precedence', 'Succession'), 1, 0, 2, 2, 104, 1, 0, 2, None,
+     None, (), None, {}, False),
+    (791, 'pysollib.games.precedence', 'Precedence (No King)', None, (), 1, 0,
+     2, 2, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (792, 'pysollib.games.gypsy', "King's Secrets", None, ('Royal Secrets',),
+     1, 0, 2, 2, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (793, 'pysollib.games.pileon', 'Relaxed PileOn', None,
+     ('Fifteen Puzzle Cell',), 0, 589824, 1, 0, 52, 1, 0, 4, None, None, (),
+     None, {}, False),
+    (794, 'pysollib.games.montana', 'House of Commons', None, (), 19, 8454144,
+     1, 1, 40, 1, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (), None,
+     {'ncards': 36}, False),
+    (795, 'pysollib.games.montana', 'Pretzel', None, (), 19, 8454144, 1, 0, 20,
+     1, 0, 4, None, (0, 1, 2, 3, 4), (), None, {'ncards': 16}, False),
+    (796, 'pysollib.games.pyramid', 'Exit', None, ('Gay Gordons',), 24, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (797, 'pysollib.games.special.poker', 'Poker Square (Waste)', None, (), 25,
+     1048576, 1, 0, 52, 1, 0, 4, None, None, (), 'pokersquare.html',
+     {'ncards': 30}, False),
+    (798, 'pysollib.games.special.poker', 'Poker Square (1 Reserve)', None, (),
+     25, 1048576, 1, 0, 52, 1, 0, 4, None, None, (), 'pokersquare.html',
+     {'ncards': 30}, False),
+    (799, 'pysollib.games.special.poker', 'Poker Square (2 Reserves)', None,
+     (), 25, 1048576, 1, 0, 52, 1, 0, 4, None, None, (), 'pokersquare.html',
+     {'ncards': 35}, False),
+    (800, 'pysollib.games.acesandkings', 'Aces and Kings', None, (), 1, 0, 2,
+     0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (801, 'pysollib.games.montecarlo', 'Double Nestor', None, (), 24, 65536, 2,
+     0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (802, 'pysollib.games.pyramid', 'Triple Alliance (2 Decks)', None, (), 24,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (803, 'pysollib.games.picturegallery', 'Big Parade', None, (), 41, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (804, 'pysollib.games.picturegallery', 'Three Up', None, (), 41, 0, 3, 0,
+     156, 1, 0, 4, None, None, (), None, {}, False),
+    (805, 'pysollib.games.special.cribbage', 'Cribbage Square', None, (), 37,
+     1048576, 1, 0, 52, 1, 0, 4, None, None, (), None, {'ncards': 17}, False),
+    (806, 'pysollib.games.special.cribbage', 'Cribbage Square (Waste)', None,
+     (), 37, 1048576, 1, 0, 52, 1, 0, 4, None, None, (), 'cribbagesquare.html',
+     {'ncards': 22}, False),
+    (807, 'pysollib.games.special.cribbage', 'Cribbage Square (1 Reserve)',
+     None, (), 37, 1048576, 1, 0, 52, 1, 0, 4, None, None, (),
+     'cribbagesquare.html', {'ncards': 22}, False),
+    (808, 'pysollib.games.special.cribbage', 'Cribbage Square (2 Reserves)',
+     None, (), 37, 1048576, 1, 0, 52, 1, 0, 4, None, None, (),
+     'cribbagesquare.html', {'ncards': 27}, False),
+    (809, 'pysollib.games.special.cribbage', 'Cribbage Shuffle', None, (), 37,
+     1114112, 1, 0, 52, 1, 0, 4, None, None, (), None, {'ncards': 17}, False),
+    (810, 'pysollib.games.montecarlo', 'Quatorze', None, (), 24, 0, 1, 0, 52,
+     1, 0, 2, None, None, (), None, {}, False),
+    (811, 'pysollib.games.pushpin', "Accordion's Revenge", None, (), 0, 0, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (812, 'pysollib.games.golf', 'Sticko', None, (), 0, 8388608, 1, 0, 32, 1,
+     0, 3, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (813, 'pysollib.games.freecell', 'Double FreeCell (Traditional)', None, (),
+     10, 65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (814, 'pysollib.games.acesandkings', 'Acey and Kingsley', None, (), 1, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (815, 'pysollib.games.fortythieves', 'Following', None, (), 9, 0, 1, 1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (816, 'pysollib.games.pushpin', 'Decade', None, ('Ten Twenty Thirty',), 0,
+     0, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (817, 'pysollib.games.special.poker', 'Maverick', None, (), 25, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {'ncards': 25}, False),
+    (818, 'pysollib.games.fortythieves', 'Triple Rail', None, (), 9, 0, 3, 0,
+     156, 1, 0, 3, None, None, (), None, {}, False),
+    (819, 'pysollib.games.fan', 'Bear River', None, (), 8, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (820, 'pysollib.games.acesandkings', 'Racing Aces', None, (), 2, 0, 3, 0,
+     156, 1, 0, 3, None, None, (), None, {}, False),
+    (821, 'pysollib.games.klondike', 'Trigon', None, (), 15, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (822, 'pysollib.games.harp', 'Double Trigon', None, (), 15, 0, 2, -1, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (823, 'pysollib.games.bakersdozen', 'Unusual', None, (), 4, 65536, 2, -1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (824, 'pysollib.games.braid', 'Small Backbone', None, (), 21, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (825, 'pysollib.games.spider', 'Scorpion Towers', None, (), 30, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (826, 'pysollib.games.yukon', 'Yukonic Plague', None, (), 33, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (827, 'pysollib.games.grandfathersclock', 'German Clock', None,
+     ('Die Uhr',), 0, 0, 1, 1, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (828, 'pysollib.games.harp', 'Churchill', None, ('Prime Minister',), 12, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (829, 'pysollib.games.montecarlo', 'Block Ten', None, (), 24, 0, 1, 0, 52,
+     1, 0, 1, None, None, (), None, {}, False),
+    (830, 'pysollib.games.curdsandwhey', 'Fire and Ice', None, (), 0, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (831, 'pysollib.games.beleagueredcastle', 'Siegecraft', None, (), 5, 65536,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, True),
+    (832, 'pysollib.games.precedence', 'Display', None, (), 1, 0, 2, 1, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (833, 'pysollib.games.curdsandwhey', 'Up and Up', None, (), 0, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (834, 'pysollib.games.fan', 'Rainbow Fan', None, (), 8, 0, 2, 3, 104, 1, 0,
+     4, None, None, (), None, {}, False),
+    (835, 'pysollib.games.canfield', 'Casino Canfield', None, ('Reno',), 6,
+     1048576, 1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (836, 'pysollib.games.numerica', 'Ladybug', None, (), 0, 0, 1, -2, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (837, 'pysollib.games.fortythieves', 'Single Spark', None,
+     ('Simple Spark',), 9, 0, 1, 0, 52, 1, 0, 2, None, None, (), None, {},
+     False),
+    (838, 'pysollib.games.fortythieves', 'The Spark', None, (), 9, 0, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (839, 'pysollib.games.special.pegged', 'Pegged Diamond', None, (), 36, 0,
+     1, 0, 32, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31),
+     'pegged.html', {}, False),
+    (840, 'pysollib.games.special.pegged', 'Pegged Star', None, (), 36, 0, 1,
+     0, 13, 9, 0, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12),
+     'pegged.html', {}, False),
+    (841, 'pysollib.games.wavemotion', 'Flow', None, (), 0, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (842, 'pysollib.games.gypsy', 'Swiss Patience', None, (), 12, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (843, 'pysollib.games.special.memory', 'Memory Sequence', None,
+     ('Ace Through King',), 18, 1048576, 1, 0, 13, 1, 0, 5, (1,), None, (),
+     None, {}, False),
+    (844, 'pysollib.games.sultan', 'Archway', None, (), 1, 0, 2, -1, 104, 1, 0,
+     2, None, None, (), None, {}, False),
+    (845, 'pysollib.games.moojub', 'Moojub', None, (), 0, 0, 1, 0, 52, 1, 0, 2,
+     None, None, (), None, {}, False),
+    (846, 'pysollib.games.pyramid', 'Pyramid Dozen', None, (), 24, 65536, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (847, 'pysollib.games.fortythieves', 'Pluto', None, ('Square',), 9, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (848, 'pysollib.games.fortythieves', 'Malmaison', None, (), 9, 0, 4, 0,
+     208, 1, 0, 4, None, None, (), None, {}, False),
+    (849, 'pysollib.games.klondike', 'Relaxed Raglan', None, (), 27, 589824, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (850, 'pysollib.games.knockout', 'Knockout', None,
+     ('Hope', 'Hope Deferred'), 0, 8388608, 1, 2, 32, 1, 0, 1, None,
+     (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (851, 'pysollib.games.knockout', 'Herz zu Herz', None, (), 0, 8388608, 1,
+     2, 32, 1, 0, 1, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (852, 'pysollib.games.interlock', 'Guardian', None, (), 15, 0, 1, -1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (853, 'pysollib.games.auldlangsyne', 'Grandfather', None, (), 23, 0, 2, 1,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (854, 'pysollib.games.pyramid', 'Neptune', None, ('Mixtures',), 24, 0, 1,
+     0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (855, 'pysollib.games.klondike', 'Half Klondike', None, (), 15, 8388608, 1,
+     -1, 26, 1, 0, 3, (1, 2), None, (), None, {}, False),
+    (856, 'pysollib.games.osmosis', 'Open Peek', None, (), 0, 196608, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (857, 'pysollib.games.yukon', 'Tasmanian Patience', None, (), 33, 0, 1, -1,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (858, 'pysollib.games.montana', 'Station', None, (), 19, 65536, 1, 2, 52,
+     1, 0, 4, None, None, (), None, {'ncards': 48}, False),
+    (859, 'pysollib.games.sthelena', "King's Audience", None,
+     ("Queen's Audience",), 0, 0, 1, 0, 52, 1, 0, 2, None, None, (), None, {},
+     False),
+    (860, 'pysollib.games.bakersdozen', "Baker's Dozen (2 Decks)", None, (), 4,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, True),
+    (861, 'pysollib.games.klondike', 'Wildflower', None, (), 27, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (862, 'pysollib.games.montecarlo', 'Simple Tens', None, ('Add Up Tens',),
+     24, 8396800, 1, 0, 36, 1, 0, 1, None, (0, 1, 2, 3, 4, 5, 6, 7, 8), (),
+     None, {}, False),
+    (863, 'pysollib.games.calculation', 'Imaginary Thirteen', None,
+     ('Pythagor',), 1, 0, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (864, 'pysollib.games.osmosis', 'Dimensions', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (865, 'pysollib.games.hitormiss', 'Hit or Miss Unlimited', None, (), 0,
+     8192, 1, -1, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (866, 'pysollib.games.auldlangsyne', 'Old Fashioned', None, (), 23, 0, 1,
+     0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (867, 'pysollib.games.montecarlo', 'Double Fourteen', None, (), 24, 65536,
+     2, 0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (868, 'pysollib.games.golf', 'Bobby', None, (), 11, 0, 1, 2, 52, 1, 0, 1,
+     None, None, (), None, {}, False),
+    (869, 'pysollib.games.klondike', 'Smokey', None, (), 15, 0, 1, 2, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (870, 'pysollib.games.spider', 'Fair Maids', None, (), 30, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (871, 'pysollib.games.fan', 'Ceiling Fan', None, (), 8, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (872, 'pysollib.games.knockout', 'Knockout +', None, ('Abandon Hope',), 0,
+     0, 1, 2, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (873, 'pysollib.games.klondike', 'Agnes Two', None, (), 27, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (874, 'pysollib.games.montecarlo', 'Patient Pairs', None, ('Isabel',), 24,
+     0, 1, 0, 52, 1, 0, 2, None, None, (), None, {}, False),
+    (875, 'pysollib.games.montecarlo', 'Patient Pairs (Open)', None, (), 24,
+     65536, 1, 0, 52, 1, 0, 4, None, None, (), 'patientpairs.html', {}, False),
+    (876, 'pysollib.games.bakersdozen', 'Vineyard', None, (), 4, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, True),
+    (877, 'pysollib.games.montana', 'Double Montana', None, (), 19, 65536, 2,
+     2, 104, 1, 0, 4, None, None, (), None, {'ncards': 96}, False),
+    (878, 'pysollib.games.wavemotion', 'Wading Pool', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (879, 'pysollib.games.fan', 'Roaming Proils', None, (), 8, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (880, 'pysollib.games.golf', 'Carcassonne', None, (), 21, 65536, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (881, 'pysollib.games.beleagueredcastle', 'Lasker', None, (), 5, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (882, 'pysollib.games.diplomat', 'McClellan', None, (), 9, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (883, 'pysollib.games.pushpin', '23 Skidoo', None, (), 0, 0, 1, 0, 52, 1,
+     0, 5, None, None, (), None, {}, False),
+    (884, 'pysollib.games.fortythieves', 'Jacks in the Box', None, (), 9, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (885, 'pysollib.games.harp', 'Pitt the Younger', None, (), 12, 0, 2, 0,
+     104, 1, 0, 3, None, None, (), None, {}, False),
+    (886, 'pysollib.games.special.memory', 'Memory 16', None, (), 18, 1056768,
+     2, 0, 16, 10, 0, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7), None, {}, False),
+    (887, 'pysollib.games.special.memory', 'Memory 52', None, (), 18, 1048576,
+     2, 0, 52, 10, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25),
+     None, {}, False),
+    (888, 'pysollib.games.klondike', 'Six by Six', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (889, 'pysollib.games.demonsandthieves', 'Demons and Thieves', None, (), 9,
+     0, 2, 2, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (890, 'pysollib.games.gypsy', 'Yeast Dough', None, (), 12, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (891, 'pysollib.games.golf', 'All in a Row II', None, (), 11, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (892, 'pysollib.games.golf', 'Double Putt', None, (), 11, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, True),
+    (893, 'pysollib.games.klondike', 'Taking Silk', None, (), 15, 0, 2, 0, 104,
+     1, 0, 3, None, None, (), None, {}, False),
+    (894, 'pysollib.games.fan', 'Cromwell', None, (), 8, 65536, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (895, 'pysollib.games.fortythieves', 'Preference', None, (), 9, 0, 1, 0,
+     52, 1, 0, 1, None, None, (), None, {}, False),
+    (896, 'pysollib.games.canfield', 'The Plot', None, (), 6, 0, 2, 0, 104, 1,
+     0, 3, None, None, (), None, {}, False),
+    (897, 'pysollib.games.yukon', 'Kiev', None, ('Kyiv',), 30, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (898, 'pysollib.games.montecarlo', 'Aces Square', None, ('Miner',), 0, 0,
+     1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (899, 'pysollib.games.numerica', 'Housefly', None, (), 23, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (901, 'pysollib.games.fan', 'La Belle Lucie', None,
+     ('Beautiful Lutecia', 'Fair Lucy', 'Lovely Lucy', 'Midnight Oil'), 8,
+     327680, 1, 2, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (903, 'pysollib.games.acesup', 'Aces Up', None, ('Aces High', 'Drivel'), 0,
+     270336, 1, 0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (906, 'pysollib.games.golf', 'Thieves', None, (), 11, 0, 1, 0, 54, 1, 1, 3,
+     None, None, (0, 1), None, {}, True),
+    (907, 'pysollib.games.bakersdozen', 'Stewart', None, (), 4, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (908, 'pysollib.games.fan', 'Open Proils', None, (), 8, 65536, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (909, 'pysollib.games.clearthedungeon', 'Clear the Dungeon', None, (), 0,
+     0, 1, 0, 54, 1, 1, 4, None, None, (0, 1), None, {}, False),
+    (910, 'pysollib.games.fortythieves', "Napoleon's Shoulder", None, (), 9, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (911, 'pysollib.games.acesandkings', 'Deuces and Queens', None, (), 1, 0,
+     2, 0, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (912, 'pysollib.games.gypsy', 'Small Triangle', None, (), 12, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (913, 'pysollib.games.klondike', 'Nine Across', None, (), 15, 0, 1, -1, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (914, 'pysollib.games.yukon', 'Canberra', None, (), 33, 0, 1, 1, 52, 1, 0,
+     3, None, None, (), None, {}, False),
+    (915, 'pysollib.games.grandfathersclock', 'Relaxed Clock', None,
+     ('Watch',), 0, 524288, 1, 0, 52, 1, 0, 1, None, None, (), None, {},
+     False),
+    (916, 'pysollib.games.pyramid', 'Tens', None, ('Take Ten',), 24, 0, 1, 0,
+     52, 1, 0, 1, None, None, (), None, {}, False),
+    (917, 'pysollib.games.spider', 'Astrocyte', None, (), 30, 0, 2, 0, 104, 1,
+     0, 4, None, None, (), None, {}, False),
+    (918, 'pysollib.games.pushpin', 'Seven Up', None,
+     ('Seventh Wonder', 'The Magic Seven'), 0, 0, 1, 0, 52, 1, 0, 5, None,
+     None, (), None, {}, False),
+    (919, 'pysollib.games.yukon', 'Dnieper', None, ('Dnipro',), 30, 0, 1, 0,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (920, 'pysollib.games.harp', 'Quadruple Klondike', None, (), 15, 0, 4, -1,
+     208, 1, 0, 3, None, None, (), None, {}, False),
+    (921, 'pysollib.games.harp', 'Quadruple Klondike (Draw 3)', None, (), 15,
+     0, 4, -1, 208, 1, 0, 3, None, None, (), None, {}, False),
+    (922, 'pysollib.games.canfield', 'Quadruple Canfield', None, (), 6, 0, 4,
+     -1, 208, 1, 0, 3, None, None, (), None, {}, False),
+    (923, 'pysollib.games.montecarlo', 'Crispy', None, (), 0, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (924, 'pysollib.games.threepeaks', 'Ricochet', None, (), 11, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (925, 'pysollib.games.yukon', 'Yukon Cells', None, (), 33, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (926, 'pysollib.games.fan', 'Alexander the Great', None, (), 8, 65536, 1,
+     0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (927, 'pysollib.games.picturegallery', 'Big Picture Gallery', None, (), 41,
+     0, 3, 0, 156, 1, 0, 3, None, None, (), None, {}, False),
+    (928, 'pysollib.games.picturegallery', 'Huge Picture Gallery', None, (),
+     41, 0, 4, 0, 208, 1, 0, 3, None, None, (), None, {}, False),
+    (929, 'pysollib.games.pyramid', 'Eight Cards', None, ('Acht Karten',), 24,
+     0, 1, 0, 52, 1, 0, 1, None, None, (), None, {}, False),
+    (930, 'pysollib.games.klondike', 'Klondike Territory', None, (), 27, 0, 1,
+     0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (931, 'pysollib.games.numerica', 'The Bogey', None, (), 0, 0, 1, -1, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (932, 'pysollib.games.picturegallery', "Devil's Grip", None, (), 41,
+     8388608, 2, 0, 96, 1, 0, 2, None, (1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12),
+     (), None, {}, False),
+    (933, 'pysollib.games.fortythieves', 'Cascade', None, (), 9, 0, 1, 0, 52,
+     1, 0, 3, None, None, (), None, {}, False),
+    (934, 'pysollib.games.acesup', 'Valentine', None, (), 0, 0, 1, -1, 52, 1,
+     0, 1, None, None, (), None, {}, False),
+    (935, 'pysollib.games.montecarlo', 'Juvenile', None, (), 24, 65536, 2, 0,
+     104, 1, 0, 2, None, None, (), None, {}, False),
+    (936, 'pysollib.games.yukon', 'Yukon Kings', None, (), 33, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (937, 'pysollib.games.pyramid', 'The Lucky Number', None, (), 24, 0, 2, 0,
+     104, 1, 0, 1, None, None, (), None, {}, False),
+    (938, 'pysollib.games.interlock', 'Interlock', None, (), 15, 131072, 1, -1,
+     52, 1, 0, 3, None, None, (), None, {}, False),
+    (939, 'pysollib.games.interlock', 'Love a Duck', None, (), 33, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (940, 'pysollib.games.fortythieves', 'Thirty-Nine Steps', None, (), 9, 0,
+     2, 0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (941, 'pysollib.games.golf', 'Binary Star', None, ('Black Holes',), 11,
+     65536, 2, 0, 104, 1, 0, 4, None, None, (), None, {}, True),
+    (942, 'pysollib.games.yukon', 'Quadruple Yukon', None, (), 33, 0, 4, 0,
+     208, 1, 0, 3, None, None, (), None, {}, False),
+    (943, 'pysollib.games.royalcotillion', "Rosamund's Bower", None,
+     ('Rosamund',), 0, 0, 1, 3, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (944, 'pysollib.games.picturegallery', 'Blue Jacket', None, (), 41, 0, 2,
+     0, 104, 1, 0, 4, None, None, (), None, {}, False),
+    (945, 'pysollib.games.special.pegged', 'Pegged Hexagon', None, (), 36, 0,
+     1, 0, 61, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60),
+     'pegged.html', {}, False),
+    (946, 'pysollib.games.interlock', 'Sarlacc', None, (), 10, 65536, 1, 0, 52,
+     1, 0, 4, None, None, (), None, {}, False),
+    (947, 'pysollib.games.canfield', 'Club', None, (), 8, 0, 2, 0, 104, 1, 0,
+     3, None, None, (), None, {}, False),
+    (948, 'pysollib.games.calculation', 'Appreciate', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (949, 'pysollib.games.bristol', 'Vincent', None, (), 8, 0, 1, 0, 52, 1, 0,
+     4, None, None, (), None, {}, False),
+    (950, 'pysollib.games.pyramid', 'Eighteens', None, ('Steel Wheels',), 24,
+     0, 2, 0, 104, 1, 0, 2, None, None, (), None, {}, False),
+    (951, 'pysollib.games.beleagueredcastle', 'Morphy', None, (), 5, 65536, 1,
+     0, 52, 1, 0, 5, None, None, (), None, {}, False),
+    (952, 'pysollib.games.royalcotillion', 'Big Alhambra', None, (), 2, 0, 3,
+     2, 156, 1, 0, 3, None, None, (), None, {}, False),
+    (953, 'pysollib.games.freecell', 'Petal', None, (), 10, 65536, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, True),
+    (954, 'pysollib.games.klondike', 'Wildcards', None, (), 5, 65536, 1, 0, 54,
+     1, 1, 4, None, None, (0, 1), None, {}, True),
+    (955, 'pysollib.games.special.cribbage', 'Cribbage Patience', None, (), 37,
+     1048576, 1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+    (956, 'pysollib.games.klondike', 'Joke Klon', None, (), 15, 0, 1, -1, 54,
+     1, 1, 3, None, None, (0, 1), None, {}, False),
+    (957, 'pysollib.games.klondike', 'Joke Klon (Draw 3)', None, (), 15, 0, 1,
+     -1, 54, 1, 1, 2, None, None, (0, 1), None, {}, False),
+    (958, 'pysollib.games.numerica', 'Ninety-One', None, (), 0, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (959, 'pysollib.games.golf', 'Double Uintah', None, (), 11, 0, 2, -1, 104,
+     1, 0, 2, None, None, (), None, {}, False),
+    (960, 'pysollib.games.freecell', 'Obstruction', None, (), 10, 196608, 1, 0,
+     54, 1, 1, 4, None, None, (0, 1), None, {}, False),
+    (961, 'pysollib.games.pyramid', 'Nines', None, (), 24, 0, 1, 0, 52, 1, 0,
+     1, None, None, (), None, {}, False),
+    (962, 'pysollib.games.picturegallery', 'Carousel', None, (), 41, 8388608,
+     2, 0, 96, 1, 0, 3, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None,
+     {}, False),
+    (963, 'pysollib.games.yukon', 'Sevastopol', None, (), 30, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (964, 'pysollib.games.yukon', 'Russian Cell', None, (), 33, 0, 1, 0, 52, 1,
+     0, 3, None, None, (), None, {}, False),
+    (965, 'pysollib.games.golf', "King's Way", None, (), 11, 0, 2, 1, 104, 1,
+     0, 2, None, None, (), None, {}, False),
+    (966, 'pysollib.games.gypsy', 'Ace of Hearts', None, (), 0, 0, 1, 0, 52, 1,
+     0, 4, None, None, (), None, {}, False),
+    (967, 'pysollib.games.katzenschwanz', 'Xerxes', None, (), 1, 8454144, 2, 0,
+     48, 1, 0, 3, None, (0, 8, 9, 10, 11, 12), (), None, {}, False),
+    (968, 'pysollib.games.katzenschwanz', 'Zingara', None, (), 1, 8454144, 2,
+     0, 64, 1, 0, 3, None, (0, 6, 7, 8, 9, 10, 11, 12), (), None, {}, False),
+    (969, 'pysollib.games.pyramid', 'Eleven Triangle', None, (), 24, 0, 1, 0,
+     52, 1, 0, 2, None, None, (), None, {}, False),
+    (1900, 'pysollib.games.freecell', 'FreeCell (2 Reserves)', None, (), 10,
+     65536, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (1901, 'pysollib.games.freecell', 'FreeCell (No Reserve)', None, (), 10,
+     65536, 1, 0, 52, 1, 0, 5, None, None, (), None, {}, True),
+    (5001, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Altar', 'Altar', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5002, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Arena 1', 'Arena 1',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5003, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Arena 2', 'Arena 2',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5004, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Arrow', 'Arrow', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5005, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Art Moderne',
+     'Art Moderne', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5006, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Balance', 'Balance',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5007, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Bat', 'Bat', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5008, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Beetle', 'Beetle',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5009, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Big Hole',
+     'Big Hole', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5010, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Bizarre', 'Bizarre',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5011, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Boat', 'Boat', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5012, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Bug', 'Bug', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5013, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Butterfly 1',
+     'Butterfly 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5014, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Castle', 'Castle',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5015, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Cat and Mouse',
+     'Cat and Mouse', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5016, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Ceremonial',
+     'Ceremonial', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5017, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Checkered',
+     'Checkered', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5018, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Chip', 'Chip', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5019, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Columns', 'Columns',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5020, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Crown', 'Crown', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5021, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Cupola', 'Cupola',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5022, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Deep Well',
+     'Deep Well', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5023, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Dragon 1',
+     'Dragon 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5024, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Dude', 'Dude', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5026, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Enterprise',
+     'Enterprise', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5027, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Eye', 'Eye', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5028, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg F-15 Eagle',
+     'F-15 Eagle', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5029, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Farandole',
+     'Farandole', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5030, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Fish', 'Fish', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5031, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Five Pyramids 1',
+     'Five Pyramids 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5033, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Flowers 1',
+     'Flowers 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5034, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Traditional',
+     'Traditional', (), 16, 262144, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5035, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Fortress Towers',
+     'Fortress Towers', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5036, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Full Vision 1',
+     'Full Vision 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5037, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Full Vision 2',
+     'Full Vision 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5038, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Future', 'Future',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5039, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Garden', 'Garden',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5040, 'pysollib.games.mahjongg.mahjongg1', "Mahjongg Gayle's", "Gayle's",
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5041, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Glade', 'Glade', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5042, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg H for Haga',
+     'H for Haga', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5044, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Helios', 'Helios',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5045, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg High and Low',
+     'High and Low', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5047, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Inca', 'Inca', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5048, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Inner Circle',
+     'Inner Circle', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5049, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Joker', 'Joker', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5050, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg K for Kyodai',
+     'K for Kyodai', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5052, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Km', 'Km', (), 16, 0,
+     4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5053, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Kujaku', 'Kujaku',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5054, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Labyrinth',
+     'Labyrinth', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5055, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Lion 1', 'Lion 1',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5056, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Lost', 'Lost', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5057, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Maya', 'Maya', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5058, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Mesh', 'Mesh', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5059, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Moth', 'Moth', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5060, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg N for Namida',
+     'N for Namida', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5063, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Temple 1',
+     'Temple 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5064, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Order', 'Order', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5065, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Pattern', 'Pattern',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5067, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Portal', 'Portal',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5068, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Rocket', 'Rocket',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5069, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Scorpion',
+     'Scorpion', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5070, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Screw Up',
+     'Screw Up', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5071, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Seven', 'Seven', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5072, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Seven Pyramids',
+     'Seven Pyramids', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5073, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Shield', 'Shield',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5074, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Siam', 'Siam', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5076, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Square', 'Square',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5077, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Squares', 'Squares',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5078, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Squaring',
+     'Squaring', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5079, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Stairs 1',
+     'Stairs 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5080, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Star Ship',
+     'Star Ship', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5081, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Steps Pyramid',
+     'Steps Pyramid', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5082, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Stonehenge',
+     'Stonehenge', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5083, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Sun and Moon',
+     'Sun and Moon', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5084, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Temple 2',
+     'Temple 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5086, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg The Door',
+     'The Door', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5087, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg The Great Wall',
+     'The Great Wall', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5088, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Theater', 'Theater',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5089, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Tile Fighter',
+     'Tile Fighter', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5090, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Tilepiles',
+     'Tilepiles', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5091, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Time Tunnel',
+     'Time Tunnel', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5092, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Tomb', 'Tomb', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5094, 'pysollib.games.mahjongg.mahjongg1',
+     'Mahjongg Traditional Reviewed', 'Traditional Reviewed', (), 16, 0, 4, 0,
+     144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5095, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Tree of Life',
+     'Tree of Life', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5096, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Twin Temples',
+     'Twin Temples', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5097, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Vi', 'Vi', (), 16, 0,
+     4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5098, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Victory Arrow',
+     'Victory Arrow', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5099, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Wavelets',
+     'Wavelets', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5100, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Well 1', 'Well 1',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5102, 'pysollib.games.mahjongg.mahjongg1', 'Mahjongg Yummy', 'Yummy', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5200, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Another Round',
+     'Another Round', (), 16, 0, 4, 0, 140, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7), 'mahjongg.html',
+     {'decks': 1}, True),
+    (5201, 'pysollib.games.mahjongg.mahjongg2', "Mahjongg Aqab's", "Aqab's",
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5202, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Big Mountain',
+     'Big Mountain', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5203, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Bridge 1',
+     'Bridge 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5204, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Butterfly 2',
+     'Butterfly 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5205, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg ChessMania',
+     'ChessMania', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5206, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Cross', 'Cross', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5207, 'pysollib.games.mahjongg.mahjongg2', "Mahjongg Cupido's Heart",
+     "Cupido's Heart", (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5208, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Diamond', 'Diamond',
+     (), 16, 0, 4, 0, 140, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7), 'mahjongg.html',
+     {'decks': 1}, True),
+    (5209, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Dragon 2',
+     'Dragon 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5210, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Empty Pyramids',
+     'Empty Pyramids', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5211, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Fish Face',
+     'Fish Face', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5212, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Floating City',
+     'Floating City', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5215, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Hidden Words',
+     'Hidden Words', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5216, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Hovercraft',
+     'Hovercraft', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5217, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Hurdles', 'Hurdles',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5218, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Tornado', 'Tornado',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5219, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg I Love U',
+     'I Love U', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5220, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Inazuma', 'Inazuma',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5221, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg JPs', 'JPs', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5222, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Japan', 'Japan', (),
+     16, 0, 4, 0, 96, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7), (),
+     'mahjongg.html', {'decks': 1}, True),
+    (5223, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Krebs', 'Krebs', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5224, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kumo', 'Kumo', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5225, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 14',
+     'Kyodai 14', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5226, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 17',
+     'Kyodai 17', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5227, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 18',
+     'Kyodai 18', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5228, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 20',
+     'Kyodai 20', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5229, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 23',
+     'Kyodai 23', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5230, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 24',
+     'Kyodai 24', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5231, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 25',
+     'Kyodai 25', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5232, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 26',
+     'Kyodai 26', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5233, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 27',
+     'Kyodai 27', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5234, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 28',
+     'Kyodai 28', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5235, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 41',
+     'Kyodai 41', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5236, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Kyodai 42',
+     'Kyodai 42', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5237, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Lattice', 'Lattice',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5239, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Loose Ends',
+     'Loose Ends', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5240, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Mini Traditional',
+     'Mini Traditional', (), 16, 0, 4, 0, 48, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3), (), 'mahjongg.html', {'decks': 1}, True),
+    (5241, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Mini-Layout',
+     'Mini-Layout', (), 16, 0, 4, 0, 8, 4, 0, None, (0, 1, 2), (), (0, 1),
+     'mahjongg.html', {'decks': 1}, True),
+    (5242, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Mission Impossible',
+     'Mission Impossible', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5243, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Multi X', 'Multi X',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5245, 'pysollib.games.mahjongg.mahjongg2', "Mahjongg Okie's Nitemare",
+     "Okie's Nitemare", (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5246, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Orbital', 'Orbital',
+     (), 16, 0, 4, 0, 84, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (),
+     'mahjongg.html', {'decks': 1}, True),
+    (5247, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Owl', 'Owl', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5248, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Pantheon',
+     'Pantheon', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5249, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Papillon',
+     'Papillon', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5250, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Pyramid 1',
+     'Pyramid 1', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5251, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Pyramid 2',
+     'Pyramid 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5252, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Quad', 'Quad', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5253, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Rectangle',
+     'Rectangle', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5254, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Reindeer',
+     'Reindeer', (), 16, 0, 4, 0, 64, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4),
+     (0,), 'mahjongg.html', {'decks': 1}, True),
+    (5255, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Rings', 'Rings', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5256, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg River Bridge',
+     'River Bridge', (), 16, 0, 4, 0, 116, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8), (0, 1), 'mahjongg.html', {'decks': 1}, True),
+    (5257, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Roman Arena',
+     'Roman Arena', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5258, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Rugby', 'Rugby', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5259, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Shapeshifter',
+     'Shapeshifter', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5260, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Space Bridge',
+     'Space Bridge', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5261, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Space Shuttle',
+     'Space Shuttle', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5262, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Stage 1', 'Stage 1',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5263, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Stage 2', 'Stage 2',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5264, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Stairs 2',
+     'Stairs 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5265, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Stairs 3',
+     'Stairs 3', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5266, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Stargate',
+     'Stargate', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5267, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Sukis', 'Sukis', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5268, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Temple 3',
+     'Temple 3', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5269, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Temple 4',
+     'Temple 4', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5270, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Totally Random-Made',
+     'Totally Random-Made', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5271, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Trika', 'Trika', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5272, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Twin', 'Twin', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5273, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Two Domes',
+     'Two Domes', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5274, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Vagues', 'Vagues',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5275, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Well 2', 'Well 2',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5276, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Whatever',
+     'Whatever', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5277, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg Win', 'Win', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5278, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg X-Files', 'X-Files',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5279, 'pysollib.games.mahjongg.mahjongg2', 'Mahjongg X-Shape', 'X-Shape',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5401, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Taipei', 'Taipei',
+     (), 16, 262144, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5402, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Hare', 'Hare', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5403, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Horse', 'Horse', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5404, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Rat', 'Rat', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5405, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Tiger', 'Tiger', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5406, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Ram', 'Ram', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5407, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Wedges', 'Wedges',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5408, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Monkey', 'Monkey',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5409, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Rooster', 'Rooster',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5410, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Dog', 'Dog', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5411, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Snake', 'Snake', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5412, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Boar', 'Boar', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5413, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Ox', 'Ox', (), 16, 0,
+     4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5414, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Bridge 2',
+     'Bridge 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5415, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Spider', 'Spider',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5416, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Waves', 'Waves', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5417, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Hot Coffee',
+     'Hot Coffee', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5418, 'pysollib.games.mahjongg.mahjongg3', 'Mahjongg Zigzag', 'Zigzag',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5600, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Eagle', 'Eagle', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5601, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Five Pyramids 2',
+     'Five Pyramids 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5602, 'pysollib.games.mahjongg.mahjonggL',
+     'Mahjongg H for Haga Traditional', 'H for Haga Traditional', (), 16, 0, 4,
+     0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5603, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Hourglass',
+     'Hourglass', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5604, 'pysollib.games.mahjongg.mahjonggL',
+     'Mahjongg K for Kyodai Traditional', 'K for Kyodai Traditional', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5605, 'pysollib.games.mahjongg.mahjonggL',
+     'Mahjongg N for Namida Traditional', 'N for Namida Traditional', (), 16,
+     0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5606, 'pysollib.games.mahjongg.mahjonggL',
+     'Mahjongg Naoki Haga Traditional', 'Naoki Haga Traditional', (), 16, 0, 4,
+     0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5607, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Phoenix', 'Phoenix',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5608, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Teotihucan',
+     'Teotihucan', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5609, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Tower and Walls',
+     'Tower and Walls', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5610, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg What a Pyramid',
+     'What a Pyramid', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5611, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Flowers 2',
+     'Flowers 2', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5612, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Full Vision 3',
+     'Full Vision 3', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5613, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Lion 2', 'Lion 2',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5615, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Big X', 'Big X', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5616, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Axis', 'Axis', (),
+     16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 1},
+     True),
+    (5617, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Cobweb', 'Cobweb',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5618, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Pyramids',
+     'Pyramids', (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5619, 'pysollib.games.mahjongg.mahjonggL', 'Mahjongg Wicker', 'Wicker',
+     (), 16, 0, 4, 0, 144, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 1}, True),
+    (5620, 'pysollib.games.mahjongg.mahjonggL', 'Double Mahjongg Big Square',
+     'Big Square', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5621, 'pysollib.games.mahjongg.mahjonggL', 'Double Mahjongg Rows', 'Rows',
+     (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5622, 'pysollib.games.mahjongg.mahjonggL', 'Half Mahjongg K 2', 'K 2', (),
+     16, 0, 4, 0, 72, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5), (),
+     'mahjongg.html', {'decks': 1}, True),
+    (5623, 'pysollib.games.mahjongg.mahjonggL', 'Half Mahjongg Abstract',
+     'Abstract', (), 16, 0, 4, 0, 72, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5), (), 'mahjongg.html', {'decks': 1}, True),
+    (5801, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Faro', 'Faro',
+     (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5803, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Two Squares',
+     'Two Squares', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5805, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Twin Picks',
+     'Twin Picks', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5806, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Roost',
+     'Roost', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5807, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Big Castle',
+     'Big Castle', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5808, 'pysollib.games.mahjongg.mahjongg3',
+     'Double Mahjongg Eight Squares', 'Eight Squares', (), 16, 0, 8, 0, 288, 4,
+     0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 2},
+     True),
+    (5809, 'pysollib.games.mahjongg.mahjongg3',
+     'Double Mahjongg Big Traditional', 'Big Traditional', (), 16, 0, 8, 0,
+     288, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'mahjongg.html', {'decks': 2},
+     True),
+    (5810, 'pysollib.games.mahjongg.mahjongg3', 'Double Mahjongg Sphere',
+     'Sphere', (), 16, 0, 8, 0, 288, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     'mahjongg.html', {'decks': 2}, True),
+    (5901, 'pysollib.games.mahjongg.mahjongg3', 'Half Mahjongg Happy New Year',
+     'Happy New Year', (), 16, 0, 4, 0, 72, 4, 0, None, (0, 1, 2),
+     (0, 1, 2, 3, 4, 5), (), 'mahjongg.html', {'decks': 1}, True),
+    (5904, 'pysollib.games.mahjongg.mahjongg3', 'Half Mahjongg Smile', 'Smile',
+     (), 16, 0, 4, 0, 72, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5), (),
+     'mahjongg.html', {'decks': 1}, True),
+    (5905, 'pysollib.games.mahjongg.mahjongg3', 'Half Mahjongg Wall', 'Wall',
+     (), 16, 0, 4, 0, 72, 4, 0, None, (0, 1, 2), (0, 1, 2, 3, 4, 5), (),
+     'mahjongg.html', {'decks': 1}, True),
+    (11001, 'pysollib.games.mahjongg.shisensho', 'Shisen-Sho 14x6', None, (),
+     34, 0, 4, 0, 84, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (),
+     'shisensho.html', {'decks': 1}, True),
+    (11002, 'pysollib.games.mahjongg.shisensho', 'Shisen-Sho 18x8', None, (),
+     34, 0, 4, 0, 144, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'shisensho.html', {'decks': 1},
+     True),
+    (11003, 'pysollib.games.mahjongg.shisensho', 'Shisen-Sho 24x12', None, (),
+     34, 0, 8, 0, 288, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'shisensho.html', {'decks': 2},
+     True),
+    (11004, 'pysollib.games.mahjongg.shisensho',
+     'Shisen-Sho (No Gravity) 14x6', None, (), 34, 0, 4, 0, 84, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (), 'shisensho.html', {'decks': 1},
+     True),
+    (11005, 'pysollib.games.mahjongg.shisensho',
+     'Shisen-Sho (No Gravity) 18x8', None, (), 34, 0, 4, 0, 144, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'shisensho.html', {'decks': 1},
+     True),
+    (11006, 'pysollib.games.mahjongg.shisensho',
+     'Shisen-Sho (No Gravity) 24x12', None, (), 34, 0, 8, 0, 288, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'shisensho.html', {'decks': 2},
+     True),
+    (11011, 'pysollib.games.mahjongg.shisensho', 'Not Shisen-Sho 14x6', None,
+     (), 34, 0, 4, 0, 84, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (),
+     'notshisensho.html', {'decks': 1}, True),
+    (11012, 'pysollib.games.mahjongg.shisensho', 'Not Shisen-Sho 18x8', None,
+     (), 34, 0, 4, 0, 144, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'notshisensho.html', {'decks': 1},
+     True),
+    (11013, 'pysollib.games.mahjongg.shisensho', 'Not Shisen-Sho 24x12', None,
+     (), 34, 0, 8, 0, 288, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'notshisensho.html', {'decks': 2},
+     True),
+    (11014, 'pysollib.games.mahjongg.shisensho', 'Four Rivers 14x6', None, (),
+     34, 0, 4, 0, 84, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (),
+     'fourrivers.html', {'decks': 1}, True),
+    (11015, 'pysollib.games.mahjongg.shisensho', 'Four Rivers 18x8', None, (),
+     34, 0, 4, 0, 144, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'fourrivers.html', {'decks': 1},
+     True),
+    (11016, 'pysollib.games.mahjongg.shisensho', 'Four Rivers 24x12', None, (),
+     34, 0, 8, 0, 288, 4, 0, 4, (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'fourrivers.html', {'decks': 2},
+     True),
+    (11017, 'pysollib.games.mahjongg.shisensho',
+     'Four Rivers (No Gravity) 14x6', None, (), 34, 0, 4, 0, 84, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6), (), 'fourrivers.html', {'decks': 1},
+     True),
+    (11018, 'pysollib.games.mahjongg.shisensho',
+     'Four Rivers (No Gravity) 18x8', None, (), 34, 0, 4, 0, 144, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'fourrivers.html', {'decks': 1},
+     True),
+    (11019, 'pysollib.games.mahjongg.shisensho',
+     'Four Rivers (No Gravity) 24x12', None, (), 34, 0, 8, 0, 288, 4, 0, 4,
+     (0, 1, 2), (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), 'fourrivers.html', {'decks': 2},
+     True),
+    (12345, 'pysollib.games.special.hanafuda', 'Oonsoo', None, (), 13, 262144,
+     1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12346, 'pysollib.games.special.hanafuda', 'MatsuKiri', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12347, 'pysollib.games.special.hanafuda', 'Gaji', None, (), 13, 65536, 1,
+     0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12348, 'pysollib.games.special.hanafuda', 'Flower Clock', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12349, 'pysollib.games.special.hanafuda', 'Pagoda', None, (), 13, 0, 2, 0,
+     96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12350, 'pysollib.games.special.hanafuda', 'Samuri', None, (), 13, 0, 1, 0,
+     48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12351, 'pysollib.games.special.hanafuda', 'Great Wall', None, (), 13, 0,
+     4, 0, 192, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12352, 'pysollib.games.special.hanafuda', 'Hanafuda Four Winds', None, (),
+     13, 0, 1, 1, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12353, 'pysollib.games.special.hanafuda', 'Sumo', None, (), 13, 65536, 1,
+     0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12354, 'pysollib.games.special.hanafuda', 'Big Sumo', None, (), 13, 65536,
+     2, 0, 96, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12355, 'pysollib.games.special.hanafuda', 'Little Easy', None, (), 13, 0,
+     1, -1, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12356, 'pysollib.games.special.hanafuda', 'Big Easy', None, (), 13, 0, 2,
+     -1, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12357, 'pysollib.games.special.hanafuda', 'Easy Supreme', None, (), 13, 0,
+     4, -1, 192, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12358, 'pysollib.games.special.hanafuda', 'Just For Fun', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12359, 'pysollib.games.special.hanafuda', 'Firecracker', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12360, 'pysollib.games.special.hanafuda', 'Easy x One', None, (), 13, 0,
+     1, 1, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12361, 'pysollib.games.special.hanafuda', 'Relax', None, (), 13, 0, 1, 1,
+     48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12362, 'pysollib.games.special.hanafuda', 'Double Samuri', None, (), 13,
+     0, 2, 0, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12363, 'pysollib.games.special.hanafuda', 'Super Samuri', None, (), 13, 0,
+     4, 0, 192, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12364, 'pysollib.games.special.hanafuda', 'Double Your Fun', None, (), 13,
+     65536, 2, 0, 96, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12365, 'pysollib.games.special.hanafuda', 'Cherry Bomb', None, (), 13,
+     65536, 2, 0, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12366, 'pysollib.games.special.hanafuda', 'Oonsoo Too', None, (), 13, 0,
+     1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12367, 'pysollib.games.special.hanafuda', 'Oonsoo Strict', None, (), 13,
+     0, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12368, 'pysollib.games.special.hanafuda', 'Oonsoo Open', None, (), 13, 0,
+     1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12369, 'pysollib.games.special.hanafuda1', 'Paulownia', None, (), 13, 0,
+     1, -1, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3),
+     (), None, {}, False),
+    (12370, 'pysollib.games.special.hanafuda1', 'Lesser Queue', None, (), 13,
+     0, 2, 2, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12371, 'pysollib.games.special.hanafuda1', 'Greater Queue', None, (), 13,
+     0, 4, 2, 192, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12372, 'pysollib.games.special.hanafuda', 'MatsuKiri Strict', None, (),
+     13, 65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12373, 'pysollib.games.special.hanafuda1', 'Japanese Garden', None, (),
+     13, 65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12374, 'pysollib.games.special.hanafuda1', 'Japanese Garden II', None, (),
+     13, 65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12375, 'pysollib.games.special.hanafuda1', 'Six Sages', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12376, 'pysollib.games.special.hanafuda1', 'Six Tengus', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12377, 'pysollib.games.special.hanafuda1', 'Japanese Garden III', None,
+     (), 13, 65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12378, 'pysollib.games.special.hanafuda1', 'Hanafuda Four Seasons', None,
+     (), 13, 65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12379, 'pysollib.games.special.hanafuda', 'Oonsoo Times Two', None, (),
+     13, 0, 2, 0, 96, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12380, 'pysollib.games.special.hanafuda1', 'Eularia', None, (), 13, 0, 1,
+     -1, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12381, 'pysollib.games.special.hanafuda1', 'Peony', None, (), 13, 0, 1,
+     -1, 48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12382, 'pysollib.games.special.hanafuda1', 'Iris', None, (), 13, 0, 1, 0,
+     48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12383, 'pysollib.games.special.hanafuda1', 'Pine', None, (), 13, 0, 1, 0,
+     48, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (0, 1, 2, 3), (),
+     None, {}, False),
+    (12384, 'pysollib.games.special.hanafuda1', 'Wisteria', None, (), 13,
+     65536, 1, 0, 48, 2, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (12385, 'pysollib.games.special.hanafuda1', 'Flower Arrangement', None, (),
+     13, 0, 2, 0, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (13001, 'pysollib.games.special.larasgame', "Katrina's Game", None, (), 31,
+     0, 2, 1, 156, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13002, 'pysollib.games.special.larasgame', "Bridget's Game", None, (), 14,
+     0, 2, 1, 136, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (13003, 'pysollib.games.special.larasgame', "Fatimeh's Game", None, (), 20,
+     0, 1, 2, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (13004, 'pysollib.games.special.larasgame', "Kali's Game", None, (), 7, 0,
+     1, 2, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (13005, 'pysollib.games.special.larasgame', "Dojouji's Game", None, (), 13,
+     0, 2, 0, 96, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (13006, 'pysollib.games.larasgame', "Lara's Game Relaxed", None, (), 1, 0,
+     2, 1, 104, 1, 0, 3, None, None, (), None, {}, False),
+    (13007, 'pysollib.games.larasgame', "Lara's Game Doubled", None, (), 3, 0,
+     4, 2, 208, 1, 0, 3, None, None, (), None, {}, False),
+    (13008, 'pysollib.games.special.larasgame', "Katrina's Game Relaxed", None,
+     (), 31, 0, 2, 1, 156, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13009, 'pysollib.games.special.larasgame', "Katrina's Game Doubled", None,
+     (), 31, 0, 4, 2, 312, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13010, 'pysollib.games.special.larasgame', "Bridget's Game Doubled", None,
+     (), 14, 0, 4, 2, 272, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (13011, 'pysollib.games.special.larasgame', "Kali's Game Relaxed", None,
+     (), 7, 0, 1, 2, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (13012, 'pysollib.games.special.larasgame', "Kali's Game Doubled", None,
+     (), 7, 0, 2, 3, 240, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (13013, 'pysollib.games.special.larasgame', "Fatimeh's Game Relaxed", None,
+     (), 20, 0, 1, 2, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (13014, 'pysollib.games.special.larasgame', "Dojouji's Game Doubled", None,
+     (), 13, 0, 4, 0, 192, 2, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11),
+     (0, 1, 2, 3), (), None, {}, False),
+    (13160, 'pysollib.games.special.tarock', 'Imperial Trump Yukon', None, (),
+     31, 147456, 1, 0, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13161, 'pysollib.games.special.tarock', 'Klondike Nouveau', None, (), 31,
+     147456, 1, -1, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13162, 'pysollib.games.special.tarock', 'Yukon Nouveau', None, (), 31,
+     147456, 1, 0, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13163, 'pysollib.games.special.tarock1', 'Cockroach', None, (), 31,
+     147456, 1, 0, 78, 3, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13164, 'pysollib.games.special.tarock1', 'Double Cockroach', None, (), 31,
+     147456, 2, 0, 156, 3, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {'ncards': 78}, False),
+    (13165, 'pysollib.games.special.tarock1', 'Corkscrew', None, (), 31,
+     212992, 2, 0, 156, 3, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {'ncards': 78}, False),
+    (13166, 'pysollib.games.special.tarock1', 'Serpent', None, (), 31, 212992,
+     2, 0, 156, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {'ncards': 78}, False),
+    (13167, 'pysollib.games.special.tarock1', 'Rambling', None, (), 31, 212992,
+     2, 0, 156, 3, 0, 4, None, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {'ncards': 78}, False),
+    (13168, 'pysollib.games.special.tarock1', "Fool's Up", None, (), 31,
+     147456, 1, 0, 78, 3, 0, 1, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (13169, 'pysollib.games.special.tarock1', 'Trumps Row', None, (), 31,
+     147456, 1, 4, 78, 3, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {'ncards': 73}, False),
+    (14401, 'pysollib.games.special.mughal', 'Mughal Circles', None, (), 20, 0,
+     1, 0, 96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14402, 'pysollib.games.special.mughal', 'Ghulam', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14403, 'pysollib.games.special.mughal', 'Shamsher', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14404, 'pysollib.games.special.mughal', 'Eight Legions', None, (), 20, 0,
+     1, 0, 96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14405, 'pysollib.games.special.mughal', 'Ashrafi', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14406, 'pysollib.games.special.mughal', 'Tipati', None, (), 20, 0, 1, 0,
+     96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14407, 'pysollib.games.special.mughal', 'Ashwapati', None, (), 20, 0, 1,
+     -1, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14408, 'pysollib.games.special.mughal', 'Gajapati', None, (), 20, 0, 1,
+     -1, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14409, 'pysollib.games.special.mughal', 'Narpati', None, (), 20, 0, 1, 0,
+     96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14410, 'pysollib.games.special.mughal', 'Garhpati', None, (), 20, 0, 1,
+     -1, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14411, 'pysollib.games.special.mughal', 'Dhanpati', None, (), 20, 0, 1, 1,
+     96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14412, 'pysollib.games.special.mughal', "Akbar's Triumph", None, (), 20,
+     0, 1, 2, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (14413, 'pysollib.games.special.mughal', "Akbar's Conquest", None, (), 20,
+     0, 2, 2, 192, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15406, 'pysollib.games.special.dashavatara', 'Matsya', None, (), 7, 0, 1,
+     0, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15407, 'pysollib.games.special.dashavatara', 'Kurma', None, (), 7, 0, 1,
+     -1, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15408, 'pysollib.games.special.dashavatara', 'Varaha', None, (), 7, 0, 1,
+     -1, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15409, 'pysollib.games.special.dashavatara', 'Narasimha', None, (), 7, 0,
+     1, 0, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15410, 'pysollib.games.special.dashavatara', 'Vamana', None, (), 7, 0, 1,
+     -1, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15411, 'pysollib.games.special.dashavatara', 'Parashurama', None, (), 7,
+     0, 1, 1, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15412, 'pysollib.games.special.dashavatara', 'Ten Avatars', None, (), 7,
+     0, 1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15413, 'pysollib.games.special.dashavatara', 'Dashavatara Circles', None,
+     (), 7, 0, 1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15414, 'pysollib.games.special.dashavatara', 'Balarama', None, (), 7, 0,
+     1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15415, 'pysollib.games.special.dashavatara', 'Hayagriva', None, (), 7, 0,
+     1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15416, 'pysollib.games.special.dashavatara', 'Shanka', None, (), 7, 0, 1,
+     0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15417, 'pysollib.games.special.dashavatara', 'Journey to Cuddapah', None,
+     (), 7, 0, 1, 2, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15418, 'pysollib.games.special.dashavatara', 'Long Journey to Cuddapah',
+     None, (), 7, 0, 2, 2, 240, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15419, 'pysollib.games.special.dashavatara', 'Surukh', None, (), 7, 0, 1,
+     0, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15420, 'pysollib.games.special.dashavatara', "Appachan's Waterfall", None,
+     (), 7, 0, 1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15421, 'pysollib.games.special.dashavatara', 'Hiranyaksha', None, (), 7,
+     0, 1, 0, 120, 8, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (15422, 'pysollib.games.special.dashavatara', 'Dashavatara', None, (), 7,
+     0, 1, 0, 120, 8, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16000, 'pysollib.games.special.mughal', 'Vajra', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16001, 'pysollib.games.special.mughal', 'Danda', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16002, 'pysollib.games.special.mughal', 'Khadga', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16003, 'pysollib.games.special.mughal', 'Makara', None, (), 20, 0, 1, 0,
+     96, 6, 0, 4, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16004, 'pysollib.games.special.mughal', 'Ashta Dikapala', None, (), 20, 0,
+     1, 0, 96, 6, 0, 3, (0, 1, 2, 3, 4, 5, 6, 7),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11), (), None, {}, False),
+    (16666, 'pysollib.games.special.hexadeck', 'Klondike Plus 16', None, (),
+     14, 0, 1, 1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16667, 'pysollib.games.special.hexadeck', 'Hex A Klon (Draw 3)', None, (),
+     14, 0, 1, -1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16668, 'pysollib.games.special.hexadeck', 'King Only Hex A Klon', None,
+     (), 14, 0, 1, -1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16669, 'pysollib.games.special.hexadeck', 'The Familiar', None, (), 14, 0,
+     1, 1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16670, 'pysollib.games.special.hexadeck', 'Two Familiars', None, (), 14,
+     0, 2, 1, 136, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16671, 'pysollib.games.special.hexadeck', '10 x 8', None, (), 14, 0, 2,
+     -1, 136, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16672, 'pysollib.games.special.hexadeck', 'Drawbridge', None, (), 14, 0,
+     1, 1, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16673, 'pysollib.games.special.hexadeck', 'Double Drawbridge', None, (),
+     14, 0, 2, 1, 136, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16674, 'pysollib.games.special.hexadeck', 'Hidden Passages', None, (), 14,
+     0, 1, 1, 68, 5, 0, 2, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16675, 'pysollib.games.special.hexadeck', "Cluitjar's Lair", None, (), 14,
+     0, 1, 0, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16676, 'pysollib.games.special.hexadeck', "Merlin's Meander", None, (),
+     14, 0, 2, 2, 136, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16677, 'pysollib.games.special.hexadeck', "Mage's Game", None, (), 14,
+     65536, 1, 0, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16678, 'pysollib.games.special.hexadeck', 'Convolution', None, (), 14,
+     65536, 2, 0, 136, 5, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16679, 'pysollib.games.special.hexadeck', 'Hex Labyrinth', None, (), 14,
+     65536, 2, 0, 136, 5, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16680, 'pysollib.games.special.hexadeck', 'Snakestone', None, (), 14,
+     65536, 2, 0, 136, 5, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16681, 'pysollib.games.special.hexadeck', 'Hex Yukon', None, (), 14, 0, 1,
+     0, 68, 5, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (16682, 'pysollib.games.special.hexadeck', 'Magic Montana', None, (), 14,
+     65536, 1, 2, 68, 5, 0, 4, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), (0, 1, 2, 3),
+     None, {}, False),
+    (18000, 'pysollib.games.special.ishido', 'Ishido', None, (), 39, 0, 2, 0,
+     72, 12, 0, 4, (0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5), (), None, {},
+     False),
+    (18001, 'pysollib.games.special.ishido', 'Ishido Relaxed', None, (), 39, 0,
+     2, 0, 72, 12, 0, 4, (0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5), (), None, {},
+     False),
+    (18002, 'pysollib.games.special.ishido', 'Free Ishido', None, (), 39, 0, 2,
+     0, 72, 12, 0, 4, (0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5), (), None, {},
+     False),
+    (18003, 'pysollib.games.special.ishido', 'Free Ishido Relaxed', None, (),
+     39, 0, 2, 0, 72, 12, 0, 4, (0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5), (),
+     None, {}, False),
+    (18004, 'pysollib.games.special.ishido', 'Ishido Scored', None, (), 39,
+     1048576, 2, 0, 72, 12, 0, 4, (0, 1, 2, 3, 4, 5), (0, 1, 2, 3, 4, 5), (),
+     None, {}, False),
+    (19000, 'pysollib.games.special.samegame', 'Samegame 3 Colors 15x10', None,
+     (), 42, 0, 1, 0, 150, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149),
+     (), 'samegame.html', {}, False),
+    (19001, 'pysollib.games.special.samegame', 'Samegame 4 Colors 15x10', None,
+     (), 42, 0, 1, 0, 150, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149),
+     (), 'samegame.html', {}, False),
+    (19002, 'pysollib.games.special.samegame', 'Samegame 5 Colors 15x10', None,
+     (), 42, 0, 1, 0, 150, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149),
+     (), 'samegame.html', {}, False),
+    (19003, 'pysollib.games.special.samegame', 'Samegame 6 Colors 15x10', None,
+     (), 42, 0, 1, 0, 150, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149),
+     (), 'samegame.html', {}, False),
+    (19004, 'pysollib.games.special.samegame', 'Samegame 3 Colors 20x10', None,
+     (), 42, 0, 1, 0, 200, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199),
+     (), 'samegame.html', {}, False),
+    (19005, 'pysollib.games.special.samegame', 'Samegame 4 Colors 20x10', None,
+     (), 42, 0, 1, 0, 200, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199),
+     (), 'samegame.html', {}, False),
+    (19006, 'pysollib.games.special.samegame', 'Samegame 5 Colors 20x10', None,
+     (), 42, 0, 1, 0, 200, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199),
+     (), 'samegame.html', {}, False),
+    (19007, 'pysollib.games.special.samegame', 'Samegame 6 Colors 20x10', None,
+     (), 42, 0, 1, 0, 200, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199),
+     (), 'samegame.html', {}, False),
+    (19008, 'pysollib.games.special.samegame', 'Samegame 3 Colors 25x15', None,
+     (), 42, 0, 1, 0, 375, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206,
+      207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220,
+      221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234,
+      235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248,
+      249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262,
+      263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276,
+      277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290,
+      291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304,
+      305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318,
+      319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332,
+      333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346,
+      347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+      361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374),
+     (), 'samegame.html', {}, False),
+    (19009, 'pysollib.games.special.samegame', 'Samegame 4 Colors 25x15', None,
+     (), 42, 0, 1, 0, 375, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206,
+      207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220,
+      221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234,
+      235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248,
+      249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262,
+      263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276,
+      277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290,
+      291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304,
+      305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318,
+      319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332,
+      333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346,
+      347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+      361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374),
+     (), 'samegame.html', {}, False),
+    (19010, 'pysollib.games.special.samegame', 'Samegame 5 Colors 25x15', None,
+     (), 42, 0, 1, 0, 375, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206,
+      207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220,
+      221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234,
+      235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248,
+      249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262,
+      263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276,
+      277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290,
+      291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304,
+      305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318,
+      319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332,
+      333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346,
+      347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+      361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374),
+     (), 'samegame.html', {}, False),
+    (19011, 'pysollib.games.special.samegame', 'Samegame 6 Colors 25x15', None,
+     (), 42, 0, 1, 0, 375, 12, 0, 4, (0,),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108,
+      109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122,
+      123, 124, 125, 126, 127, 128, 129, 130, 131, 132, 133, 134, 135, 136,
+      137, 138, 139, 140, 141, 142, 143, 144, 145, 146, 147, 148, 149, 150,
+      151, 152, 153, 154, 155, 156, 157, 158, 159, 160, 161, 162, 163, 164,
+      165, 166, 167, 168, 169, 170, 171, 172, 173, 174, 175, 176, 177, 178,
+      179, 180, 181, 182, 183, 184, 185, 186, 187, 188, 189, 190, 191, 192,
+      193, 194, 195, 196, 197, 198, 199, 200, 201, 202, 203, 204, 205, 206,
+      207, 208, 209, 210, 211, 212, 213, 214, 215, 216, 217, 218, 219, 220,
+      221, 222, 223, 224, 225, 226, 227, 228, 229, 230, 231, 232, 233, 234,
+      235, 236, 237, 238, 239, 240, 241, 242, 243, 244, 245, 246, 247, 248,
+      249, 250, 251, 252, 253, 254, 255, 256, 257, 258, 259, 260, 261, 262,
+      263, 264, 265, 266, 267, 268, 269, 270, 271, 272, 273, 274, 275, 276,
+      277, 278, 279, 280, 281, 282, 283, 284, 285, 286, 287, 288, 289, 290,
+      291, 292, 293, 294, 295, 296, 297, 298, 299, 300, 301, 302, 303, 304,
+      305, 306, 307, 308, 309, 310, 311, 312, 313, 314, 315, 316, 317, 318,
+      319, 320, 321, 322, 323, 324, 325, 326, 327, 328, 329, 330, 331, 332,
+      333, 334, 335, 336, 337, 338, 339, 340, 341, 342, 343, 344, 345, 346,
+      347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 358, 359, 360,
+      361, 362, 363, 364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374),
+     (), 'samegame.html', {}, False),
+    (22216, 'pysollib.games.threepeaks', 'Three Peaks (Scored)', None, (), 11,
+     1048576, 1, 0, 52, 1, 0, 3, None, None, (), 'threepeaks.html', {}, False),
+    (22217, 'pysollib.games.threepeaks', 'Three Peaks (Open)', None, (), 11,
+     65536, 1, 0, 52, 1, 0, 3, None, None, (), 'threepeaks.html', {}, False),
+    (22218, 'pysollib.games.threepeaks', 'Three Peaks (Scored/Open)', None, (),
+     11, 1114112, 1, 0, 52, 1, 0, 3, None, None, (), 'threepeaks.html', {},
+     False),
+    (22223, 'pysollib.games.special.matrix', 'Matrix 3x3', None, (), 17, 0, 1,
+     0, 9, 9, 0, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7, 8), 'matrix.html', {},
+     False),
+    (22224, 'pysollib.games.special.matrix', 'Matrix 4x4', None, (), 17, 0, 1,
+     0, 16, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), 'matrix.html', {},
+     False),
+    (22225, 'pysollib.games.special.matrix', 'Matrix 5x5', None, (), 17, 0, 1,
+     0, 25, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24),
+     'matrix.html', {}, False),
+    (22226, 'pysollib.games.special.matrix', 'Matrix 6x6', None, (), 17, 0, 1,
+     0, 36, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35),
+     'matrix.html', {}, False),
+    (22227, 'pysollib.games.special.matrix', 'Matrix 7x7', None, (), 17, 0, 1,
+     0, 49, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48),
+     'matrix.html', {}, False),
+    (22228, 'pysollib.games.special.matrix', 'Matrix 8x8', None, (), 17, 0, 1,
+     0, 64, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63),
+     'matrix.html', {}, False),
+    (22229, 'pysollib.games.special.matrix', 'Matrix 9x9', None, (), 17, 0, 1,
+     0, 81, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80),
+     'matrix.html', {}, False),
+    (22230, 'pysollib.games.special.matrix', 'Matrix 10x10', None, (), 17, 0,
+     1, 0, 100, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99),
+     'matrix.html', {}, False),
+    (22231, 'pysollib.games.threepeaks', 'Three Peaks', None, ('Tri Peaks',),
+     11, 262144, 1, 0, 52, 1, 0, 3, None, None, (), None, {}, False),
+    (22232, 'pysollib.games.special.tarock1', 'Le Grande Teton', None, (), 31,
+     147456, 1, 0, 78, 3, 0, 3, None,
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21),
+     None, {}, False),
+    (22303, 'pysollib.games.special.matrix', 'Picture Matrix 3x3', None, (),
+     17, 0, 1, 0, 9, 11, 3, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7, 8),
+     'matrix.html', {}, False),
+    (22304, 'pysollib.games.special.matrix', 'Picture Matrix 4x4', None, (),
+     17, 0, 1, 0, 16, 11, 4, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), 'matrix.html', {},
+     False),
+    (22305, 'pysollib.games.special.matrix', 'Picture Matrix 5x5', None, (),
+     17, 0, 1, 0, 25, 11, 5, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24),
+     'matrix.html', {}, False),
+    (22306, 'pysollib.games.special.matrix', 'Picture Matrix 6x6', None, (),
+     17, 0, 1, 0, 36, 11, 6, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35),
+     'matrix.html', {}, False),
+    (22307, 'pysollib.games.special.matrix', 'Picture Matrix 7x7', None, (),
+     17, 0, 1, 0, 49, 11, 7, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48),
+     'matrix.html', {}, False),
+    (22308, 'pysollib.games.special.matrix', 'Picture Matrix 8x8', None, (),
+     17, 0, 1, 0, 64, 11, 8, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63),
+     'matrix.html', {}, False),
+    (22309, 'pysollib.games.special.matrix', 'Picture Matrix 9x9', None, (),
+     17, 0, 1, 0, 81, 11, 9, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80),
+     'matrix.html', {}, False),
+    (22310, 'pysollib.games.special.matrix', 'Picture Matrix 10x10', None, (),
+     17, 0, 1, 0, 100, 11, 10, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99),
+     'matrix.html', {}, False),
+    (22353, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 3x3', None, (),
+     26, 0, 1, 0, 9, 11, 3, 5, (), (), (0, 1, 2, 3, 4, 5, 6, 7, 8),
+     'tilepuzzle.html', {}, False),
+    (22354, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 4x4', None, (),
+     26, 0, 1, 0, 16, 11, 4, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), 'tilepuzzle.html',
+     {}, False),
+    (22355, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 5x5', None, (),
+     26, 0, 1, 0, 25, 11, 5, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24),
+     'tilepuzzle.html', {}, False),
+    (22356, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 6x6', None, (),
+     26, 0, 1, 0, 36, 11, 6, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35),
+     'tilepuzzle.html', {}, False),
+    (22357, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 7x7', None, (),
+     26, 0, 1, 0, 49, 11, 7, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48),
+     'tilepuzzle.html', {}, False),
+    (22358, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 8x8', None, (),
+     26, 0, 1, 0, 64, 11, 8, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63),
+     'tilepuzzle.html', {}, False),
+    (22359, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 9x9', None, (),
+     26, 0, 1, 0, 81, 11, 9, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80),
+     'tilepuzzle.html', {}, False),
+    (22360, 'pysollib.games.special.tilepuzzle', 'Tile Puzzle 10x10', None, (),
+     26, 0, 1, 0, 100, 11, 10, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99),
+     'tilepuzzle.html', {}, False),
+    (22400, 'pysollib.games.special.lightsout', 'Lights Out 4x4', None, (), 38,
+     0, 1, 0, 16, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), 'lightsout.html',
+     {}, False),
+    (22401, 'pysollib.games.special.lightsout', 'Lights Out 5x5', None, (), 38,
+     0, 1, 0, 25, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24),
+     'lightsout.html', {}, False),
+    (22402, 'pysollib.games.special.lightsout', 'Lights Out 6x6', None, (), 38,
+     0, 1, 0, 36, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35),
+     'lightsout.html', {}, False),
+    (22403, 'pysollib.games.special.lightsout', 'Lights Out 7x7', None, (), 38,
+     0, 1, 0, 49, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48),
+     'lightsout.html', {}, False),
+    (22404, 'pysollib.games.special.lightsout', 'Lights Out 8x8', None, (), 38,
+     0, 1, 0, 64, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63),
+     'lightsout.html', {}, False),
+    (22405, 'pysollib.games.special.lightsout', 'Lights Out 9x9', None, (), 38,
+     0, 1, 0, 81, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80),
+     'lightsout.html', {}, False),
+    (22406, 'pysollib.games.special.lightsout', 'Lights Out 10x10', None, (),
+     38, 0, 1, 0, 100, 9, 0, 5, (), (),
+     (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+      21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38,
+      39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56,
+      57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+      75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92,
+      93, 94, 95, 96, 97, 98, 99),
+     'lightsout.html', {}, False),
+    (343001, 'pysollib.games.bisley13', 'Bisley 13', None, (), 0, 65536, 1, 0,
+     52, 1, 0, 4, None, None, (), None, {}, False),
+    (555001, 'pysollib.games.daddylonglegs', 'Daddy Longlegs', None, (), 30, 0,
+     1, 0, 52, 1, 0, 4, None, None, (), None, {}, False),
+)
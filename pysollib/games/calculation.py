@@ -102,7 +102,8 @@ class Calculation(Game):
         lines.sort(key=len)
         max_line = lines[-1]
         text_width = get_text_width(max_line,
-                                    font=self.app.getFont("canvas_fixed"))
+                                    font=self.app.getFont("canvas_fixed"),
+                                    root=self.canvas)
         return help, text_width
 
     def createGame(self, playcards=20):
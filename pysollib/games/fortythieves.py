@@ -1318,22 +1318,22 @@ class BlindPatience_Hint(DefaultHint):
         if len(rpile) == 0:
             return True
         # now check for loops
-        rr = self.ClonedStack(from_stack, stackcards=rpile)
         if self.level < 2:
             # hint
             if to_stack.cards and not to_stack.cards[-1].face_up:
-                if rr.cards and not rr.cards[-1].face_up:
+                if rpile and not rpile[-1].face_up:
                     return True
-            if rr.cards and not rr.cards[-1].face_up:
+            if rpile and not rpile[-1].face_up:
                 return True
             if not to_stack.cards:
                 return True
         else:
             # demo mode
-            if rr.cards and not rr.cards[-1].face_up:
-                if len(rr.cards) < len(to_stack.cards):
+            if rpile and not rpile[-1].face_up:
+                if len(rpile) < len(to_stack.cards):
                     return True
-        if rr.acceptsCards(to_stack, pile):
+        if self.askWithCards(from_stack, rpile,
+                             from_stack.acceptsCards, to_stack, pile):
             # the pile we are going to move could be moved back -
             # this is dangerous as we can create endless loops...
             return False
@@ -67,23 +67,30 @@ class Golf_Hint(AbstractHint):
                 continue
             # this assertion must hold for Golf
             assert ncards == 1
-            # clone the Waste (including the card that will be dropped) to
-            # form our new foundations
-            ww = (self.ClonedStack(w, stackcards=w.cards+[r.cards[-1]]), )
-            # now search for a stack that would benefit from this card
+            # put the card on the Waste (without moving it) to form our
+            # new foundations
             score, color = 10000 + r.id, None
-            for t in game.sg.dropstacks:
-                if not t.cards:
-                    continue
-                if t is r:
-                    t = self.ClonedStack(r, stackcards=r.cards[:-1])
-                if t.canFlipCard():
-                    score = score + 100
-                elif t.canDropCards(ww)[0]:
-                    score = score + 100
+            saved = w.makeCards(w.cards+[r.cards[-1]])
+            try:
+                # now search for a stack that would benefit from this card
+                for t in game.sg.dropstacks:
+                    if not t.cards:
+                        continue
+                    if t is r:
+                        benefits = self.askWithCards(
+                            r, r.cards[:-1], self._benefitsFromDrop, r, w)
+                    else:
+                        benefits = self._benefitsFromDrop(t, w)
+                    if benefits:
+                        score = score + 100
+            finally:
+                w.unmakeCards(saved)
             # add hint
             self.addHint(score, ncards, r, w, color)
 
+    def _benefitsFromDrop(self, t, w):
+        return t.canFlipCard() or t.canDropCards((w,))[0]
+
 
 # ************************************************************************
 # *
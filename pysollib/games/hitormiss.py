@@ -155,10 +155,10 @@ class HitOrMiss(Game):
         # save vars (for undo/redo)
         return [self.rank, self.deadDeals]
 
-    def getSnapshotHash(self):
+    def getSnapshotState(self):
         # Takes the chosen rank into account when determining
         # if the game is stuck.
-        return Game.getSnapshotHash(self) + str(self.rank)
+        return self.rank
 
 
 class HitOrMissUnlimited(HitOrMiss):
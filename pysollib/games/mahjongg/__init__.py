@@ -20,8 +20,11 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 # ---------------------------------------------------------------------------##
-from . import mahjongg1  # noqa: F401
-from . import mahjongg2  # noqa: F401
-from . import mahjongg3  # noqa: F401
-from . import mahjonggL  # noqa: F401
-from . import shisensho  # noqa: F401
+from pysollib.gamedb import GAME_DB
+
+if not GAME_DB.index_loaded:
+    from . import mahjongg1  # noqa: F401
+    from . import mahjongg2  # noqa: F401
+    from . import mahjongg3  # noqa: F401
+    from . import mahjonggL  # noqa: F401
+    from . import shisensho  # noqa: F401
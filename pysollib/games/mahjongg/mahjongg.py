@@ -26,6 +26,9 @@ import time
 
 from pysollib.game import Game
 from pysollib.gamedb import GI, GameInfo, registerGame
+from pysollib.games.mahjongg.solvable import MahjonggDealer
+from pysollib.games.mahjongg.solver import MahjonggSolver, \
+        MahjonggSolver_Hint
 from pysollib.hint import AbstractHint
 from pysollib.layout import Layout
 from pysollib.mfxutil import Image, Struct, kwdefault
@@ -35,6 +38,7 @@ from pysollib.pysoltk import ANCHOR_NW, EVENT_HANDLED, bind
 from pysollib.pysoltk import MfxCanvasImage, MfxCanvasText
 from pysollib.pysoltk import MfxMessageDialog
 from pysollib.settings import DEBUG, TOOLKIT
+from pysollib.solvercache import SolverCache
 from pysollib.stack import \
         InitialDealTalonStack, \
         OpenStack
@@ -43,44 +47,32 @@ from pysollib.util import ANY_SUIT, NO_RANK
 from six.moves import range
 
 
-def factorial(x):
-    if x <= 1:
-        return 1
-    a = 1
-    for i in range(x):
-        a *= (i+1)
-    return a
-
-
 # ************************************************************************
 # *
 # ************************************************************************
 
 class Mahjongg_Hint(AbstractHint):
-    # FIXME: no intelligence whatsoever is implemented here
+    # a move drops the pair (see Mahjongg_RowStack.moveMove)
+    LOOKAHEAD = False
+
     def computeHints(self):
         game = self.game
-        # get free stacks
-        stacks = []
-        for r in game.s.rows:
-            if r.cards and not r.basicIsBlocked():
-                stacks.append(r)
-        # find matching tiles
-        i = 0
+        # the next move of a solution (see checkSolvable)
+        best = game.getSolutionMove()
+        # get free stacks and group them by tile type
+        stacks = game.getFreeRows()
+        types = game.getTileTypes(stacks)
+        # find matching tiles (the pairs in the order of stacks)
         for r in stacks:
-            for t in stacks[i+1:]:
-                if game.cardsMatch(r.cards[0], t.cards[0]):
-                    # simple scoring...
-                    # score = 10000 + r.id + t.id
-                    rb = r.blockmap
-                    tb = t.blockmap
-                    score = \
-                        10000 + \
-                        1000 * (len(rb.below) + len(tb.below)) + \
-                        len(rb.all_left) + len(rb.all_right) + \
-                        len(tb.all_left) + len(tb.all_right)
-                    self.addHint(score, 1, r, t)
-            i += 1
+            same = types[game.getTileType(r.cards[0])]
+            del same[0]                 # r itself
+            for t in same:
+                # simple scoring...
+                # score = 10000 + r.id + t.id
+                score = 10000 + r.blockmap.score + t.blockmap.score
+                if r in best and t in best:
+                    score += 50000
+                self.addHint(score, 1, r, t)
 
 
 # ************************************************************************
@@ -134,22 +126,55 @@ class Mahjongg_RowStack(OpenStack):
         OpenStack.__init__(self, x, y, game, **cap)
 
     def basicIsBlocked(self):
+        occupied = self.game.occupied
+        bm = self.blockmap
         # any of above blocks
-        for stack in self.blockmap.above:
-            if stack.cards:
-                return 1
+        if occupied & bm.above_mask:
+            return 1
         # any of left blocks - but we can try right as well
-        for stack in self.blockmap.left:
-            if stack.cards:
-                break
-        else:
-            return 0
-        # any of right blocks
-        for stack in self.blockmap.right:
-            if stack.cards:
-                return 1
+        if occupied & bm.left_mask and occupied & bm.right_mask:
+            return 1
         return 0
 
+    # keep game.occupied and game.free up to date
+    def _updateFree(self):
+        game = self.game
+        if self.cards:
+            game.occupied |= self.blockmap.bit
+        else:
+            game.occupied &= ~self.blockmap.bit
+        for stack in self.blockmap.affects:
+            if stack.cards and not stack.basicIsBlocked():
+                game.free |= stack.blockmap.bit
+            else:
+                game.free &= ~stack.blockmap.bit
+
+    def addCard(self, card, unhide=1, update=1):
+        card = OpenStack.addCard(self, card, unhide=unhide, update=update)
+        self._updateFree()
+        return card
+
+    def insertCard(self, card, position, unhide=1, update=1):
+        card = OpenStack.insertCard(self, card, position,
+                                    unhide=unhide, update=update)
+        self._updateFree()
+        return card
+
+    def removeCard(self, card=None, unhide=1, update=1, update_positions=0):
+        card = OpenStack.removeCard(self, card, unhide=unhide, update=update,
+                                    update_positions=update_positions)
+        self._updateFree()
+        return card
+
+    def makeCards(self, cards):
+        saved = OpenStack.makeCards(self, cards)
+        self._updateFree()
+        return saved
+
+    def unmakeCards(self, saved):
+        OpenStack.unmakeCards(self, saved)
+        self._updateFree()
+
     def acceptsCards(self, from_stack, cards):
         if not OpenStack.acceptsCards(self, from_stack, cards):
             return 0
@@ -331,6 +356,11 @@ class Mahjongg_RowStack(OpenStack):
         return None
 
 
+# the results of AbstractMahjonggGame.checkSolvable(); kept apart from
+# the solutions of the solver dialog (solver_cache), and not saved
+_check_cache = SolverCache(max_size=200)
+
+
 # ************************************************************************
 # *
 # ************************************************************************
@@ -338,6 +368,11 @@ class Mahjongg_RowStack(OpenStack):
 class AbstractMahjonggGame(Game):
     Hint_Class = Mahjongg_Hint
     RowStack_Class = Mahjongg_RowStack
+    Solver_Class = MahjonggSolver_Hint
+
+    # the budget of checkSolvable; it runs on every move (see getStuck)
+    SOLVER_MAX_ITERS = 5000
+    SOLVER_MAX_TIME = 0.05
 
     GAME_VERSION = 3
 
@@ -509,6 +544,13 @@ class AbstractMahjonggGame(Game):
                 # bottom=bottom,
                 all_left=None,
                 all_right=None,
+                # bit masks, see below
+                bit=0,
+                above_mask=0,
+                left_mask=0,
+                right_mask=0,
+                affects=None,
+                score=0,
             )
 
         def get_all_left(s):
@@ -536,6 +578,30 @@ class AbstractMahjonggGame(Game):
             r.blockmap.all_left = tuple(r.blockmap.all_left.keys())
             r.blockmap.all_right = tuple(r.blockmap.all_right.keys())
 
+        # compile the blockmap into bit masks of the rows (bit i is
+        # s.rows[i]); self.occupied has the bits of the rows with a tile
+        # and self.free the bits of the free tiles (see
+        # Mahjongg_RowStack.addCard/removeCard)
+        affects = {}
+        for i, r in enumerate(s.rows):
+            r.blockmap.bit = 1 << i
+            affects[r] = [r]
+        for r in s.rows:
+            bm = r.blockmap
+            bm.above_mask = self._getMask(bm.above)
+            bm.left_mask = self._getMask(bm.left)
+            bm.right_mask = self._getMask(bm.right)
+            # see Mahjongg_Hint
+            bm.score = 1000 * len(bm.below) + \
+                len(bm.all_left) + len(bm.all_right)
+            for t in bm.above + bm.left + bm.right:
+                affects[t].append(r)
+        for r in s.rows:
+            r.blockmap.affects = tuple(affects[r])
+        self.occupied = self.free = 0
+        self._dealer = None             # see _createSolvable()
+        self._checked = None            # see checkSolvable()
+
         # create other stacks
         for i in range(4):
             for j in range(9):
@@ -578,213 +644,33 @@ class AbstractMahjonggGame(Game):
         if self.app.opt.mahjongg_create_solvable == 0:
             return cards
         # try to create a solvable game
-        if self.app.opt.mahjongg_create_solvable == 1:
-            # easy
-            return self._shuffleHook1(cards[:])
-        # hard
-        new_cards = self._shuffleHook2(self.s.rows, cards)
+        # 1 - easy, 2 - hard
+        forward = self.app.opt.mahjongg_create_solvable == 1
+        new_cards = self._createSolvable(self.s.rows, cards, forward)
         if new_cards is None:
             return cards
         return new_cards
 
-    def _shuffleHook1(self, cards):
-        # old version; it generate a very easy layouts
-        old_cards = cards[:]
-        rows = self.s.rows
-
-        def is_blocked(s, new_cards):
-            # any of above blocks
-            for stack in s.blockmap.above:
-                if new_cards[stack.id] is None:
-                    return True
-            # any of left blocks - but we can try right as well
-            for stack in s.blockmap.left:
-                if new_cards[stack.id] is None:
-                    break
-            else:
-                return False
-            # any of right blocks
-            for stack in s.blockmap.right:
-                if new_cards[stack.id] is None:
-                    return True
-            return False
-
-        def create_solvable(cards, new_cards):
-            if not cards:
-                return new_cards
-            # select two matching cards
-            c1 = cards[0]
-            del cards[0]
-            c2 = None
-            for i in range(len(cards)):
-                if self.cardsMatch(c1, cards[i]):
-                    c2 = cards[i]
-                    del cards[i]
-                    break
-            #
-            free_stacks = []            # none-blocked stacks
-            for r in rows:
-                if new_cards[r.id] is None and not is_blocked(r, new_cards):
-                    free_stacks.append(r)
-            if len(free_stacks) < 2:
-                return None             # try another way
-            #
-            i = factorial(len(free_stacks))//2//factorial(len(free_stacks)-2)
-            old_pairs = []
-            for j in range(i):
-                nc = new_cards[:]
-                while True:
-                    # create uniq pair
-                    r1 = self.random.randrange(0, len(free_stacks))
-                    r2 = self.random.randrange(0, len(free_stacks)-1)
-                    if r2 >= r1:
-                        r2 += 1
-                    if (r1, r2) not in old_pairs and (r2, r1) not in old_pairs:
-                        old_pairs.append((r1, r2))
-                        break
-                # add two selected cards to new_cards
-                s1 = free_stacks[r1]
-                s2 = free_stacks[r2]
-                nc[s1.id] = c1
-                nc[s2.id] = c2
-                # check if this layout is solvable (backtracking)
-                nc = create_solvable(cards[:], nc)
-                if nc:
-                    return nc
-            return None                 # try another way
-
-        new_cards = create_solvable(cards, [None]*len(cards))
-        if new_cards:
-            new_cards.reverse()
-            return new_cards
-        print('oops! can\'t create a solvable game')
-        return old_cards
-
-    def _shuffleHook2(self, rows, cards):
-
+    # return cards in a solvable order for dealing to rows, or None
+    def _createSolvable(self, rows, cards, forward=False):
         start_time = time.time()
-        iters = [0]
-        # limitations
-        max_time = 5.0                  # seconds
-        max_iters = 2*len(cards)
-
-        def is_suitable(stack, cards):
-            for s in stack.blockmap.below:
-                if cards[s.id] == 1:
-                    continue
-                # check if below stacks are non-empty
-                if cards[s.id] is None:
-                    return False
-
-            for s in stack.blockmap.left:
-                if cards[s.id] == 1:
-                    continue
-                if cards[s.id] is None:
-                    for t in s.blockmap.all_left:
-                        if cards[t.id] == 1:
-                            continue
-                        if cards[t.id] is not None:
-                            # we have empty stack between two non-empty
-                            return False
-
-            for s in stack.blockmap.right:
-                if cards[s.id] == 1:
-                    continue
-                if cards[s.id] is None:
-                    for t in s.blockmap.all_right:
-                        if cards[t.id] == 1:
-                            continue
-                        if cards[t.id] is not None:
-                            # we have empty stack between two non-empty
-                            return False
-            return True
-
-        def create_solvable(cards, new_cards):
-            iters[0] += 1
-            if iters[0] > max_iters:
-                return None
-            if time.time() - start_time > max_time:
-                return None
-            if not cards:
-                return new_cards
-
-            nc = new_cards[:]
-
-            # select two matching cards
-            c1 = cards[0]
-            del cards[0]
-            c2 = None
-            for i in range(len(cards)):
-                if self.cardsMatch(c1, cards[i]):
-                    c2 = cards[i]
-                    del cards[i]
-                    break
-
-            # find suitable stacks
-            #  suitable_stacks = []
-            #  for r in rows:
-            #      if nc[r.id] is None and is_suitable(r, nc):
-            #          suitable_stacks.append(r)
-            suitable_stacks = [r for r in rows
-                               if nc[r.id] is None and is_suitable(r, nc)]
-
-            old_pairs = []
-            i = factorial(len(suitable_stacks))//2 \
-                // factorial(len(suitable_stacks)-2)
-            for j in range(i):
-                if iters[0] > max_iters:
-                    return None
-                if time.time() - start_time > max_time:
-                    return None
-
-                # select two suitable stacks
-                while True:
-                    # create a uniq pair
-                    r1 = self.random.randrange(0, len(suitable_stacks))
-                    r2 = self.random.randrange(0, len(suitable_stacks))
-                    if r1 == r2:
-                        continue
-                    if (r1, r2) not in old_pairs and (r2, r1) not in old_pairs:
-                        old_pairs.append((r1, r2))
-                        break
-                s1 = suitable_stacks[r1]
-                s2 = suitable_stacks[r2]
-                # check if s1 don't block s2
-                nc[s1.id] = c1
-                if not is_suitable(s2, nc):
-                    nc[s1.id] = None
-                    continue
-                nc[s2.id] = c2
-                # check if this layout is solvable (backtracking)
-                ret = create_solvable(cards[:], nc)
-                if ret:
-                    ret = [x for x in ret if x != 1]
-                    return ret
-                nc[s1.id] = nc[s2.id] = None  # try another way
-
+        if rows is self.s.rows:
+            if self._dealer is None:
+                self._dealer = MahjonggDealer(rows)
+            dealer = self._dealer
+        else:
+            dealer = MahjonggDealer(rows)
+        pairs = dealer.getPairs(cards, self.cardsMatch)
+        ret = None
+        if pairs is not None:
+            ret = dealer.createDeal(pairs, self.random, forward)
+        if DEBUG:
+            print('create_solvable time:', time.time() - start_time)
+        if ret is None:
+            print('oops! can\'t create a solvable game')
             return None
-
-        new_cards = [None]*len(self.s.rows)  # None - empty stack, 1 - non-used
-        drows = dict.fromkeys(rows)     # optimization
-        for r in self.s.rows:
-            if r not in drows:
-                new_cards[r.id] = 1
-        del drows
-
-        while True:
-            ret = create_solvable(cards[:], new_cards)
-            if DEBUG:
-                print('create_solvable time:', time.time() - start_time)
-            if ret:
-                ret.reverse()
-                return ret
-            if time.time() - start_time > max_time or \
-                    iters[0] <= max_iters:
-                print('oops! can\'t create a solvable game')
-                return None
-            iters = [0]
-        print('oops! can\'t create a solvable game')
-        return None
+        ret.reverse()
+        return ret
 
     def _mahjonggShuffle(self):
         talon = self.s.talon
@@ -815,7 +701,7 @@ class AbstractMahjonggGame(Game):
         old_state = self.enterState(self.S_FILL)
         self.saveSeedMove()
 
-        new_cards = self._shuffleHook2(rows, cards)
+        new_cards = self._createSolvable(rows, cards)
         if new_cards is None:
             if TOOLKIT != 'kivy':
                 MfxMessageDialog(self.top, title=_('Warning'),
@@ -869,26 +755,21 @@ a solvable configuration.'''),
     def getAutoStacks(self, event=None):
         return ((), (), ())
 
+    def getStuck(self):
+        if not Game.getStuck(self):
+            return False
+        if not self.app.opt.mahjongg_check_solvable:
+            return True
+        # there are free pairs, but can the game still be won?
+        return self.checkSolvable().solver_state != 'unsolved'
+
     def updateText(self):
         if self.preview > 1 or self.texts.info is None:
             return
 
         # find matching tiles
-        stacks = []
-        for r in self.s.rows:
-            if r.cards and not r.basicIsBlocked():
-                stacks.append(r)
-        f, i = 0, 0
-        for r in stacks:
-            n = 0
-            for t in stacks[i+1:]:
-                if self.cardsMatch(r.cards[0], t.cards[0]):
-                    n += 1
-            # if n == 3: n = 1
-            # elif n == 2: n = 0
-            n = n % 2
-            f += n
-            i += 1
+        types = self.getTileTypes(self.getFreeRows())
+        f = sum([len(t) // 2 for t in types.values()])
 
         if f == 0:
             f = _('No Free\nMatching\nPairs')
@@ -1000,6 +881,76 @@ a solvable configuration.'''),
     # Mahjongg extras
     #
 
+    def createSolver(self):
+        return MahjonggSolver(self)
+
+    # run the solver on the current position with a small budget;
+    # returns the solver hint: solver_state is 'solved' (hints has the
+    # solution), 'unsolved' or 'intractable'. The solver runs once per
+    # position: getStuck() and the hints of the same position share it.
+    def checkSolvable(self):
+        solver = self.Solver_Class(self, None)
+        checked = self._checked
+        if checked is not None and \
+                checked.board_string == solver.calcBoardString():
+            return checked
+        solver.cache = _check_cache
+        # look at the clock on every position: a Shisen-Sho position of
+        # a big layout takes milliseconds
+        solver.config(max_iters=self.SOLVER_MAX_ITERS,
+                      max_time=self.SOLVER_MAX_TIME, iters_step=1)
+        solver.computeHints()
+        solver.saveNextSolution()
+        self._checked = solver
+        return solver
+
+    # the stacks of the next move of a solution (see Mahjongg_Hint)
+    def getSolutionMove(self):
+        if not self.app.opt.mahjongg_check_solvable:
+            return ()
+        solver = self.checkSolvable()
+        if solver.solver_state != 'solved':
+            return ()
+        return solver.hints[0][1:]
+
+    def _getMask(self, stacks):
+        mask = 0
+        for stack in stacks:
+            mask |= stack.blockmap.bit
+        return mask
+
+    # the rows with a free tile, in the order of s.rows
+    def getFreeRows(self):
+        rows = self.s.rows
+        free = self.free
+        stacks = []
+        while free:
+            bit = free & -free
+            stacks.append(rows[bit.bit_length() - 1])
+            free ^= bit
+        return stacks
+
+    # two tiles match if they have the same type (see cardsMatch)
+    def getTileType(self, card):
+        rank = card.rank
+        if card.suit == 3:
+            if rank >= 8:
+                rank = 8
+            elif rank >= 4:
+                rank = 4
+        return card.suit * 16 + rank
+
+    # a dictionary of lists: the stacks grouped by the type of the tile
+    def getTileTypes(self, stacks):
+        types = {}
+        for r in stacks:
+            t = self.getTileType(r.cards[0])
+            if t in types:
+                types[t].append(r)
+            else:
+                types[t] = [r]
+        return types
+
     def cardsMatch(self, card1, card2):
         if card1.suit != card2.suit:
             return 0
@@ -25,6 +25,7 @@ from pysollib.gamedb import GI, GameInfo, registerGame
 from pysollib.games.mahjongg.mahjongg import AbstractMahjonggGame, \
         Mahjongg_RowStack, \
         comp_cardset
+from pysollib.games.mahjongg.solver import AbstractSolver
 from pysollib.hint import AbstractHint
 from pysollib.layout import Layout
 from pysollib.mfxutil import kwdefault
@@ -41,29 +42,24 @@ from six.moves import range
 
 
 class Shisen_Hint(AbstractHint):
+    # a move drops the pair (see Mahjongg_RowStack.moveMove)
+    LOOKAHEAD = False
+
     TOP_MATCHING = False
-    # FIXME: no intelligence whatsoever is implemented here
 
     def computeHints(self):
         game = self.game
-        # get free stacks
-        stacks = []
-        for r in game.s.rows:
-            if r.cards:
-                stacks.append(r)
-        # find matching tiles
-        i = 0
-        for r in stacks:
-            for t in stacks[i+1:]:
-                # if game.cardsMatch(r.cards[0], t.cards[0]):
-                if r.acceptsCards(t, t.cards):
-                    # simple scoring...
-                    if self.TOP_MATCHING:
-                        score = 2000 - r.rown - t.rown
-                    else:
-                        score = 1000 + r.rown + t.rown
-                    self.addHint(score, 1, r, t)
-            i += 1
+        # the next move of a solution (see checkSolvable)
+        best = game.getSolutionMove()
+        for r, t in game.getMatchingPairs():
+            # simple scoring...
+            if self.TOP_MATCHING:
+                score = 2000 - r.rown - t.rown
+            else:
+                score = 1000 + r.rown + t.rown
+            if r in best and t in best:
+                score += 5000
+            self.addHint(score, 1, r, t)
 
 
 class NotShisen_Hint(Shisen_Hint):
@@ -98,126 +94,67 @@ class Shisen_RowStack(Mahjongg_RowStack):
     def basicIsBlocked(self):
         return 0
 
+    # keep game.grid up to date
+    def _updateFree(self):
+        self.game.grid[self.gridpos] = len(self.cards) and 1
+
     def acceptsCards(self, from_stack, cards):
         if not self.game.cardsMatch(self.cards[0], cards[-1]):
             return 0
-
-        cols, rows = self.game.L
-        game_cols = self.game.cols
-        x1, y1 = self.coln+1, self.rown+1
-        x2, y2 = from_stack.coln+1, from_stack.rown+1
-        dx, dy = x2 - x1, y2 - y1
-
-        a = []
-        for i in range(cols+2):
-            a.append([5]*(rows+2))
-
-        def can_move(x, y, nx, ny, direct, d, direct_chng_cnt):
-            if (nx == x2 and ny == y2 and (self.allowAdjacent or
-                                           (abs(dx) > 1 and abs(dy) > 1)
-                                           or direct_chng_cnt > 0)):
-                return 1
-            if nx < 0 or ny < 0 or nx > cols+1 or ny > rows+1:
-                return 0
-            if nx in (0, cols+1) or ny in (0, rows+1) \
-                    or not game_cols[nx-1][ny-1].cards:
-                if direct_chng_cnt == 0:
-                    return 1
-                elif direct_chng_cnt == 1:
-                    if direct != d:
-                        if d == 1 and dy > 0:
-                            return 1
-                        elif d == 2 and dy < 0:
-                            return 1
-                        elif d == 3 and dx > 0:
-                            return 1
-                        elif d == 4 and dx < 0:
-                            return 1
-                    else:
-                        return 1
-                elif direct_chng_cnt == 2:
-                    if direct != d:
-                        if d in (1, 2) and x == x2:
-                            return 1
-                        elif y == y2:
-                            return 1
-                    else:
-                        if d == 1 and y < y2:
-                            return 1
-                        elif d == 2 and y > y2:
-                            return 1
-                        elif d == 3 and x < x2:
-                            return 1
-                        elif d == 4 and x > x2:
-                            return 1
-                elif direct_chng_cnt == 3:
-                    if direct == d:
-                        return 1
-
-            return 0
-
-        res_path = [None]
-
-        def do_accepts(x, y, direct, direct_chng_cnt, path):
-            # if direct_chng_cnt > 3:
-            #    return
-            if a[x][y] < direct_chng_cnt:
-                return
-            # if res_path[0]:
-            #    return
-            a[x][y] = direct_chng_cnt
-            if x == x2 and y == y2:
-                res_path[0] = path
-                return
-
-            if can_move(x, y, x, y+1, direct, 1, direct_chng_cnt):  # 1
-                # dcc = direct == 1 and direct_chng_cnt or direct_chng_cnt+1
-                p = path[:]
-                if direct == 1:
-                    dcc = direct_chng_cnt
-                else:
-                    dcc = direct_chng_cnt+1
-                    p.append((x, y))
-                do_accepts(x, y+1, 1, dcc, p)
-            if can_move(x, y, x, y-1, direct, 2, direct_chng_cnt):  # 2
-                # dcc = direct == 2 and direct_chng_cnt or direct_chng_cnt+1
-                p = path[:]
-                if direct == 2:
-                    dcc = direct_chng_cnt
-                else:
-                    dcc = direct_chng_cnt+1
-                    p.append((x, y))
-                do_accepts(x, y-1, 2, dcc, p)
-            if can_move(x, y, x+1, y, direct, 3, direct_chng_cnt):  # 3
-                # dcc = direct == 3 and direct_chng_cnt or direct_chng_cnt+1
-                p = path[:]
-                if direct == 3:
-                    dcc = direct_chng_cnt
-                else:
-                    dcc = direct_chng_cnt+1
-                    p.append((x, y))
-                do_accepts(x+1, y, 3, dcc, p)
-            if can_move(x, y, x-1, y, direct, 4, direct_chng_cnt):  # 4
-                # dcc = direct == 4 and direct_chng_cnt or direct_chng_cnt+1
-                p = path[:]
-                if direct == 4:
-                    dcc = direct_chng_cnt
-                else:
-                    dcc = direct_chng_cnt+1
-                    p.append((x, y))
-                do_accepts(x-1, y, 4, dcc, p)
-
-        do_accepts(x1, y1, 0, 0, [])
-        # from pprint import pprint
-        # pprint(a)
-
-        if a[x2][y2] > 3:
-            return None
-
-        res_path = res_path[0]
-        res_path.append((x2, y2))
-        # print res_path
-        return res_path
+        return self.getPaths().get(from_stack)
+
+    # the matching tiles that can be connected with this tile by a line
+    # with at most two turns through empty cells (the cells around the
+    # board are always empty); a dictionary: stack -> path, the path is
+    # the list of the corners in the coordinates of the grid (the tiles
+    # start at (1, 1))
+    def getPaths(self):
+        game = self.game
+        w = game.grid_width
+        found, parent = self.findTiles(game.grid, w, self.gridpos)
+        paths = {}
+        card = self.cards[0]
+        for i, p in found.items():
+            stack = game.grid_stacks[i]
+            if not game.cardsMatch(card, stack.cards[0]):
+                continue
+            path = [i]
+            while p is not None:
+                path.append(p)
+                p = parent[p]
+            path.reverse()
+            paths[stack] = [(j % w, j // w - 1) for j in path]
+        return paths
+
+    # the tiles that can be reached from the cell start of a grid (see
+    # AbstractShisenGame.createGame); returns two dictionaries: the
+    # tiles and the empty cells with the cell where the last line to
+    # them starts (None for start)
+    #
+    # This is a breadth-first search by the number of lines (a 0-1 BFS:
+    # going straight on costs nothing, a turn costs one line), so a line
+    # is followed to its end and every empty cell is reached only once.
+    def findTiles(self, grid, w, start):
+        turns = {1: (w, -w), -1: (w, -w), w: (1, -1), -w: (1, -1)}
+        parent = {start: None}
+        found = {}
+        todo = [(start, (1, -1, w, -w))]
+        for n in (1, 2, 3):
+            lines = []
+            for p, dirs in todo:
+                for d in dirs:
+                    i = p + d
+                    while not grid[i]:
+                        if i not in parent:
+                            parent[i] = p
+                            lines.append((i, turns[d]))
+                        i += d
+                    if grid[i] == 1 and i not in found and \
+                            (n > 1 or i != p + d or self.allowAdjacent):
+                        found[i] = p
+            todo = lines
+        found.pop(start, None)
+        return found, parent
 
     def fillStack(self):
         self.game.fillStack(self)
@@ -298,6 +235,106 @@ class Shisen_RowStack(Mahjongg_RowStack):
         game.canvas.update_idletasks()
 
 
+# ************************************************************************
+# * Solver (see games/mahjongg/solver.py): the board is a copy of
+# * game.grid, with gravity the tiles above a removed tile fall down
+# ************************************************************************
+
+class ShisenSolver(AbstractSolver):
+    def __init__(self, game):
+        AbstractSolver.__init__(self)
+        self.rows = game.s.rows
+        self.grid = game.grid[:]
+        self.w = game.grid_width
+        self.gravity = game.GRAVITY
+        # the rules of the row stacks
+        self.findTiles = game.s.rows[0].findTiles
+        self.stacks = game.grid_stacks
+        # the type and the bit of the tile of each cell
+        self.types = [None] * len(self.grid)
+        self.ids = [None] * len(self.grid)
+        self.count = {}
+        self.cells = []
+        n = 0
+        for r in game.s.rows:
+            self.cells.append(r.gridpos)
+            if r.cards:
+                t = game.getTileType(r.cards[0])
+                self.types[r.gridpos] = t
+                self.ids[r.gridpos] = n
+                self.count[t] = self.count.get(t, 0) + 1
+                n += 1
+        self.cells.sort()
+        self.present = (1 << n) - 1
+        self._undo = []
+
+    def isSolved(self):
+        return not self.present
+
+    def getKey(self):
+        return self.present
+
+    def getMoves(self):
+        grid, w, types, count = self.grid, self.w, self.types, self.count
+        groups = {}
+        for i in self.cells:
+            if grid[i] == 1:
+                groups.setdefault(types[i], []).append(i)
+        moves = []
+        for t, cells in groups.items():
+            pairs = []
+            for x in range(len(cells) - 1):
+                found = self.findTiles(grid, w, cells[x])[0]
+                for j in cells[x+1:]:
+                    if j in found:
+                        pairs.append((cells[x], j))
+            if pairs and len(cells) == 2 and not self.gravity:
+                # the last two tiles of this type: without gravity a
+                # removal never blocks a tile
+                return pairs
+            moves.extend(pairs)
+        # the last tiles of a type first
+        moves.sort(key=lambda m: count[types[m[0]]])
+        return moves
+
+    def _remove(self, i):
+        grid, types, ids, w = self.grid, self.types, self.ids, self.w
+        if self.gravity:
+            while grid[i-w] == 1:
+                types[i], ids[i] = types[i-w], ids[i-w]
+                i -= w
+        grid[i] = 0
+        types[i] = ids[i] = None
+
+    def doMove(self, move):
+        a, b = move
+        grid, types, ids, w = self.grid, self.types, self.ids, self.w
+        cols = [(x, grid[x::w], types[x::w], ids[x::w])
+                for x in set((a % w, b % w))]
+        self._undo.append((self.present, cols))
+        self.present &= ~(1 << ids[a] | 1 << ids[b])
+        self.count[types[a]] -= 2
+        # the upper tile first
+        self._remove(min(a, b))
+        self._remove(max(a, b))
+
+    def undoMove(self, move):
+        grid, types, ids, w = self.grid, self.types, self.ids, self.w
+        self.present, cols = self._undo.pop()
+        for x, g, t, i in cols:
+            grid[x::w], types[x::w], ids[x::w] = g, t, i
+        self.count[types[move[0]]] += 2
+
+    def getStacks(self, move):
+        return self.stacks[move[0]], self.stacks[move[1]]
+
+    def getMove(self, stack1, stack2):
+        return stack1.gridpos, stack2.gridpos
+
+    def getBoard(self):
+        return [self.types[r.gridpos] for r in self.rows]
+
+
 class AbstractShisenGame(AbstractMahjonggGame):
     Hint_Class = NotShisen_Hint  # Shisen_Hint
     RowStack_Class = Shisen_RowStack
@@ -349,6 +386,18 @@ class AbstractShisenGame(AbstractMahjonggGame):
         # set game extras
         self.check_dist = l.CW*l.CW + l.CH*l.CH     # see _getClosestStack()
 
+        # the grid of the tiles (see Shisen_RowStack.getPaths): the
+        # board with a border of empty cells, a column and two rows of
+        # walls (2) stop the lines; 1 is a tile
+        self.grid_width = gw = cols + 3
+        self.grid = [0] * (gw * (rows + 4))
+        for i in range(gw):
+            self.grid[i] = self.grid[-1-i] = 2
+        for i in range(gw-1, len(self.grid), gw):
+            self.grid[i] = 2
+        self.grid_stacks = [None] * len(self.grid)
+        self._checked = None            # see checkSolvable()
+
         #
         self.cols = [[] for i in range(cols)]
         cl = range(cols)
@@ -362,6 +411,8 @@ class AbstractShisenGame(AbstractMahjonggGame):
                 stack.CARD_XOFFSET = 0
                 stack.CARD_YOFFSET = 0
                 stack.coln, stack.rown = col, row
+                stack.gridpos = (row + 2) * gw + col + 1
+                self.grid_stacks[stack.gridpos] = stack
                 s.rows.append(stack)
                 self.cols[col].append(stack)
         # from pprint import pprint
@@ -399,17 +450,7 @@ class AbstractShisenGame(AbstractMahjonggGame):
 
         if self.app.opt.shisen_show_matching:
             # find matching tiles
-            stacks = self.s.rows
-            f, i = 0, 0
-            for r in stacks:
-                i = i + 1
-                if not r.cards:
-                    continue
-                for t in stacks[i:]:
-                    if not t.cards:
-                        continue
-                    if r.acceptsCards(t, t.cards):
-                        f += 1
+            f = len(self.getMatchingPairs())
             if f == 0:
                 f = _('No Free\nMatching\nPairs')
             else:
@@ -430,6 +471,19 @@ class AbstractShisenGame(AbstractMahjonggGame):
         t = r1 + r2 + f
         self.texts.info.config(text=t)
 
+    # the pairs of tiles that can be removed, in the order of s.rows
+    def getMatchingPairs(self):
+        pairs = []
+        for r in self.s.rows:
+            if r.cards:
+                stacks = [t for t in r.getPaths() if t.id > r.id]
+                stacks.sort(key=lambda t: t.id)
+                pairs.extend([(r, t) for t in stacks])
+        return pairs
+
+    def createSolver(self):
+        return ShisenSolver(self)
+
     def drawHintArrow(self, from_stack, to_stack, ncards, sleep):
         from_stack.drawArrow(to_stack, sleep)
 
@@ -484,6 +538,17 @@ class NotShisen_RowStack(Shisen_RowStack):
         return [(self.coln+1, self.rown+1),
                 (from_stack.coln+1, from_stack.rown+1)]
 
+    # any tile in the same column or row
+    def findTiles(self, grid, w, start):
+        found = {}
+        for d in (1, -1, w, -w):
+            i = start + d
+            while grid[i] != 2:
+                if grid[i] == 1:
+                    found[i] = start
+                i += d
+        return found, {start: None}
+
 
 class NotShisen_14x6(AbstractShisenGame):
     Hint_Class = NotShisen_Hint
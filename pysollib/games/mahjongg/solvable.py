@@ -0,0 +1,290 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import time
+
+# ************************************************************************
+# * Solvable Mahjongg deals
+# *
+# * A deal is built by assigning the pairs of matching tiles to pairs of
+# * positions in the order they can be removed, so removing them in that
+# * order solves the game:
+# *
+# *   forward  (easy)   start with the full layout and take away two
+# *                     random free positions for every pair; this is
+# *                     the generator of the old versions, kept so the
+# *                     game numbers deal the same
+# *   backward (hard)   start with the empty layout and put every pair
+# *                     (the last removed one first) on two positions
+# *                     where both tiles are free; positions that could
+# *                     never be filled anymore are avoided
+# *
+# * The positions are the bits of an int (the placed positions and the
+# * candidates for the next pair); after each step only the neighbours
+# * of the two positions are checked again. Dead ends are left by
+# * backtracking; the backward search starts again after max_iters
+# * steps.
+# ************************************************************************
+
+
+def _bits(mask):
+    # the indices of the bits set in mask
+    ret = []
+    while mask:
+        bit = mask & -mask
+        ret.append(bit.bit_length() - 1)
+        mask ^= bit
+    return ret
+
+
+class MahjonggDealer:
+    def __init__(self, rows):
+        self.solution = None
+        # rows are Mahjongg_RowStack (see AbstractMahjonggGame.createGame);
+        # stacks that are not in rows count as empty
+        index = dict([(r, i) for i, r in enumerate(rows)])
+        self.n = n = len(rows)
+
+        def mask(stacks):
+            m = 0
+            for s in stacks:
+                i = index.get(s)
+                if i is not None:
+                    m |= 1 << i
+            return m
+
+        bms = [r.blockmap for r in rows]
+        self.above = [mask(bm.above) for bm in bms]
+        self.below = [mask(bm.below) for bm in bms]
+        self.left = [mask(bm.left) for bm in bms]
+        self.right = [mask(bm.right) for bm in bms]
+        self.all_left = [mask(bm.all_left) for bm in bms]
+        self.all_right = [mask(bm.all_right) for bm in bms]
+        # the positions to check again when a position changes
+        up, down, side = [[[] for i in range(n)] for j in range(3)]
+        for k in range(n):
+            for i in _bits(self.below[k]):
+                up[i].append(k)
+            for i in _bits(self.above[k]):
+                down[i].append(k)
+            for i in _bits(self.left[k] | self.right[k]):
+                side[i].append(k)
+        self.up = [tuple(x) for x in up]
+        self.down = [tuple(x) for x in down]
+        self.side = [tuple(x) for x in side]
+
+    # return the pairs of matching cards in the order of cards, or None
+    def getPairs(self, cards, match):
+        cards = cards[:]
+        pairs = []
+        while cards:
+            c1 = cards.pop(0)
+            for i in range(len(cards)):
+                if match(c1, cards[i]):
+                    pairs.append((c1, cards.pop(i)))
+                    break
+            else:
+                return None
+        return pairs
+
+    # return a list with a card for every row, or None; the pairs are
+    # removed in the order of the list and self.solution has the
+    # positions of the pairs in that order
+    def createDeal(self, pairs, random, forward=False,
+                   max_iters=None, max_time=2.0):
+        if 2 * len(pairs) != self.n:
+            return None
+        if max_iters is None:
+            max_iters = self.n
+        start_time = time.time()
+        self.deadline = start_time + max_time
+        while True:
+            self.iters = max_iters
+            self.random = random
+            self.cards = [None] * self.n
+            self.solution = []
+            if forward:
+                full = (1 << self.n) - 1
+                done = self._removePairs(pairs, 0, full,
+                                         self._getFree(full))
+                self.solution.reverse()
+            else:
+                done = self._placePairs(pairs, len(pairs) - 1, 0,
+                                        self._getCandidates(0))
+            cards, self.cards = self.cards, None
+            self.random = None
+            if done:
+                return cards
+            if forward or self.iters > 0 or time.time() > self.deadline:
+                # no solution or out of time
+                return None
+
+    def _swap(self, order, i):
+        # a step of the Fisher-Yates shuffle: a random one of order[i:]
+        # goes to order[i]
+        j = self.random.randint(i, len(order) - 1)
+        order[i], order[j] = order[j], order[i]
+
+    #
+    # forward: remove the pairs from the full layout
+    #
+
+    def _isFree(self, i, occupied):
+        if self.above[i] & occupied:
+            return False
+        return not (self.left[i] & occupied and self.right[i] & occupied)
+
+    def _getFree(self, occupied):
+        free = 0
+        for i in _bits(occupied):
+            if self._isFree(i, occupied):
+                free |= 1 << i
+        return free
+
+    def _updateFree(self, free, occupied, i):
+        free &= ~(1 << i)
+        for k in self.down[i] + self.side[i]:
+            if occupied >> k & 1 and self._isFree(k, occupied):
+                free |= 1 << k
+        return free
+
+    def _removePairs(self, pairs, depth, occupied, free):
+        if depth == len(pairs):
+            return True
+        if time.time() > self.deadline:
+            return False
+        order = _bits(free)
+        n = len(order)
+        if n < 2:
+            return False
+        # try the pairs of free positions in a random order, drawn the
+        # way the old generator did
+        tried = set()
+        for j in range(n * (n - 1) // 2):
+            while True:
+                r1 = self.random.randrange(0, n)
+                r2 = self.random.randrange(0, n - 1)
+                if r2 >= r1:
+                    r2 += 1
+                if (r1, r2) not in tried and (r2, r1) not in tried:
+                    tried.add((r1, r2))
+                    break
+            a, b = order[r1], order[r2]
+            occ = occupied & ~(1 << a | 1 << b)
+            fr = self._updateFree(free, occ, a)
+            fr = self._updateFree(fr, occ, b)
+            if self._removePairs(pairs, depth + 1, occ, fr):
+                self.cards[a], self.cards[b] = pairs[depth]
+                self.solution.append((a, b))
+                return True
+        return False
+
+    #
+    # backward: place the pairs on the empty layout
+    #
+
+    def _isCandidate(self, k, placed):
+        return (not placed >> k & 1 and
+                not self.below[k] & ~placed and
+                not (self.left[k] & placed and self.right[k] & placed))
+
+    def _getCandidates(self, placed):
+        cand = 0
+        for k in range(self.n):
+            if self._isCandidate(k, placed):
+                cand |= 1 << k
+        return cand
+
+    def _updateCandidates(self, cand, placed, i):
+        cand &= ~(1 << i)
+        for k in self.up[i] + self.side[i]:
+            if self._isCandidate(k, placed):
+                cand |= 1 << k
+            else:
+                cand &= ~(1 << k)
+        return cand
+
+    def _isDead(self, k, placed):
+        # an empty position between two placed tiles can't be filled
+        # (only the neighbours of the new tiles are checked)
+        return (not placed >> k & 1 and
+                self.all_left[k] & placed and self.all_right[k] & placed)
+
+    def _canPlace(self, tiles, placed):
+        # the tiles are free and no empty position gets lost
+        for i in tiles:
+            if self.above[i] & placed:
+                return False
+            if self.left[i] & placed and self.right[i] & placed:
+                return False
+            for k in self.side[i]:
+                if self._isDead(k, placed):
+                    return False
+        return True
+
+    def _isGood(self, a, placed, good):
+        ret = good.get(a)
+        if ret is None:
+            ret = good[a] = self._canPlace((a,), placed | 1 << a)
+        return ret
+
+    def _placePairs(self, pairs, depth, placed, cand):
+        if depth < 0:
+            return True
+        # try the candidates in a random order; the order is shuffled
+        # as far as it is used (order[:shuffled])
+        order = _bits(cand)
+        n = len(order)
+        shuffled = 0
+        # a pair can only use positions that are good for a single tile
+        good = {}
+        for x in range(n):
+            if x == shuffled:
+                self._swap(order, x)
+                shuffled += 1
+            a = order[x]
+            if not self._isGood(a, placed, good):
+                continue
+            for y in range(x + 1, n):
+                if y == shuffled:
+                    self._swap(order, y)
+                    shuffled += 1
+                b = order[y]
+                if not self._isGood(b, placed, good):
+                    continue
+                pl = placed | 1 << a | 1 << b
+                if not self._canPlace((a, b), pl):
+                    continue
+                cd = self._updateCandidates(cand, pl, a)
+                cd = self._updateCandidates(cd, pl, b)
+                if depth and not cd & cd - 1:
+                    # less than two places left for the next pair
+                    continue
+                self.iters -= 1
+                if self.iters < 0:
+                    return False
+                if self._placePairs(pairs, depth - 1, pl, cd):
+                    self.cards[a], self.cards[b] = pairs[depth]
+                    self.solution.append((a, b))
+                    return True
+        return False
@@ -0,0 +1,349 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import time
+
+from pysollib.games.mahjongg.solvable import _bits
+from pysollib.hint import Base_Solver_Hint, PySolHintLayoutImportError
+from pysollib.mygettext import _
+
+# ************************************************************************
+# * Solver for the Mahjongg and Shisen-Sho games
+# *
+# * A depth-first search over the pairs that can be removed. A position
+# * is an int (the bits of the tiles left), the positions that can't be
+# * solved are remembered. Tiles of the same type are interchangeable:
+# * if all tiles of a type left can be removed at once, that is the only
+# * move tried (removing tiles never blocks a tile in these games, see
+# * getMoves).
+# *
+# * The search ends after max_iters positions or max_time seconds
+# * ('intractable'); otherwise it is exact: 'solved' or 'unsolved'.
+# ************************************************************************
+
+
+class AbstractSolver:
+    def __init__(self):
+        self.solution = None
+        self.iters = 0
+        self.stored = 0
+
+    # return 'solved' (self.solution has the moves), 'unsolved' or
+    # 'intractable'; progress is called with the keywords of the solver
+    # dialog, stop returns True to cancel the search
+    def solve(self, max_iters=None, max_time=None, progress=None,
+              iters_step=100, stop=None):
+        self.max_iters = max_iters
+        self.end_time = max_time and time.time() + max_time
+        self.progress = progress
+        self.iters_step = max(iters_step, 1)
+        self.stop = stop
+        self.iters = 0
+        self.timed_out = False
+        self.failed = set()
+        self.solution = []
+        ret = self._search(0)
+        self.stored = len(self.failed)
+        self.failed = self.progress = self.stop = None
+        if ret:
+            self.solution.reverse()
+            return 'solved'
+        self.solution = None
+        if ret is None:
+            return 'intractable'
+        return 'unsolved'
+
+    # return True if solved, False if not, None if out of budget
+    def _search(self, depth):
+        if self.isSolved():
+            return True
+        key = self.getKey()
+        if key in self.failed:
+            return False
+        self.iters += 1
+        if self.max_iters and self.iters > self.max_iters:
+            return None
+        if self.iters % self.iters_step == 0:
+            if self.end_time and time.time() > self.end_time:
+                self.timed_out = True
+                return None
+            if self.stop and self.stop():
+                return None
+            if self.progress:
+                self.progress(iter=self.iters, depth=depth,
+                              states=len(self.failed))
+        for move in self.getMoves():
+            self.doMove(move)
+            ret = self._search(depth + 1)
+            self.undoMove(move)
+            if ret:
+                self.solution.append(self.getStacks(move))
+                return True
+            if ret is None:
+                return None
+        self.failed.add(key)
+        return False
+
+    #
+    # subclass overrides
+    #
+
+    def isSolved(self):
+        raise NotImplementedError
+
+    def getKey(self):
+        raise NotImplementedError
+
+    # a list of moves (pairs of positions), the most promising first
+    def getMoves(self):
+        raise NotImplementedError
+
+    def doMove(self, move):
+        raise NotImplementedError
+
+    def undoMove(self, move):
+        raise NotImplementedError
+
+    # the pair of stacks of a move in the current position
+    def getStacks(self, move):
+        raise NotImplementedError
+
+    # the move of a pair of stacks in the current position
+    def getMove(self, stack1, stack2):
+        raise NotImplementedError
+
+    # the tile types of the current position, a list in the order of
+    # game.s.rows (None for no tile)
+    def getBoard(self):
+        raise NotImplementedError
+
+
+class MahjonggSolver(AbstractSolver):
+    def __init__(self, game):
+        AbstractSolver.__init__(self)
+        # a position is the bit i for s.rows[i] (see blockmap.bit)
+        self.rows = rows = game.s.rows
+        self.n = len(rows)
+        bms = [r.blockmap for r in rows]
+        self.above = [bm.above_mask for bm in bms]
+        self.left = [bm.left_mask for bm in bms]
+        self.right = [bm.right_mask for bm in bms]
+        self.score = [bm.score for bm in bms]
+        self.all_left = [game._getMask(bm.all_left) for bm in bms]
+        self.all_right = [game._getMask(bm.all_right) for bm in bms]
+        self.affects = [tuple(_bits(game._getMask(bm.affects)))
+                        for bm in bms]
+        self.types = [game.getTileType(r.cards[0]) if r.cards else None
+                      for r in rows]
+        self.count = {}
+        self.tiles = {}                 # type -> the bits of its tiles
+        for i, t in enumerate(self.types):
+            if t is not None:
+                self.count[t] = self.count.get(t, 0) + 1
+                self.tiles[t] = self.tiles.get(t, 0) | 1 << i
+        # under[i]: the tiles below tile i, directly or not
+        self.under = [None] * self.n
+        for i in range(self.n):
+            self._getUnder(i, bms)
+        self.occupied = game.occupied
+        self.free = game.free
+        self._undo = []
+        # the last two tiles of a type on top of each other can't be
+        # removed (see getMoves)
+        self.dead = [t for t in self.count if self.count[t] == 2 and
+                     self._isStacked(self.tiles[t])]
+
+    def _getUnder(self, i, bms):
+        if self.under[i] is None:
+            under = 0
+            for s in bms[i].below:
+                j = s.blockmap.bit.bit_length() - 1
+                under |= 1 << j | self._getUnder(j, bms)
+            self.under[i] = under
+        return self.under[i]
+
+    def _isStacked(self, mask):
+        # mask has two tiles, is one of them below the other?
+        a, b = _bits(mask)
+        return bool(self.under[a] >> b & 1 or self.under[b] >> a & 1)
+
+    def isSolved(self):
+        return not self.occupied
+
+    def getKey(self):
+        return self.occupied
+
+    def getMoves(self):
+        if self.dead:
+            return []
+        types = self.types
+        groups = {}
+        for i in _bits(self.free):
+            groups.setdefault(types[i], []).append(i)
+        moves = []
+        for t, free in groups.items():
+            if len(free) == self.count[t]:
+                # all the tiles of this type are free and stay free
+                return [(free[0], free[1])]
+            pairs = []
+            for x in range(len(free)):
+                for y in range(x + 1, len(free)):
+                    a, b = free[x], free[y]
+                    if self.count[t] == 4 and self._isStacked(
+                            self.tiles[t] & self.occupied &
+                            ~(1 << a | 1 << b)):
+                        continue
+                    pairs.append((a, b))
+            if len(free) == self.count[t] - 1 > 1:
+                # one tile is not free: however the tiles are paired, a
+                # pair of free tiles is removed, so these are all the
+                # moves to try
+                return self._sortMoves(pairs)
+            moves.extend(pairs)
+        return self._sortMoves(moves)
+
+    def _sortMoves(self, moves):
+        # remove the tiles that block the most tiles first, then the
+        # tiles on top and in the middle of the rows (see Mahjongg_Hint)
+        score = self.score
+        weight = {}
+        for i in set([a for m in moves for a in m]):
+            weight[i] = self._getWeight(i)
+        moves.sort(key=lambda m: (-weight[m[0]] - weight[m[1]],
+                                  -score[m[0]] - score[m[1]]))
+        return moves
+
+    def _getWeight(self, i):
+        occupied = self.occupied
+        left = bin(self.all_left[i] & occupied).count('1')
+        right = bin(self.all_right[i] & occupied).count('1')
+        return 2 * bin(self.under[i] & occupied).count('1') + \
+            max(left, right)
+
+    def _isFree(self, i, occupied):
+        if self.above[i] & occupied:
+            return False
+        return not (self.left[i] & occupied and self.right[i] & occupied)
+
+    def doMove(self, move):
+        a, b = move
+        self._undo.append((self.occupied, self.free))
+        occupied = self.occupied & ~(1 << a | 1 << b)
+        free = self.free
+        for k in self.affects[a] + self.affects[b]:
+            if occupied >> k & 1 and self._isFree(k, occupied):
+                free |= 1 << k
+            else:
+                free &= ~(1 << k)
+        self.occupied, self.free = occupied, free
+        self.count[self.types[a]] -= 2
+
+    def undoMove(self, move):
+        self.occupied, self.free = self._undo.pop()
+        self.count[self.types[move[0]]] += 2
+
+    def getStacks(self, move):
+        return self.rows[move[0]], self.rows[move[1]]
+
+    def getMove(self, stack1, stack2):
+        return (stack1.blockmap.bit.bit_length() - 1,
+                stack2.blockmap.bit.bit_length() - 1)
+
+    def getBoard(self):
+        occupied = self.occupied
+        return [self.types[i] if occupied >> i & 1 else None
+                for i in range(self.n)]
+
+
+# ************************************************************************
+# * The solver for the solver dialog and for the checks of the game (see
+# * AbstractMahjonggGame.checkSolvable): game.createSolver() returns the
+# * solver of the current position.
+# ************************************************************************
+
+class MahjonggSolver_Hint(Base_Solver_Hint):
+    def __init__(self, game, dialog, **game_type):
+        Base_Solver_Hint.__init__(self, game, dialog, **game_type)
+        self.options['max_time'] = None
+        self.engine = None
+
+    def _setText(self, **kw):
+        if self.dialog:
+            return self.dialog.setText(**kw)
+
+    def _formatBoard(self, types):
+        tiles = ['--' if t is None else '%02x' % t for t in types]
+        return '\n'.join([' '.join(tiles[i:i+16])
+                          for i in range(0, len(tiles), 16)]) + '\n'
+
+    def calcBoardString(self):
+        game = self.game
+        return self._formatBoard([
+            game.getTileType(r.cards[0]) if r.cards else None
+            for r in game.s.rows])
+
+    # the engine copies the position too (see SolverThread)
+    def prepare(self):
+        Base_Solver_Hint.prepare(self)
+        self.engine = self.game.createSolver()
+
+    def computeHints(self):
+        if self.engine is None:
+            self.prepare()
+        board = self.board_string
+        if self.loadSolution(board):
+            return
+        solver = self.engine
+        progress = None
+        if self.options['progress']:
+            progress = self._setText
+        self.solver_state = solver.solve(
+            max_iters=self.options['max_iters'],
+            max_time=self.options['max_time'],
+            progress=progress, iters_step=self.options['iters_step'],
+            stop=lambda: self.cancelled)
+        self._setText(iter=solver.iters, states=solver.stored)
+        hints = []
+        if self.solver_state == 'solved':
+            hints = [[1, r, t] for r, t in solver.solution]
+        if self.cancelled:
+            self.solver_state = 'cancelled'
+            hints = []
+        self.hints = hints
+        if not solver.timed_out:
+            # the cache key has max_iters, but not max_time
+            self.saveSolution(board)
+        hints.append(None)
+
+    # the position after the first move of the solution is solved too
+    def saveNextSolution(self):
+        if self.solver_state != 'solved' or len(self.hints) < 3:
+            return
+        solver = self.game.createSolver()
+        solver.doMove(solver.getMove(*self.hints[0][1:]))
+        self.saveSolution(self._formatBoard(solver.getBoard()),
+                          self.hints[1:])
+
+    def importFile(solver, fh, s_game, self):
+        raise PySolHintLayoutImportError(
+            _('Unsupported game for import'), [], 0)
@@ -70,8 +70,8 @@ class SiebenBisAs_Hint(CautiousDefaultHint):
                 not to_stack.acceptsCards(from_stack, pile):
             return 0
         # now check for loops
-        rr = self.ClonedStack(from_stack, stackcards=rpile)
-        if rr.acceptsCards(to_stack, pile):
+        if self.askWithCards(from_stack, rpile,
+                             from_stack.acceptsCards, to_stack, pile):
             # the pile we are going to move could be moved back -
             # this is dangerous as we can create endless loops...
             return 0
@@ -179,8 +179,8 @@ class Maze_Hint(SiebenBisAs_Hint):
                 not to_stack.acceptsCards(from_stack, pile):
             return False
         # now check for loops
-        rr = self.ClonedStack(from_stack, stackcards=rpile)
-        if rr.acceptsCards(to_stack, pile):
+        if self.askWithCards(from_stack, rpile,
+                             from_stack.acceptsCards, to_stack, pile):
             # the pile we are going to move could be moved back -
             # this is dangerous as we can create endless loops...
             return False
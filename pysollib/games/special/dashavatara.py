@@ -1132,8 +1132,8 @@ class Dashavatara_Hint(AbstractHint):
                 if not pile or len(pile) != 1:
                     continue
                 if r in game.s.tableaux:
-                    rr = self.ClonedStack(r, stackcards=r.cards[:-1])
-                    if rr.acceptsCards(None, pile):
+                    if self.askWithCards(r, r.cards[:-1],
+                                         r.acceptsCards, None, pile):
                         # do not move a card that is already in correct place
                         continue
                     base_score = 80000 + (4 - r.cap.base_suit)
@@ -1154,8 +1154,8 @@ class Dashavatara_Hint(AbstractHint):
                 pile = r.getPile()
                 if not pile or len(pile) != 1:
                     continue
-                rr = self.ClonedStack(r, stackcards=r.cards[:-1])
-                if rr.acceptsCards(None, pile):
+                if self.askWithCards(r, r.cards[:-1],
+                                     r.acceptsCards, None, pile):
                     # do not move a card that is already in correct place
                     continue
                 # find a stack that would accept this card
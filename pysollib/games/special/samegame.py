@@ -46,12 +46,10 @@ class Samegame_Hint(AbstractHint):
 
     def computeHints(self):
         game = self.game
-        for r in game.s.rows:
-            if r.cards:
-                removeStacks = r.getRemoveStacks()
-                score = 100 * len(removeStacks)
-                if score > 100:
-                    self.addHint(score, 1, r, game.s.foundations[0])
+        for stacks in game.getRegions():
+            score = 100 * len(stacks)
+            if score > 100:
+                self.addHint(score, 1, stacks[0], game.s.foundations[0])
 
 
 class Samegame_Foundation(AbstractFoundationStack):
@@ -84,8 +82,6 @@ class Samegame_RowStack(OpenStack):
             game.updateStackMove(self, 2 | 16)
             for stack in removeStacks:
                 game.moveMove(1, stack, game.s.foundations[0], frames=0)
-            for stack in removeStacks:
-                stack.fillStack()
             game.slideStacks()
 
             if not game.demo:
@@ -98,39 +94,28 @@ class Samegame_RowStack(OpenStack):
             return OpenStack.moveMove(self, ncards, to_stack, frames=frames,
                                       shadow=shadow)
 
-    def fillStack(self):
-        self.game.fillStack(self)
-
-    def getRemoveStacks(self):
-        removeStacks = [self]
-        spotsChecked = 0
-        while spotsChecked < len(removeStacks):
-            adjacent = self.getAdjacent(removeStacks[spotsChecked].id)
-            for adjacentStack in adjacent:
-                if adjacentStack not in removeStacks and \
-                        len(adjacentStack.cards) > 0 and \
-                        adjacentStack.cards[0].suit == self.cards[0].suit:
-                    removeStacks.append(adjacentStack)
-            spotsChecked += 1
-        return removeStacks
-
-    def getAdjacent(self, playSpace):
-        cols, rows = self.game.L
-        s = self.game.s
-        adjacentRows = []
-        if playSpace % rows != (rows - 1):
-            adjacentRows.append(s.rows[playSpace + 1])
-
-        if playSpace % rows != 0:
-            adjacentRows.append(s.rows[playSpace - 1])
+    def addCard(self, card, unhide=1, update=1):
+        card = OpenStack.addCard(self, card, unhide=unhide, update=update)
+        self.game.updateRegions(self)
+        return card
 
-        if playSpace + rows < (cols * rows):
-            adjacentRows.append(s.rows[playSpace + rows])
+    def insertCard(self, card, position, unhide=1, update=1):
+        card = OpenStack.insertCard(self, card, position,
+                                    unhide=unhide, update=update)
+        self.game.updateRegions(self)
+        return card
 
-        if playSpace - rows > -1:
-            adjacentRows.append(s.rows[playSpace - rows])
+    def removeCard(self, card=None, unhide=1, update=1, update_positions=0):
+        card = OpenStack.removeCard(self, card, unhide=unhide, update=update,
+                                    update_positions=update_positions)
+        self.game.updateRegions(self)
+        return card
 
-        return adjacentRows
+    # the stacks of the region of this stack (see getRegions)
+    def getRemoveStacks(self):
+        if not self.cards:
+            return [self]
+        return self.game.getRegion(self)
 
 
 class AbstractSamegameGame(Game):
@@ -175,6 +160,15 @@ class AbstractSamegameGame(Game):
         h = l.YM + dyy + rows * cardh + d_y + l.YM
         self.setSize(w, h)
 
+        # the regions (see getRegions)
+        n = cols * rows
+        self._parent = list(range(n))
+        self._size = [0] * n
+        self._trail = []                # the unions: (child, parent)
+        self._marks = [0] * cols        # len(self._trail) before a column
+        self._dirty = 0                 # the first column to do again
+        self._regions = None
+
         #
         self.cols = [[] for i in range(cols)]
         cl = range(cols)
@@ -217,34 +211,102 @@ class AbstractSamegameGame(Game):
         return Card(id, deck, id % self.COLORS, id % self.COLORS,
                     game=self, x=x, y=y)
 
-    def fillStack(self, stack):
-        to_stack = stack
-        for from_stack in self.cols[stack.coln][stack.rown+1::-1]:
-            if not from_stack.cards:
-                continue
-            self.moveMove(1, from_stack, to_stack, frames=0)
-            to_stack = from_stack
-
     def slideStacks(self):
-        # Slide to the left to fill empty columns.
-        numrows = self.L[1]
-        card = 0
-        emptycols = 0
-        for c in range(len(self.cols)):
-            iscolempty = True
-            colstart = card
-            for r in range(numrows):
-                if len(self.s.rows[card].cards) > 0:
-                    iscolempty = False
-                card += 1
-            if iscolempty:
-                emptycols += 1
-            elif emptycols > 0:
-                for r in range(colstart, card):
-                    if len(self.s.rows[r].cards) > 0:
-                        self.moveMove(1, self.s.rows[r],
-                                      self.s.rows[r - (numrows * emptycols)],
-                                      frames=0)
+        # Let the cards fall down and slide to the left to fill empty
+        # columns, every card is moved once to its new place. The
+        # columns are done from the left and from the bottom, so the
+        # new place is always empty.
+        to_col = 0
+        for col in self.cols:
+            to_row = len(col)
+            for stack in col[::-1]:
+                if stack.cards:
+                    to_row -= 1
+                    to_stack = self.cols[to_col][to_row]
+                    if to_stack is not stack:
+                        self.moveMove(1, stack, to_stack, frames=0)
+            if to_row < len(col):
+                to_col += 1
+
+    #
+    # Samegame extras
+    #
+
+    # The regions are the groups of adjacent cards of the same color.
+    # They are found with a union-find of the cells (the index in
+    # s.rows, column by column) without path compression: the unions of
+    # each column are kept in self._trail, so after a move only the
+    # columns from the first changed one on are done again.
+
+    def updateRegions(self, stack):
+        self._dirty = min(self._dirty, stack.coln)
+        self._regions = None
+
+    def _find(self, i):
+        parent = self._parent
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    def _union(self, i, j):
+        i, j = self._find(i), self._find(j)
+        if i == j:
+            return
+        size = self._size
+        if size[i] > size[j]:
+            i, j = j, i
+        self._parent[i] = j
+        size[j] += size[i]
+        self._trail.append((i, j))
+
+    def _updateRegions(self):
+        cols, rows = self.L
+        first = self._dirty
+        if first >= cols:
+            return
+        # undo the unions of the columns from first on
+        parent, size, trail = self._parent, self._size, self._trail
+        while len(trail) > self._marks[first]:
+            i, j = trail.pop()
+            parent[i] = i
+            size[j] -= size[i]
+        stacks = self.s.rows
+        for c in range(first, cols):
+            self._marks[c] = len(trail)
+            for i in range(c * rows, (c + 1) * rows):
+                parent[i] = i
+                if not stacks[i].cards:
+                    size[i] = 0
+                    continue
+                size[i] = 1
+                suit = stacks[i].cards[0].suit
+                for j in (i - 1, i - rows):
+                    if j >= 0 and (j != i - 1 or i % rows) and \
+                            stacks[j].cards and \
+                            stacks[j].cards[0].suit == suit:
+                        self._union(i, j)
+        self._dirty = cols
+
+    def _getRegions(self):
+        # root -> the stacks of the region
+        if self._regions is None:
+            self._updateRegions()
+            regions = {}
+            for stack in self.s.rows:
+                if stack.cards:
+                    root = self._find(stack.id)
+                    regions.setdefault(root, []).append(stack)
+            self._regions = regions
+        return self._regions
+
+    # a list of the regions, a region is a list of stacks; both in the
+    # order of s.rows
+    def getRegions(self):
+        return sorted(self._getRegions().values(), key=lambda r: r[0].id)
+
+    def getRegion(self, stack):
+        regions = self._getRegions()
+        return regions[self._find(stack.id)]
 
 
 class Samegame3_20x10(AbstractSamegameGame):
@@ -79,8 +79,7 @@ class Spider_Hint(SpiderType_Hint):
     def shallMovePile(self, r, t, pile, rpile):
         if not SpiderType_Hint.shallMovePile(self, r, t, pile, rpile):
             return False
-        rr = self.ClonedStack(r, stackcards=rpile)
-        if rr.acceptsCards(t, pile):
+        if self.askWithCards(r, rpile, r.acceptsCards, t, pile):
             # the pile we are going to move from r to t
             # could be moved back from t ro r - this is
             # dangerous for as we can create loops...
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import csv
+import json
+import multiprocessing
+import time
+import traceback
+
+from pysollib.app import Application
+from pysollib.images import Images
+from pysollib.mfxutil import Struct
+from pysollib.pysolaudio import AbstractAudioClient
+from pysollib.pysolrandom import construct_random
+from pysollib.resource import Cardset
+
+# ************************************************************************
+# * Headless mode - run the game engine without a window.
+# *
+# * The null widgets below stand in for the Tk toplevel and canvas so
+# * that Game.create(), Game.newGame() and the stack/card views run
+# * unchanged; every drawing call is simply swallowed.
+# ************************************************************************
+
+
+def _nop(*args, **kw):
+    return None
+
+
+class NullWidget(object):
+    # answer every method the engine may call on a widget with a no-op
+    _w = '.null'
+    _tclCommands = (None,)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _nop
+
+    def winfo_ismapped(self):
+        return 0
+
+    def winfo_width(self):
+        return 1
+
+    def winfo_height(self):
+        return 1
+
+    def bind(self, sequence=None, func=None, add=None):
+        return sequence
+
+
+class NullTk(NullWidget):
+    def splitlist(self, value):
+        return ()
+
+    def getint(self, value):
+        # tkinter.font.Font(root=canvas).measure() - no text has a width
+        return 0
+
+
+class NullCanvas(NullWidget):
+    def __init__(self):
+        self.tk = NullTk()
+        self.preview = 0
+        self.busy = False
+        self.items = {}
+        self.xmargin, self.ymargin = 10, 10
+        self._text_color = "#000000"
+        self._text_items = []
+        self.__item_id = 0
+
+    def _create(self, itemType, args, kw):
+        self.__item_id += 1
+        return self.__item_id
+
+    def coords(self, *args):
+        return [0, 0, 0, 0]
+
+    def bbox(self, *args):
+        return (0, 0, 0, 0)
+
+    def _getints(self, value):
+        return (0, 0, 0, 0)
+
+    def _do(self, name, args=()):
+        return ''
+
+    def find_overlapping(self, *args):
+        return ()
+
+    def gettags(self, *args):
+        return ()
+
+
+class NullImages(Images):
+    # card geometry of the default (Standard) cardset; no images at all
+    def __init__(self):
+        cs = Cardset(ranks=tuple(range(13)), suits="cshd")
+        cs.update(dict(CARDW=73, CARDH=97, CARD_XOFFSET=16, CARD_YOFFSET=25,
+                       SHADOW_XOFFSET=7, SHADOW_YOFFSET=7))
+        Images.__init__(self, None, cs)
+
+    def getFace(self, deck, suit, rank):
+        return None
+
+    def getBack(self, update=False):
+        return None
+
+    def getTalonBottom(self):
+        return None
+
+    getReserveBottom = getTalonBottom
+    getBlankBottom = getTalonBottom
+    getBraidBottom = getTalonBottom
+
+    def getSuitBottom(self, suit=-1):
+        return None
+
+    def getLetter(self, rank):
+        return None
+
+    def getShadow(self, ncards):
+        return None
+
+    def getShade(self):
+        return None
+
+    def getHighlightedCard(self, deck, suit, rank, color=None):
+        return None
+
+    def getHighlightedBack(self):
+        return None
+
+    def resize(self, xf, yf, resample=1):
+        pass
+
+
+class HeadlessApp(Application):
+    def __init__(self, lookahead=0):
+        Application.__init__(self)
+        self.top = NullWidget()
+        self.menubar = NullWidget()
+        self.canvas = NullCanvas()
+        self.images = NullImages()
+        self.cardset = self.images.cs
+        self.audio = AbstractAudioClient()
+        self.intro = Struct(progress=None)
+        opt = self.opt
+        opt.animations = 0
+        opt.redeal_animation = False
+        opt.win_animation = False
+        opt.flip_animation = False
+        opt.sound = False
+        opt.statusbar = False
+        opt.auto_scale = False
+        opt.spread_stacks = False
+        opt.save_games_geometry = False
+        opt.stuck_notification = False
+        opt.shade_filled_stacks = False
+        opt.timeouts['demo'] = 0
+        # seconds per move for the demo lookahead search, 0 - off
+        opt.demo_lookahead = lookahead > 0
+        if lookahead > 0:
+            opt.demo_lookahead_time = lookahead
+
+    def createGame(self, id):
+        game = self.constructGame(id)
+        game.create(self)
+        self.game = game
+        return game
+
+
+# ************************************************************************
+# * Play deals with the demo logic (Game.playOneDemoMove, i.e. the
+# * built-in hint classes) and report the outcome.
+# ************************************************************************
+
+def playDemoGame(game, seed, max_moves=2000):
+    result = Struct(gameid=game.id, seed=seed, won=False, moves=0,
+                    time=0.0, stuck='', error=None)
+    t0 = time.time()
+    try:
+        game.newGame(random=construct_random(str(seed)))
+        demo = game.demo = Struct(
+            level=2,
+            mixed=0,
+            sleep=0,
+            last_deal=[],
+            snapshots=game.createSnapshotStore(),
+            hint=None,
+            keypress=None,
+            start_demo_moves=game.stats.demo_moves,
+            info_text=None,
+        )
+        steps = 0
+        while True:
+            if game.isGameWon():
+                result.won = True
+                break
+            # a buggy _autoDeal() may keep "dealing" without any move
+            if game.moves.index >= max_moves or steps >= max_moves:
+                result.stuck = 'max-moves'
+                break
+            steps += 1
+            if game.playOneDemoMove(demo):
+                game.finishMove()
+                result.won = bool(game.isGameWon())
+                if result.won:
+                    break
+                if game.moves.index >= max_moves or \
+                        game.moves.index > game.DEMO_MAX_MOVES:
+                    result.stuck = 'max-moves'
+                elif not demo.hint:
+                    result.stuck = 'no-moves'
+                else:
+                    # the talon is exhausted or dealing repeats a position
+                    result.stuck = 'no-progress'
+                break
+            game.finishMove()
+        game.demo = None
+    except Exception:
+        result.stuck = 'error'
+        result.error = traceback.format_exc()
+    result.moves = game.moves.index
+    result.time = time.time() - t0
+    return result
+
+
+def simulateGames(app, game_ids, seeds, max_moves=2000):
+    # generator of results, one for each (game id, seed) pair
+    for id in game_ids:
+        try:
+            game = app.createGame(id)
+        except Exception:
+            yield Struct(gameid=id, seed=None, won=False, moves=0,
+                         time=0.0, stuck='error',
+                         error=traceback.format_exc())
+            continue
+        for seed in seeds:
+            yield playDemoGame(game, seed, max_moves=max_moves)
+        game.destruct()
+        app.game = None
+
+
+# ************************************************************************
+# * Fan (game id, seeds) chunks out over a process pool. Each worker
+# * process keeps its own HeadlessApp; results are streamed back in the
+# * order the chunks finish.
+# ************************************************************************
+
+_worker_app = None
+
+
+def _initWorker(lookahead):
+    global _worker_app
+    _worker_app = HeadlessApp(lookahead)
+
+
+def _runChunk(chunk):
+    id, seeds, max_moves = chunk
+    return list(simulateGames(_worker_app, [id], seeds, max_moves=max_moves))
+
+
+def simulateGamesParallel(game_ids, seeds, max_moves=2000,
+                          processes=None, chunksize=16, lookahead=0):
+    seeds = list(seeds)
+    chunks = [(id, seeds[i:i+chunksize], max_moves)
+              for id in game_ids
+              for i in range(0, len(seeds), chunksize)]
+    pool = multiprocessing.Pool(processes, _initWorker, (lookahead,))
+    try:
+        for results in pool.imap_unordered(_runChunk, chunks):
+            for r in results:
+                yield r
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+# ************************************************************************
+# * Write results as JSON lines or CSV, one line per deal
+# ************************************************************************
+
+class ResultWriter(object):
+    FIELDS = ('gameid', 'seed', 'won', 'moves', 'time', 'stuck', 'error')
+
+    def __init__(self, file, format='json'):
+        if format not in ('json', 'csv'):
+            raise ValueError('unknown result format: %s' % format)
+        self.file = file
+        self.format = format
+        self.csv = None
+        if format == 'csv':
+            self.csv = csv.DictWriter(file, self.FIELDS)
+            self.csv.writeheader()
+
+    def write(self, result):
+        d = dict((k, getattr(result, k)) for k in self.FIELDS)
+        d['time'] = round(d['time'], 6)
+        if self.csv:
+            d['won'] = int(d['won'])
+            self.csv.writerow(d)
+        else:
+            self.file.write(json.dumps(d, sort_keys=True) + '\n')
+        # stream, a survey can be interrupted at any time
+        self.file.flush()
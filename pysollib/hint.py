@@ -24,18 +24,64 @@
 
 import os
 import re
+import shlex
+import shutil
 import subprocess
+import threading
 import time
+import traceback
 from io import BytesIO
 
+import pysollib.settings
 from pysollib.mfxutil import destruct
 from pysollib.pysolrandom import construct_random
-from pysollib.settings import DEBUG, FCS_COMMAND
+from pysollib.settings import DEBUG
+from pysollib.solvercache import solver_cache
 from pysollib.util import KING
 
 import six
+from six.moves import queue
+
+# ************************************************************************
+# * MoveIndex finds the stacks that may accept a pile by lookup instead
+# * of asking every stack.
+# *
+# * A plain sequence row stack (see Stack.getSequenceFollows()) only
+# * accepts a pile whose first card follows its face-up top card, so
+# * while it is not empty it is indexed by the rank it wants next.
+# * All other stacks are candidates for every pile. This is only a
+# * necessary condition; candidates still must pass acceptsCards().
+# ************************************************************************
+
+
+class MoveIndex:
+    def __init__(self, stacks):
+        self.anytime = []               # (pos, stack) always a candidate
+        self.byrank = {}                # rank -> [(pos, stack, top, test)]
+        for pos, stack in enumerate(stacks):
+            follows = stack.cards and stack.getSequenceFollows()
+            if not follows:
+                self.anytime.append((pos, stack))
+                continue
+            top = stack.cards[-1]
+            if not top.face_up:
+                continue
+            rank = (top.rank + stack.cap.dir) % stack.cap.mod
+            self.byrank.setdefault(rank, []).append(
+                (pos, stack, top, follows))
+
+    def getCandidates(self, card):
+        # stacks that may accept a pile starting with card, in the
+        # original order
+        found = [(pos, stack)
+                 for pos, stack, top, follows in self.byrank.get(card.rank, ())
+                 if follows(top, card)]
+        if not found:
+            return [stack for pos, stack in self.anytime]
+        found.extend(self.anytime)
+        found.sort(key=lambda x: x[0])
+        return [stack for pos, stack in found]
 
-FCS_VERSION = None
 
 # ************************************************************************
 # * HintInterface is an abstract class that defines the public
@@ -47,6 +93,11 @@ FCS_VERSION = None
 
 
 class HintInterface:
+    # the demo may look ahead by playing the moves of the hints with
+    # Stack.makeCards() (see Game.getHints); games whose moves do more
+    # than move the cards (e.g. drop a pair) turn this off
+    LOOKAHEAD = True
+
     # level == 0: show hint (key `H')
     # level == 1: show hint and display score value (key `Ctrl-H')
     # level == 2: demo
@@ -100,13 +151,35 @@ class AbstractHint(HintInterface):
         self.hints = []
         self.max_score = 0
         self.__destructClones()
+        self.__move_indexes = {}
         self.solver_state = 'not_started'
 
+    # the stacks that may accept a pile starting with card (see MoveIndex)
+    def getTargetStacks(self, stacks, card):
+        key = id(stacks)
+        index = self.__move_indexes.get(key)
+        if index is None or index[0] is not stacks:
+            index = self.__move_indexes[key] = (stacks, MoveIndex(stacks))
+        return index[1].getCandidates(card)
+
+    #
+    # hypothetical positions
+    #
+
+    # Ask query(*args) while stack holds cards instead of its own
+    # cards (see Stack.makeCards()).
+    def askWithCards(self, stack, cards, query, *args):
+        saved = stack.makeCards(cards)
+        try:
+            return query(*args)
+        finally:
+            stack.unmakeCards(saved)
+
     #
     # stack cloning
     #
 
-    # Create a shallow copy of a stack.
+    # Create a shallow copy of a stack (prefer askWithCards()).
     class AClonedStack:
         def __init__(self, stack, stackcards):
             # copy class identity
@@ -220,8 +293,8 @@ class AbstractHint(HintInterface):
         if len(rpile) == 0:
             return 1
         # now check for loops
-        rr = self.ClonedStack(from_stack, stackcards=rpile)
-        if rr.acceptsCards(to_stack, pile):
+        if self.askWithCards(from_stack, rpile,
+                             from_stack.acceptsCards, to_stack, pile):
             # the pile we are going to move could be moved back -
             # this is dangerous as we can create endless loops...
             return 0
@@ -237,8 +310,8 @@ class AbstractHint(HintInterface):
             if len(rpile) == 0:
                 return 1
             # now check for loops
-            rr = self.ClonedStack(from_stack, stackcards=rpile)
-            if rr.acceptsCards(to_stack, pile):
+            if self.askWithCards(from_stack, rpile,
+                                 from_stack.acceptsCards, to_stack, pile):
                 # the pile we are going to move could be moved back -
                 # this is dangerous as we can create endless loops...
                 return 0
@@ -309,8 +382,8 @@ class DefaultHint(AbstractHint):
         assert pile
         bonus = 0
         if rpile:
-            rr = self.ClonedStack(r, stackcards=rpile)
-            if (rr.canDropCards(self.game.s.foundations))[0]:
+            if self.askWithCards(r, rpile, r.canDropCards,
+                                 self.game.s.foundations)[0]:
                 # the card below the pile can be dropped
                 bonus = self.BONUS_DROP_CARD
         if t.cards and t.cards[-1].suit == pile[0].suit:
@@ -503,7 +576,7 @@ class DefaultHint(AbstractHint):
         empty_row_seen = 0
         r_is_waste = r in self.game.sg.talonstacks
 
-        for t in rows:
+        for t in self.getTargetStacks(rows, pile[0]):
             score, color = 0, None
             if not self.shallMovePile(r, t, pile, rpile):
                 continue
@@ -545,8 +618,8 @@ class DefaultHint(AbstractHint):
                 drop_info = []
                 i = 0
                 for c in pile:
-                    rr = self.ClonedStack(r, stackcards=[c])
-                    stack, ncards = rr.canDropCards(foundations)
+                    stack, ncards = self.askWithCards(
+                        r, [c], r.canDropCards, foundations)
                     if stack and stack is not r:
                         assert ncards == 1
                         drop_info.append((c, stack, ncards, i))
@@ -559,7 +632,7 @@ class DefaultHint(AbstractHint):
                     # assert r.canMoveCards(sub_pile)
                     if not r.canMoveCards(sub_pile):
                         continue
-                    for t in rows:
+                    for t in self.getTargetStacks(rows, sub_pile[0]):
                         if t is r or not t.acceptsCards(r, sub_pile):
                             continue
                         # print "drop move", r, t, sub_pile
@@ -580,10 +653,10 @@ class DefaultHint(AbstractHint):
             if not card or not s.canMoveCards([card]):
                 continue
             # search a RowStack that would accept the card
-            for t in rows:
+            for t in self.getTargetStacks(rows, card):
                 if t is s or not t.acceptsCards(s, [card]):
                     continue
-                tt = self.ClonedStack(t, stackcards=t.cards+[card])
+                tcards = t.cards+[card]
                 # search a Stack that would benefit from this card
                 for r in dropstacks:
                     if r is t:
@@ -591,12 +664,12 @@ class DefaultHint(AbstractHint):
                     pile = r.getPile()
                     if not pile:
                         continue
-                    if not tt.acceptsCards(r, pile):
+                    if not self.askWithCards(t, tcards,
+                                             t.acceptsCards, r, pile):
                         continue
                     # compute remaining pile in r
                     rpile = r.cards[:(len(r.cards)-len(pile))]
-                    rr = self.ClonedStack(r, stackcards=rpile)
-                    if rr.acceptsCards(t, pile):
+                    if self.askWithCards(r, rpile, r.acceptsCards, t, pile):
                         # the pile we are going to move from r to t
                         # could be moved back from t ro r - this is
                         # dangerous as we can create loops...
@@ -620,11 +693,10 @@ class DefaultHint(AbstractHint):
             pile = [card]
             # compute remaining pile in r
             rpile = r.cards[:(len(r.cards)-len(pile))]
-            rr = self.ClonedStack(r, stackcards=rpile)
             for t in reservestacks:
                 if t is r or not t.acceptsCards(r, pile):
                     continue
-                if rr.acceptsCards(t, pile):
+                if self.askWithCards(r, rpile, r.acceptsCards, t, pile):
                     # the pile we are going to move from r to t
                     # could be moved back from t ro r - this is
                     # dangerous as we can create loops...
@@ -693,9 +765,8 @@ class Yukon_Hint(YukonType_Hint):
         tpile = t.getPile()
         if tpile:
             for cr in pile:
-                rr = self.ClonedStack(r, stackcards=[cr])
                 for ct in tpile:
-                    if rr.acceptsCards(t, [ct]):
+                    if self.askWithCards(r, [cr], r.acceptsCards, t, [ct]):
                         d = bonus // 1000
                         bonus = (d * 1000) + bonus % 100
                         break
@@ -726,6 +797,120 @@ class PySolHintLayoutImportError(Exception):
         return self.msg + ":\n\n" + ', '.join(self.cards)
 
 
+# ************************************************************************
+# * A solver session is shared by all hints of all games: the solver
+# * command is split and looked up in the PATH once and its version is
+# * queried once, and every solve runs the executable directly instead
+# * of starting a shell first.
+# ************************************************************************
+
+def splitCommand(command, posix=(os.name != 'nt')):
+    # Windows paths have backslashes, so they are not split in POSIX
+    # mode; the other mode keeps the quotes of "C:\Program Files\..."
+    argv = shlex.split(command, posix=posix)
+    if not posix:
+        argv = [a[1:-1] if len(a) > 1 and a[0] == a[-1] and a[0] in '"\''
+                else a for a in argv]
+    return argv
+
+
+class SolverSession:
+    def __init__(self, command):
+        # command is a string or a function returning the current
+        # command (settings.FCS_COMMAND may be changed at startup)
+        self.command = command
+        self.version = None
+        self._command = None
+        self._argv = None
+
+    def getArgv(self):
+        command = self.command
+        if callable(command):
+            command = command()
+        if command != self._command:
+            argv = splitCommand(command)
+            exe = shutil.which(argv[0])
+            if exe:
+                argv[0] = exe
+            self._command = command
+            self._argv = argv
+            self.version = None
+        return self._argv
+
+    def run(self, args, board):
+        argv = self.getArgv() + list(args)
+        if DEBUG:
+            print(' '.join(argv))
+        kw = {'stdin': subprocess.PIPE,
+              'stdout': subprocess.PIPE,
+              'stderr': subprocess.PIPE}
+        if os.name != 'nt':
+            kw['close_fds'] = True
+        try:
+            p = subprocess.Popen(argv, **kw)
+        except OSError:
+            raise RuntimeError('Solver not found: {}'.format(argv[0]))
+        bytes_board = six.binary_type(board, 'utf-8')
+        pout, perr = p.communicate(bytes_board)
+        if p.returncode in (127, 1):
+            # Linux and Windows return codes for "command not found" error
+            raise RuntimeError('Solver exited with {}'.format(p.returncode))
+        return BytesIO(pout), BytesIO(perr)
+
+    def open(self, args, board):
+        return SolverProcess(self.getArgv() + list(args), board)
+
+    def getVersion(self):
+        self.getArgv()
+        if self.version is None:
+            pout, _ = self.run(['--version'], '')
+            s = six.text_type(pout.read(), encoding='utf-8')
+            m = re.search(r'version ([0-9]+)\.([0-9]+)\.([0-9]+)', s)
+            if m:
+                self.version = (int(m.group(1)), int(m.group(2)),
+                                int(m.group(3)))
+            else:
+                self.version = (0, 0, 0)
+        return self.version
+
+
+class SolverProcess:
+    def __init__(self, argv, board):
+        if DEBUG:
+            print(' '.join(argv))
+        kw = {'stdin': subprocess.PIPE,
+              'stdout': subprocess.PIPE,
+              'stderr': None if DEBUG else subprocess.DEVNULL}
+        if os.name != 'nt':
+            kw['close_fds'] = True
+        try:
+            self.p = subprocess.Popen(argv, **kw)
+        except OSError:
+            raise RuntimeError('Solver not found: {}'.format(argv[0]))
+        self.stdout = self.p.stdout
+        self.killed = False
+        try:
+            self.p.stdin.write(six.binary_type(board, 'utf-8'))
+            self.p.stdin.close()
+        except OSError:
+            # the solver has already exited, close() reports it
+            pass
+
+    def kill(self):
+        self.killed = True
+        try:
+            self.p.kill()
+        except OSError:
+            pass
+
+    def close(self):
+        self.stdout.close()
+        self.p.wait()
+        if not self.killed and self.p.returncode in (127, 1):
+            raise RuntimeError(
+                'Solver exited with {}'.format(self.p.returncode))
+
+
 class Base_Solver_Hint:
     def __init__(self, game, dialog, **game_type):
         self.game = game
@@ -739,6 +924,10 @@ class Base_Solver_Hint:
             }
         self.hints = []
         self.hints_index = 0
+        self.cancelled = False
+        self._process = None
+        self.board_string = None
+        self.cache = solver_cache       # see loadSolution()
 
         # correct cards rank if foundations.base_rank != 0 (Penguin, Opus)
         if 'base_rank' in game_type:    # (Simple Simon)
@@ -752,6 +941,16 @@ class Base_Solver_Hint:
     def config(self, **kw):
         self.options.update(kw)
 
+    # read the position to solve; SolverThread calls this on the main
+    # thread, computeHints() may run in another one
+    def prepare(self):
+        self.board_string = self.calcBoardString()
+
+    def getBoardString(self):
+        if self.board_string is None:
+            self.prepare()
+        return self.board_string
+
     def _card2str_format(self, fmt, rank, suit):
         # row and reserves
         rank = (rank-self.base_rank) % 13
@@ -776,6 +975,10 @@ class Base_Solver_Hint:
         h = self.hints[self.hints_index]
         if h is None:
             return None
+        if self.hints_index > 0:
+            # the rest of the solution solves this position too
+            self.saveSolution(self.calcBoardString(),
+                              self.hints[self.hints_index:])
         ncards, src, dest = h
         thint = None
         if len(src.cards) > ncards and not src.cards[-ncards-1].face_up:
@@ -809,22 +1012,44 @@ class Base_Solver_Hint:
             self._v = None
             return False
 
-    def run_solver(self, command, board):
-        if DEBUG:
-            print(command)
-        kw = {'shell': True,
-              'stdin': subprocess.PIPE,
-              'stdout': subprocess.PIPE,
-              'stderr': subprocess.PIPE}
-        if os.name != 'nt':
-            kw['close_fds'] = True
-        p = subprocess.Popen(command, **kw)
-        bytes_board = six.binary_type(board, 'utf-8')
-        pout, perr = p.communicate(bytes_board)
-        if p.returncode in (127, 1):
-            # Linux and Windows return codes for "command not found" error
-            raise RuntimeError('Solver exited with {}'.format(p.returncode))
-        return BytesIO(pout), BytesIO(perr)
+    def getCacheKey(self, board):
+        return (self.__class__.__name__, self.game.id,
+                tuple(sorted(self.game_type.items())), board,
+                self.options['preset'], self.options['max_iters'])
+
+    def loadSolution(self, board):
+        # look up a solution of this position, return True if found
+        value = self.cache.get(self.getCacheKey(board))
+        if value is None:
+            return False
+        self.solver_state, moves = value
+        allstacks = self.game.allstacks
+        self.hints = [[ncards, allstacks[src],
+                       allstacks[dest] if dest >= 0 else None]
+                      for ncards, src, dest in moves]
+        self.hints.append(None)
+        return True
+
+    def saveSolution(self, board, hints=None):
+        if self.cancelled:
+            return
+        if hints is None:
+            hints = self.hints
+        moves = tuple((h[0], h[1].id, h[2].id if h[2] else -1)
+                      for h in hints if h is not None)
+        self.cache.put(self.getCacheKey(board),
+                       (self.solver_state, moves))
+
+    def run_solver(self, session, args, board):
+        # start the solver; its output is read while it is running
+        self._process = session.open(args, board)
+        return self._process
+
+    def cancel(self):
+        # may be called from another thread than computeHints()
+        self.cancelled = True
+        if self._process:
+            self._process.kill()
 
     def importFile(solver, fh, s_game, self):
         s_game.endGame()
@@ -839,6 +1064,10 @@ class Base_Solver_Hint:
         pass
 
 
+fcs_session = SolverSession(lambda: pysollib.settings.FCS_COMMAND)
+bhs_session = SolverSession(
+    lambda: BlackHoleSolver_Hint.BLACK_HOLE_SOLVER_COMMAND)
+
 use_fc_solve_lib = False
 
 try:
@@ -1012,36 +1241,29 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
     def computeHints(self):
         game = self.game
         game_type = self.game_type
-        global FCS_VERSION
-        if FCS_VERSION is None:
-            if use_fc_solve_lib:
-                FCS_VERSION = (5, 0, 0)
-            else:
-                pout, _ = self.run_solver(FCS_COMMAND + ' --version', '')
-                s = six.text_type(pout.read(), encoding='utf-8')
-                m = re.search(r'version ([0-9]+)\.([0-9]+)\.([0-9]+)', s)
-                if m:
-                    FCS_VERSION = (int(m.group(1)), int(m.group(2)),
-                                   int(m.group(3)))
-                else:
-                    FCS_VERSION = (0, 0, 0)
+        if use_fc_solve_lib:
+            fcs_version = (5, 0, 0)
+        else:
+            fcs_version = fcs_session.getVersion()
 
         progress = self.options['progress']
 
-        board = self.calcBoardString()
+        board = self.getBoardString()
         if DEBUG:
             print('--------------------\n', board, '--------------------')
+        if self.loadSolution(board):
+            return
         args = []
         if use_fc_solve_lib:
             args += ['--reset', '-opt', ]
         else:
             args += ['-m', '-p', '-opt', '-sel']
-            if FCS_VERSION >= (4, 20, 0):
+            if fcs_version >= (4, 20, 0):
                 args += ['-hoi']
         if (not use_fc_solve_lib) and progress:
             args += ['--iter-output']
             fcs_iter_output_step = None
-            if FCS_VERSION >= (4, 20, 0):
+            if fcs_version >= (4, 20, 0):
                 fcs_iter_output_step = self.options['iters_step']
                 args += ['--iter-output-step', str(fcs_iter_output_step)]
             if DEBUG:
@@ -1066,8 +1288,8 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
             fc_solve_lib_obj.input_cmd_line(args)
             status = fc_solve_lib_obj.solve_board(board)
         else:
-            command = FCS_COMMAND+' '+' '.join(args)
-            pout, perr = self.run_solver(command, board)
+            process = self.run_solver(fcs_session, args, board)
+            pout = process.stdout
         self.solver_state = 'unknown'
         stack_types = {
             'the': game.s.foundations,
@@ -1191,16 +1413,19 @@ class FreeCellSolver_Hint(Base_Solver_Hint):
         if DEBUG:
             print('time:', time.time()-start_time)
 
+        if not use_fc_solve_lib:
+            process.close()
+
+        if self.cancelled:
+            self.solver_state = 'cancelled'
+            hints = []
         self.hints = hints
         if len(hints) > 0:
             if self.solver_state != 'intractable':
                 self.solver_state = 'solved'
+        self.saveSolution(board)
         self.hints.append(None)
 
-        if not use_fc_solve_lib:
-            pout.close()
-            perr.close()
-
 
 class BlackHoleSolver_Hint(Base_Solver_Hint):
     BLACK_HOLE_SOLVER_COMMAND = 'black-hole-solve'
@@ -1316,9 +1541,11 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
         game = self.game
         game_type = self.game_type
 
-        board = self.calcBoardString()
+        board = self.getBoardString()
         if DEBUG:
             print('--------------------\n', board, '--------------------')
+        if self.loadSolution(board):
+            return
         if use_bh_solve_lib:
             # global bh_solve_lib_obj
             # bh_solve_lib_obj = bh_solve_lib_obj.new_bhs_user_handle()
@@ -1343,8 +1570,6 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
             if 'wrap_ranks' in game_type:
                 args += ['--wrap-ranks']
 
-            command = self.BLACK_HOLE_SOLVER_COMMAND + ' ' + ' '.join(args)
-
         if DEBUG:
             start_time = time.time()
 
@@ -1353,7 +1578,8 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
         if use_bh_solve_lib:
             ret_code = bh_solve_lib_obj.resume_solution()
         else:
-            pout, perr = self.run_solver(command, board)
+            process = self.run_solver(bhs_session, args, board)
+            pout = process.stdout
 
             for sbytes in pout:
                 s = six.text_type(sbytes, encoding='utf-8')
@@ -1419,14 +1645,17 @@ class BlackHoleSolver_Hint(Base_Solver_Hint):
                 src = game.s.rows[found_stack_idx]
 
                 hints.append([1, src, None])
-            pout.close()
-            perr.close()
+            process.close()
 
         if DEBUG:
             print('time:', time.time()-start_time)
 
-        hints.append(None)
+        if self.cancelled:
+            self.solver_state = 'cancelled'
+            hints = []
         self.hints = hints
+        self.saveSolution(board)
+        hints.append(None)
 
 
 class FreeCellSolverWrapper:
@@ -1447,3 +1676,52 @@ class BlackHoleSolverWrapper:
     def __call__(self, game, dialog):
         hint = BlackHoleSolver_Hint(game, dialog, **self.game_type)
         return hint
+
+
+# ************************************************************************
+# * Run a solver in a background thread. The thread stands in for the
+# * solver dialog: progress reported by the solver is queued and picked
+# * up by the main loop with getProgress(), so that no widget is touched
+# * outside of the main thread.
+# ************************************************************************
+
+# the solver libraries are single instances, solve one board at a time
+_solver_lock = threading.Lock()
+
+
+class SolverThread(threading.Thread):
+    def __init__(self, solver):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.solver = solver
+        solver.dialog = self
+        # the error of computeHints(), for the dialog
+        self.error = None
+        self._progress = queue.Queue()
+        # the game may change while solving
+        solver.prepare()
+
+    def run(self):
+        with _solver_lock:
+            if self.solver.cancelled:
+                return
+            try:
+                self.solver.computeHints()
+            except Exception as err:
+                if DEBUG:
+                    traceback.print_exc()
+                self.error = err
+
+    def setText(self, **kw):
+        self._progress.put(kw)
+
+    def getProgress(self):
+        kw = {}
+        while True:
+            try:
+                kw.update(self._progress.get_nowait())
+            except queue.Empty:
+                return kw
+
+    def cancel(self):
+        self.solver.cancel()
@@ -23,18 +23,105 @@
 
 
 import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from pysollib.mfxutil import Image, ImageTk, USE_PIL, print_err
+from pysollib.mfxutil import Image, ImageTk, Struct, USE_PIL, print_err
+from pysollib.pysoltk import after_cancel, after_idle
 from pysollib.pysoltk import copyImage, createBottom, createImage, \
         createImagePIL, loadImage
 from pysollib.pysoltk import shadowImage
 from pysollib.resource import CSI
 from pysollib.settings import TOOLKIT
 
+# ************************************************************************
+# * Worker threads for the PIL work (decoding, resampling) of Images.
+# * Tk is not thread safe, so the threads only make PIL images; the
+# * PhotoImages are made in the main thread.
+# ************************************************************************
+
+if TOOLKIT == 'tk' and USE_PIL:
+    from pysollib.pysoltk import PIL_Image, createBottomPIL, readImagePIL
+else:
+    PIL_Image = createBottomPIL = readImagePIL = None
+
+IMAGE_THREADS = min(8, os.cpu_count() or 1)
+
+_pool = None
+
+
+def mapPIL(func, items):
+    global _pool
+    items = list(items)
+    if IMAGE_THREADS < 2 or len(items) < 2:
+        return [func(item) for item in items]
+    if _pool is None:
+        _pool = ThreadPoolExecutor(IMAGE_THREADS)
+    return list(_pool.map(func, items))
+
+
+# ************************************************************************
+# * Scaled face cards as PNG files, so that the resampling is done only
+# * once for every size. A file is used as long as it is newer than the
+# * image of the cardset it was made of.
+# ************************************************************************
+
+
+class ScaledImageDiskCache:
+    def __init__(self, dirname):
+        self.dir = dirname
+
+    def _getPath(self, key, name):
+        ident, width, height, resample = key
+        ident = re.sub(r'[^\w.-]', '_', ident)
+        return os.path.join(self.dir, ident,
+                            '%dx%d-%d' % (width, height, resample),
+                            name + '.png')
+
+    def load(self, key, name, source):
+        path = self._getPath(key, name)
+        try:
+            if os.path.getmtime(path) < os.path.getmtime(source):
+                return None
+            im = Image.open(path)
+            im.load()
+        except EnvironmentError:
+            return None
+        return im
+
+    def save(self, key, name, image):
+        path = self._getPath(key, name)
+        try:
+            dirname = os.path.dirname(path)
+            if not os.path.isdir(dirname):
+                os.makedirs(dirname)
+            image.save(path, 'PNG')
+        except EnvironmentError as ex:
+            print_err('cannot save scaled image %s: %s' % (path, ex))
+
+
 # ************************************************************************
 # * Images
 # ************************************************************************
 
+def _getImageMemorySize(im, seen):
+    # 4 bytes per pixel for the image and for each PIL copy
+    if im is None or id(im) in seen:
+        return 0
+    seen.add(id(im))
+    try:
+        size = im.width() * im.height() * 4
+    except Exception:
+        return 0
+    for pil_image in (getattr(im, '_pil_image', None),
+                      getattr(im, '_pil_image_orig', None)):
+        if pil_image is not None and id(pil_image) not in seen:
+            seen.add(id(pil_image))
+            w, h = pil_image.size
+            size += w * h * 4
+    return size
+
 
 class ImagesCardback:
     def __init__(self, index, name, image, menu_image=None):
@@ -54,10 +141,23 @@ class Images:
         self._xfactor = 1.0
         self._yfactor = 1.0
         self._resampling = 0
+        # face cards that are still to be loaded by startPrefetch()
+        self._prefetch = []
+        self._prefetch_timer = None
+        # image sets of other sizes, least recently used first (see
+        # resize)
+        self._scaled = OrderedDict()
+        self.scaled_cache_size = 4
+        self.scaled_hits = 0
+        self.scaled_misses = 0
+        # a ScaledImageDiskCache or None
+        self.scaled_disk_cache = None
         if cs is None:
             return
         self._setSize()
+        # face cards, loaded on demand (see _getCard); None - not loaded
         self._card = []
+        self._face_names = []
         self._back = []
         # bottom of stack (link to _bottom_negative/_bottom_positive)
         self._bottom = []
@@ -78,7 +178,7 @@ class Images:
         self.cardset_bottoms = False
 
     def destruct(self):
-        pass
+        self.stopPrefetch()
 
     def __loadCard(self, filename, check_w=1, check_h=1):
         # print '__loadCard:', filename
@@ -90,7 +190,9 @@ class Images:
             img = loadImage(file=f)
         except Exception:
             return None
+        return self.__checkCard(img, f, check_w, check_h)
 
+    def __checkCard(self, img, f, check_w, check_h):
         w, h = img.width(), img.height()
         if self.CARDW < 0:
             self.CARDW, self.CARDH = w, h
@@ -100,7 +202,34 @@ class Images:
                 raise ValueError("Invalid size %dx%d of image %s" % (w, h, f))
         return img
 
-    def __loadBottom(self, filename, check_w=1, check_h=1, color='white'):
+    # the PIL part of __loadCard (see mapPIL)
+    def __readCard(self, filename):
+        f = os.path.join(self.cs.dir, filename)
+        if not os.path.exists(f):
+            print_err('card image path %s does not exist' % f)
+            return None
+        try:
+            return readImagePIL(f)
+        except Exception:
+            return None
+
+    # __loadCard for a list of (filename, check_w, check_h)
+    def __loadCards(self, args):
+        if PIL_Image is None:
+            return [self.__loadCard(*a) for a in args]
+        pil_images = mapPIL(lambda a: self.__readCard(a[0]), args)
+        images = []
+        for a, pil_image in zip(args, pil_images):
+            img = None
+            if pil_image is not None:
+                f = os.path.join(self.cs.dir, a[0])
+                img = self.__checkCard(PIL_Image(image=pil_image), f,
+                                       a[1], a[2])
+            images.append(img)
+        return images
+
+    # load the bottoms for a list of (filename, color)
+    def __loadBottoms(self, args):
         cs_type = CSI.TYPE_ID[self.cs.type]
         imagedir = None
         d = os.path.join('images', 'cards', 'bottoms')
@@ -111,17 +240,25 @@ class Images:
         if ((not USE_PIL and TOOLKIT != 'kivy') or self.cardset_bottoms
                 or imagedir is None):
             # load image
-            img = self.__loadCard(filename+self.cs.ext, check_w, check_h)
-            return img
+            return self.__loadCards([(filename+self.cs.ext, 1, 1)
+                                     for filename, color in args])
 
         # create image
         d = os.path.join('images', 'cards', 'bottoms', cs_type)
-        try:
-            fn = self.d.findImage(filename, d)
-        except Exception:
-            fn = None
-        img = createBottom(self._card[0], color, fn)
-        return img
+        bottoms = []
+        for filename, color in args:
+            try:
+                fn = self.d.findImage(filename, d)
+            except Exception:
+                fn = None
+            bottoms.append((color, fn))
+        mask = self._getCard(0)
+        if PIL_Image is None:
+            return [createBottom(mask, color, fn) for color, fn in bottoms]
+        pil_images = mapPIL(lambda b: createBottomPIL(mask, b[0], b[1]),
+                            bottoms)
+        return [None if im is None else PIL_Image(image=im)
+                for im in pil_images]
 
     def __addBack(self, im1, name):
         r = max(self.CARDW / 40.0, self.CARDH / 60.0)
@@ -174,58 +311,56 @@ class Images:
         ext = self.cs.ext[1:]
         pstep = 0
         if progress:
-            pstep = self.cs.ncards + len(self.cs.backnames) + \
+            pstep = 1 + len(self.cs.backnames) + \
                     self.cs.nbottoms + self.cs.nletters
             pstep += self.cs.nshadows + 1  # shadows & shade
             pstep = max(0, (80.0 - progress.percent) / pstep)
-        # load face cards
-        for n in self.cs.getFaceCardNames():
-            self._card.append(self.__loadCard(n + self.cs.ext))
-            self._card[-1].filename = n
-            if progress:
-                progress.update(step=pstep)
-        assert len(self._card) == self.cs.ncards
+        # face cards are loaded when they are needed; only check that
+        # they are there and load the first one (for the size and for
+        # the bottoms and the shade)
+        self._face_names = self.cs.getFaceCardNames()
+        assert len(self._face_names) == self.cs.ncards
+        for n in self._face_names:
+            f = os.path.join(self.cs.dir, n + self.cs.ext)
+            if not os.path.exists(f):
+                print_err('card image path %s does not exist' % f)
+                return 0
+        self._card = [None] * self.cs.ncards
+        self._card[0] = self._loadFace(0)
+        if self._card[0] is None:
+            return 0
+        if progress:
+            progress.update(step=pstep)
         # load backgrounds
-        for name in self.cs.backnames:
-            if name:
-                im = self.__loadCard(name)
-                if im:
-                    self.__addBack(im, name)
-                else:
-                    print_err('in {cs_dir}/config.txt: card back "{fname}" '
-                              'does not exist'.format(
-                                  cs_dir=self.cs.dir, fname=name))
+        names = [name for name in self.cs.backnames if name]
+        for name, im in zip(names,
+                            self.__loadCards([(n, 1, 1) for n in names])):
+            if im:
+                self.__addBack(im, name)
+            else:
+                print_err('in {cs_dir}/config.txt: card back "{fname}" '
+                          'does not exist'.format(
+                              cs_dir=self.cs.dir, fname=name))
         if progress:
             progress.update(step=1)
 
-        # load bottoms
+        # load bottoms and letters, each followed by its negative
+        args = []
         for i in range(self.cs.nbottoms):
-            name = "bottom%02d" % (i + 1)
-            bottom = self.__loadBottom(name, color='black')
-            if bottom is not None:
-                self._bottom_positive.append(bottom)
-            if progress:
-                progress.update(step=pstep)
-            # load negative bottoms
-            name = "bottom%02d-n" % (i + 1)
-            bottom = self.__loadBottom(name, color='white')
-            if bottom is not None:
-                self._bottom_negative.append(bottom)
-            if progress:
-                progress.update(step=pstep)
-        # load letters
+            args.append(("bottom%02d" % (i + 1), 'black'))
+            args.append(("bottom%02d-n" % (i + 1), 'white'))
         for rank in range(self.cs.nletters):
-            name = "l%02d" % (rank + 1)
-            bottom = self.__loadBottom(name, color='black')
+            args.append(("l%02d" % (rank + 1), 'black'))
+            args.append(("l%02d-n" % (rank + 1), 'white'))
+        bottoms = self.__loadBottoms(args)
+        n = 2 * self.cs.nbottoms
+        for i, bottom in enumerate(bottoms):
             if bottom is not None:
-                self._letter_positive.append(bottom)
-            if progress:
-                progress.update(step=pstep)
-            # load negative letters
-            name = "l%02d-n" % (rank + 1)
-            bottom = self.__loadBottom(name, color='white')
-            if bottom is not None:
-                self._letter_negative.append(bottom)
+                if i < n:
+                    lists = (self._bottom_positive, self._bottom_negative)
+                else:
+                    lists = (self._letter_positive, self._letter_negative)
+                lists[i % 2].append(bottom)
             if progress:
                 progress.update(step=pstep)
 
@@ -244,7 +379,7 @@ class Images:
         # shade
         if USE_PIL:
             self._highlight.append(
-                self._getHighlight(self._card[0], None, '#3896f8'))
+                self._getHighlight(self._getCard(0), None, '#3896f8'))
         else:
             self._highlight.append(self.__loadCard("shade." + ext))
         if progress:
@@ -260,7 +395,63 @@ class Images:
     def getFace(self, deck, suit, rank):
         index = suit * len(self.cs.ranks) + rank
         # print "getFace:", suit, rank, index
-        return self._card[index % self.cs.ncards]
+        return self._getCard(index % self.cs.ncards)
+
+    def _getCard(self, index):
+        im = self._card[index]
+        if im is not None:
+            return im
+        try:
+            im = self._loadFace(index)
+        except ValueError as ex:
+            print_err(str(ex))
+            im = None
+        if im is None:
+            # the files were checked in load(), do not give up now
+            cw, ch = self.getSize()
+            im = self.createMissingImage(cw, ch, fill="#ffffff",
+                                         outline="#000000")
+        elif self._xfactor != 1 or self._yfactor != 1:
+            im = self._resizeCard(im, self._xfactor, self._yfactor,
+                                  self._resampling)
+        self._card[index] = im
+        return im
+
+    # the face card in its original size
+    def _loadFace(self, index):
+        n = self._face_names[index]
+        im = self.__loadCard(n + self.cs.ext)
+        if im is not None:
+            im.filename = n
+        return im
+
+    #
+    # load the remaining face cards in the background, one per idle
+    # callback of widget
+    #
+
+    def startPrefetch(self, widget):
+        self.stopPrefetch()
+        self._prefetch = [i for i, im in enumerate(self._card) if im is None]
+        if self._prefetch:
+            self._prefetch_timer = after_idle(widget, self._prefetchEvent,
+                                              widget)
+
+    def stopPrefetch(self):
+        after_cancel(self._prefetch_timer)
+        self._prefetch_timer = None
+        self._prefetch = []
+
+    def _prefetchEvent(self, widget):
+        self._prefetch_timer = None
+        while self._prefetch:
+            index = self._prefetch.pop(0)
+            if self._card[index] is None:
+                self._getCard(index)
+                break
+        if self._prefetch:
+            self._prefetch_timer = after_idle(widget, self._prefetchEvent,
+                                              widget)
 
     def getBack(self, update=False):
         if update:
@@ -426,52 +617,133 @@ class Images:
         return (int(self.CARD_DX * self._xfactor),
                 int(self.CARD_DY * self._yfactor))
 
+    # All images of a cardset have the size of a card, so a scaled image
+    # set is identified by the scaled card size. This way slightly
+    # different factors (auto scaling) share one set.
+    def _getScaledKey(self, xf, yf, resample):
+        return (self.cs.ident, int(self.CARDW * xf), int(self.CARDH * yf),
+                resample)
+
+    def _getScaledSet(self):
+        return Struct(
+            card=self._card,
+            back=[b.image for b in self._back],
+            bottom_negative=self._bottom_negative,
+            bottom_positive=self._bottom_positive,
+            letter_negative=self._letter_negative,
+            letter_positive=self._letter_positive,
+            blank_bottom=self._blank_bottom,
+            highlight=self._highlight,
+            highlighted_images=self._highlighted_images,
+            pil_shadow=self._pil_shadow,
+        )
+
+    def _setScaledSet(self, scaled):
+        self._card = scaled.card
+        for b, im in zip(self._back, scaled.back):
+            b.image = im
+        self._bottom_negative = scaled.bottom_negative
+        self._bottom_positive = scaled.bottom_positive
+        self._letter_negative = scaled.letter_negative
+        self._letter_positive = scaled.letter_positive
+        self._blank_bottom = scaled.blank_bottom
+        self._highlight = scaled.highlight
+        self._highlighted_images = scaled.highlighted_images
+        self._pil_shadow = scaled.pil_shadow
+
+    # the PIL part of resizing an image (see mapPIL); face cards may come
+    # from the disk cache
+    def _resizePIL(self, im, xf, yf, resample):
+        name = getattr(im, 'filename', None)
+        disk_cache = self.scaled_disk_cache
+        if disk_cache is None or name is None:
+            return im.resizePIL(xf, yf, resample)
+        key = self._getScaledKey(xf, yf, resample)
+        source = os.path.join(self.cs.dir, name + self.cs.ext)
+        pil_image = disk_cache.load(key, name, source)
+        if pil_image is None:
+            pil_image = im.resizePIL(xf, yf, resample)
+            disk_cache.save(key, name, pil_image)
+        return pil_image
+
+    # resize a list of images, None stays None
+    def _resizeImages(self, images, xf, yf, resample):
+        todo = [im for im in images if im is not None]
+        if PIL_Image is None or \
+                not all([isinstance(im, PIL_Image) for im in todo]):
+            pil_images = [None] * len(todo)
+        else:
+            pil_images = mapPIL(
+                lambda im: self._resizePIL(im, xf, yf, resample), todo)
+        resized = {}
+        for im, pil_image in zip(todo, pil_images):
+            if id(im) in resized:
+                continue
+            if pil_image is None:
+                new = im.resize(xf, yf, resample=resample)
+            else:
+                new = PIL_Image(image=pil_image,
+                                pil_image_orig=im._pil_image_orig)
+            name = getattr(im, 'filename', None)
+            if name is not None:
+                new.filename = name
+            resized[id(im)] = new
+        return [None if im is None else resized[id(im)] for im in images]
+
+    def _resizeCard(self, im, xf, yf, resample):
+        return self._resizeImages([im], xf, yf, resample)[0]
+
     def resize(self, xf, yf, resample=1):
         # print 'Images.resize:', xf, yf, self._card[0].width(), self.CARDW
         if (self._xfactor == xf and self._yfactor == yf
                 and self._resampling == resample):
             # print 'no resize'
             return
+        old_key = self._getScaledKey(self._xfactor, self._yfactor,
+                                     self._resampling)
+        key = self._getScaledKey(xf, yf, resample)
         self._xfactor = xf
         self._yfactor = yf
         self._resampling = resample
         # ???self._setSize(xf, yf)
         self.setOffsets()
-        # cards
-        cards = []
-        for c in self._card:
-            c = c.resize(xf, yf, resample=resample)
-            cards.append(c)
-        self._card = cards
-        # back
-        for b in self._back:
-            b.image = b.image.resize(xf, yf, resample=resample)
-
+        if key == old_key:
+            return
+        # keep the current images
+        if self.scaled_cache_size > 0:
+            self._scaled[old_key] = self._getScaledSet()
+            while len(self._scaled) > self.scaled_cache_size:
+                self._scaled.popitem(last=False)
         # stack bottom image
         neg = self._bottom is self._bottom_negative  # dont know
-
-        bottom_negative = []
-        bottom_positive = []
-        for c in self._bottom_negative:
-            c = c.resize(xf, yf, resample=resample)
-            bottom_negative.append(c)
-        self._bottom_negative = bottom_negative
-        for c in self._bottom_positive:
-            c = c.resize(xf, yf, resample=resample)
-            bottom_positive.append(c)
-        self._bottom_positive = bottom_positive
-
-        # letters
-        letter_negative = []
-        letter_positive = []
-        for c in self._letter_negative:
-            c = c.resize(xf, yf, resample=resample)
-            letter_negative.append(c)
-        self._letter_negative = letter_negative
-        for c in self._letter_positive:
-            c = c.resize(xf, yf, resample=resample)
-            letter_positive.append(c)
-        self._letter_positive = letter_positive
+        scaled = self._scaled.pop(key, None)
+        if scaled is not None:
+            self.scaled_hits += 1
+            # cards that were loaded since
+            cards = scaled.card
+            todo = [i for i, c in enumerate(self._card)
+                    if cards[i] is None and c is not None]
+            resized = self._resizeImages([self._card[i] for i in todo],
+                                         xf, yf, resample)
+            for i, c in zip(todo, resized):
+                cards[i] = c
+            self._setScaledSet(scaled)
+            self.setNegative(neg)
+            return
+        self.scaled_misses += 1
+
+        # cards, backs, stack bottoms and letters in one go
+        lists = [self._card, [b.image for b in self._back],
+                 self._bottom_negative, self._bottom_positive,
+                 self._letter_negative, self._letter_positive]
+        resized = self._resizeImages(sum(lists, []), xf, yf, resample)
+        for i, images in enumerate(lists):
+            lists[i], resized = resized[:len(images)], resized[len(images):]
+        (self._card, backs,
+         self._bottom_negative, self._bottom_positive,
+         self._letter_negative, self._letter_positive) = lists
+        for b, im in zip(self._back, backs):
+            b.image = im
 
         self._createMissingImages()
         self.setNegative(neg)
@@ -479,13 +751,37 @@ class Images:
         self._highlighted_images = {}
         self._highlight = []
         self._highlight.append(
-            self._getHighlight(self._card[0], None, '#3896f8'))
+            self._getHighlight(self._getCard(0), None, '#3896f8'))
         self._pil_shadow = {}
 
     def reset(self):
         print('Image.reset')
         self.resize(1, 1)
 
+    # the approximate memory of the pixels of all images
+    def getMemorySize(self, seen=None):
+        if seen is None:
+            seen = set()
+        if self.cs is None:
+            return 0
+        sets = [self._getScaledSet()] + list(self._scaled.values())
+        size = 0
+        for scaled in sets:
+            for images in (scaled.card, scaled.back,
+                           scaled.bottom_negative, scaled.bottom_positive,
+                           scaled.letter_negative, scaled.letter_positive,
+                           scaled.highlight,
+                           list(scaled.highlighted_images.values()),
+                           list(scaled.pil_shadow.values()),
+                           [scaled.blank_bottom]):
+                for im in images:
+                    size += _getImageMemorySize(im, seen)
+        for images in ([b.menu_image for b in self._back],
+                       self._shadow, self._xshadow):
+            for im in images:
+                size += _getImageMemorySize(im, seen)
+        return size
+
 
 # ************************************************************************
 # *
@@ -498,7 +794,8 @@ class SubsampledImages(Images):
             r = max(images.CARDW, images.CARDH) // size_cap
 
         Images.__init__(self, None, images.cs, r=r)
-        self._card = self._subsample(images._card, r)
+        self._images = images
+        self._card = [None] * len(images._card)
         self._bottom_positive = self._subsample(images._bottom_positive, r)
         self._letter_positive = self._subsample(images._letter_positive, r)
         self._bottom_negative = self._subsample(images._bottom_negative, r)
@@ -523,6 +820,15 @@ class SubsampledImages(Images):
     def getShadow(self, ncards):
         return None
 
+    def _loadFace(self, index):
+        images = self._images
+        im = images._card[index]
+        if im is None or images._xfactor != 1 or images._yfactor != 1:
+            im = images._loadFace(index)
+        if im is None or self.reduced == 1:
+            return im
+        return im.subsample(self.reduced)
+
     def _subsample(self, images_list, r):
         s = []
         for im in images_list:
@@ -531,3 +837,67 @@ class SubsampledImages(Images):
             else:
                 s.append(im.subsample(r))
         return s
+
+
+# ************************************************************************
+# * The image sets of the cardsets in use (App.loadCardset), one per
+# * cardset type and subtype, least recently used first. Entries are
+# * (Cardset.ident, Images, SubsampledImages); old entries are evicted
+# * when the images take more than max_memory bytes.
+# ************************************************************************
+
+class CardsetImagesCache:
+    def __init__(self, max_memory=0):
+        self.max_memory = max_memory    # 0 - no limit
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    # the entry for a cardset type; if ident is given only if it is
+    # for this cardset
+    def get(self, type, subtype, ident=None):
+        key = (type, subtype)
+        entry = self._data.get(key)
+        if entry is None or (ident is not None and entry[0] != ident):
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    # returns the replaced entry or None
+    def put(self, type, subtype, entry):
+        key = (type, subtype)
+        old = self._data.pop(key, None)
+        self._data[key] = entry
+        return old
+
+    def getEntryMemorySize(self, entry):
+        seen = set()
+        return entry[1].getMemorySize(seen) + entry[2].getMemorySize(seen)
+
+    def getMemorySize(self):
+        return sum([self.getEntryMemorySize(e) for e in self._data.values()])
+
+    # drop least recently used entries until the cache fits into
+    # max_memory; entries with images in keep are not dropped
+    def evict(self, keep=()):
+        if not self.max_memory:
+            return
+        sizes = [(key, self.getEntryMemorySize(entry))
+                 for key, entry in self._data.items()]
+        total = sum([size for key, size in sizes])
+        for key, size in sizes:
+            if total <= self.max_memory:
+                break
+            entry = self._data[key]
+            if entry[1] in keep or entry[2] in keep:
+                continue
+            entry[1].stopPrefetch()
+            del self._data[key]
+            total -= size
+            self.evictions += 1
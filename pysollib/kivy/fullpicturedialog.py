@@ -79,7 +79,7 @@ class FullPictureDialog(object):
         self.stp.set_aspect(dx/dy)
         self.stp.set_matrix(cols, cols)
         for card in cards:
-            image = LImage(texture=self.images._card[card].texture)
+            image = LImage(texture=self.images._getCard(card).texture)
             self.stp.add_widget(image)
 
         self.frame.add_widget(self.stp)
@@ -41,7 +41,8 @@ from pysollib.pysoltk import MfxRoot
 from pysollib.pysoltk import PysolProgressBar
 from pysollib.pysoltk import loadImage
 from pysollib.resource import Tile
-from pysollib.settings import SOUND_MOD, TITLE, TOOLKIT
+from pysollib.settings import CHECK_GAMES, SOUND_MOD, TITLE, TOOLKIT
+from pysollib.startupprof import StartupProfiler
 from pysollib.util import DataLoader
 from pysollib.winsystems import init_root_window
 
@@ -91,6 +92,7 @@ def parse_option(argv):
                                        "noplugins",
                                        "nosound",
                                        "sound-mod=",
+                                       "profile-startup=",
                                        "help"])
     except getopt.GetoptError as err:
         print_err(str(err) + "\n" + _("try %s --help for more information") %
@@ -104,6 +106,7 @@ def parse_option(argv):
             "noplugins": False,
             "nosound": False,
             "sound-mod": None,
+            "profile-startup": None,
             }
     for i in optlist:
         if i[0] in ("-h", "--help"):
@@ -123,6 +126,8 @@ def parse_option(argv):
         elif i[0] == "--sound-mod":
             assert i[1] in ('pss', 'pygame', 'oss', 'win')
             opts["sound-mod"] = i[1]
+        elif i[0] == "--profile-startup":
+            opts["profile-startup"] = i[1]
 
     if opts["help"]:
         print(_("""Usage: %s [OPTIONS] [FILE]
@@ -132,6 +137,9 @@ def parse_option(argv):
         --sound-mod=MOD
         --nosound              disable sound support
         --noplugins            disable load plugins
+        --profile-startup=REPORT
+                               write startup timings to REPORT (JSON,
+                               - for stdout)
   -h    --help                 display this help and exit
 
   FILE - file name of a saved game
@@ -165,6 +173,21 @@ def pysol_init(app, args):
         return 1
         sys.exit(1)
     opts, filename = opts
+    profiler = StartupProfiler(enabled=bool(opts['profile-startup']))
+    profiler.start()
+    try:
+        return _pysol_init(app, args, opts, filename, profiler)
+    finally:
+        # the report covers the early exits too
+        profiler.stop()
+        try:
+            profiler.writeReport(opts['profile-startup'])
+        except EnvironmentError as err:
+            print_err(_('cannot write startup report: ') + str(err))
+
+
+def _pysol_init(app, args, opts, filename, profiler):
+    profiler.phase('config dirs')
     if filename:
         app.commandline.loadgame = filename
     app.commandline.deal = opts['deal']
@@ -198,6 +221,7 @@ def pysol_init(app, args):
                 pass
 
     # init DataLoader
+    profiler.phase('toolkit')
     f = os.path.join("html", "license.html")
     app.dataloader = DataLoader(args[0], f)
 
@@ -208,6 +232,7 @@ def pysol_init(app, args):
     app.top_cursor = top.cget("cursor")
 
     # load options
+    profiler.phase('options')
     try:
         app.loadOptions()
     except Exception:
@@ -215,9 +240,11 @@ def pysol_init(app, args):
         pass
 
     # init toolkit 2)
+    profiler.phase('toolkit 2')
     init_root_window(top, app)
 
     # prepare the progress bar
+    profiler.phase('images 1')
     app.loadImages1()
     if not app.progress_images:
         app.progress_images = (loadImage(app.gimages.logos[0]),
@@ -234,16 +261,21 @@ def pysol_init(app, args):
     app.intro.progress.update(step=1)
 
     # init games database
+    profiler.phase('game db')
+
     def progressCallback(*args):
         app.intro.progress.update(step=1)
     GAME_DB.setCallback(progressCallback)
-    import pysollib.games
-    if not opts['french-only']:
-        import pysollib.games.mahjongg
-        import pysollib.games.special
-        pysollib.games.special.no_use()
+    if CHECK_GAMES or \
+            not GAME_DB.loadIndex(french_only=opts['french-only']):
+        import pysollib.games
+        if not opts['french-only']:
+            import pysollib.games.mahjongg
+            import pysollib.games.special
+            pysollib.games.special.no_use()
 
     # try to load plugins
+    profiler.phase('plugins')
     if not opts["noplugins"]:
         for dir in (os.path.join(app.dataloader.dir, "games"),
                     os.path.join(app.dataloader.dir, "plugins"),
@@ -255,6 +287,7 @@ def pysol_init(app, args):
     GAME_DB.setCallback(None)
 
     # init audio 1)
+    profiler.phase('audio')
     app.audio = None
     sounds = {'pss':     PysolSoundServerModuleClient,
               'pygame':  PyGameAudioClient,
@@ -316,6 +349,7 @@ Please check your %(app)s installation.
         return 1
 
     # init cardsets
+    profiler.phase('cardsets')
     app.initCardsets()
     cardset = None
     c = app.opt.cardset.get(0).get(0)
@@ -355,6 +389,7 @@ Cardsets package is up to date.
                 return 3
 
     # init tiles
+    profiler.phase('tiles')
     manager = app.tabletile_manager
     tile = Tile()
     tile.color = app.opt.colors['table']
@@ -374,10 +409,13 @@ Cardsets package is up to date.
                 break
 
     # init samples and music resources
+    profiler.phase('samples')
     app.initSamples()
+    profiler.phase('music')
     app.initMusic()
 
     # init audio 2)
+    profiler.phase('audio 2')
     if not app.audio.CAN_PLAY_SOUND:
         app.opt.sound = 0
     app.audio.updateSettings()
@@ -399,11 +437,13 @@ Cardsets package is up to date.
             app.audio.playContinuousMusic(app.music_playlist)
 
     # prepare other images
+    profiler.phase('images 2')
     app.loadImages2()
     app.loadImages3()
     app.loadImages4()
 
     # load cardset
+    profiler.phase('cardset images')
     progress = app.intro.progress
     if not app.loadCardset(cardset, progress=progress, id=app.opt.last_gameid):
         if not cardset:
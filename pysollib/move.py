@@ -92,8 +92,11 @@ class AMoveMove(AtomicMove):
             x, y = to_stack.getPositionForNextCard()
             game.animatedMoveTo(from_stack, to_stack, cards, x, y,
                                 frames=frames, shadow=self.shadow)
+        from_pos = len(from_stack.cards) - ncards
+        game.updateSnapshotHash(from_stack, from_pos)
         for i in range(ncards):
             from_stack.removeCard()
+        game.updateSnapshotHash(from_stack, from_pos)
         for c in cards:
             to_stack.addCard(c)
         from_stack.updatePositions()
@@ -126,6 +129,12 @@ class AFlipMove(AtomicMove):
     def __init__(self, stack):
         self.stack_id = stack.id
 
+    def _doFlip(self, game, stack):
+        pos = len(stack.cards) - 1
+        game.updateSnapshotHash(stack, pos)
+        self._doMove(game, stack)
+        game.updateSnapshotHash(stack, pos)
+
     # do the actual move
     def _doMove(self, game, stack):
         card = stack.cards[-1]
@@ -136,10 +145,10 @@ class AFlipMove(AtomicMove):
             card.showFace()
 
     def redo(self, game):
-        self._doMove(game, game.allstacks[self.stack_id])
+        self._doFlip(game, game.allstacks[self.stack_id])
 
     def undo(self, game):
-        self._doMove(game, game.allstacks[self.stack_id])
+        self._doFlip(game, game.allstacks[self.stack_id])
 
     def cmpForRedo(self, other):
         return cmp(self.stack_id, other.stack_id)
@@ -168,6 +177,8 @@ class AFlipAndMoveMove(AtomicMove):
     def _doMove(self, game, from_stack, to_stack):
         if game.moves.state == game.S_PLAY:
             assert to_stack.acceptsCards(from_stack, from_stack.cards[-1])
+        from_pos = len(from_stack.cards) - 1
+        game.updateSnapshotHash(from_stack, from_pos)
         if self.frames == 0:
             moved = True
         else:
@@ -183,6 +194,7 @@ class AFlipAndMoveMove(AtomicMove):
             game.animatedMoveTo(from_stack, to_stack, cards, x, y,
                                 frames=self.frames, shadow=0)
         c = from_stack.removeCard(update=False)
+        game.updateSnapshotHash(from_stack, from_pos)
         to_stack.addCard(c, update=False)
         from_stack.updateText()
         to_stack.updateText()
@@ -210,20 +222,24 @@ class AFlipAllMove(AtomicMove):
 
     def redo(self, game):
         stack = game.allstacks[self.stack_id]
+        game.updateSnapshotHash(stack)
         for card in stack.cards:
             if card.face_up:
                 card.showBack()
             else:
                 card.showFace()
+        game.updateSnapshotHash(stack)
         stack.refreshView()
 
     def undo(self, game):
         stack = game.allstacks[self.stack_id]
+        game.updateSnapshotHash(stack)
         for card in stack.cards:
             if card.face_up:
                 card.showBack()
             else:
                 card.showFace()
+        game.updateSnapshotHash(stack)
         stack.refreshView()
 
     def cmpForRedo(self, other):
@@ -245,6 +261,7 @@ class ATurnStackMove(AtomicMove):
         to_stack = game.allstacks[self.to_stack_id]
         assert len(from_stack.cards) > 0
         assert len(to_stack.cards) == 0
+        game.updateSnapshotHash(from_stack)
         mylen = len(from_stack.cards)
         for i in range(mylen):
             # unhide = (i >= mylen - 2)
@@ -254,7 +271,9 @@ class ATurnStackMove(AtomicMove):
             # print 2, unhide, card.__dict__
             assert card.face_up
             to_stack.addCard(card, unhide=unhide, update=0)
+            game.updateSnapshotHash(to_stack, i)
             card.showBack(unhide=unhide)
+            game.updateSnapshotHash(to_stack, i)
             # print 3, unhide, to_stack.getCard().__dict__
         from_stack.updateText()
         to_stack.updateText()
@@ -264,6 +283,7 @@ class ATurnStackMove(AtomicMove):
         to_stack = game.allstacks[self.from_stack_id]
         assert len(from_stack.cards) > 0
         assert len(to_stack.cards) == 0
+        game.updateSnapshotHash(from_stack)
         mylen = len(from_stack.cards)
         for i in range(mylen):
             # unhide = (i >= mylen - 2)
@@ -297,6 +317,8 @@ class NEW_ATurnStackMove(AtomicMove):
     def _doMove(self, from_stack, to_stack, show_face):
         assert len(from_stack.cards) > 0
         assert len(to_stack.cards) == 0
+        game = from_stack.game
+        game.updateSnapshotHash(from_stack)
         for card in from_stack.cards:
             card.item.dtag(from_stack.group)
             card.item.addtag(to_stack.group)
@@ -308,6 +330,7 @@ class NEW_ATurnStackMove(AtomicMove):
                 card.showBack(unhide=0)
         to_stack.cards = from_stack.cards
         from_stack.cards = []
+        game.updateSnapshotHash(to_stack)
         from_stack.refreshView()
         from_stack.updateText()
         to_stack.refreshView()
@@ -459,12 +482,14 @@ class AShuffleStackMove(AtomicMove):
         assert stack is game.s.talon
         # shuffle (see random)
         game.random.setstate(self.state)
+        game.updateSnapshotHash(stack)
         seq = stack.cards
         n = len(seq) - 1
         while n > 0:
             j = game.random.randint(0, n)
             seq[n], seq[j] = seq[j], seq[n]
             n = n - 1
+        game.updateSnapshotHash(stack)
         stack.refreshView()
 
     def undo(self, game):
@@ -475,7 +500,9 @@ class AShuffleStackMove(AtomicMove):
             c = game.cards[id]
             assert c.id == id
             cards.append(c)
+        game.updateSnapshotHash(stack)
         stack.cards = cards
+        game.updateSnapshotHash(stack)
         # restore the state
         game.random.setstate(self.state)
         stack.refreshView()
@@ -508,7 +535,9 @@ class ASingleCardMove(AtomicMove):
             assert to_stack.acceptsCards(
                 from_stack, [from_stack.cards[from_pos]])
         card = from_stack.cards[from_pos]
+        game.updateSnapshotHash(from_stack, from_pos)
         card = from_stack.removeCard(card, update_positions=1)
+        game.updateSnapshotHash(from_stack, from_pos)
         if self.frames != 0:
             x, y = to_stack.getPositionFor(card)
             game.animatedMoveTo(from_stack, to_stack, [card], x, y,
@@ -520,7 +549,10 @@ class ASingleCardMove(AtomicMove):
         from_stack = game.allstacks[self.from_stack_id]
         to_stack = game.allstacks[self.to_stack_id]
         from_pos = self.from_pos
+        to_pos = len(to_stack.cards) - 1
+        game.updateSnapshotHash(to_stack, to_pos)
         card = to_stack.removeCard()
+        game.updateSnapshotHash(to_stack, to_pos)
         # if self.frames != 0:
         #  x, y = to_stack.getPositionFor(card)
         #  game.animatedMoveTo(from_stack, to_stack, [card], x, y,
@@ -81,8 +81,11 @@ highlight_samerank = boolean
 highlight_not_matching = boolean
 peek_facedown = boolean
 stuck_notification = boolean
+snapshots_max = integer(0, 10000000)
+snapshots_eviction = string
 mahjongg_show_removed = boolean
 mahjongg_create_solvable = integer(0, 2)
+mahjongg_check_solvable = boolean
 shisen_show_hint = boolean
 shisen_show_matching = boolean
 animations = integer(0, 5)
@@ -122,8 +125,15 @@ mouse_undo = boolean
 negative_bottom = boolean
 randomize_place = boolean
 use_cardset_bottoms = boolean
+prefetch_card_images = boolean
+scaled_images_cache_size = integer(0, 100)
+scaled_images_on_disk = boolean
+cardsets_cache_memory = integer(0, 100000)
 dragcursor = boolean
 save_games_geometry = boolean
+binary_saves = boolean
+move_journal = boolean
+move_journal_compact = integer(0, 100000)
 game_geometry = int_list(min=2, max=2)
 sound = boolean
 sound_mode = integer(0, 1)
@@ -143,6 +153,10 @@ solver_show_progress = boolean
 solver_max_iterations = integer
 solver_iterations_output_step = integer
 solver_preset = string
+solver_cache_size = integer(0, 1000000)
+demo_lookahead = boolean
+demo_lookahead_time = float(0.01, 60.0)
+demo_lookahead_depth = integer(1, 100)
 display_win_message = boolean
 language = string
 
@@ -250,8 +264,11 @@ class Options:
         ('highlight_not_matching', 'bool'),
         ('peek_facedown', 'bool'),
         ('stuck_notification', 'bool'),
+        ('snapshots_max', 'int'),
+        ('snapshots_eviction', 'str'),
         ('mahjongg_show_removed', 'bool'),
         ('mahjongg_create_solvable', 'int'),
+        ('mahjongg_check_solvable', 'bool'),
         ('shisen_show_hint', 'bool'),
         ('shisen_show_matching', 'bool'),
         ('accordion_deal_all', 'bool'),
@@ -297,9 +314,16 @@ class Options:
         ('negative_bottom', 'bool'),
         ('randomize_place', 'bool'),
         ('use_cardset_bottoms', 'bool'),
+        ('prefetch_card_images', 'bool'),
+        ('scaled_images_cache_size', 'int'),
+        ('scaled_images_on_disk', 'bool'),
+        ('cardsets_cache_memory', 'int'),
         # ('save_cardsets', 'bool'),
         ('dragcursor', 'bool'),
         ('save_games_geometry', 'bool'),
+        ('binary_saves', 'bool'),
+        ('move_journal', 'bool'),
+        ('move_journal_compact', 'int'),
         ('sound', 'bool'),
         ('sound_mode', 'int'),
         ('sound_sample_volume', 'int'),
@@ -315,6 +339,10 @@ class Options:
         ('solver_max_iterations', 'int'),
         ('solver_iterations_output_step', 'int'),
         ('solver_preset', 'string'),
+        ('solver_cache_size', 'int'),
+        ('demo_lookahead', 'bool'),
+        ('demo_lookahead_time', 'float'),
+        ('demo_lookahead_depth', 'int'),
         ('mouse_button1', 'int'),
         ('mouse_button2', 'int'),
         ('mouse_button3', 'int'),
@@ -352,8 +380,11 @@ class Options:
         self.highlight_not_matching = True
         self.peek_facedown = False
         self.stuck_notification = False
+        self.snapshots_max = 20000      # 0 - unlimited
+        self.snapshots_eviction = 'fifo'  # 'fifo' or 'lru'
         self.mahjongg_show_removed = False
         self.mahjongg_create_solvable = 2  # 0 - none, 1 - easy, 2 - hard
+        self.mahjongg_check_solvable = True  # solver for hints and stuck
         self.accordion_deal_all = True
         self.pegged_auto_remove = True
         if TOOLKIT == 'kivy':
@@ -494,6 +525,12 @@ class Options:
         self.game_holded = 0            # gameid or 0
         self.wm_maximized = 1
         self.save_games_geometry = False
+        # save games and bookmarks in the binary format, not with pickle
+        self.binary_saves = True
+        # write every move to a journal to recover the game after a crash
+        self.move_journal = True
+        # rewrite the journal after this many moves, 0 - never
+        self.move_journal_compact = 100
         # saved games geometry (gameid: (width, height))
         self.games_geometry = {}
         self.game_geometry = (0, 0)  # game geometry before exit
@@ -501,6 +538,14 @@ class Options:
         #
         self.randomize_place = False
         self.use_cardset_bottoms = False
+        # load all face cards of a cardset when idle, not only when needed
+        self.prefetch_card_images = False
+        # image sets of other sizes kept in memory, 0 - disabled
+        self.scaled_images_cache_size = 4
+        # keep scaled card images as PNG files in the config directory
+        self.scaled_images_on_disk = False
+        # MB of images of the cardsets in use, 0 - no limit
+        self.cardsets_cache_memory = 256
         # self.save_cardsets = True
         self.dragcursor = True
         #
@@ -541,6 +586,11 @@ class Options:
         self.solver_max_iterations = 100000
         self.solver_iterations_output_step = 100
         self.solver_preset = 'video-editing'
+        self.solver_cache_size = 1000   # solutions kept, 0 - disabled
+        # demo: search a few moves ahead instead of taking the best hint
+        self.demo_lookahead = False
+        self.demo_lookahead_time = 0.5  # seconds per move
+        self.demo_lookahead_depth = 8
 
     def setDefaults(self, top=None):
         WIN_SYSTEM = pysollib.settings.WIN_SYSTEM
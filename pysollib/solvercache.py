@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import os
+from collections import OrderedDict
+
+from pysollib.mfxutil import pickle, unpickle
+
+# ************************************************************************
+# * Solutions of the solvers (see Base_Solver_Hint), least recently
+# * used first. A key is made of the game, the solver options and the
+# * board string; a value is the solver state and the moves as
+# * (ncards, from stack id, to stack id or -1 for the foundations).
+# ************************************************************************
+
+
+class SolverCache:
+    VERSION = 1
+
+    def __init__(self, max_size=1000):
+        self.max_size = max_size        # 0 - disabled
+        self.hits = 0
+        self.misses = 0
+        self.modified = False
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        if not self.max_size:
+            return None
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        if not self.max_size:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+        self.modified = True
+
+    def clear(self):
+        self._data.clear()
+        self.modified = True
+
+    def load(self, filename):
+        if not os.path.exists(filename):
+            return
+        data = unpickle(filename)
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            return
+        for key, value in data['solutions']:
+            self.put(key, value)
+        self.modified = False
+
+    def save(self, filename):
+        if not self.modified:
+            return
+        data = {'version': self.VERSION,
+                'solutions': list(self._data.items())}
+        pickle(data, filename, protocol=-1)
+        self.modified = False
+
+
+solver_cache = SolverCache()
@@ -394,6 +394,8 @@ class Stack:
     def addCard(self, card, unhide=1, update=1):
         model, view = self, self
         model.cards.append(card)
+        # before closeStack(), which may run moves on this stack
+        self.game.updateSnapshotHash(self, len(model.cards) - 1)
         card.tkraise(unhide=unhide)
         if view.can_hide_cards and len(model.cards) >= 3:
             # we only need to display the 2 top cards
@@ -407,7 +409,9 @@ class Stack:
 
     def insertCard(self, card, position, unhide=1, update=1):
         model, view = self, self
+        self.game.updateSnapshotHash(self, position)
         model.cards.insert(position, card)
+        self.game.updateSnapshotHash(self, position)
         for c in model.cards[position:]:
             c.tkraise(unhide=unhide)
         if (view.can_hide_cards and len(model.cards) >= 3 and
@@ -504,6 +508,17 @@ class Stack:
     def updateModel(self, undo, flags):
         pass
 
+    # Hypothetical positions for the hint code (make/unmake): use cards
+    # as our cards in place of cloning the stack. Nothing is drawn;
+    # the real cards must be put back with unmakeCards().
+    def makeCards(self, cards):
+        saved = self.cards
+        self.cards = cards
+        return saved
+
+    def unmakeCards(self, saved):
+        self.cards = saved
+
     # copy model data - see Hint.AClonedStack
     def copyModel(self, clone):
         clone.id = self.id
@@ -590,6 +605,12 @@ class Stack:
         # Can we drop the top cards onto one of the foundation stacks ?
         return (None, 0)    # return the stack and the number of cards
 
+    def getSequenceFollows(self):
+        # If we only accept a pile that builds on our top card by the
+        # rules of a plain sequence row stack, return the test
+        # (top card, first card of the pile) -> bool, else None.
+        return _getSequenceFollows(self)
+
     #
     # State {model}
     #
@@ -3063,6 +3084,39 @@ class SuperMoveBO_RowStack(SuperMoveStack_StackMethods, BO_RowStack):
         return len(cards) <= self._getMaxMove(len(self.cards))
 
 
+# ************************************************************************
+# * For the hint index (hint.MoveIndex): how the first card of a pile
+# * must follow the top card of a plain sequence row stack.
+# ************************************************************************
+
+_SEQUENCE_FOLLOWS = {
+    AC_RowStack._isSequence: lambda top, c: top.color != c.color,
+    SC_RowStack._isSequence: lambda top, c: top.color == c.color,
+    SS_RowStack._isSequence: lambda top, c: top.suit == c.suit,
+    RK_RowStack._isSequence: lambda top, c: True,
+    BO_RowStack._isSequence: lambda top, c: top.suit != c.suit,
+}
+
+# these only add limits to SequenceStack_StackMethods.acceptsCards()
+_SEQUENCE_ACCEPTS = (
+    SequenceStack_StackMethods.acceptsCards,
+    SuperMoveAC_RowStack.acceptsCards,
+    SuperMoveBO_RowStack.acceptsCards,
+    SuperMoveRK_RowStack.acceptsCards,
+    SuperMoveSC_RowStack.acceptsCards,
+    SuperMoveSS_RowStack.acceptsCards,
+)
+
+
+def _getSequenceFollows(stack):
+    cls = stack.__class__
+    if (getattr(cls, 'acceptsCards', None) not in _SEQUENCE_ACCEPTS or
+            cls._isAcceptableSequence is not
+            SequenceStack_StackMethods._isAcceptableSequence):
+        return None
+    return _SEQUENCE_FOLLOWS.get(cls._isSequence)
+
+
 # ************************************************************************
 # * WasteStack (a helper stack for the Talon, e.g. in Klondike)
 # ************************************************************************
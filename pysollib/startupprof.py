@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import json
+import platform
+import sys
+import time
+
+from pysollib.settings import TOOLKIT, VERSION
+
+# ************************************************************************
+# * Startup profiler (pysol --profile-startup=FILE)
+# *
+# * pysol_init() is split into named phases; phase(name) ends the
+# * running phase and starts the next one. For every phase the wall
+# * clock time, the modules imported (new entries in sys.modules), the
+# * files opened and the directories listed are recorded, and
+# * writeReport() dumps everything as JSON.
+# *
+# * Files and directories are counted with an audit hook (Python 3.8+),
+# * so only what Python itself opens is seen - images that Tk reads on
+# * its own are not. Audit hooks cannot be removed; the hook does
+# * nothing unless a profiler is running.
+# ************************************************************************
+
+REPORT_VERSION = 1
+
+_running = None
+
+
+def _auditHook(event, args):
+    p = _running
+    if p is None:
+        return
+    if event == 'open':
+        p._files += 1
+    elif event in ('os.listdir', 'os.scandir'):
+        p._dirs += 1
+
+
+_hook_installed = False
+
+
+def _installHook():
+    global _hook_installed
+    if _hook_installed:
+        return True
+    addaudithook = getattr(sys, 'addaudithook', None)
+    if addaudithook is None:
+        return False
+    addaudithook(_auditHook)
+    _hook_installed = True
+    return True
+
+
+class StartupProfiler(object):
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = []
+        self.can_count_files = False
+        self._name = None
+        self._files = self._dirs = 0
+        self._t0 = self._start = 0
+        self._modules = 0
+        self._modules_at_start = 0
+
+    def start(self):
+        global _running
+        if not self.enabled:
+            return
+        self.can_count_files = _installHook()
+        self._modules_at_start = len(sys.modules)
+        self._t0 = time.time()
+        _running = self
+
+    # end the current phase (if any) and start the next one
+    def phase(self, name):
+        if not self.enabled:
+            return
+        self._endPhase()
+        self._name = name
+        self._start = time.time()
+        self._modules = len(sys.modules)
+        self._files = self._dirs = 0
+
+    def stop(self):
+        global _running
+        if not self.enabled:
+            return
+        self._endPhase()
+        if _running is self:
+            _running = None
+
+    def _endPhase(self):
+        if self._name is None:
+            return
+        d = {
+            'name': self._name,
+            'time': round(time.time() - self._start, 6),
+            'imports': len(sys.modules) - self._modules,
+            'files': None,
+            'dirs': None,
+        }
+        if self.can_count_files:
+            d['files'], d['dirs'] = self._files, self._dirs
+        self.phases.append(d)
+        self._name = None
+
+    def getReport(self):
+        total = {'time': 0.0, 'imports': 0, 'files': None, 'dirs': None}
+        for key in ('time', 'imports'):
+            total[key] = sum([p[key] for p in self.phases])
+        total['time'] = round(total['time'], 6)
+        if self.can_count_files:
+            for key in ('files', 'dirs'):
+                total[key] = sum([p[key] for p in self.phases])
+        return {
+            'report_version': REPORT_VERSION,
+            'pysol_version': VERSION,
+            'python_version': platform.python_version(),
+            'platform': sys.platform,
+            'toolkit': TOOLKIT,
+            'start_time': self._t0,
+            # the modules imported before pysol_init(), i.e. by pysol.py
+            # and pysollib.main
+            'modules_at_start': self._modules_at_start,
+            'phases': self.phases,
+            'total': total,
+        }
+
+    def writeReport(self, filename):
+        if not self.enabled:
+            return
+        report = json.dumps(self.getReport(), indent=2, sort_keys=True)
+        if filename == '-':
+            sys.stdout.write(report + '\n')
+            return
+        with open(filename, 'w') as f:
+            f.write(report + '\n')
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- mode: python; coding: utf-8; -*-
+# ---------------------------------------------------------------------------##
+#
+# Copyright (C) 1998-2003 Markus Franz Xaver Johannes Oberhumer
+# Copyright (C) 2003 Mt. Hood Playing Card Co.
+# Copyright (C) 2005-2009 Skomoroh
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# ---------------------------------------------------------------------------##
+
+import json
+from collections import Counter
+
+from pysollib.app_stat import GameStat
+from pysollib.app_stat_result import GameStatResult
+from pysollib.mfxutil import Struct
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+# ************************************************************************
+# * Statistics database (SQLite)
+# *
+# * games      the log of the finished games of the players (prev_games
+# *            and all_prev_games of Statistics); reset games are only
+# *            hidden
+# * game_stats a GameStat for each player and game (gameid 0 is the 'all'
+# *            entry); the results (top lists) are stored as JSON, the
+# *            counters and averages as columns for queries
+# * meta       key/value pairs (JSON)
+# *
+# * Every finished game is written in one small transaction, so nothing
+# * has to be saved at exit except the balance.
+# ************************************************************************
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT,
+    gameid INTEGER,
+    game_number TEXT,
+    status INTEGER,
+    start_time REAL,
+    elapsed_time REAL,
+    version TEXT,
+    score INTEGER,
+    score_casino INTEGER,
+    game_version INTEGER,
+    hidden INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS games_player
+    ON games (player, gameid, start_time);
+CREATE TABLE IF NOT EXISTS game_stats (
+    player TEXT,
+    gameid INTEGER,
+    num_total INTEGER,
+    num_lost INTEGER,
+    num_won INTEGER,
+    num_perfect INTEGER,
+    time_average REAL,
+    moves_average REAL,
+    results TEXT,
+    PRIMARY KEY (player, gameid)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_RESULTS = ('time_result', 'moves_result', 'total_moves_result',
+            'score_result', 'score_casino_result')
+
+
+def _dumpResult(r):
+    return {'min': r.min, 'max': r.max, 'num': r.num, 'total': r.total,
+            'average': r.average,
+            'top': [(t.gameid, t.value, t.game_number, t.game_start_time)
+                    for t in r.top]}
+
+
+def _loadResult(d):
+    r = GameStatResult()
+    for key in ('min', 'max', 'num', 'total', 'average'):
+        setattr(r, key, d[key])
+    r.top = [Struct(gameid=t[0], value=t[1], game_number=t[2],
+                    game_start_time=t[3]) for t in d['top']]
+    return r
+
+
+class StatisticsDB:
+    VERSION = 1
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename)
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+            # older files may hold a row per demo game, keep the last one
+            self.conn.execute(
+                'DELETE FROM game_stats WHERE player IS NULL AND rowid NOT IN '
+                '(SELECT MAX(rowid) FROM game_stats WHERE player IS NULL '
+                'GROUP BY gameid)')
+        version = self.getValue('version')
+        if version is None:
+            self.setValue('version', self.VERSION)
+        elif version > self.VERSION:
+            self.conn.close()
+            raise sqlite3.DatabaseError(
+                'unsupported statistics database version %s' % version)
+
+    def close(self):
+        self.conn.close()
+
+    def getValue(self, key, default=None):
+        row = self.conn.execute(
+            'SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return default
+        return json.loads(row[0])
+
+    def setValue(self, key, value):
+        with self.conn:
+            self._setValue(key, value)
+
+    def _setValue(self, key, value):
+        self.conn.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                          (key, json.dumps(value)))
+
+    #
+    # the log of the games
+    #
+
+    def getGames(self, player, all_games=False):
+        sql = ('SELECT gameid, game_number, status, start_time, '
+               'elapsed_time, version, score, score_casino, game_version '
+               'FROM games WHERE player IS ?')
+        if not all_games:
+            sql += ' AND hidden = 0'
+        games = []
+        for row in self.conn.execute(sql + ' ORDER BY id', (player,)):
+            row = list(row)
+            row[5] = tuple(json.loads(row[5]))
+            games.append(tuple(row))
+        return games
+
+    def _addGame(self, player, log, hidden=0):
+        log = list(log)
+        log[5] = json.dumps(list(log[5]))
+        self.conn.execute(
+            'INSERT INTO games (player, gameid, game_number, status, '
+            'start_time, elapsed_time, version, score, score_casino, '
+            'game_version, hidden) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [player] + log + [hidden])
+
+    #
+    # GameStat
+    #
+
+    def getGameStats(self):
+        # return a dictionary of dictionaries (keys: player and gameid)
+        stats = {}
+        for row in self.conn.execute(
+                'SELECT player, gameid, num_total, num_lost, num_won, '
+                'num_perfect, results FROM game_stats'):
+            player, gameid = row[:2]
+            if gameid == 0:
+                gameid = 'all'
+            s = GameStat(gameid)
+            s.num_total, s.num_lost, s.num_won, s.num_perfect = row[2:6]
+            results = json.loads(row[6])
+            for key in _RESULTS:
+                setattr(s, key, _loadResult(results[key]))
+            stats.setdefault(player, {})[gameid] = s
+        return stats
+
+    def getFullStats(self, player):
+        # (won, lost, playing time, moves) of all games of the player
+        return dict([(row[0], tuple(row[1:])) for row in self.conn.execute(
+            'SELECT gameid, num_won + num_perfect, num_lost, time_average, '
+            'moves_average FROM game_stats WHERE player IS ? AND gameid > 0',
+            (player,))])
+
+    def _putGameStat(self, player, s):
+        results = dict([(key, _dumpResult(getattr(s, key)))
+                        for key in _RESULTS])
+        gameid = s.gameid
+        if gameid == 'all':
+            gameid = 0
+        # the demo player is None, and a NULL never conflicts with the
+        # primary key: INSERT OR REPLACE alone would add a row each time
+        self.conn.execute(
+            'DELETE FROM game_stats WHERE player IS ? AND gameid = ?',
+            (player, gameid))
+        self.conn.execute(
+            'INSERT INTO game_stats VALUES '
+            '(?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (player, gameid, s.num_total, s.num_lost, s.num_won,
+             s.num_perfect, s.time_result.average, s.moves_result.average,
+             json.dumps(results)))
+
+    #
+    # Statistics support
+    #
+
+    # a finished game: the log entry (None for the demo) and the
+    # updated GameStat objects
+    def addGameResult(self, player, log, game_stats):
+        with self.conn:
+            if log is not None:
+                self._addGame(player, log)
+            for s in game_stats:
+                self._putGameStat(player, s)
+
+    def resetStats(self, player, gameid):
+        where, args = 'player IS ?', [player]
+        if gameid != 0:
+            where, args = where + ' AND gameid = ?', args + [gameid]
+        with self.conn:
+            self.conn.execute(
+                'UPDATE games SET hidden = 1 WHERE ' + where, args)
+            self.conn.execute('DELETE FROM game_stats WHERE ' + where, args)
+
+    # import a pickled Statistics object (once)
+    def migrate(self, stats):
+        if self.getValue('migrated'):
+            return False
+        with self.conn:
+            players = set(stats.prev_games) | set(stats.all_prev_games)
+            for player in players:
+                visible = Counter(stats.prev_games.get(player, []))
+                for log in stats.all_prev_games.get(player) or \
+                        stats.prev_games.get(player, []):
+                    hidden = 1
+                    if visible[log] > 0:
+                        visible[log] -= 1
+                        hidden = 0
+                    self._addGame(player, log, hidden)
+            for player, games in stats.games_stats.items():
+                for s in games.values():
+                    self._putGameStat(player, s)
+            self._setValue('total_balance',
+                           list(stats.total_balance.items()))
+            self._setValue('saved', stats.saved)
+            self._setValue('migrated', True)
+        return True
+
+
+# ************************************************************************
+# * Statistics.prev_games and all_prev_games with a database: the games
+# * of a player are read when they are needed.
+# ************************************************************************
+
+class GamesLog(dict):
+    def __init__(self, db, all_games=False):
+        dict.__init__(self)
+        self.db = db
+        self.all_games = all_games
+
+    def _load(self, player):
+        if not dict.__contains__(self, player):
+            games = self.db.getGames(player, self.all_games)
+            if games:
+                dict.__setitem__(self, player, games)
+
+    def __contains__(self, player):
+        self._load(player)
+        return dict.__contains__(self, player)
+
+    def __getitem__(self, player):
+        self._load(player)
+        return dict.__getitem__(self, player)
+
+    def get(self, player, default=None):
+        self._load(player)
+        return dict.get(self, player, default)
@@ -757,22 +757,17 @@ class SelectGameDialogWithPreview(SelectGameDialog):
             self.preview_app.opt.shade = 0
         #
 
-        c = self.app.cardsets_cache.get(gi.category)
-        c2 = None
-        if c:
-            c2 = c.get(gi.subcategory)
+        c2 = self.app.cardsets_cache.get(gi.category, gi.subcategory)
         if not c2:
             cardset = self.app.cardset_manager.getByName(
                 self.app.opt.cardset[gi.category][gi.subcategory][0])
             self.app.loadCardset(cardset, id=gi.category,
                                  tocache=True, noprogress=True)
-            c = self.app.cardsets_cache.get(gi.category)
-            if c:
-                c2 = c.get(gi.subcategory)
+            c2 = self.app.cardsets_cache.get(gi.category,
+                                             gi.subcategory)
             if not c2:
-                c = self.app.cardsets_cache.get(cardset.type)
-                if c:
-                    c2 = c.get(cardset.subtype)
+                c2 = self.app.cardsets_cache.get(cardset.type,
+                                                 cardset.subtype)
         if c2:
             self.preview_app.images = c2[2]
         else:
@@ -790,7 +785,7 @@ class SelectGameDialogWithPreview(SelectGameDialog):
         title = self.app.getGameTitleName(gameid)
         self.top.wm_title(_("Select Game - %(game)s") % {'game': title})
         #
-        self.preview_game = gi.gameclass(gi)
+        self.preview_game = self.app.constructGame(gameid)
         self.preview_game.createPreview(self.preview_app)
         #
         random = None
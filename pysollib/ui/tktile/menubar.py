@@ -297,6 +297,7 @@ class PysolMenubarTkCommon:
             autodrop=tkinter.BooleanVar(),
             autodeal=tkinter.BooleanVar(),
             quickplay=tkinter.BooleanVar(),
+            demo_lookahead=tkinter.BooleanVar(),
             undo=tkinter.BooleanVar(),
             bookmarks=tkinter.BooleanVar(),
             hint=tkinter.BooleanVar(),
@@ -367,6 +368,7 @@ class PysolMenubarTkCommon:
         tkopt.autodrop.set(opt.autodrop)
         tkopt.autodeal.set(opt.autodeal)
         tkopt.quickplay.set(opt.quickplay)
+        tkopt.demo_lookahead.set(opt.demo_lookahead)
         tkopt.undo.set(opt.undo)
         tkopt.hint.set(opt.hint)
         tkopt.free_hint.set(opt.free_hint)
@@ -674,6 +676,9 @@ class PysolMenubarTkCommon:
         submenu.add_checkbutton(
             label=n_("&Quick play"), variable=self.tkopt.quickplay,
             command=self.mOptQuickPlay)
+        submenu.add_checkbutton(
+            label=n_("Demo &lookahead"), variable=self.tkopt.demo_lookahead,
+            command=self.mOptDemoLookahead)
         submenu = MfxMenu(menu, label=n_("Assist &level"))
         submenu.add_checkbutton(
             label=n_("Enable &undo"), variable=self.tkopt.undo,
@@ -1606,6 +1611,11 @@ Unsupported game for import.
             return
         self.app.opt.quickplay = self.tkopt.quickplay.get()
 
+    def mOptDemoLookahead(self, *args):
+        if self._cancelDrag(break_pause=False):
+            return
+        self.app.opt.demo_lookahead = self.tkopt.demo_lookahead.get()
+
     def mOptEnableUndo(self, *args):
         if self._cancelDrag(break_pause=False):
             return
@@ -122,18 +122,24 @@ class BaseSolverDialog:
         focus = self.createButtons(bottom_frame, kw)
         self.start_button = self.buttons[0]
         self.play_button = self.buttons[1]
+        self.solver_thread = None
+        self.solver_timer = None
         self._reset()
         self.connectGame(self.app.game)
         self.mainloop(focus, kw.timeout, transient=False)
 
     def mDone(self, button):
         if button == 0:
-            self.startSolving()
+            if self.solver_thread:
+                self.stopSolving()
+            else:
+                self.startSolving()
         elif button == 1:
             self.startPlay()
         elif button == 2:
             self.app.menubar.mNewGame()
         elif button == 3:
+            self.stopSolving()
             global solver_dialog
             solver_dialog = None
             self.destroy()
@@ -159,26 +165,66 @@ class BaseSolverDialog:
         self.top.update_idletasks()
 
     def reset(self):
+        # the game has changed, a running solution is of no use
+        self.stopSolving()
         self.play_button.config(state='disabled')
 
     def startSolving(self):
-        from pysollib.mygettext import ungettext
+        from pysollib.hint import SolverThread
 
         self._reset()
         game = self.app.game
         solver = game.Solver_Class(game, self)  # create solver instance
-        game.solver = solver
         preset = self.preset_var.get()
         max_iters = self._getMaxIters()
         progress = self.app.opt.solver_show_progress
         iters_step = self.app.opt.solver_iterations_output_step
         solver.config(preset=preset, max_iters=max_iters, progress=progress,
                       iters_step=iters_step)
-        try:
-            solver.computeHints()
-        except RuntimeError:
+        # solve in the background, see _pollSolver()
+        self.solver_thread = SolverThread(solver)
+        self.solver_thread.start()
+        self.start_button.config(text=_('Stop'))
+        self.solver_timer = self.top.after(100, self._pollSolver)
+
+    def stopSolving(self):
+        thread = self.solver_thread
+        if not thread:
+            return
+        thread.cancel()
+        self.solver_thread = None
+        if self.solver_timer:
+            self.top.after_cancel(self.solver_timer)
+            self.solver_timer = None
+        self.start_button.config(text=_('Start'))
+        self.result_label['text'] = _('Solving cancelled.')
+
+    def _pollSolver(self):
+        self.solver_timer = None
+        thread = self.solver_thread
+        if not thread:
+            return
+        kw = thread.getProgress()
+        if kw:
+            self.setText(**kw)
+        if thread.is_alive():
+            self.solver_timer = self.top.after(100, self._pollSolver)
+            return
+        self.solver_thread = None
+        self.start_button.config(text=_('Start'))
+        self.showSolution(thread)
+
+    def showSolution(self, thread):
+        from pysollib.mygettext import ungettext
+
+        solver = thread.solver
+        if isinstance(thread.error, RuntimeError):
             self.result_label['text'] = _('Solver not found in the PATH')
             return
+        if thread.error:
+            self.result_label['text'] = _('Solver error: %s') % thread.error
+            return
+        self.app.game.solver = solver
         hints_len = len(solver.hints)-1
         if hints_len > 0:
             if solver.solver_state == 'intractable':
@@ -247,22 +247,30 @@ def after_cancel(t):
 # * image handling
 # ************************************************************************
 
-if Image:
-    class PIL_Image(ImageTk.PhotoImage):
-        def __init__(self, file=None, image=None, pil_image_orig=None):
+# The functions with a PIL suffix only do PIL work and no Tk calls, so
+# they may be called from a worker thread (see Images).
 
-            if file:
-                image = Image.open(file).convert('RGBA')
+def readImagePIL(file):
+    image = Image.open(file).convert('RGBA')
 
-                basename = os.path.basename(file)
-                file_name = os.path.splitext(basename)[0]
+    basename = os.path.basename(file)
+    file_name = os.path.splitext(basename)[0]
 
-                findsum = findfile(file_name)
+    findsum = findfile(file_name)
 
-                if findsum != -3:  # -1 for every check
-                    image = masking(image)
+    if findsum != -3:  # -1 for every check
+        image = masking(image)
+
+        image.filename = file_name
+    return image
+
+
+if Image:
+    class PIL_Image(ImageTk.PhotoImage):
+        def __init__(self, file=None, image=None, pil_image_orig=None):
 
-                    image.filename = file_name
+            if file:
+                image = readImagePIL(file)
 
             ImageTk.PhotoImage.__init__(self, image)
             self._pil_image = image
@@ -290,6 +298,10 @@ if Image:
             return im
 
         def resize(self, xf, yf, resample=-1):
+            im = self.resizePIL(xf, yf, resample)
+            return PIL_Image(image=im, pil_image_orig=self._pil_image_orig)
+
+        def resizePIL(self, xf, yf, resample=-1):
 
             if resample == -1:
                 resample = get_default_resampling()
@@ -307,7 +319,7 @@ if Image:
                 pass  # placeholder
                 #  im = masking(im)  # now don't mask images with no name
 
-            return PIL_Image(image=im, pil_image_orig=self._pil_image_orig)
+            return im
 
 
 def masking(image):
@@ -478,12 +490,17 @@ def _createBottomImage(image, color='white', backfile=None):
     return out
 
 
-def createBottom(maskimage, color='white', backfile=None):
+def createBottomPIL(maskimage, color='white', backfile=None):
     if not hasattr(maskimage, '_pil_image'):
         return None
     maskimage = maskimage._pil_image
-    out = _createBottomImage(maskimage, color, backfile)
+    return _createBottomImage(maskimage, color, backfile)
+
 
+def createBottom(maskimage, color='white', backfile=None):
+    out = createBottomPIL(maskimage, color, backfile)
+    if out is None:
+        return None
     return PIL_Image(image=out)
 
 
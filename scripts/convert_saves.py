@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- mode: python; coding: utf-8; -*-
+
+"""Convert pickled saved games (.pso files) to the binary save format.
+
+Only convert files you trust: the old format is read with pickle.
+
+usage: convert_saves.py [options] FILE...
+
+  -o, --output=FILE       write the converted game to FILE (only for a
+                          single input file); default: replace FILE
+  -b, --backup=SUFFIX     keep the original file as FILE + SUFFIX
+                          (default: .bak, an empty SUFFIX - no backup)
+  -n, --dry-run           only report what would be converted
+  -v, --verbose           print a line for every file
+"""
+
+import getopt
+import os
+import sys
+from io import BytesIO
+
+from six.moves import builtins
+os.environ['LANG'] = 'C'
+builtins.__dict__['_'] = lambda x: x
+builtins.__dict__['n_'] = lambda x: x
+
+pysollib_path = os.path.join(sys.path[0], '..')
+sys.path[0] = os.path.normpath(pysollib_path)
+
+from pysollib.game.binsave import convertSave, isBinarySave  # noqa: E402
+from pysollib.mygettext import fix_gettext  # noqa: E402
+
+fix_gettext()
+
+
+def convert_file(filename, output, backup, dry_run):
+    with open(filename, 'rb') as f:
+        if isBinarySave(f):
+            return None
+        data = BytesIO()
+        convertSave(f, data)
+    if dry_run:
+        return data.tell()
+    if output is None:
+        output = filename
+        if backup:
+            os.replace(filename, filename + backup)
+    tmp = output + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data.getvalue())
+    os.replace(tmp, output)
+    return data.tell()
+
+
+def main(args):
+    try:
+        opts, args = getopt.getopt(args, 'o:b:nvh',
+                                   ['output=', 'backup=', 'dry-run',
+                                    'verbose', 'help'])
+    except getopt.GetoptError as err:
+        print('convert_saves.py: %s' % err, file=sys.stderr)
+        return 1
+    output = None
+    backup = '.bak'
+    dry_run = False
+    verbose = False
+    for o, a in opts:
+        if o in ('-o', '--output'):
+            output = a
+        elif o in ('-b', '--backup'):
+            backup = a
+        elif o in ('-n', '--dry-run'):
+            dry_run = True
+        elif o in ('-v', '--verbose'):
+            verbose = True
+        elif o in ('-h', '--help'):
+            print(__doc__)
+            return 0
+    if not args:
+        print(__doc__, file=sys.stderr)
+        return 1
+    if output and len(args) > 1:
+        print('convert_saves.py: --output needs a single file',
+              file=sys.stderr)
+        return 1
+
+    nconverted = nerrors = 0
+    old_size = new_size = 0
+    for filename in args:
+        try:
+            old = os.path.getsize(filename)
+            size = convert_file(filename, output, backup, dry_run)
+        except Exception as ex:
+            nerrors += 1
+            print('%s: error: %s' % (filename, ex), file=sys.stderr)
+            continue
+        if size is None:
+            if verbose:
+                print('%s: already converted' % filename)
+            continue
+        nconverted += 1
+        old_size += old
+        new_size += size
+        if verbose:
+            print('%s: %d -> %d bytes' % (filename, old, size))
+    print('converted: %d, errors: %d, size: %d -> %d bytes' % (
+        nconverted, nerrors, old_size, new_size))
+    return nerrors and 1 or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
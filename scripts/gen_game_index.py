@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- mode: python; coding: utf-8; -*-
+
+"""Write the game index (pysollib/gameindex.py) to stdout.
+
+usage: gen_game_index.py > pysollib/gameindex.py
+
+The index lets the games database register all games at startup
+without importing the game modules (see GameManager.loadIndex). It has
+to be regenerated whenever a game is added or changed.
+"""
+
+import os
+import pprint
+import sys
+
+from six.moves import builtins
+os.environ['LANG'] = 'C'
+builtins.__dict__['_'] = lambda x: x
+builtins.__dict__['n_'] = lambda x: x
+
+pysollib_path = os.path.join(sys.path[0], '..')
+sys.path[0] = os.path.normpath(pysollib_path)
+
+from pysollib.gamedb import GAME_DB  # noqa: E402
+from pysollib.gamedb import GAME_INDEX_VERSION  # noqa: E402
+from pysollib.gamedb import gameIndexEntry  # noqa: E402
+from pysollib.mygettext import fix_gettext  # noqa: E402
+from pysollib.settings import VERSION  # noqa: E402
+
+fix_gettext()
+
+# the module that registers a game is the innermost game module whose
+# top level code is running
+modules = {}
+register = GAME_DB.register
+
+
+def _register(gi):
+    f = sys._getframe(1)
+    while f:
+        name = f.f_globals.get('__name__', '')
+        if f.f_code.co_name == '<module>' and \
+                name.startswith('pysollib.games.'):
+            modules[gi.id] = name
+            break
+        f = f.f_back
+    register(gi)
+
+
+GAME_DB.register = _register
+
+import pysollib.games  # noqa: E402,F401,I100,I202
+import pysollib.games.mahjongg  # noqa: E402,F401
+import pysollib.games.special  # noqa: E402,F401
+
+
+def main():
+    entries = []
+    for id in sorted(modules):
+        entries.append(gameIndexEntry(GAME_DB.get(id), modules[id]))
+    print('# Generated by scripts/gen_game_index.py - do not edit.')
+    print('#')
+    print('# (id, module, name, short_name, altnames,')
+    print('#  game_type, game_flags, decks, redeals, ncards,')
+    print('#  category, subcategory, skill_level,')
+    print('#  suits, ranks, trumps, rules_filename, si, solver)')
+    print()
+    print('VERSION = %d' % GAME_INDEX_VERSION)
+    print('PYSOL_VERSION = %r' % VERSION)
+    print()
+    print('GAMES = (')
+    for entry in entries:
+        lines = pprint.pformat(entry, width=75, compact=True).split('\n')
+        print('\n'.join(['    ' + line for line in lines]) + ',')
+    print(')')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- mode: python; coding: utf-8; -*-
+
+"""Time the creation of solvable deals for the Mahjongg layouts.
+
+usage: mahjongg_bench.py [options] [GAME-ID[-GAME-ID]]...
+
+  -s, --seeds=FROM[-TO]   deal numbers (default: 1-10)
+  -l, --level=LEVEL       easy or hard (default: hard, see the
+                          mahjongg_create_solvable option)
+  -v, --verbose           print a line for every layout
+
+Without GAME-IDs all Mahjongg games (not Shisen-Sho) are used.
+"""
+
+import getopt
+import os
+import sys
+import time
+
+from six.moves import builtins
+os.environ['LANG'] = 'C'
+builtins.__dict__['_'] = lambda x: x
+builtins.__dict__['n_'] = lambda x: x
+
+pysollib_path = os.path.join(sys.path[0], '..')
+sys.path[0] = os.path.normpath(pysollib_path)
+
+import pysollib.games.mahjongg  # noqa: E402,F401
+from pysollib.gamedb import GAME_DB  # noqa: E402
+from pysollib.games.mahjongg.mahjongg import \
+        AbstractMahjonggGame  # noqa: E402
+from pysollib.games.mahjongg.shisensho import \
+        AbstractShisenGame  # noqa: E402
+from pysollib.headless import HeadlessApp  # noqa: E402
+from pysollib.mygettext import fix_gettext  # noqa: E402
+from pysollib.pysolrandom import construct_random  # noqa: E402
+
+fix_gettext()
+
+
+def parse_range(s):
+    if '-' in s:
+        a, b = s.split('-', 1)
+        return list(range(int(a), int(b) + 1))
+    return [int(s)]
+
+
+def is_solution(game, cards, solution):
+    # remove the pairs in the order of the solution with the rules of
+    # the game
+    rows = game.s.rows
+    present = set(rows)
+    for a, b in solution:
+        r1, r2 = rows[a], rows[b]
+        if not game.cardsMatch(cards[a], cards[b]):
+            return False
+        for r in (r1, r2):
+            bm = r.blockmap
+            if [s for s in bm.above if s in present]:
+                return False
+            if [s for s in bm.left if s in present] and \
+                    [s for s in bm.right if s in present]:
+                return False
+        present.discard(r1)
+        present.discard(r2)
+    return not present
+
+
+def main(args):
+    try:
+        opts, args = getopt.getopt(args, 's:l:vh',
+                                   ['seeds=', 'level=', 'verbose', 'help'])
+    except getopt.GetoptError as err:
+        print('mahjongg_bench.py: %s' % err, file=sys.stderr)
+        return 1
+    seeds = list(range(1, 11))
+    forward = False
+    verbose = False
+    for o, a in opts:
+        if o in ('-s', '--seeds'):
+            seeds = parse_range(a)
+        elif o in ('-l', '--level'):
+            if a not in ('easy', 'hard'):
+                print('mahjongg_bench.py: unknown level: %s' % a,
+                      file=sys.stderr)
+                return 1
+            forward = a == 'easy'
+        elif o in ('-v', '--verbose'):
+            verbose = True
+        elif o in ('-h', '--help'):
+            print(__doc__)
+            return 0
+    game_ids = []
+    for a in args:
+        game_ids.extend(parse_range(a))
+    if not game_ids:
+        game_ids = GAME_DB.getGamesIdSortedById()
+
+    app = HeadlessApp()
+    nlayouts = ndeals = nfailed = 0
+    total = worst = 0.0
+    for id in game_ids:
+        gi = GAME_DB.get(id)
+        if gi is None or not issubclass(gi.gameclass, AbstractMahjonggGame) \
+                or issubclass(gi.gameclass, AbstractShisenGame):
+            continue
+        game = app.createGame(id)
+        times = []
+        failed = 0
+        for seed in seeds:
+            cards = list(game.cards)
+            game.random = construct_random(str(seed))
+            game.random.shuffle(cards)
+            t = time.time()
+            ret = game._createSolvable(game.s.rows, cards, forward)
+            times.append(time.time() - t)
+            if ret is None:
+                failed += 1
+                continue
+            ret.reverse()
+            if not is_solution(game, ret, game._dealer.solution):
+                print('game %d, deal %d: not solvable' % (id, seed),
+                      file=sys.stderr)
+                failed += 1
+        nlayouts += 1
+        ndeals += len(times)
+        nfailed += failed
+        total += sum(times)
+        worst = max([worst] + times)
+        if verbose:
+            print('%5d %-32s %4d tiles %8.2fms avg %8.2fms max %3d failed'
+                  % (id, gi.short_name, len(game.s.rows),
+                     1000 * sum(times) / len(times), 1000 * max(times),
+                     failed))
+        app.game = None
+        game.destruct()
+    print('layouts: %d, deals: %d, failed: %d' % (nlayouts, ndeals, nfailed))
+    print('time: avg %.2fms, max %.2fms' % (
+        ndeals and 1000 * total / ndeals or 0.0, 1000 * worst))
+    return nfailed and 1 or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- mode: python; coding: utf-8; -*-
+
+"""Play many deals headlessly with the demo autopilot and report
+throughput (games/sec, moves/sec) and the win rate.
+
+usage: simulate.py [options] [GAME-ID[-GAME-ID]]...
+
+  -s, --seeds=FROM[-TO]   deal numbers to play (default: 1-10)
+  -m, --max-moves=N       give up a deal after N moves (default: 2000)
+  -l, --lookahead=SECONDS let the demo search ahead for SECONDS per
+                          move (default: 0, take the best hint)
+  -j, --jobs=N            play the deals in N processes (default: 1,
+                          0 means one process per core)
+  -o, --output=FILE       write a line for every deal to FILE ('-' is
+                          stdout)
+  -f, --format=FORMAT     format of the output: json (JSON lines) or csv
+  -v, --verbose           print a line for every deal
+"""
+
+import getopt
+import os
+import sys
+import time
+
+from six.moves import builtins
+os.environ['LANG'] = 'C'
+builtins.__dict__['_'] = lambda x: x
+builtins.__dict__['n_'] = lambda x: x
+
+pysollib_path = os.path.join(sys.path[0], '..')
+sys.path[0] = os.path.normpath(pysollib_path)
+
+import pysollib.games  # noqa: E402,F401
+import pysollib.games.mahjongg  # noqa: E402,F401
+import pysollib.games.special  # noqa: E402,F401
+from pysollib.gamedb import GAME_DB  # noqa: E402
+from pysollib.headless import HeadlessApp, ResultWriter  # noqa: E402
+from pysollib.headless import simulateGames  # noqa: E402
+from pysollib.headless import simulateGamesParallel  # noqa: E402
+from pysollib.mygettext import fix_gettext  # noqa: E402
+
+fix_gettext()
+
+
+def parse_range(s):
+    if '-' in s:
+        a, b = s.split('-', 1)
+        return list(range(int(a), int(b) + 1))
+    return [int(s)]
+
+
+def main(args):
+    try:
+        opts, args = getopt.getopt(args, 's:m:l:j:o:f:vh',
+                                   ['seeds=', 'max-moves=', 'lookahead=',
+                                    'jobs=',
+                                    'output=', 'format=', 'verbose',
+                                    'help'])
+    except getopt.GetoptError as err:
+        print('simulate.py: %s' % err, file=sys.stderr)
+        return 1
+    seeds = list(range(1, 11))
+    max_moves = 2000
+    lookahead = 0
+    jobs = 1
+    output = None
+    format = 'json'
+    verbose = False
+    for o, a in opts:
+        if o in ('-s', '--seeds'):
+            seeds = parse_range(a)
+        elif o in ('-m', '--max-moves'):
+            max_moves = int(a)
+        elif o in ('-l', '--lookahead'):
+            lookahead = float(a)
+        elif o in ('-j', '--jobs'):
+            jobs = int(a)
+        elif o in ('-o', '--output'):
+            output = a
+        elif o in ('-f', '--format'):
+            format = a
+        elif o in ('-v', '--verbose'):
+            verbose = True
+        elif o in ('-h', '--help'):
+            print(__doc__)
+            return 0
+    game_ids = []
+    for a in args:
+        game_ids.extend(parse_range(a))
+    if not game_ids:
+        game_ids = GAME_DB.getGamesIdSortedById()
+    game_ids = [id for id in game_ids if GAME_DB.get(id)]
+
+    if format not in ('json', 'csv'):
+        print('simulate.py: unknown format: %s' % format, file=sys.stderr)
+        return 1
+    writer = None
+    # keep stdout clean for the results
+    out = output == '-' and sys.stderr or sys.stdout
+    if output == '-':
+        writer = ResultWriter(sys.stdout, format)
+    elif output:
+        writer = ResultWriter(open(output, 'w', newline=''), format)
+
+    if jobs == 1:
+        results = simulateGames(HeadlessApp(lookahead), game_ids, seeds,
+                                max_moves=max_moves)
+    else:
+        results = simulateGamesParallel(game_ids, seeds, max_moves=max_moves,
+                                        processes=jobs or None,
+                                        lookahead=lookahead)
+    ngames = nmoves = nwon = nerrors = 0
+    t0 = time.time()
+    for r in results:
+        if writer:
+            writer.write(r)
+        if r.error:
+            nerrors += 1
+            print('game %s, deal %s: error\n%s' % (r.gameid, r.seed, r.error),
+                  file=sys.stderr)
+            continue
+        ngames += 1
+        nmoves += r.moves
+        nwon += r.won
+        if verbose:
+            print('%5d %10d %-5s %5d %8.3f %s' % (
+                r.gameid, r.seed, r.won and 'won' or 'lost',
+                r.moves, r.time, r.stuck), file=out)
+    t = max(time.time() - t0, 1e-9)
+    if writer and writer.file is not sys.stdout:
+        writer.file.close()
+    print('games: %d, won: %d (%.1f%%), moves: %d, errors: %d' % (
+        ngames, nwon, ngames and 100.0 * nwon / ngames or 0.0,
+        nmoves, nerrors), file=out)
+    print('time: %.2fs, games/sec: %.2f, moves/sec: %.1f' % (
+        t, ngames / t, nmoves / t), file=out)
+    return nerrors and 1 or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -6,8 +6,12 @@
 #
 # Distributed under terms of the MIT license.
 
+import unittest
+
 import pysollib.stack
 from pysollib.acard import AbstractCard
+from pysollib.headless import HeadlessApp
+from pysollib.pysoltk import MfxCanvasGroup
 
 """
 
@@ -60,3 +64,13 @@ def _empty_override(*args):
 
 
 pysollib.stack.MfxCanvasGroup = _empty_override
+
+
+class HeadlessTestCase(unittest.TestCase):
+    # self.app is a HeadlessApp; the games get the real canvas group, not
+    # the override above
+    def setUp(self):
+        self.addCleanup(setattr, pysollib.stack, 'MfxCanvasGroup',
+                        pysollib.stack.MfxCanvasGroup)
+        pysollib.stack.MfxCanvasGroup = MfxCanvasGroup
+        self.app = HeadlessApp()
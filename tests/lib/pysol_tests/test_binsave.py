@@ -0,0 +1,155 @@
+# Distributed under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from pickle import UnpicklingError
+
+import pysollib.games  # noqa: F401
+from pysollib.game import GameMoves
+from pysollib.game.binsave import BinarySaveReader, BinarySaveWriter
+from pysollib.game.binsave import convertSave, isBinarySave
+from pysollib.headless import playDemoGame
+from pysollib.move import AMoveMove, AShuffleStackMove, AUpdateStackMove
+from pysollib.pysolrandom import construct_random
+
+from .common_mocks import HeadlessTestCase
+
+
+def _move(cls, **kw):
+    am = cls.__new__(cls)
+    am.__dict__.update(kw)
+    return am
+
+
+def _roundTrip(values, random=None):
+    f = BytesIO()
+    w = BinarySaveWriter(f)
+    for v in values:
+        w.dump(v)
+    f.seek(0)
+    p = BinarySaveReader(f)
+    p.set_random(random)
+    return [p.load() for v in values], f.getvalue()
+
+
+class BinarySaveTests(unittest.TestCase):
+    def test_values(self):
+        values = [0, 127, 128, -1, 2 ** 70, -2 ** 1000, 1.5, True, False,
+                  None, '', 'EOF', 'K\xf6nig', b'\x00\xff', (), [],
+                  (1, (2, [3])), {1: ('a', 2), 'x': None},
+                  [0, 2 ** 64 - 1, 12345678901234567890]]
+        result, data = _roundTrip(values)
+        self.assertEqual(result, values)
+        self.assertEqual([type(v) for v in result],
+                         [type(v) for v in values])
+
+    def test_card_ids(self):
+        # one byte for each card id and face_up
+        values = list(range(104)) + [1] * 104
+        result, data = _roundTrip(values)
+        self.assertEqual(result, values)
+        self.assertEqual(len(data), 10 + 208)
+        # a list of ids is a varint block: tag, count and one byte each
+        values = [list(range(104)), [5, 1, 200]]
+        result, data = _roundTrip(values)
+        self.assertEqual(result, values)
+        self.assertEqual(len(data), 10 + 2 + 104 + 2 + 4)
+
+    def test_uint64s(self):
+        snapshots = [0, 7, 2 ** 64 - 1]
+        f = BytesIO()
+        w = BinarySaveWriter(f)
+        w.dumpUInt64s(snapshots)
+        w.dump('EOF')
+        self.assertEqual(len(f.getvalue()), 10 + 2 + 24 + 5)
+        f.seek(0)
+        p = BinarySaveReader(f)
+        self.assertEqual(p.load(), snapshots)
+        self.assertEqual(p.load(), 'EOF')
+
+    def test_moves(self):
+        moves = GameMoves()
+        moves.history = [
+            [_move(AMoveMove, ncards=3, from_stack_id=1, to_stack_id=12,
+                   frames=-1, shadow=-1),
+             _move(AUpdateStackMove, stack_id=12, flags=3)],
+            [_move(AShuffleStackMove, stack_id=0, card_ids=(5, 1, 200),
+                   state=(123, 456))],
+        ]
+        moves.index = 2
+        (result,), data = _roundTrip([moves])
+        self.assertIsInstance(result, GameMoves)
+        self.assertEqual(result.index, 2)
+        self.assertEqual(
+            [[(type(am), am.__dict__) for am in m] for m in result.history],
+            [[(type(am), am.__dict__) for am in m] for m in moves.history])
+
+    def test_seed_state(self):
+        r = construct_random('12345678901234567890')
+        state = r.getstate()
+        (result,), data = _roundTrip([state], random=r)
+        self.assertEqual(result, state)
+        self.assertRaises(UnpicklingError, _roundTrip, [state])
+
+    def test_damaged(self):
+        f = BytesIO()
+        w = BinarySaveWriter(f)
+        w.dump([1, 2, 300])
+        data = f.getvalue()
+        self.assertTrue(isBinarySave(BytesIO(data)))
+        self.assertFalse(isBinarySave(BytesIO(b'\x80\x04')))
+        self.assertRaises(UnpicklingError, BinarySaveReader,
+                          BytesIO(b'\x80\x04' + data))
+        for bad in (data[:-1], data[:10] + b'\xff'):
+            p = BinarySaveReader(BytesIO(bad))
+            self.assertRaises(UnpicklingError, p.load)
+        self.assertRaises(TypeError, w.dump, object())
+
+
+class GameSaveTests(HeadlessTestCase):
+    def setUp(self):
+        HeadlessTestCase.setUp(self)
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _state(self, game, stacks=None):
+        if stacks is None:
+            # a loaded game, not restored yet
+            stacks = game.loadinfo.stacks
+        return (stacks,
+                [[(type(am), am.__dict__) for am in m]
+                 for m in game.moves.history],
+                game.moves.index, game.snapshots.tolist(),
+                sorted(game.gsaveinfo.bookmarks))
+
+    def test_save(self):
+        game = self.app.createGame(8)      # FreeCell
+        playDemoGame(game, 1, max_moves=40)
+        game.setBookmark(0, confirm=0)
+        binary = os.path.join(self.dir, 'binary.pso')
+        pickled = os.path.join(self.dir, 'pickled.pso')
+        converted = os.path.join(self.dir, 'converted.pso')
+        game._saveGame(binary)
+        self.app.opt.binary_saves = False
+        game.setBookmark(1, confirm=0)
+        game._saveGame(pickled)
+        with open(pickled, 'rb') as f, open(converted, 'wb') as g:
+            self.assertFalse(isBinarySave(f))
+            convertSave(f, g)
+        self.assertLess(os.path.getsize(converted),
+                        os.path.getsize(pickled))
+        state = self._state(game, [[(c.id, c.face_up) for c in s.cards]
+                                   for s in game.allstacks])
+        for fn in (pickled, converted):
+            g = game._loadGame(fn, self.app)
+            self.assertEqual(self._state(g), state)
+        g = game._loadGame(binary, self.app)
+        self.assertEqual(self._state(g), state[:-1] + ([0],))
+        # a converted bookmark
+        g = game._loadGame(converted, self.app)
+        self.assertTrue(isBinarySave(BytesIO(g.gsaveinfo.bookmarks[1][0])))
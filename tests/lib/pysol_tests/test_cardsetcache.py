@@ -0,0 +1,88 @@
+# Distributed under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pysollib.cardsetparser import CardsetConfigCache
+
+CONFIG_TXT = """\
+PySolFC solitaire cardset;4;.gif;1;52;7
+123-dondorf;%s
+79 123 8
+16 25 7 7
+back01.gif
+back01.gif
+"""
+
+
+class CardsetConfigCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.dir, 'cardsets.dat')
+        self.cardsets = os.path.join(self.dir, 'cardsets')
+        os.mkdir(self.cardsets)
+        self._addCardset('cardset-dondorf', 'Dondorf')
+        os.mkdir(os.path.join(self.cardsets, 'cardset-empty'))
+        os.mkdir(os.path.join(self.cardsets, 'other'))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _addCardset(self, name, title, images=True):
+        d = os.path.join(self.cardsets, name)
+        os.mkdir(d)
+        self._writeConfig(d, title)
+        if images:
+            for fn in ('back01.gif', 'shade.gif'):
+                open(os.path.join(d, fn), 'w').close()
+        return d
+
+    def _writeConfig(self, d, title):
+        with open(os.path.join(d, 'config.txt'), 'w') as f:
+            f.write(CONFIG_TXT % title)
+
+    def _scan(self):
+        cache = CardsetConfigCache()
+        cache.load(self.cache_file)
+        result = []
+        for d in cache.listCardsetDirs(self.cardsets):
+            r = cache.readCardset(d)
+            if r is not None:
+                result.append((os.path.basename(d), r[0].name, r[1]))
+        cache.save(self.cache_file)
+        return cache, result
+
+    def test_cache(self):
+        cache, result = self._scan()
+        self.assertEqual(result, [('cardset-dondorf', 'Dondorf', True)])
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        cache, result2 = self._scan()
+        self.assertEqual(result2, result)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        self.assertFalse(cache.modified)
+
+        # a changed config is read again
+        d = os.path.join(self.cardsets, 'cardset-dondorf')
+        self._writeConfig(d, 'Dondorf 2')
+        t = time.time() + 10
+        os.utime(os.path.join(d, 'config.txt'), (t, t))
+        # and so are new cardsets
+        t = time.time() + 20
+        self._addCardset('cardset-new', 'New', images=False)
+        os.utime(self.cardsets, (t, t))
+        cache, result = self._scan()
+        self.assertEqual(result, [('cardset-dondorf', 'Dondorf 2', True),
+                                  ('cardset-new', 'New', False)])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_copies(self):
+        cache, result = self._scan()
+        d = os.path.join(self.cardsets, 'cardset-dondorf')
+        cs, has_images = cache.readCardset(d)
+        cs.styles.append(99)
+        cs2, has_images = cache.readCardset(d)
+        self.assertEqual(cs2.styles, [7])
+        self.assertEqual(cs2.dir, d)
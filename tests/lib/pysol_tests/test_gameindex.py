@@ -0,0 +1,64 @@
+# Distributed under the MIT Expat License.
+
+import os
+import subprocess
+import sys
+import unittest
+
+import pysollib.games  # noqa: F401
+import pysollib.games.mahjongg  # noqa: F401
+import pysollib.games.special  # noqa: F401
+import pysollib.settings
+from pysollib import gameindex
+from pysollib.gamedb import GAME_DB, GAME_INDEX_VERSION
+from pysollib.gamedb import gameIndexEntry, gameInfoFromIndex
+
+LAZY_SCRIPT = '''
+import sys
+from six.moves import builtins
+builtins._ = lambda x: x
+builtins.n_ = lambda x: x
+from pysollib.gamedb import GAME_DB
+assert GAME_DB.loadIndex()
+ids = GAME_DB.getGamesIdSortedById()
+assert not [m for m in sys.modules if m.startswith('pysollib.games.')]
+assert GAME_DB.loadGameClass(GAME_DB.get(2)).__name__ == 'Klondike'
+assert 'pysollib.games.klondike' in sys.modules
+assert 'pysollib.games.spider' not in sys.modules
+for id in ids:
+    assert GAME_DB.loadGameClass(GAME_DB.get(id)) is not None, id
+print(len(ids))
+'''
+
+
+class GameIndexTests(unittest.TestCase):
+    def test_up_to_date(self):
+        # run scripts/gen_game_index.py > pysollib/gameindex.py if this
+        # test fails
+        self.assertEqual(gameindex.VERSION, GAME_INDEX_VERSION)
+        self.assertEqual(gameindex.PYSOL_VERSION, pysollib.settings.VERSION)
+        ids = set()
+        for entry in gameindex.GAMES:
+            gi = GAME_DB.get(entry[0])
+            self.assertIsNotNone(gi, entry[0])
+            self.assertEqual(gameIndexEntry(gi, entry[1]), entry)
+            ids.add(gi.id)
+        self.assertEqual(ids, set(GAME_DB.getGamesIdSortedById()))
+
+    def test_game_info(self):
+        for entry in gameindex.GAMES:
+            gi = GAME_DB.get(entry[0])
+            igi = gameInfoFromIndex(entry)
+            self.assertIsNone(igi.gameclass)
+            self.assertEqual(igi.module, entry[1])
+            d, id = dict(gi.__dict__), dict(igi.__dict__)
+            for key in ('gameclass', 'module', 'si'):
+                del d[key], id[key]
+            self.assertEqual(id, d)
+            self.assertEqual(igi.si.__dict__, gi.si.__dict__)
+
+    def test_lazy_import(self):
+        root = os.path.dirname(os.path.dirname(pysollib.__file__))
+        out = subprocess.check_output(
+            [sys.executable, '-c', LAZY_SCRIPT], cwd=root)
+        self.assertEqual(int(out), len(GAME_DB.getGamesIdSortedById()))
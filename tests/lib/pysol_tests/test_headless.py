@@ -0,0 +1,64 @@
+# Distributed under the MIT Expat License.
+
+import io
+import json
+
+import pysollib.games  # noqa: F401
+from pysollib.headless import ResultWriter
+from pysollib.headless import playDemoGame, simulateGames
+from pysollib.headless import simulateGamesParallel
+
+from .common_mocks import HeadlessTestCase
+
+
+class HeadlessTests(HeadlessTestCase):
+    def test_demo_game(self):
+        game = self.app.createGame(8)      # FreeCell
+        r = playDemoGame(game, 1)
+        self.assertIsNone(r.error)
+        self.assertEqual(r.moves, game.moves.index)
+        self.assertTrue(r.won or r.stuck)
+        # same deal, same game
+        r2 = playDemoGame(game, 1)
+        self.assertEqual((r2.won, r2.moves), (r.won, r.moves))
+
+    def test_text_width(self):
+        # Calculation measures the width of its help text
+        game = self.app.createGame(256)
+        r = playDemoGame(game, 1, max_moves=20)
+        self.assertIsNone(r.error)
+
+    def test_simulate(self):
+        results = list(simulateGames(self.app, [2, 8], range(1, 4),
+                                     max_moves=100))
+        self.assertEqual(len(results), 6)
+        self.assertEqual([r.gameid for r in results], [2, 2, 2, 8, 8, 8])
+        for r in results:
+            self.assertIsNone(r.error)
+            self.assertLessEqual(r.moves, 100)
+
+    def test_parallel(self):
+        serial = list(simulateGames(self.app, [2, 8], range(1, 5)))
+        parallel = list(simulateGamesParallel([2, 8], range(1, 5),
+                                              processes=2, chunksize=3))
+        key = (lambda r: (r.gameid, r.seed, r.won, r.moves, r.stuck))
+        self.assertEqual(sorted(map(key, parallel)),
+                         sorted(map(key, serial)))
+
+    def test_writer(self):
+        results = list(simulateGames(self.app, [8], range(1, 3)))
+        f = io.StringIO()
+        w = ResultWriter(f, 'json')
+        for r in results:
+            w.write(r)
+        lines = f.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])['seed'], 2)
+        f = io.StringIO()
+        w = ResultWriter(f, 'csv')
+        for r in results:
+            w.write(r)
+        lines = f.getvalue().splitlines()
+        self.assertEqual(lines[0], ','.join(ResultWriter.FIELDS))
+        self.assertTrue(lines[1].startswith('8,1,'))
+        self.assertRaises(ValueError, ResultWriter, f, 'xml')
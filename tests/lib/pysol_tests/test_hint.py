@@ -1,9 +1,14 @@
 # Written by Shlomi Fish, under the MIT Expat License.
 
+import os
+import sys
+import threading
+import time
 import unittest
 
 from pysollib.acard import AbstractCard
-from pysollib.hint import Base_Solver_Hint
+from pysollib.hint import Base_Solver_Hint, SolverSession, SolverThread
+from pysollib.hint import splitCommand
 
 
 class HintTests(unittest.TestCase):
@@ -20,3 +25,84 @@ class HintTests(unittest.TestCase):
         # TEST
         self.assertEqual(got, '8D', 'card2str2 works')
         # diag('got == ' + got)
+
+    def test_split_command(self):
+        self.assertEqual(
+            splitCommand(r'"C:\Program Files\fc-solve.exe" -m', posix=False),
+            [r'C:\Program Files\fc-solve.exe', '-m'])
+        self.assertEqual(splitCommand("fc-solve -l 'a b'", posix=True),
+                         ['fc-solve', '-l', 'a b'])
+
+
+@unittest.skipIf(os.name == 'nt', 'posix quoting')
+class SolverSessionTests(unittest.TestCase):
+    def _command(self, code):
+        return '%s -c "%s"' % (sys.executable, code)
+
+    def test_version(self):
+        s = SolverSession(self._command(
+            "print('fc-solve version 5.20.1')"))
+        self.assertEqual(s.getVersion(), (5, 20, 1))
+        argv = s.getArgv()
+        self.assertEqual(argv[0], sys.executable)
+        self.assertIs(s.getArgv(), argv)
+
+    def test_run(self):
+        s = SolverSession(self._command(
+            "import sys; print(sys.argv[1:], sys.stdin.read().strip())"))
+        pout, perr = s.run(['--max-iters', '100'], 'KD QD\n')
+        self.assertEqual(pout.read().strip(),
+                         b"['--max-iters', '100'] KD QD")
+
+    def test_not_found(self):
+        s = SolverSession('no-such-solver-command')
+        self.assertRaises(RuntimeError, s.run, [], '')
+
+    def test_thread_cancel(self):
+        session = SolverSession(self._command(
+            "import time\nfor i in range(1000): "
+            "print(i, flush=True); time.sleep(0.01)"))
+
+        class CountingSolver(Base_Solver_Hint):
+            def calcBoardString(self):
+                return ''
+
+            def computeHints(self):
+                process = self.run_solver(session, [], '')
+                for line in process.stdout:
+                    self._setText(iter=int(line))
+                process.close()
+                self.hints = [None]
+
+        solver = CountingSolver(None, None, base_rank=0)
+        thread = SolverThread(solver)
+        thread.start()
+        progress = {}
+        while not progress and thread.is_alive():
+            time.sleep(0.01)
+            progress = thread.getProgress()
+        self.assertIn('iter', progress)
+        thread.cancel()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertTrue(solver.cancelled)
+        self.assertIsNone(thread.error)
+
+    def test_thread_error(self):
+        boards = []
+
+        class FailingSolver(Base_Solver_Hint):
+            def calcBoardString(self):
+                boards.append(threading.current_thread())
+                return ''
+
+            def computeHints(self):
+                self.getBoardString()
+                raise ValueError('bad output')
+
+        thread = SolverThread(FailingSolver(None, None, base_rank=0))
+        thread.start()
+        thread.join(5)
+        # the board was read before the thread started
+        self.assertEqual(boards, [threading.main_thread()])
+        self.assertIsInstance(thread.error, ValueError)
@@ -0,0 +1,205 @@
+# Distributed under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pysollib.images
+from pysollib.images import CardsetImagesCache, Images
+from pysollib.images import ScaledImageDiskCache, SubsampledImages
+from pysollib.images import mapPIL
+from pysollib.mfxutil import Image
+from pysollib.resource import Cardset
+
+
+class FakeImage(object):
+    resized = 0
+
+    def __init__(self, file=None, w=73, h=97):
+        self.file, self.w, self.h = file, w, h
+
+    def width(self):
+        return self.w
+
+    def height(self):
+        return self.h
+
+    def resize(self, xf, yf, resample=-1):
+        FakeImage.resized += 1
+        return FakeImage(self.file, int(self.w*xf), int(self.h*yf))
+
+    def subsample(self, r):
+        return FakeImage(self.file, self.w//r, self.h//r)
+
+
+class LazyImagesTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        cs = Cardset(ranks=tuple(range(13)), suits="cshd")
+        cs.update(dict(ncards=52, ext=".gif", CARDW=73, CARDH=97,
+                       CARD_XOFFSET=16, CARD_YOFFSET=25, dir=self.dir))
+        self.images = Images(None, cs)
+        self.images._face_names = cs.getFaceCardNames()
+        self.images._card = [None] * cs.ncards
+        for n in self.images._face_names:
+            open(os.path.join(self.dir, n + cs.ext), 'w').close()
+        self.loaded = []
+        patcher = mock.patch('pysollib.images.loadImage', self._loadImage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _loadImage(self, file):
+        self.loaded.append(os.path.basename(file))
+        return FakeImage(file)
+
+    def test_get_face(self):
+        images = self.images
+        im = images.getFace(0, 1, 0)
+        self.assertEqual(self.loaded, ['01s.gif'])
+        self.assertEqual(im.filename, '01s')
+        self.assertIs(images.getFace(0, 1, 0), im)
+        self.assertEqual(self.loaded, ['01s.gif'])
+        self.assertEqual(len([c for c in images._card if c]), 1)
+
+    def test_resized(self):
+        # a card loaded after Images.resize() gets the current size
+        images = self.images
+        images._xfactor, images._yfactor = 2, 1.5
+        im = images.getFace(0, 0, 1)
+        self.assertEqual((im.width(), im.height()), (146, 145))
+        self.assertEqual(self.loaded, ['02c.gif'])
+
+    def test_memory_size(self):
+        images = self.images
+        self.assertEqual(images.getMemorySize(), 0)
+        images.getFace(0, 0, 0)
+        images.getFace(0, 0, 1)
+        self.assertEqual(images.getMemorySize(), 2 * 73 * 97 * 4)
+
+    def test_subsampled(self):
+        simages = SubsampledImages(self.images, r=2)
+        self.assertEqual(self.loaded, [])
+        self.assertEqual(simages.getFace(0, 0, 0).width(), 36)
+        self.assertEqual(self.loaded, ['01c.gif'])
+        self.assertIsNone(self.images._card[0])
+
+    def test_scaled_cache(self):
+        images = self.images
+        # no Tk here
+        for name, func in (
+                ('createMissingImage',
+                 lambda self, w, h, **kw: FakeImage(None, w, h)),
+                ('_getHighlight', lambda self, *args: None)):
+            patcher = mock.patch.object(Images, name, func)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        im = images.getFace(0, 0, 0)
+        FakeImage.resized = 0
+        images.resize(2, 2, 1)
+        self.assertEqual(images.getFace(0, 0, 0).width(), 146)
+        self.assertEqual((images.scaled_hits, images.scaled_misses), (0, 1))
+        self.assertEqual(FakeImage.resized, 1)
+        # back to the original size
+        images.resize(1, 1, 0)
+        self.assertIs(images.getFace(0, 0, 0), im)
+        self.assertEqual((images.scaled_hits, images.scaled_misses), (1, 1))
+        # a card loaded since is scaled when the set is used again
+        images.getFace(0, 0, 1)
+        images.resize(2, 2, 1)
+        self.assertEqual(images.getFace(0, 0, 1).width(), 146)
+        self.assertEqual((images.scaled_hits, images.scaled_misses), (2, 1))
+        self.assertEqual(FakeImage.resized, 2)
+        # the same card size
+        images.resize(2.001, 2.001, 1)
+        self.assertEqual(images.getOffsets(), (32, 50))
+        self.assertEqual(FakeImage.resized, 2)
+        self.assertEqual(self.loaded, ['01c.gif', '02c.gif'])
+
+
+class ScaledImageDiskCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_disk_cache(self):
+        cache = ScaledImageDiskCache(os.path.join(self.dir, 'scaled'))
+        source = os.path.join(self.dir, '01c.gif')
+        open(source, 'w').close()
+        key = ('123-dondorf;Dondorf', 146, 194, 1)
+        self.assertIsNone(cache.load(key, '01c', source))
+        im = Image.new('RGBA', (146, 194), (255, 0, 0, 255))
+        cache.save(key, '01c', im)
+        im2 = cache.load(key, '01c', source)
+        self.assertEqual(im2.size, (146, 194))
+        self.assertEqual(im2.getpixel((0, 0)), (255, 0, 0, 255))
+        self.assertIsNone(cache.load(key[:3] + (2,), '01c', source))
+        # the cardset was updated
+        t = os.path.getmtime(source) + 10
+        os.utime(source, (t, t))
+        self.assertIsNone(cache.load(key, '01c', source))
+
+
+class MapPILTests(unittest.TestCase):
+    def test_map(self):
+        items = list(range(100))
+        for threads in (1, 4):
+            with mock.patch.object(pysollib.images, 'IMAGE_THREADS',
+                                   threads):
+                self.assertEqual(mapPIL(lambda i: i*i, items),
+                                 [i*i for i in items])
+
+
+class FakeImages(object):
+    def __init__(self, size):
+        self.size = size
+        self.prefetch = True
+
+    def getMemorySize(self, seen):
+        return self.size
+
+    def stopPrefetch(self):
+        self.prefetch = False
+
+
+class CardsetImagesCacheTests(unittest.TestCase):
+    def _entry(self, ident, size):
+        return (ident, FakeImages(size), FakeImages(size // 4))
+
+    def test_cache(self):
+        cache = CardsetImagesCache(max_memory=300)
+        a, b, c = [self._entry(i, 100) for i in 'abc']
+        self.assertIsNone(cache.put(1, 0, a))
+        self.assertIsNone(cache.put(2, 0, b))
+        self.assertIs(cache.get(1, 0, 'a'), a)
+        self.assertIsNone(cache.get(1, 0, 'x'))
+        self.assertIsNone(cache.get(3, 0))
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertIsNone(cache.put(3, 0, c))
+        self.assertEqual(cache.getMemorySize(), 375)
+        # b is the least recently used one
+        cache.evict()
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(2, 0))
+        self.assertFalse(b[1].prefetch)
+        self.assertEqual(cache.evictions, 1)
+        # a replaced entry is returned to the caller
+        d = self._entry('d', 300)
+        self.assertIs(cache.put(1, 0, d), a)
+        cache.evict(keep=(d[1],))
+        self.assertEqual(len(cache), 1)
+        self.assertIs(cache.get(1, 0), d)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_no_limit(self):
+        cache = CardsetImagesCache()
+        for i in range(10):
+            cache.put(i, 0, self._entry(i, 1000))
+        cache.evict()
+        self.assertEqual(len(cache), 10)
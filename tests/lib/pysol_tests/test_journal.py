@@ -0,0 +1,77 @@
+# Distributed under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+from io import BytesIO
+
+import pysollib.games  # noqa: F401
+from pysollib.game.binsave import BinarySaveReader
+from pysollib.game.journal import J_REDO, J_UNDO, MoveJournal, loadJournal
+from pysollib.headless import playDemoGame
+
+from .common_mocks import HeadlessTestCase
+
+
+class MoveJournalTests(HeadlessTestCase):
+    def setUp(self):
+        HeadlessTestCase.setUp(self)
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'journal.dat')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _state(self, game):
+        return ([[(c.id, bool(c.face_up)) for c in s.cards]
+                 for s in game.allstacks],
+                game.moves.index, len(game.moves.history),
+                game.stats.total_moves, game.stats.undo_moves,
+                game.stats.redo_moves, game.stats.demo_moves,
+                game.snapshots.tolist())
+
+    def _play(self, id, compact_moves):
+        game = self.app.createGame(id)
+        game.journal = MoveJournal(self.filename, compact_moves)
+        playDemoGame(game, 5, max_moves=60)
+        for i in range(6):
+            game.undo()
+        for i in range(2):
+            game.redo()
+        game.undo()
+        return game
+
+    def _recover(self, id):
+        base, records = loadJournal(self.filename)
+        game = self.app.createGame(id)
+        loaded = game._undumpGame(BinarySaveReader(BytesIO(base)), self.app)
+        game.restoreGame(loaded)
+        game.replayJournal(records)
+        return game, records
+
+    def test_recover(self):
+        game = self._play(8, 0)                 # FreeCell
+        game2, records = self._recover(8)
+        self.assertEqual(self._state(game2), self._state(game))
+        self.assertEqual([r[0] for r in records[-3:]],
+                         [J_REDO, J_REDO, J_UNDO])
+        game.journal.stop()
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_compact(self):
+        game = self._play(2, 4)                 # Klondike
+        game2, records = self._recover(2)
+        self.assertLess(len(records), 4)
+        self.assertEqual(self._state(game2), self._state(game))
+
+    def test_truncated(self):
+        game = self._play(8, 0)
+        game.journal.stop()
+        game = self._play(8, 0)
+        state = self._state(game)
+        game.undo()
+        # the last record is cut off
+        with open(self.filename, 'rb+') as f:
+            f.truncate(os.path.getsize(self.filename) - 1)
+        game2, records = self._recover(8)
+        self.assertEqual(self._state(game2)[:2], state[:2])
@@ -0,0 +1,63 @@
+# Distributed under the MIT Expat License.
+
+import pysollib.games  # noqa: F401
+from pysollib.game.lookahead import LookaheadSearch
+from pysollib.game.snapshot import snapshotHash
+from pysollib.headless import HeadlessApp, playDemoGame
+from pysollib.pysolrandom import construct_random
+
+from .common_mocks import HeadlessTestCase
+
+
+class LookaheadTests(HeadlessTestCase):
+    def _newGame(self, id, seed):
+        game = self.app.createGame(id)
+        game.newGame(random=construct_random(str(seed)))
+        return game
+
+    def test_sort_hints(self):
+        game = self._newGame(8, 3)      # FreeCell
+        cards = [list(s.cards) for s in game.allstacks]
+        h = snapshotHash(game.allstacks)
+        hints = game.getHints(2)
+        search = LookaheadSearch(game, game.getHintClass(),
+                                 time_budget=60, max_depth=3)
+        sorted_hints = search.sortHints(hints)
+        self.assertEqual(sorted(sorted_hints), sorted(hints))
+        self.assertEqual(search.depth, 3)
+        self.assertGreater(search.nodes, len(hints))
+        # the table is left alone
+        self.assertEqual([s.cards for s in game.allstacks], cards)
+        self.assertEqual(snapshotHash(game.allstacks), h)
+
+    def test_cycle(self):
+        # a card moved to a free cell and back: the value of the middle
+        # position is cut short by the path, and is not stored
+        game = self._newGame(8, 3)
+        row, cell = game.s.rows[0], game.s.reserves[0]
+
+        class PingPongHint:
+            def __init__(self, game, level):
+                pass
+
+            def getHints(self):
+                if cell.cards:
+                    return [(0, 0, 1, cell, row, None, None)]
+                return [(0, 0, 1, row, cell, None, None)]
+
+        search = LookaheadSearch(game, PingPongHint, time_budget=60,
+                                 max_depth=3)
+        search.search(PingPongHint(game, 2).getHints())
+        self.assertEqual(search.depth, 3)
+        cell.addCard(row.removeCard())
+        entry = search._tt[snapshotHash(game.allstacks)]
+        self.assertEqual(entry[0], 0)
+        self.assertNotEqual(entry[1], search.SCORE_DEAD_END)
+
+    def test_demo_game(self):
+        app = HeadlessApp(lookahead=0.05)
+        self.assertTrue(app.opt.demo_lookahead)
+        game = app.createGame(8)
+        r = playDemoGame(game, 3, max_moves=300)
+        self.assertIsNone(r.error)
+        self.assertTrue(r.won or r.stuck)
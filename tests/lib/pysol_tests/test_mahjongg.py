@@ -0,0 +1,248 @@
+# Distributed under the MIT Expat License.
+
+from collections import deque
+
+import pysollib.games.mahjongg  # noqa: F401
+from pysollib.games.mahjongg.solvable import MahjonggDealer
+from pysollib.headless import HeadlessApp, playDemoGame
+from pysollib.pysolrandom import construct_random
+from pysollib.solvercache import solver_cache
+
+from .common_mocks import HeadlessTestCase
+
+
+def _isSolution(game, rows, cards, solution):
+    # remove the pairs in the order of the solution
+    present = set(rows)
+    for a, b in solution:
+        if not game.cardsMatch(cards[a], cards[b]):
+            return False
+        for r in (rows[a], rows[b]):
+            if _isBlocked(r, present):
+                return False
+        present.difference_update((rows[a], rows[b]))
+    return not present
+
+
+def _isBlocked(stack, present=None):
+    # the blocking rule, walking the stacks of the blockmap
+    if present is None:
+        present = [s for s in stack.game.s.rows if s.cards]
+    bm = stack.blockmap
+    if [s for s in bm.above if s in present]:
+        return True
+    return bool([s for s in bm.left if s in present] and
+                [s for s in bm.right if s in present])
+
+
+def _lines(game, r, t):
+    # the least number of lines from r to t through empty cells (cells
+    # outside the board are empty), a 0-1 BFS on (cell, direction)
+    cols, rows = game.L
+
+    def empty(x, y):
+        return x in (0, cols+1) or y in (0, rows+1) or \
+            not game.cols[x-1][y-1].cards
+    start, end = (r.coln+1, r.rown+1), (t.coln+1, t.rown+1)
+    dist = {}
+    dirs = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    todo = deque([(1, start, d, 1) for d in dirs])
+    while todo:
+        n, (x, y), d, length = todo.popleft()
+        x, y = x + d[0], y + d[1]
+        if (x, y) == end and (n > 1 or length > 1 or r.allowAdjacent):
+            return n
+        if not (0 <= x <= cols+1 and 0 <= y <= rows+1) or not empty(x, y) \
+                or dist.get(((x, y), d), 4) <= n:
+            continue
+        dist[(x, y), d] = n
+        for d2 in dirs:
+            if d2 == d:
+                todo.appendleft((n, (x, y), d, length + 1))
+            elif n < 3 and d2 != (-d[0], -d[1]):
+                todo.append((n + 1, (x, y), d2, 1))
+    return None
+
+
+class MahjonggTests(HeadlessTestCase):
+    def _check(self, game):
+        rows = game.s.rows
+        free = [r for r in rows if r.cards and not _isBlocked(r)]
+        self.assertEqual(game.getFreeRows(), free)
+        self.assertEqual(game.occupied,
+                         sum([r.blockmap.bit for r in rows if r.cards]))
+        for r in rows:
+            self.assertEqual(bool(r.basicIsBlocked()), _isBlocked(r))
+        # free matching pairs as counted by updateText
+        f = 0
+        for i, r in enumerate(free):
+            n = len([t for t in free[i+1:]
+                     if game.cardsMatch(r.cards[0], t.cards[0])])
+            f += n % 2
+        types = game.getTileTypes(free)
+        self.assertEqual(sum([len(t) // 2 for t in types.values()]), f)
+        # the hints are all free matching pairs
+        pairs = [(r, t) for i, r in enumerate(free) for t in free[i+1:]
+                 if game.cardsMatch(r.cards[0], t.cards[0])]
+        hints = game.Hint_Class(game, 0).getHints(0)
+        self.assertEqual(sorted([(h[3].id, h[4].id) for h in hints]),
+                         sorted([(r.id, t.id) for r, t in pairs]))
+
+    def test_blocking(self):
+        for id in (5001, 5050):
+            game = self.app.createGame(id)
+            for seed in (1, 2):
+                playDemoGame(game, seed, max_moves=30)
+                self._check(game)
+                for i in range(5):
+                    game.undo()
+                self._check(game)
+
+    def test_make_cards(self):
+        # the hint code plays hypothetical moves with makeCards()
+        for id in (5001, 11001):
+            game = self.app.createGame(id)
+            playDemoGame(game, 1, max_moves=10)
+            r, t = game.getHints(0)[0][3:5]
+            saved = [r.makeCards([]), t.makeCards([])]
+            if id == 5001:
+                self._check(game)
+            else:
+                self.assertEqual(game.grid[r.gridpos], 0)
+            t.unmakeCards(saved[1])
+            r.unmakeCards(saved[0])
+            if id == 5001:
+                self._check(game)
+            else:
+                self.assertEqual(game.grid[r.gridpos], 1)
+
+    def test_demo_lookahead(self):
+        app = HeadlessApp(lookahead=0.05)
+        for id in (5001, 5002, 11001, 11004):
+            game = app.createGame(id)
+            result = playDemoGame(game, 1, max_moves=40)
+            self.assertIsNone(result.error)
+            self.assertGreater(result.moves, 0)
+
+    def test_shisensho(self):
+        # Shisen_RowStack is a Mahjongg_RowStack without a blockmap
+        game = self.app.createGame(11001)
+        result = playDemoGame(game, 1, max_moves=30)
+        self.assertIsNone(result.error)
+        self.assertGreater(result.moves, 0)
+
+    def test_shisensho_paths(self):
+        # Shisen-Sho, Four Rivers (no adjacent tiles), no gravity
+        for id in (11001, 11014, 11005):
+            game = self.app.createGame(id)
+            for moves in (0, 10, 25):
+                playDemoGame(game, 2, max_moves=moves)
+                rows = [r for r in game.s.rows if r.cards]
+                pairs = [(r, t) for i, r in enumerate(rows) for t in rows[i+1:]
+                         if game.cardsMatch(r.cards[0], t.cards[0]) and
+                         _lines(game, r, t)]
+                self.assertEqual(game.getMatchingPairs(), pairs)
+                for r, t in pairs:
+                    path = r.acceptsCards(t, t.cards)
+                    self.assertEqual(len(path), _lines(game, r, t) + 1)
+                    self.assertEqual(path[0], (r.coln+1, r.rown+1))
+                    self.assertEqual(path[-1], (t.coln+1, t.rown+1))
+
+    def _deal(self, game, rows, seed, forward):
+        cards = [r.cards[0] for r in rows]
+        random = construct_random(str(seed))
+        random.shuffle(cards)
+        dealer = MahjonggDealer(rows)
+        pairs = dealer.getPairs(cards, game.cardsMatch)
+        deal = dealer.createDeal(pairs, random, forward)
+        self.assertIsNotNone(deal)
+        self.assertEqual(sorted([c.id for c in deal]),
+                         sorted([c.id for c in cards]))
+        self.assertTrue(_isSolution(game, rows, deal, dealer.solution))
+
+    def test_solvable(self):
+        for id in (5001, 5004, 5809):           # Altar, Arrow, Big Trad.
+            game = self.app.createGame(id)
+            game.newGame(random=construct_random('1'))
+            for seed in (1, 2, 3):
+                self._deal(game, game.s.rows, seed, False)
+                self._deal(game, game.s.rows, seed, True)
+        # shuffle the remaining tiles
+        playDemoGame(game, 4, max_moves=20)
+        rows = [r for r in game.s.rows if r.cards]
+        self._deal(game, rows, 5, False)
+
+    def test_solvable_easy(self):
+        # the easy generator deals the game numbers as before
+        game = self.app.createGame(5001)
+        game.app.opt.mahjongg_create_solvable = 1
+        cards = list(game.cards)
+        game.random = construct_random('1')
+        game.random.shuffle(cards)
+        deal = game._shuffleHook(cards)
+        self.assertEqual([c.id for c in deal[:8]],
+                         [56, 25, 108, 22, 15, 138, 135, 87])
+
+    def _solve(self, game, seed):
+        game.newGame(random=construct_random(str(seed)))
+        solver = game.Solver_Class(game, None)
+        solver.config(max_iters=20000)
+        solver.computeHints()
+        return solver
+
+    def test_solver(self):
+        # Altar, Shisen-Sho, Shisen-Sho (Gravity)
+        for id in (5001, 11001, 11004):
+            game = self.app.createGame(id)
+            solver = self._solve(game, 1)
+            self.assertEqual(solver.solver_state, 'solved')
+            engine = game.createSolver()
+            for h in solver.hints[:-1]:
+                r, t = h[1:]
+                self.assertEqual(
+                    engine.getBoard(),
+                    [game.getTileType(s.cards[0]) if s.cards else None
+                     for s in game.s.rows])
+                self.assertTrue(t.acceptsCards(r, r.cards))
+                engine.doMove(engine.getMove(r, t))
+                r.moveMove(1, t)
+                game.finishMove()
+            self.assertTrue(game.isGameWon())
+
+    def test_solver_dead(self):
+        game = self.app.createGame(5001)
+        game.newGame(random=construct_random('1'))
+        # put two matching tiles on top of each other
+        engine = game.createSolver()
+        r = [s for s in game.s.rows if s.blockmap.below][0]
+        t = r.blockmap.below[0]
+        a, b = engine.getMove(r, t)
+        engine.types[b] = engine.types[a]
+        engine.count = {engine.types[a]: 2}
+        engine.tiles = {engine.types[a]: 1 << a | 1 << b}
+        engine.occupied = 1 << a | 1 << b
+        engine.free = 1 << a
+        engine.dead = []
+        self.assertEqual(engine.solve(), 'unsolved')
+        # the hint follows the solution
+        solver = game.checkSolvable()
+        self.assertEqual(solver.solver_state, 'solved')
+        self.assertEqual(game.getSolutionMove(), solver.hints[0][1:])
+
+    def test_check_solvable(self):
+        game = self.app.createGame(11003)       # Shisen-Sho 24x12
+        game.newGame(random=construct_random('1'))
+        solver_cache.clear()
+        # once per position, and not in the cache of the solver dialog
+        solver = game.checkSolvable()
+        self.assertIs(game.checkSolvable(), solver)
+        game.getStuck()
+        self.assertIs(game._checked, solver)
+        self.assertEqual(len(solver_cache), 0)
+        # a result of the time limit is not cached
+        solver = game.Solver_Class(game, None)
+        solver.config(max_iters=None, max_time=0.001, iters_step=1)
+        solver.computeHints()
+        self.assertEqual(solver.solver_state, 'intractable')
+        self.assertTrue(solver.engine.timed_out)
+        self.assertFalse(solver.loadSolution(solver.board_string))
@@ -0,0 +1,57 @@
+# Distributed under the MIT Expat License.
+
+import pysollib.games  # noqa: F401
+from pysollib.hint import MoveIndex
+from pysollib.pysolrandom import construct_random
+
+from .common_mocks import HeadlessTestCase
+
+
+class MoveIndexTests(HeadlessTestCase):
+    def _checkGame(self, id):
+        game = self.app.createGame(id)
+        for seed in range(1, 4):
+            game.newGame(random=construct_random(str(seed)))
+            for i in range(30):
+                index = MoveIndex(game.s.rows)
+                for r in game.sg.dropstacks:
+                    pile = r.getPile()
+                    if not pile:
+                        continue
+                    accepts = [t for t in game.s.rows
+                               if t.acceptsCards(r, pile)]
+                    candidates = index.getCandidates(pile[0])
+                    self.assertEqual(
+                        [t for t in candidates if t.acceptsCards(r, pile)],
+                        accepts)
+                hints = game.getHints(2)
+                if not hints:
+                    break
+                score, pos, ncards, from_stack, to_stack = hints[0][:5]
+                if ncards == 0:
+                    game.dealCards()
+                elif from_stack is to_stack:
+                    from_stack.flipMove()
+                else:
+                    from_stack.moveMove(ncards, to_stack, frames=0)
+                game.finishMove()
+        game.destruct()
+
+    def test_klondike(self):
+        self._checkGame(2)
+
+    def test_freecell(self):
+        self._checkGame(8)
+
+    def test_fortythieves(self):
+        self._checkGame(13)
+
+    def test_spider(self):
+        self._checkGame(10)
+
+    def test_indexed(self):
+        game = self.app.createGame(2)
+        game.newGame(random=construct_random('1'))
+        index = MoveIndex(game.s.rows)
+        self.assertFalse(index.anytime)
+        game.destruct()
@@ -0,0 +1,59 @@
+# Distributed under the MIT Expat License.
+
+import pysollib.games.special  # noqa: F401
+from pysollib.headless import playDemoGame
+
+from .common_mocks import HeadlessTestCase
+
+
+def _regions(game):
+    # the regions by a flood fill of every stack
+    cols, rows = game.L
+    regions = []
+    done = set()
+    for stack in game.s.rows:
+        if not stack.cards or stack in done:
+            continue
+        region = [stack]
+        done.add(stack)
+        for s in region:
+            for c, r in ((s.coln+1, s.rown), (s.coln-1, s.rown),
+                         (s.coln, s.rown+1), (s.coln, s.rown-1)):
+                if not (0 <= c < cols and 0 <= r < rows):
+                    continue
+                t = game.cols[c][r]
+                if t not in done and t.cards and \
+                        t.cards[0].suit == stack.cards[0].suit:
+                    region.append(t)
+                    done.add(t)
+        regions.append(sorted(region, key=lambda s: s.id))
+    return regions
+
+
+class SamegameTests(HeadlessTestCase):
+    def _check(self, game):
+        self.assertEqual(game.getRegions(), _regions(game))
+        for stacks in game.getRegions():
+            for stack in stacks:
+                self.assertEqual(stack.getRemoveStacks(), stacks)
+        # the cards are at the bottom of the columns, the columns at the
+        # left
+        heights = [len([s for s in col if s.cards]) for col in game.cols]
+        for col, h in zip(game.cols, heights):
+            self.assertEqual([bool(s.cards) for s in col],
+                             [False] * (len(col) - h) + [True] * h)
+        n = len([h for h in heights if h])
+        self.assertEqual(heights[n:], [0] * (len(heights) - n))
+
+    def test_regions(self):
+        for id in (19000, 19011):
+            game = self.app.createGame(id)
+            for moves in (0, 5, 20):
+                result = playDemoGame(game, 1, max_moves=moves)
+                self.assertIsNone(result.error)
+                self._check(game)
+                for i in range(3):
+                    game.undo()
+                self._check(game)
+                game.redo()
+                self._check(game)
@@ -27,6 +27,9 @@ class MockGame:
             pysollib.stack.Yukon_SS_RowStack(0, 0, self) for s in range(4)]
         self.preview = 0
 
+    def updateSnapshotHash(self, stack, start=0):  # noqa: N802
+        pass
+
 
 class Mock_S_Game:  # noqa: N801
     def __init__(self):
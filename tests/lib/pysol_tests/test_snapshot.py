@@ -0,0 +1,227 @@
+# Distributed under the MIT Expat License.
+
+import random
+import unittest
+
+import pysollib.games  # noqa: F401
+from pysollib.acard import AbstractCard
+from pysollib.game import Game, GameMoves
+from pysollib.game.snapshot import SnapshotStore, snapshotHash
+from pysollib.headless import playDemoGame
+from pysollib.move import AFlipAllMove, AFlipMove, AMoveMove
+from pysollib.move import ASingleCardMove, ATurnStackMove
+
+from .common_mocks import HeadlessTestCase
+
+
+class MockCard(AbstractCard):
+    def showFace(self, unhide=1):
+        self.face_up = 1
+
+    def showBack(self, unhide=1):
+        self.face_up = 0
+
+
+class MockStack:
+    def __init__(self, id):
+        self.id = id
+        self.cards = []
+
+    # same snapshot hash hooks as Stack.addCard()/insertCard()
+    def addCard(self, card, unhide=1, update=1):
+        self.cards.append(card)
+        self.game.updateSnapshotHash(self, len(self.cards) - 1)
+        self.closeStack()
+        return card
+
+    def insertCard(self, card, position, unhide=1, update=1):
+        self.game.updateSnapshotHash(self, position)
+        self.cards.insert(position, card)
+        self.game.updateSnapshotHash(self, position)
+        self.closeStack()
+        return card
+
+    def removeCard(self, card=None, unhide=1, update=1, update_positions=0):
+        if card is None:
+            return self.cards.pop()
+        self.cards.remove(card)
+        return card
+
+    def updatePositions(self):
+        pass
+
+    def updateText(self):
+        pass
+
+    def refreshView(self):
+        pass
+
+    def closeStack(self):
+        pass
+
+
+class MockPileOnStack(MockStack):
+    # flip the cards when the stack has 4 cards of the same rank, a
+    # nested move (see pileon.py)
+    def closeStack(self):
+        if len(self.cards) == 4 and \
+                len(set([c.rank for c in self.cards])) == 1:
+            self.game.flipAllMove(self)
+
+
+class MockGame:
+    S_DEAL = Game.S_DEAL
+    S_PLAY = Game.S_PLAY
+    S_UNDO = Game.S_UNDO
+    S_REDO = Game.S_REDO
+
+    getSnapshot = Game.getSnapshot
+    getSnapshotState = Game.getSnapshotState
+    updateSnapshotHash = Game.updateSnapshotHash
+    resetSnapshotHash = Game.resetSnapshotHash
+
+    def __init__(self, nstacks, stack_class=MockStack):
+        self.moves = GameMoves()
+        # do not check acceptsCards()
+        self.moves.state = self.S_DEAL
+        self.allstacks = [stack_class(i) for i in range(nstacks)]
+        for stack in self.allstacks:
+            stack.game = self
+        self.snapshot_hash = None
+        self.cards = []
+        for deck in range(2):
+            for suit in range(4):
+                for rank in range(13):
+                    c = MockCard(deck*52 + suit*13 + rank,
+                                 deck, suit, rank, self)
+                    self.cards.append(c)
+                    self.allstacks[rank % nstacks].addCard(c)
+
+    def flipAllMove(self, stack):
+        AFlipAllMove(stack).do(self)
+
+
+class SnapshotTests(unittest.TestCase):
+    def _randomMove(self, game, rnd):
+        stacks = [s for s in game.allstacks if s.cards]
+        from_stack = rnd.choice(stacks)
+        to_stack = rnd.choice(
+            [s for s in game.allstacks if s is not from_stack])
+        kind = rnd.randrange(4)
+        if kind == 0:
+            return AFlipMove(from_stack)
+        if kind == 1:
+            return AFlipAllMove(from_stack)
+        if kind == 2:
+            return ASingleCardMove(from_stack, to_stack,
+                                   rnd.randrange(len(from_stack.cards)), 0)
+        return AMoveMove(rnd.randint(1, len(from_stack.cards)),
+                         from_stack, to_stack, 0)
+
+    def test_incremental_hash(self):
+        rnd = random.Random(24)
+        game = MockGame(7)
+        start = game.getSnapshot()
+        self.assertEqual(start, snapshotHash(game.allstacks))
+        history = []
+        for i in range(500):
+            am = self._randomMove(game, rnd)
+            am.do(game)
+            history.append(am)
+            self.assertEqual(game.getSnapshot(), snapshotHash(game.allstacks))
+        for am in reversed(history):
+            am.undo(game)
+            self.assertEqual(game.getSnapshot(), snapshotHash(game.allstacks))
+        self.assertEqual(game.getSnapshot(), start)
+
+    def test_turn_stack(self):
+        game = MockGame(3)
+        for c in game.allstacks[0].cards:
+            c.showFace()
+        game.allstacks[1].cards = []
+        game.resetSnapshotHash()
+        start = game.getSnapshot()
+        am = ATurnStackMove(game.allstacks[0], game.allstacks[1])
+        am.do(game)
+        self.assertNotEqual(game.getSnapshot(), start)
+        self.assertEqual(game.getSnapshot(), snapshotHash(game.allstacks))
+        am.undo(game)
+        self.assertEqual(game.getSnapshot(), start)
+
+    def test_nested_move(self):
+        game = MockGame(3, MockPileOnStack)
+        stacks = game.allstacks
+        for c in game.cards:
+            c.showFace()
+        # three aces on stack 2, the fourth one on top of stack 0
+        aces = [c for c in stacks[0].cards if c.rank == 0][:4]
+        for c in aces:
+            stacks[0].cards.remove(c)
+        stacks[1].cards.extend(stacks[2].cards)
+        stacks[2].cards = aces[:3]
+        stacks[0].cards.append(aces[3])
+        game.resetSnapshotHash()
+        start = game.getSnapshot()
+        am = AMoveMove(1, stacks[0], stacks[2], 0)
+        am.do(game)
+        self.assertEqual([c.face_up for c in stacks[2].cards], [0] * 4)
+        self.assertEqual(game.getSnapshot(), snapshotHash(game.allstacks))
+        self.assertNotEqual(game.getSnapshot(), start)
+
+    def test_card_identity(self):
+        # cards of different decks are interchangeable
+        game = MockGame(1)
+        cards = game.allstacks[0].cards
+        h = snapshotHash(game.allstacks)
+        cards[0], cards[52] = cards[52], cards[0]
+        self.assertEqual(snapshotHash(game.allstacks), h)
+        cards[0], cards[1] = cards[1], cards[0]
+        self.assertNotEqual(snapshotHash(game.allstacks), h)
+
+
+class SnapshotGameTests(HeadlessTestCase):
+    def test_close_stack(self):
+        # Picture Gallery, Small PileOn, Crossword: closeStack() runs
+        # nested moves
+        for id in (7, 289, 778):
+            game = self.app.createGame(id)
+            finishMove = game.finishMove
+
+            def check():
+                finishMove()
+                self.assertEqual(game.getSnapshot(),
+                                 snapshotHash(game.allstacks))
+            game.finishMove = check
+            for seed in (1, 2):
+                playDemoGame(game, seed, max_moves=150)
+            while game.moves.index:
+                game.undo()
+                self.assertEqual(game.getSnapshot(),
+                                 snapshotHash(game.allstacks))
+
+
+class SnapshotStoreTests(unittest.TestCase):
+    def test_add(self):
+        store = SnapshotStore([5, 3, 5, 7])
+        self.assertEqual(store.tolist(), [5, 3, 7])
+        self.assertIn(3, store)
+        self.assertFalse(store.add(3))
+        self.assertTrue(store.add(11))
+        self.assertEqual(len(store), 4)
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_evict_oldest(self):
+        store = SnapshotStore(range(10), max_size=4)
+        self.assertEqual(store.tolist(), [6, 7, 8, 9])
+        self.assertEqual(store.evicted, 6)
+        store.add(6)
+        store.add(10)
+        self.assertEqual(store.tolist(), [7, 8, 9, 10])
+
+    def test_evict_lru(self):
+        store = SnapshotStore(range(4), max_size=4,
+                              eviction=SnapshotStore.EVICT_LRU)
+        store.add(0)
+        store.add(4)
+        self.assertEqual(store.tolist(), [2, 3, 0, 4])
@@ -0,0 +1,74 @@
+# Distributed under the MIT Expat License.
+
+import os
+import tempfile
+import unittest
+
+from pysollib.hint import Base_Solver_Hint
+from pysollib.mfxutil import Struct
+from pysollib.solvercache import SolverCache, solver_cache
+
+
+class SolverCacheTests(unittest.TestCase):
+    def test_lru(self):
+        cache = SolverCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(len(cache), 2)
+
+    def test_disabled(self):
+        cache = SolverCache(max_size=0)
+        cache.put('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+    def test_save_load(self):
+        cache = SolverCache()
+        cache.put(('FreeCell', 'board'), ('solved', ((1, 2, -1),)))
+        fd, fn = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            cache.save(fn)
+            self.assertFalse(cache.modified)
+            other = SolverCache()
+            other.load(fn)
+            self.assertEqual(other.get(('FreeCell', 'board')),
+                             ('solved', ((1, 2, -1),)))
+        finally:
+            os.remove(fn)
+
+
+class MockStack:
+    def __init__(self, id):
+        self.id = id
+
+
+class SolutionTests(unittest.TestCase):
+    def setUp(self):
+        solver_cache.clear()
+        self.game = Struct(id=2, allstacks=[MockStack(i) for i in range(5)])
+
+    def _solver(self):
+        game = self.game
+        solver = Base_Solver_Hint(game, None, base_rank=0)
+        solver.config(preset='none', max_iters=1000)
+        return solver
+
+    def test_roundtrip(self):
+        solver = self._solver()
+        stacks = solver.game.allstacks
+        solver.solver_state = 'solved'
+        solver.hints = [[1, stacks[1], stacks[2]], [3, stacks[4], None]]
+        solver.saveSolution('board')
+        other = self._solver()
+        self.assertFalse(other.loadSolution('other board'))
+        self.assertTrue(other.loadSolution('board'))
+        self.assertEqual(other.solver_state, 'solved')
+        self.assertEqual(other.hints, solver.hints + [None])
+        # the options are part of the key
+        other.config(max_iters=2000)
+        self.assertFalse(other.loadSolution('board'))
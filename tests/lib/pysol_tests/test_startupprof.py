@@ -0,0 +1,66 @@
+# Distributed under the MIT Expat License.
+
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from pysollib.startupprof import StartupProfiler
+
+
+class StartupProfilerTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        sys.path.insert(0, self.dir)
+
+    def tearDown(self):
+        sys.path.remove(self.dir)
+        sys.modules.pop('pysol_startupprof_mod', None)
+        shutil.rmtree(self.dir)
+
+    def test_report(self):
+        fn = os.path.join(self.dir, 'pysol_startupprof_mod.py')
+        with open(fn, 'w') as f:
+            f.write('X = 1\n')
+        importlib.invalidate_caches()
+        p = StartupProfiler()
+        p.start()
+        p.phase('files')
+        for i in range(3):
+            with open(fn):
+                pass
+        os.listdir(self.dir)
+        p.phase('imports')
+        importlib.import_module('pysol_startupprof_mod')
+        p.stop()
+        # not counted any more
+        with open(fn):
+            pass
+        report = os.path.join(self.dir, 'report.json')
+        p.writeReport(report)
+        with open(report) as f:
+            r = json.load(f)
+        self.assertEqual([ph['name'] for ph in r['phases']],
+                         ['files', 'imports'])
+        files, imports = r['phases']
+        self.assertEqual(files['imports'], 0)
+        self.assertEqual(imports['imports'], 1)
+        if p.can_count_files:
+            self.assertEqual(files['files'], 3)
+            self.assertEqual(files['dirs'], 1)
+            self.assertEqual(r['total']['files'], files['files'] +
+                             imports['files'])
+        self.assertEqual(r['total']['imports'], 1)
+        self.assertGreaterEqual(r['total']['time'], 0)
+
+    def test_disabled(self):
+        p = StartupProfiler(enabled=False)
+        p.start()
+        p.phase('nothing')
+        p.stop()
+        self.assertEqual(p.phases, [])
+        p.writeReport(os.path.join(self.dir, 'report.json'))
+        self.assertEqual(os.listdir(self.dir), [])
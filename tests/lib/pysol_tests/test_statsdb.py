@@ -0,0 +1,128 @@
+# Distributed under the MIT Expat License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pysollib.app_statistics import Statistics
+from pysollib.mfxutil import Struct
+from pysollib.statsdb import StatisticsDB, sqlite3
+
+
+class FakeGame(object):
+    GAME_VERSION = 1
+
+    def __init__(self, id, number, moves):
+        self.id = id
+        self.number = number
+        self.gstats = Struct(start_time=1000.0 + number,
+                             total_elapsed_time=60.0)
+        self.stats = Struct(elapsed_time=60.0 + moves, total_moves=moves)
+        self.moves = Struct(index=moves)
+
+    def getGameNumber(self, format):
+        return str(self.number)
+
+    def getGameScore(self):
+        return None
+
+    def getGameScoreCasino(self):
+        return None
+
+    def updateTime(self):
+        pass
+
+
+@unittest.skipIf(sqlite3 is None, 'no sqlite3')
+class StatisticsDBTests(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.dir, 'statistics.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def _play(self, stats):
+        # (gameid, deal, status, moves)
+        for args in ((2, 1, 1, 100), (2, 2, 0, 50), (8, 3, 2, 80),
+                     (8, 4, 1, 90), (8, 5, 0, 10)):
+            stats.updateStats('joe', FakeGame(*(args[:2] + args[3:])),
+                              args[2])
+        stats.updateStats(None, FakeGame(8, 6, 70), 1)
+
+    def _open(self):
+        stats = Statistics()
+        stats.setDB(StatisticsDB(self.filename))
+        self.addCleanup(stats.db.close)
+        return stats
+
+    def _compare(self, a, b):
+        self.assertEqual(sorted(a.games_stats, key=str),
+                         sorted(b.games_stats, key=str))
+        for player in a.games_stats:
+            for gameid in a.games_stats[player]:
+                self.assertEqual(a.getFullStats(player, gameid),
+                                 b.getFullStats(player, gameid))
+                sa = a.games_stats[player][gameid]
+                sb = b.games_stats[player][gameid]
+                self.assertEqual(
+                    [t.__dict__ for t in sa.moves_result.top],
+                    [t.__dict__ for t in sb.moves_result.top])
+        self.assertEqual(a.prev_games.get('joe'), b.prev_games.get('joe'))
+        self.assertEqual(a.all_prev_games.get('joe'),
+                         b.all_prev_games.get('joe'))
+
+    def test_update(self):
+        memory = Statistics()
+        self._play(memory)
+        stats = self._open()
+        self._play(stats)
+        self._compare(stats, memory)
+        # a new session
+        stats2 = self._open()
+        self._compare(stats2, memory)
+        self.assertEqual(stats2.getAllFullStats('joe'),
+                         memory.getAllFullStats('joe'))
+        self.assertEqual(stats2.getAllFullStats('joe')[8][:2], (2, 1))
+        self.assertEqual(stats2.getAllFullStats(None), {8: (1, 0, 130.0, 70)})
+
+    def test_demo(self):
+        # one row per game for the demo player too
+        stats = self._open()
+        for number in range(6, 10):
+            stats.updateStats(None, FakeGame(8, number, 70), 1)
+        rows = stats.db.conn.execute(
+            'SELECT gameid, num_won FROM game_stats WHERE player IS NULL '
+            'ORDER BY gameid').fetchall()
+        self.assertEqual(rows, [(0, 4), (8, 4)])
+        stats2 = self._open()
+        self.assertEqual(stats2.getFullStats(None, 8)[0], 4)
+
+    def test_reset(self):
+        stats = self._open()
+        self._play(stats)
+        stats.resetStats('joe', 2)
+        stats2 = self._open()
+        self.assertEqual([g[0] for g in stats2.prev_games['joe']],
+                         [8, 8, 8])
+        self.assertEqual(len(stats2.all_prev_games['joe']), 5)
+        self.assertEqual(stats2.getFullStats('joe', 2), (0, 0, 0, 0))
+        stats.resetStats('joe', 0)
+        stats2 = self._open()
+        self.assertNotIn('joe', stats2.prev_games)
+        self.assertNotIn('joe', stats2.games_stats)
+        self.assertIn(None, stats2.games_stats)
+
+    def test_migrate(self):
+        old = Statistics()
+        self._play(old)
+        old.resetStats('joe', 2)
+        old.total_balance = {8: 25}
+        db = StatisticsDB(self.filename)
+        self.assertTrue(db.migrate(old))
+        self.assertFalse(db.migrate(old))
+        db.close()
+        stats = self._open()
+        self._compare(stats, old)
+        self.assertEqual(stats.total_balance, {8: 25})